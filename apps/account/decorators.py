@@ -0,0 +1,42 @@
+# Imports
+import functools
+from typing import Any, Callable, Coroutine
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user
+from django.contrib.auth.views import redirect_to_login
+
+
+# Decorator to require a logged in user in an async view
+def async_login_required(
+    view_func: Callable[..., Coroutine[Any, Any, Any]],
+) -> Callable[..., Coroutine[Any, Any, Any]]:
+    """Async version of login_required
+
+    The session and the user are loaded with a sync query, so the user is
+    resolved once off the event loop and set on the request, then the view
+    and its templates use it without touching the database again.
+
+    Args:
+        view_func (Callable[..., Coroutine[Any, Any, Any]]): The async view
+
+    Returns:
+        Callable[..., Coroutine[Any, Any, Any]]: The decorated view
+    """
+
+    # Async wrapper
+    @functools.wraps(view_func)
+    async def wrapper(request, *args, **kwargs):
+        # Resolve the user of the session
+        request.user = await sync_to_async(get_user)(request)
+
+        # If the user is not authenticated
+        if not request.user.is_authenticated:
+            # Redirect to the login page
+            return redirect_to_login(request.get_full_path())
+
+        # Return the response of the view
+        return await view_func(request, *args, **kwargs)
+
+    # Return the wrapper
+    return wrapper
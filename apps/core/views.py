@@ -1,14 +1,19 @@
 # Imports
-from django.contrib.auth.decorators import login_required
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
 from django.shortcuts import redirect, render
 from django.urls import reverse
 
+from apps.account.decorators import async_login_required
 from apps.socket.helpers import (
-    get_top_equity_gainers_quotes,
-    get_top_equity_losers_quotes,
-    get_top_index_quotes,
+    aget_top_equity_gainers_quotes,
+    aget_top_equity_losers_quotes,
+    aget_top_index_quotes,
 )
-from apps.socket.utils import is_market_open
+from apps.socket.utils import is_market_open, with_timeout
 
 
 # Home view
@@ -35,8 +40,9 @@ def home_view(request):
 
 
 # Explore view
-@login_required
-def explore_view(request):
+@transaction.non_atomic_requests
+@async_login_required
+async def explore_view(request):
     """Explore view
 
     Args:
@@ -46,14 +52,22 @@ def explore_view(request):
         HttpResponse: The response object
     """
 
+    # Get the quotes of the independent sources concurrently
+    timeout = settings.VIEW_SOURCE_TIMEOUT
+    indices, gainers, losers = await asyncio.gather(
+        with_timeout(aget_top_index_quotes(), timeout, {}),
+        with_timeout(aget_top_equity_gainers_quotes(), timeout, {}),
+        with_timeout(aget_top_equity_losers_quotes(), timeout, {}),
+    )
+
     # Create a context dictionary
     context = {
         "user": request.user,
-        "indices": get_top_index_quotes(),
-        "gainers": get_top_equity_gainers_quotes(),
-        "losers": get_top_equity_losers_quotes(),
+        "indices": indices,
+        "gainers": gainers,
+        "losers": losers,
         "is_market_open": is_market_open(),
     }
 
     # Render the explore.html template
-    return render(request, "core/explore.html", context)
+    return await sync_to_async(render)(request, "core/explore.html", context)
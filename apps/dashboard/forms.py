@@ -30,10 +30,10 @@ class ChartFilterForm(forms.Form):
         required=True,
         widget=forms.Select(),
     )
-    indicator = forms.ChoiceField(
-        label="Indicator",
+    indicator = forms.MultipleChoiceField(
+        label="Indicators",
         choices=INDICATORS,
-        initial="none",
+        initial=["none"],
         required=True,
-        widget=forms.Select(),
+        widget=forms.SelectMultiple(),
     )
@@ -1,8 +1,12 @@
 # Imports
 import pytest
+from django.core.cache import cache
 from django.urls import reverse
 from pytest_django.asserts import assertTemplateUsed
 
+from apps.dashboard.models import StockIndexWatchlist
+from apps.socket.publishers import QuotePublisher, build_group_name
+
 
 # Function to test the dashboard home view when the user is unauthenticated
 @pytest.mark.django_db
@@ -49,3 +53,34 @@ def test_dashboard_home_view_authenticated(client, user):
     assert "user" in response.context
     assert response.context["request"].user.is_authenticated
     assert response.context["user"] == user
+
+
+# Function to test the dashboard renders the bookmarks from the last snapshots
+@pytest.mark.django_db
+def test_dashboard_home_view_renders_from_snapshots(client, user, settings):
+    # Use an in-memory cache and render the page from the snapshots
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    settings.VIEW_RENDER_FROM_SNAPSHOT = True
+    cache.clear()
+
+    # Bookmark an index and a stock, only the index was published
+    StockIndexWatchlist.objects.create(user=user, symbol="^NSEI", type="INDEX")
+    StockIndexWatchlist.objects.create(user=user, symbol="TCS.NS", type="EQUITY")
+    quote = {"symbol": "^NSEI", "quoteType": "INDEX", "lastPrice": 1.0}
+    cache.set(
+        QuotePublisher.page_key(build_group_name("quote", "^NSEI")), {"^NSEI": quote}
+    )
+
+    # Authenticate the user
+    client.force_login(user)
+
+    # Get the dashboard home page
+    response = client.get(reverse("dashboard:home"))
+
+    # Assert the index is rendered from its snapshot and the stock as a skeleton
+    assert response.context["hydrate"]
+    assert response.context["quotes"]["^NSEI"] == quote
+    assert response.context["quotes"]["TCS.NS"]["skeleton"]
+    assert response.content.count(b"data-skeleton") == 1
@@ -1,4 +1,5 @@
 # Imports
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.http import JsonResponse
@@ -8,7 +9,13 @@ from django.urls import reverse
 from apps.dashboard.forms import ChartFilterForm
 from apps.dashboard.models import StockIndexWatchlist
 from apps.socket.constants import INTERVALS, PERIODS
-from apps.socket.helpers import generate_candlestick_chart, get_quote
+from apps.socket.helpers import (
+    format_indicators,
+    get_candlestick_chart_html,
+    get_quote,
+    parse_indicators,
+)
+from apps.socket.publishers import get_page_snapshots
 from apps.socket.utils import is_market_open
 
 
@@ -32,19 +39,44 @@ def home_view(request):
     # Dict to store the quotes
     quotes = {}
 
-    # Traverse over the bookmarked items
-    for item in bookmarked_items:
-        # Get the quote for the item
-        quote = get_quote(item.symbol)
+    # Render the page from the last published quotes unless configured otherwise
+    hydrate = settings.VIEW_RENDER_FROM_SNAPSHOT
 
-        # Append the quote to the quotes dict
-        quotes[quote[0]] = quote[1]
+    # Get the last published quotes of every item at once
+    snapshots = (
+        get_page_snapshots("quote", [(item.symbol,) for item in bookmarked_items])
+        if hydrate
+        else []
+    )
+
+    # Traverse over the bookmarked items
+    for position, item in enumerate(bookmarked_items):
+        # If the page is rendered from live quotes
+        if not hydrate:
+            # Get the quote for the item
+            quote = get_quote(item.symbol)
+
+            # Append the quote to the quotes dict
+            quotes[quote[0]] = quote[1]
+            continue
+
+        # Get the last published quote of the item
+        quote = next(iter((snapshots[position] or {}).values()), None)
+
+        # Append the quote, or a skeleton row if there is none
+        quotes[item.symbol] = quote or {
+            "symbol": item.symbol,
+            "shortName": item.symbol,
+            "quoteType": item.type,
+            "skeleton": True,
+        }
 
     # Create a context dictionary
     context = {
         "user": request.user,
         "is_market_open": is_market_open(),
         "quotes": quotes,
+        "hydrate": hydrate,
     }
 
     # Render the dashboard.html template
@@ -87,7 +119,7 @@ def playground_view(request, symbol: str):
     # Get the period and interval
     period = form.data.get("period", "1d")
     interval = form.data.get("interval", "5m")
-    indicator = form.data.get("indicator", "none")
+    indicators = parse_indicators(",".join(form.data.getlist("indicator")))
 
     # Check if period and interval are valid
     if period not in dict(PERIODS) or interval not in dict(INTERVALS[period]):
@@ -106,8 +138,11 @@ def playground_view(request, symbol: str):
     # Set the choices for the interval field
     form.fields["interval"].choices = intervals
 
-    # Set the initial indicator
-    form.fields["indicator"].initial = indicator
+    # Set the initial indicators
+    form.fields["indicator"].initial = [name for name, _ in indicators] or ["none"]
+
+    # Format the indicators with their parameters
+    indicator = format_indicators(indicators)
 
     # Get the quote for the symbol
     quote = get_quote(symbol)
@@ -120,8 +155,8 @@ def playground_view(request, symbol: str):
         # Redirect to the dashboard
         return redirect(reverse("core:explore"))
 
-    # Generate the candlestick chart
-    chart = generate_candlestick_chart(symbol, period, interval, indicator, 800)
+    # Get the candlestick chart, rendered once per bar
+    chart = get_candlestick_chart_html(symbol, period, interval, indicator, 800)
 
     # Create a context dictionary
     context = {
@@ -129,7 +164,7 @@ def playground_view(request, symbol: str):
         "is_market_open": is_market_open(),
         "form": form,
         "quote": quote[1],
-        "chart": chart.to_html(),
+        "chart": chart,
         "period": period,
         "interval": interval,
         "indicator": indicator,
@@ -0,0 +1,76 @@
+# Imports
+from typing import Callable, List
+
+import pandas as pd
+
+from apps.socket.benchmarks.indicator_kernels import best_time, build_history
+from apps.socket.helpers.candlestick_chart_helper import build_candlestick_figure
+from apps.socket.helpers.chart_indicator_helpers import evaluate_indicators
+from apps.socket.utils import build_candle_hover_text, figure_to_payload
+
+# Number of bars of the charts of every period size
+CHART_LENGTHS = {
+    "1d/5m": 75,
+    "5d/1m": 375 * 5,
+    "10y/1d": 252 * 10,
+    "max/1d": 252 * 30,
+}
+
+
+# Reference hover labels, with an f-string per bar
+def reference_hover_text(history_df: pd.DataFrame) -> List[str]:
+    # Return the labels
+    return [
+        f"Date: {date}<br>"
+        + f"Open: {open_}<br>"
+        + f"High: {high}<br>"
+        + f"Low: {low}<br>"
+        + f"Close: {close}"
+        for date, open_, high, low, close in zip(
+            history_df.index,
+            history_df["Open"],
+            history_df["High"],
+            history_df["Low"],
+            history_df["Close"],
+        )
+    ]
+
+
+# Function to run the benchmark
+def run(write: Callable[[str], None] = print) -> None:
+    """Write the time of the hover labels and of the chart build path
+
+    Args:
+        write (Callable[[str], None], optional): Writes a line. Defaults to print.
+    """
+
+    # Write the header
+    write(
+        f"{'chart':<8} {'bars':>6} {'hover ref':>11} {'hover vec':>11} "
+        f"{'speedup':>8} {'figure':>11} {'payload':>11}"
+    )
+
+    # For each period size
+    for chart, length in CHART_LENGTHS.items():
+        # Build the history in the exchange timezone, like Yahoo serves it
+        history_df = build_history(length).round(2)
+        history_df.index = history_df.index.tz_localize("Asia/Kolkata")
+
+        # Build the indicators drawn on the chart
+        results = evaluate_indicators(history_df, [("sma", {})])
+
+        # Time the hover labels, the figure and the streamed payload
+        reference_time = best_time(reference_hover_text, history_df, repeat=3)
+        vectorized_time = best_time(build_candle_hover_text, history_df)
+        figure_time = best_time(
+            build_candlestick_figure, history_df, results, 100.0, repeat=3
+        )
+        fig = build_candlestick_figure(history_df, results, 100.0)
+        payload_time = best_time(figure_to_payload, fig, repeat=3)
+
+        # Write the times in milliseconds
+        write(
+            f"{chart:<8} {length:>6} {reference_time * 1e3:>9.2f}ms "
+            f"{vectorized_time * 1e3:>9.2f}ms {reference_time / vectorized_time:>7.1f}x "
+            f"{figure_time * 1e3:>9.2f}ms {payload_time * 1e3:>9.2f}ms"
+        )
@@ -0,0 +1,262 @@
+# Imports
+import timeit
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+from apps.socket.helpers.chart_indicator_helpers import kernels
+
+# Number of bars of the benchmarked series
+SERIES_LENGTHS = {"10y/1d": 252 * 10, "5d/1m": 375 * 5}
+
+
+# Function to build a random walk history
+def build_history(length: int, seed: int = 0) -> pd.DataFrame:
+    """Build a random walk OHLC history
+
+    Args:
+        length (int): Number of bars
+        seed (int, optional): Seed of the random generator. Defaults to 0.
+
+    Returns:
+        pd.DataFrame: The history
+    """
+
+    # Random closes around 100, rounded like exchange prices so ties happen
+    generator = np.random.default_rng(seed)
+    close = np.round(100 + np.cumsum(generator.normal(0, 1, length)), 1)
+
+    # Random ranges around the closes
+    spread = np.abs(generator.normal(0, 1, (2, length)))
+
+    # Return the history
+    return pd.DataFrame(
+        {
+            "Open": close + generator.normal(0, 0.5, length),
+            "High": close + spread[0],
+            "Low": close - spread[1],
+            "Close": close,
+        },
+        index=pd.date_range("2015-01-01", periods=length, freq="min"),
+    )
+
+
+# Reference WMA, with a Python callback per window
+def reference_wma(history_df: pd.DataFrame, window: int = 20) -> pd.Series:
+    # Linear weights
+    weights = list(range(1, window + 1))
+
+    # Return the weighted mean of every window
+    return (
+        history_df["Close"]
+        .rolling(window)
+        .apply(lambda prices: np.dot(prices, weights) / sum(weights), raw=True)
+    )
+
+
+# Reference TRIMA, the SMA of the SMA
+def reference_trima(history_df: pd.DataFrame, window: int = 20) -> pd.Series:
+    # Return the double smoothed closes
+    return history_df["Close"].rolling(window).mean().rolling(window).mean()
+
+
+# Reference T3, with chained pandas EMAs
+def reference_t3(
+    history_df: pd.DataFrame, window: int = 10, vfactor: float = 0.7
+) -> pd.Series:
+    # Chained EMAs
+    e1 = history_df["Close"].ewm(span=window, adjust=False).mean()
+    e2 = e1.ewm(span=window, adjust=False).mean()
+
+    # Return the smoothed combination
+    return ((1 + vfactor) * e1 - vfactor * e2).ewm(span=window, adjust=False).mean()
+
+
+# Reference KAMA, with a loop over the rows
+def reference_kama(
+    history_df: pd.DataFrame, window: int = 10, fast: int = 2, slow: int = 30
+) -> np.ndarray:
+    # Efficiency ratio
+    change = abs(history_df["Close"].diff(window))
+    volatility = abs(history_df["Close"].diff()).rolling(window=window).sum()
+    er = np.divide(change, volatility, out=np.zeros_like(change), where=volatility != 0)
+
+    # Smoothing constants
+    fast_sc = 2 / (fast + 1)
+    slow_sc = 2 / (slow + 1)
+    smoothing_constant = (er * (fast_sc - slow_sc) + slow_sc) ** 2
+
+    # Run the recursion
+    kama = np.full_like(history_df["Close"], np.nan)
+    kama[window] = history_df["Close"].iloc[window]
+    for i in range(window + 1, len(history_df)):
+        kama[i] = kama[i - 1] + smoothing_constant.iloc[i] * (
+            history_df["Close"].iloc[i] - kama[i - 1]
+        )
+
+    # Return the KAMA
+    return kama
+
+
+# Reference MAMA and FAMA, with a loop over the rows
+def reference_mama(
+    history_df: pd.DataFrame,
+    window: int = 10,
+    fast_limit: float = 0.5,
+    slow_limit: float = 0.05,
+) -> Tuple[np.ndarray, np.ndarray]:
+    # Smoothing constants
+    abs_price_change = abs(history_df["Close"].diff())
+    smoothing_constant = (
+        abs_price_change / abs_price_change.rolling(window=window).sum()
+    ) * (fast_limit - slow_limit) + slow_limit
+
+    # Run the recursions
+    fama = np.full_like(history_df["Close"], np.nan)
+    mama = np.full_like(history_df["Close"], np.nan)
+    fama[window] = mama[window] = history_df["Close"].iloc[window]
+    for i in range(window + 1, len(history_df)):
+        fama[i] = fama[i - 1] + smoothing_constant.iloc[i] * (
+            history_df["Close"].iloc[i] - fama[i - 1]
+        )
+        mama[i] = mama[i - 1] + (1 - smoothing_constant.iloc[i]) * (
+            history_df["Close"].iloc[i] - mama[i - 1]
+        )
+
+    # Return the MAMA and the FAMA
+    return mama, fama
+
+
+# Reference price based OBV, with a loop over the rows
+def reference_price_obv(history_df: pd.DataFrame) -> list:
+    # Count the rising bars minus the falling bars
+    obv_like = [0]
+    for i in range(1, len(history_df)):
+        if history_df["Close"].iloc[i] > history_df["Close"].iloc[i - 1]:
+            obv_like.append(obv_like[-1] + 1)
+        elif history_df["Close"].iloc[i] < history_df["Close"].iloc[i - 1]:
+            obv_like.append(obv_like[-1] - 1)
+        else:
+            obv_like.append(obv_like[-1])
+
+    # Return the running count
+    return obv_like
+
+
+# Reference Aroon ages, with a Python callback per window
+def reference_extreme_age(
+    history_df: pd.DataFrame, period: int = 14
+) -> Tuple[pd.Series, pd.Series]:
+    # Rolling windows of the closes
+    rolling = history_df["Close"].rolling(window=period)
+
+    # Return the ages of the maximum and the minimum
+    return (
+        rolling.apply(lambda x: x[::-1].argmax(), raw=False),
+        rolling.apply(lambda x: x[::-1].argmin(), raw=False),
+    )
+
+
+# Reference CCI mean deviation, with a Python callback per window
+def reference_mean_deviation(history_df: pd.DataFrame, window: int = 20) -> pd.Series:
+    # Typical prices
+    typical = (history_df["High"] + history_df["Low"] + history_df["Close"]) / 3
+
+    # Return the mean absolute deviation of every window
+    return typical.rolling(window).apply(lambda x: abs(x - x.mean()).mean(), raw=False)
+
+
+# Reference directional movements, with a Python callback per row
+def reference_directional_movement(
+    history_df: pd.DataFrame,
+) -> Tuple[pd.Series, pd.Series]:
+    # Raw movements
+    frame = pd.DataFrame(
+        {"+DM": history_df["High"].diff(), "-DM": history_df["Low"].diff().abs()}
+    )
+
+    # Apply the conditions row by row
+    frame["+DM"] = frame.apply(
+        lambda x: x["+DM"] if x["+DM"] > 0 and x["+DM"] > x["-DM"] else 0, axis=1
+    )
+    frame["-DM"] = frame.apply(
+        lambda x: x["-DM"] if x["-DM"] > 0 and x["-DM"] > x["+DM"] else 0, axis=1
+    )
+
+    # Return the movements
+    return frame["+DM"], frame["-DM"]
+
+
+# Pairs of reference and kernel implementations, by indicator
+BENCHMARKS: Dict[str, Tuple[Callable, Callable]] = {
+    "wma": (reference_wma, lambda df: kernels.wma(df["Close"].to_numpy(), 20)),
+    "trima": (reference_trima, lambda df: kernels.trima(df["Close"].to_numpy(), 20)),
+    "t3": (reference_t3, lambda df: kernels.t3(df["Close"].to_numpy(), 10, 0.7)),
+    "kama": (
+        reference_kama,
+        lambda df: kernels.kama(df["Close"].to_numpy(), 10, 2, 30),
+    ),
+    "mama": (
+        reference_mama,
+        lambda df: kernels.mama(df["Close"].to_numpy(), 10, 0.5, 0.05),
+    ),
+    "obv": (reference_price_obv, lambda df: kernels.price_obv(df["Close"].to_numpy())),
+    "aroon": (
+        reference_extreme_age,
+        lambda df: kernels.rolling_extreme_age(df["Close"].to_numpy(), 14),
+    ),
+    "cci": (
+        reference_mean_deviation,
+        lambda df: kernels.rolling_mean_deviation(
+            ((df["High"] + df["Low"] + df["Close"]) / 3).to_numpy(), 20
+        ),
+    ),
+    "dm": (
+        reference_directional_movement,
+        lambda df: kernels.directional_movement(
+            df["High"].to_numpy(), df["Low"].to_numpy()
+        ),
+    ),
+}
+
+
+# Function to time a function
+def best_time(func: Callable, *args, repeat: int = 5) -> float:
+    # Run once to get the number of calls of every timed run
+    timer = timeit.Timer(lambda: func(*args))
+    number, _ = timer.autorange()
+
+    # Return the best time per call
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+# Function to run the benchmark
+def run(write: Callable[[str], None] = print) -> None:
+    """Write the time of the reference and the kernel implementations
+
+    Args:
+        write (Callable[[str], None], optional): Writes a line. Defaults to print.
+    """
+
+    # Write the header
+    write(
+        f"{'series':<8} {'indicator':<10} {'reference':>12} {'kernel':>12} {'speedup':>9}"
+    )
+
+    # For each series
+    for series, length in SERIES_LENGTHS.items():
+        # Build the history
+        history_df = build_history(length)
+
+        # For each indicator
+        for name, (reference, kernel) in BENCHMARKS.items():
+            # Time both implementations
+            reference_time = best_time(reference, history_df, repeat=3)
+            kernel_time = best_time(kernel, history_df)
+
+            # Write the times in milliseconds
+            write(
+                f"{series:<8} {name:<10} {reference_time * 1e3:>10.2f}ms "
+                f"{kernel_time * 1e3:>10.3f}ms {reference_time / kernel_time:>8.0f}x"
+            )
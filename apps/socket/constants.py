@@ -19,6 +19,42 @@ REQUIRED_FIELDS = [
     "dayHigh",
 ]
 
+# Price fields of the NSE breadth table, named like the required fields
+NSE_BREADTH_PRICE_FIELDS = [
+    "lastPrice",
+    "previousClose",
+    "open",
+    "dayLow",
+    "dayHigh",
+]
+
+# Yahoo batch quote endpoint
+YAHOO_QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+
+# NSE home page, it sets the cookies required by the API
+NSE_HOME_URL = "https://www.nseindia.com"
+
+# NSE API url of the securities in F&O
+NSE_FNO_URL = (
+    "https://www.nseindia.com/api/equity-stockIndices?index=SECURITIES%20IN%20F%26O"
+)
+
+# Headers of the NSE requests
+NSE_HEADERS = {
+    "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+    "accept-language": "en-US,en;q=0.9,en-IN;q=0.8,en-GB;q=0.7",
+    "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36",
+}
+
+# Mapping of the batch quote fields to the required fields
+BATCH_QUOTE_FIELDS = {
+    "lastPrice": "regularMarketPrice",
+    "previousClose": "regularMarketPreviousClose",
+    "open": "regularMarketOpen",
+    "dayLow": "regularMarketDayLow",
+    "dayHigh": "regularMarketDayHigh",
+}
+
 # Stock exchange categories
 NSE_CATEGORIES = [
     ("broad-market", "Broad Market Indices"),
@@ -289,3 +325,40 @@ INDICATORS = [
     ("obv", "On Balance Volume"),
     ("ht_trendline", "Hilbert Transform - Instantaneous Trendline"),
 ]
+
+# Maximum number of indicators added to one chart
+MAX_CHART_INDICATORS = 5
+
+# Allowed range of the indicator parameters by type, the integers are windows
+# and the floats are smoothing factors, indicators can override the range of
+# any of their parameters when they register
+INDICATOR_PARAM_BOUNDS = {int: (1, 500), float: (0.001, 1.0)}
+
+# Widths of the streamed charts in points, charts are drawn with the first
+# bucket that fits their width so that charts of similar widths share a topic
+CHART_POINT_BUCKETS = (250, 500, 1000, 2000, 4000)
+
+# Longest period Yahoo serves for every interval, used to backfill the history
+# and to trim the stored bars
+HISTORY_BACKFILL_PERIODS = {
+    "1m": "14d",
+    "2m": "60d",
+    "5m": "60d",
+    "15m": "60d",
+    "30m": "60d",
+    "60m": "730d",
+    "90m": "60d",
+    "1d": "max",
+    "5d": "max",
+    "1wk": "max",
+    "1mo": "max",
+    "3mo": "max",
+}
+
+# Longest window Yahoo serves in one request, longer backfills are fetched in
+# chunks
+HISTORY_REQUEST_DAYS = {"1m": 7}
+
+# Finest interval stored for the intraday periods, coarser intraday intervals
+# of these periods are resampled from it
+HISTORY_BASE_INTERVALS = {"1d": "1m", "5d": "1m", "1mo": "30m"}
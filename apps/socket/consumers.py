@@ -1,67 +1,35 @@
 # Imports
 import json
+from urllib.parse import parse_qs
 
-import anyio
+import pandas as pd
 from channels.generic.websocket import AsyncWebsocketConsumer
 from django.apps import apps
+from django.conf import settings
 
-from apps.socket.helpers import (
-    generate_candlestick_chart,
-    get_bookmarked_quotes,
-    get_index_quotes,
-    get_quote,
-    get_top_equity_gainers_20_quotes,
-    get_top_equity_gainers_quotes,
-    get_top_equity_losers_20_quotes,
-    get_top_equity_losers_quotes,
-    get_top_index_quotes,
-)
+from apps.socket.constants import CHART_POINT_BUCKETS
+from apps.socket.helpers import format_indicators, parse_indicators
+from apps.socket.publishers import publisher
+from apps.socket.utils import interval_minutes
 
 
-# TopIndexQuotesConsumer class
-class TopIndexQuotesConsumer(AsyncWebsocketConsumer):
-    # Connect method
-    async def connect(self):
-        # Accept the connection
-        await self.accept()
-
-        # Flag to control the updates
-        self.keep_sending = True
-
-        # Send initial data when connection is established
-        await self.send_quotes()
-
-    # Disconnect method
-    async def disconnect(self, close_code):
-        # Stop sending updates on disconnect
-        self.keep_sending = False
-
-    # Receive method
-    async def send_quotes(self):
-        # Try
-        try:
-            # Send data to the WebSocket client
-            while self.keep_sending:
-                # Fetch the top index quotes
-                quotes_dict = get_top_index_quotes()
-
-                # Send the quotes to the WebSocket client
-                await self.send(json.dumps(quotes_dict))
-
-                # Wait for 2.0 second before sending the next update
-                await anyio.sleep(2.0)
+# TopicConsumer class
+class TopicConsumer(AsyncWebsocketConsumer):
+    """Base consumer that relays a published topic to the WebSocket client
 
-        # If any exception occurs
-        except Exception as e:
-            # Print the error
-            print(f"Error in send_quotes: {e}")
+    The consumer does not poll anything by itself, it joins the channel layer
+    group of its topic and the shared publisher broadcasts every update once
+    for all the subscribers of that topic. The client receives a snapshot on
+    connect, then deltas, and can ask for a new snapshot with
+    {"type": "resync", "stream": <stream>} when it detects a sequence gap.
 
-            # Stop sending updates
-            self.keep_sending = False
+    Attributes:
+        topic_name (str): Name of the topic in the publisher registry
+    """
 
+    # Attributes
+    topic_name = None
 
-# IndexQuotesConsumer class
-class IndexQuotesConsumer(AsyncWebsocketConsumer):
     # Connect method
     async def connect(self):
         # Accept the connection
@@ -70,164 +38,89 @@ class IndexQuotesConsumer(AsyncWebsocketConsumer):
         # Parse query parameters from the connection scope
         self.query_params = self.parse_query_string(self.scope["query_string"])
 
-        # Flag to control the updates
-        self.keep_sending = True
+        # Groups this consumer is subscribed to
+        self.groups_subscribed = []
 
-        # Send initial data when connection is established
-        await self.send_quotes()
+        # Subscribe to the topics
+        await self.subscribe()
 
     # Disconnect method
     async def disconnect(self, close_code):
-        # Stop sending updates on disconnect
-        self.keep_sending = False
+        # Unsubscribe from all the topics
+        for group in getattr(self, "groups_subscribed", []):
+            await publisher.unsubscribe(self.channel_layer, self.channel_name, group)
 
-    # Receive method
-    async def send_quotes(self):
-        # Try
-        try:
-            # Send data to the WebSocket client
-            while self.keep_sending:
-                # Get values from the query parameters
-                stock_exchange = self.query_params.get("stock_exchange", "NSE")
-                category = self.query_params.get("category", "broad-market")
-
-                # Fetch the index quotes
-                quotes_dict = get_index_quotes(stock_exchange, category)
+        # Forget the groups
+        self.groups_subscribed = []
 
-                # Send the quotes to the WebSocket client
-                await self.send(json.dumps(quotes_dict))
+    # Method to subscribe to the topics
+    async def subscribe(self):
+        # Subscribe to the topic of the consumer
+        await self.subscribe_topic(self.topic_name, *self.get_topic_args())
 
-                # Wait for 2.0 second before sending the next update
-                await anyio.sleep(2.0)
-
-        # If any exception occurs
-        except Exception as e:
-            # Print the error
-            print(f"Error in send_quotes: {e}")
-
-            # Stop sending updates
-            self.keep_sending = False
-
-    # Static method to parse query string
-    @staticmethod
-    def parse_query_string(query_string: bytes) -> dict:
-        """Parse the query string and return the query parameters as a dictionary.
+    # Method to subscribe to a single topic
+    async def subscribe_topic(self, topic_name: str, *args: str):
+        """Subscribe to a topic and send its last snapshot if available
 
         Args:
-            query_string (bytes): The query string from the connection scope.
-
-        Returns:
-            dict: The query parameters as a dictionary.
+            topic_name (str): Name of the topic
+            *args (str): Arguments of the topic
         """
 
-        # Import the required function
-        from urllib.parse import parse_qs
-
-        # Decode and parse the query string
-        query_params = parse_qs(query_string.decode())
-
-        # Convert list values to single values (assuming single-value params)
-        return {key: value[0] for key, value in query_params.items()}
-
-
-# QuoteConsumer class
-class QuoteConsumer(AsyncWebsocketConsumer):
-    # Connect method
-    async def connect(self):
-        # Accept the connection
-        await self.accept()
-
-        # Extract the symbol from the URL
-        self.symbol = self.scope["url_route"]["kwargs"]["symbol"]
+        # Subscribe to the topic
+        group = await publisher.subscribe(
+            self.channel_layer, self.channel_name, topic_name, *args
+        )
 
-        # Flag to control the updates
-        self.keep_sending = True
+        # Remember the group
+        self.groups_subscribed.append(group)
 
         # Send initial data when connection is established
-        await self.send_quote()
-
-    # Disconnect method
-    async def disconnect(self, close_code):
-        # Stop sending updates on disconnect
-        self.keep_sending = False
-
-    # Receive method
-    async def send_quote(self):
-        # Try
-        try:
-            # Send data to the WebSocket client
-            while self.keep_sending:
-                # Fetch the index quotes
-                quote = get_quote(self.symbol)
-
-                # Send the quotes to the WebSocket client
-                await self.send(json.dumps(quote))
-
-                # Wait for 2.0 second before sending the next update
-                await anyio.sleep(2.0)
-
-        # If any exception occurs
-        except Exception as e:
-            # Print the error
-            print(f"Error in send_quote: {e}")
-
-            # Stop sending updates
-            self.keep_sending = False
-
-
-# QuoteChartConsumer class
-class QuoteChartConsumer(AsyncWebsocketConsumer):
-    # Connect method
-    async def connect(self):
-        # Accept the connection
-        await self.accept()
+        await self.send_snapshot(group)
 
-        # Extract the symbol from the URL
-        self.symbol = self.scope["url_route"]["kwargs"]["symbol"]
+    # Method to send the snapshot of a topic
+    async def send_snapshot(self, group: str):
+        """Send the last published payload of a topic if available
 
-        # Parse query parameters from the connection scope
-        self.query_params = self.parse_query_string(self.scope["query_string"])
-
-        # Flag to control the updates
-        self.keep_sending = True
+        Args:
+            group (str): The group name of the topic
+        """
 
-        # Send initial data when connection is established
-        await self.send_quote()
+        # Get the last published payload
+        snapshot = await publisher.get_snapshot(group)
 
-    # Disconnect method
-    async def disconnect(self, close_code):
-        # Stop sending updates on disconnect
-        self.keep_sending = False
+        # If a payload is available
+        if snapshot is not None:
+            # Send the snapshot
+            await self.topic_message({"group": group, "text": snapshot})
 
     # Receive method
-    async def send_quote(self):
-        # Try
+    async def receive(self, text_data=None, bytes_data=None):
+        # Try to parse the client message
         try:
-            # Send data to the WebSocket client
-            while self.keep_sending:
-                # Get the period and interval from the query parameters
-                period = self.query_params.get("period", "1d")
-                interval = self.query_params.get("interval", "5m")
-                indicator = self.query_params.get("indicator", "none")
-
-                # Get the chart for the index quote
-                chart = generate_candlestick_chart(
-                    self.symbol, period, interval, indicator
-                ).to_html()
-
-                # Send the quotes to the WebSocket client
-                await self.send(chart)
-
-                # Wait for 5.0 second before sending the next update
-                await anyio.sleep(5.0)
-
-        # If any exception occurs
-        except Exception as e:
-            # Print the error
-            print(f"Error in send_quote: {e}")
-
-            # Stop sending updates
-            self.keep_sending = False
+            message = json.loads(text_data or "")
+
+        # If the message is not valid JSON
+        except ValueError:
+            return
+
+        # If the client asks for a resync
+        if isinstance(message, dict) and message.get("type") == "resync":
+            # Resync the requested stream, or all of them
+            stream = message.get("stream")
+            for group in self.groups_subscribed:
+                if stream in (None, group):
+                    await self.send_snapshot(group)
+
+    # Method to get the topic arguments
+    def get_topic_args(self) -> tuple:
+        # No arguments by default
+        return ()
+
+    # Topic message handler
+    async def topic_message(self, event):
+        # Send the payload to the WebSocket client
+        await self.send(event["text"])
 
     # Static method to parse query string
     @staticmethod
@@ -241,9 +134,6 @@ class QuoteChartConsumer(AsyncWebsocketConsumer):
             dict: The query parameters as a dictionary.
         """
 
-        # Import the required function
-        from urllib.parse import parse_qs
-
         # Decode and parse the query string
         query_params = parse_qs(query_string.decode())
 
@@ -251,282 +141,218 @@ class QuoteChartConsumer(AsyncWebsocketConsumer):
         return {key: value[0] for key, value in query_params.items()}
 
 
-# TopEquityGainersQuotesConsumer class
-class TopEquityGainersQuotesConsumer(AsyncWebsocketConsumer):
-    # Connect method
-    async def connect(self):
-        # Accept the connection
-        await self.accept()
-
-        # Flag to control the updates
-        self.keep_sending = True
-
-        # Send initial data when connection is established
-        await self.send_quotes()
-
-    # Disconnect method
-    async def disconnect(self, close_code):
-        # Stop sending updates on disconnect
-        self.keep_sending = False
-
-    # Receive method
-    async def send_quotes(self):
-        # Try
-        try:
-            # Send data to the WebSocket client
-            while self.keep_sending:
-                # Fetch the top equity gainers quotes
-                quotes_dict = get_top_equity_gainers_quotes()
-
-                # Send the quotes to the WebSocket client
-                await self.send(json.dumps(quotes_dict))
-
-                # Wait for 2.0 second before sending the next update
-                await anyio.sleep(2.0)
-
-        # If any exception occurs
-        except Exception as e:
-            # Print the error
-            print(f"Error in send_quotes: {e}")
-
-            # Stop sending updates
-            self.keep_sending = False
-
-
-# TopEquityLosersQuotesConsumer class
-class TopEquityLosersQuotesConsumer(AsyncWebsocketConsumer):
-    # Connect method
-    async def connect(self):
-        # Accept the connection
-        await self.accept()
-
-        # Flag to control the updates
-        self.keep_sending = True
-
-        # Send initial data when connection is established
-        await self.send_quotes()
+# TopIndexQuotesConsumer class
+class TopIndexQuotesConsumer(TopicConsumer):
+    # Attributes
+    topic_name = "topIndexQuotes"
 
-    # Disconnect method
-    async def disconnect(self, close_code):
-        # Stop sending updates on disconnect
-        self.keep_sending = False
 
-    # Receive method
-    async def send_quotes(self):
-        # Try
-        try:
-            # Send data to the WebSocket client
-            while self.keep_sending:
-                # Fetch the top equity losers quotes
-                quotes_dict = get_top_equity_losers_quotes()
+# IndexQuotesConsumer class
+class IndexQuotesConsumer(TopicConsumer):
+    # Attributes
+    topic_name = "indexQuotes"
 
-                # Send the quotes to the WebSocket client
-                await self.send(json.dumps(quotes_dict))
+    # Method to get the topic arguments
+    def get_topic_args(self) -> tuple:
+        # Get values from the query parameters
+        stock_exchange = self.query_params.get("stock_exchange", "NSE")
+        category = self.query_params.get("category", "broad-market")
 
-                # Wait for 2.0 second before sending the next update
-                await anyio.sleep(2.0)
+        # Return the arguments
+        return stock_exchange, category
 
-        # If any exception occurs
-        except Exception as e:
-            # Print the error
-            print(f"Error in send_quotes: {e}")
 
-            # Stop sending updates
-            self.keep_sending = False
+# QuoteConsumer class
+class QuoteConsumer(TopicConsumer):
+    # Attributes
+    topic_name = "quote"
 
+    # Method to get the topic arguments
+    def get_topic_args(self) -> tuple:
+        # Extract the symbol from the URL
+        return (self.scope["url_route"]["kwargs"]["symbol"],)
 
-# TopEquityGainersQuotes20Consumer class
-class TopEquityGainersQuotes20Consumer(AsyncWebsocketConsumer):
-    # Connect method
-    async def connect(self):
-        # Accept the connection
-        await self.accept()
 
-        # Parse query parameters from the connection scope
-        self.query_params = self.parse_query_string(self.scope["query_string"])
-
-        # Flag to control the updates
-        self.keep_sending = True
+# QuoteChartConsumer class
+class QuoteChartConsumer(TopicConsumer):
+    # Attributes
+    topic_name = "quoteChart"
 
-        # Send initial data when connection is established
-        await self.send_quotes()
+    # Static method to normalize the number of points of a chart
+    @staticmethod
+    def parse_points(value: str) -> str:
+        """Round the width of a chart up to a bucket of CHART_POINT_BUCKETS,
+        so that charts of similar widths share their topic
 
-    # Disconnect method
-    async def disconnect(self, close_code):
-        # Stop sending updates on disconnect
-        self.keep_sending = False
+        Args:
+            value (str): The width of the chart in pixels, empty for the default
 
-    # Receive method
-    async def send_quotes(self):
-        # Try
-        try:
-            # Send data to the WebSocket client
-            while self.keep_sending:
-                # Get values from the query parameters
-                stock_exchange = self.query_params.get("stock_exchange", "NSE")
+        Raises:
+            ValueError: If the width is not a positive number
 
-                # Fetch the top equity gainers quotes
-                quotes_dict = get_top_equity_gainers_20_quotes(stock_exchange)
+        Returns:
+            str: The number of points, empty for the default
+        """
 
-                # Send the quotes to the WebSocket client
-                await self.send(json.dumps(quotes_dict))
+        # If the default width is requested
+        if not value:
+            return ""
 
-                # Wait for 2.0 second before sending the next update
-                await anyio.sleep(2.0)
+        # If the width is not a number
+        if not value.isdigit() or int(value) <= 0:
+            raise ValueError(f"Invalid chart width {value!r}")
 
-        # If any exception occurs
-        except Exception as e:
-            # Print the error
-            print(f"Error in send_quotes: {e}")
+        # Get the first bucket that fits the width
+        points = next(
+            (bucket for bucket in CHART_POINT_BUCKETS if bucket >= int(value)),
+            CHART_POINT_BUCKETS[-1],
+        )
 
-            # Stop sending updates
-            self.keep_sending = False
+        # Return the bucket, capped by the maximum number of points
+        return str(min(points, settings.CHART_MAX_POINTS))
 
-    # Static method to parse query string
+    # Static method to normalize a timestamp of a zoomed chart
     @staticmethod
-    def parse_query_string(query_string: bytes) -> dict:
-        """Parse the query string and return the query parameters as a dictionary.
+    def parse_timestamp(value: str, interval: str, ceil: bool = False) -> str:
+        """Snap a bound of the zoomed window of a chart to the bars of its
+        interval, so that close zooms share their topic
 
         Args:
-            query_string (bytes): The query string from the connection scope.
+            value (str): The timestamp, empty for no bound
+            interval (str): Interval of the chart
+            ceil (bool, optional): Snap to the next bar instead of the
+                previous one. Defaults to False.
+
+        Raises:
+            ValueError: If the value is not a timestamp
 
         Returns:
-            dict: The query parameters as a dictionary.
+            str: The ISO timestamp, empty for no bound
         """
 
-        # Import the required function
-        from urllib.parse import parse_qs
-
-        # Decode and parse the query string
-        query_params = parse_qs(query_string.decode())
+        # If there is no bound
+        if not value:
+            return ""
 
-        # Convert list values to single values (assuming single-value params)
-        return {key: value[0] for key, value in query_params.items()}
-
-
-# TopEquityLosersQuotes20Consumer class
-class TopEquityLosersQuotes20Consumer(AsyncWebsocketConsumer):
-    # Connect method
-    async def connect(self):
-        # Accept the connection
-        await self.accept()
+        # Parse the timestamp
+        try:
+            timestamp = pd.Timestamp(value)
 
-        # Parse query parameters from the connection scope
-        self.query_params = self.parse_query_string(self.scope["query_string"])
+        # If the value is not a timestamp
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid chart bound {value!r}") from e
 
-        # Flag to control the updates
-        self.keep_sending = True
+        # If the value is missing
+        if timestamp is pd.NaT:
+            raise ValueError(f"Invalid chart bound {value!r}")
 
-        # Send initial data when connection is established
-        await self.send_quotes()
+        # Length of the bars, daily and longer bars snap to days
+        minutes = interval_minutes(interval)
+        freq = f"{minutes}min" if minutes is not None else "D"
 
-    # Disconnect method
-    async def disconnect(self, close_code):
-        # Stop sending updates on disconnect
-        self.keep_sending = False
+        # Return the snapped timestamp
+        return (timestamp.ceil(freq) if ceil else timestamp.floor(freq)).isoformat()
 
-    # Receive method
-    async def send_quotes(self):
+    # Method to subscribe to the topics
+    async def subscribe(self):
         # Try
         try:
-            # Send data to the WebSocket client
-            while self.keep_sending:
-                # Get values from the query parameters
-                stock_exchange = self.query_params.get("stock_exchange", "NSE")
+            # Get the arguments of the chart
+            args = self.get_topic_args()
 
-                # Fetch the top equity losers quotes
-                quotes_dict = get_top_equity_losers_20_quotes(stock_exchange)
+        # If the client sent invalid arguments
+        except ValueError:
+            # Close the connection instead of creating a topic for them
+            await self.close(code=4400)
+            return
 
-                # Send the quotes to the WebSocket client
-                await self.send(json.dumps(quotes_dict))
+        # Subscribe to the topic of the chart
+        await self.subscribe_topic(self.topic_name, *args)
 
-                # Wait for 2.0 second before sending the next update
-                await anyio.sleep(2.0)
+    # Method to get the topic arguments
+    def get_topic_args(self) -> tuple:
+        # Extract the symbol from the URL
+        symbol = self.scope["url_route"]["kwargs"]["symbol"]
 
-        # If any exception occurs
-        except Exception as e:
-            # Print the error
-            print(f"Error in send_quotes: {e}")
+        # Get the period and interval from the query parameters
+        period = self.query_params.get("period", "1d")
+        interval = self.query_params.get("interval", "5m")
+        indicator = self.query_params.get("indicator", "none")
 
-            # Stop sending updates
-            self.keep_sending = False
+        # Normalize the indicators, so that equal charts share their topic
+        indicator = format_indicators(parse_indicators(indicator))
 
-    # Static method to parse query string
-    @staticmethod
-    def parse_query_string(query_string: bytes) -> dict:
-        """Parse the query string and return the query parameters as a dictionary.
+        # Get the number of points and the zoomed window of the chart
+        points = self.parse_points(self.query_params.get("points", ""))
+        start = self.parse_timestamp(self.query_params.get("start", ""), interval)
+        end = self.parse_timestamp(self.query_params.get("end", ""), interval, True)
 
-        Args:
-            query_string (bytes): The query string from the connection scope.
+        # If the zoomed window has a single bound
+        if bool(start) != bool(end):
+            raise ValueError(f"Invalid chart window {start!r} - {end!r}")
 
-        Returns:
-            dict: The query parameters as a dictionary.
-        """
+        # If the zoomed window is empty, comparing naive and aware bounds fails
+        try:
+            if start and pd.Timestamp(start) >= pd.Timestamp(end):
+                raise ValueError(f"Invalid chart window {start!r} - {end!r}")
+        except TypeError as e:
+            raise ValueError(f"Invalid chart window {start!r} - {end!r}") from e
 
-        # Import the required function
-        from urllib.parse import parse_qs
+        # Return the arguments
+        return symbol, period, interval, indicator, points, start, end
 
-        # Decode and parse the query string
-        query_params = parse_qs(query_string.decode())
 
-        # Convert list values to single values (assuming single-value params)
-        return {key: value[0] for key, value in query_params.items()}
+# TopEquityGainersQuotesConsumer class
+class TopEquityGainersQuotesConsumer(TopicConsumer):
+    # Attributes
+    topic_name = "topEquityGainersQuotes"
 
 
-# BookmarkQuotes class
-class BookmarkQuotes(AsyncWebsocketConsumer):
-    # Connect method
-    async def connect(self):
-        # Accept the connection
-        await self.accept()
+# TopEquityLosersQuotesConsumer class
+class TopEquityLosersQuotesConsumer(TopicConsumer):
+    # Attributes
+    topic_name = "topEquityLosersQuotes"
 
-        # Extract the customer_id from the URL
-        self.customer_id = self.scope["url_route"]["kwargs"]["customer_id"]
 
-        # Flag to control the updates
-        self.keep_sending = True
+# TopEquityGainersQuotes20Consumer class
+class TopEquityGainersQuotes20Consumer(TopicConsumer):
+    # Attributes
+    topic_name = "topEquityGainersQuotes20"
 
-        # Send initial data when connection is established
-        await self.send_quotes()
+    # Method to get the topic arguments
+    def get_topic_args(self) -> tuple:
+        # Get values from the query parameters
+        return (self.query_params.get("stock_exchange", "NSE"),)
 
-    # Disconnect method
-    async def disconnect(self, close_code):
-        # Stop sending updates on disconnect
-        self.keep_sending = False
 
-    # Receive method
-    async def send_quotes(self):
-        # Try
-        try:
-            # Send data to the WebSocket client
-            while self.keep_sending:
-                # Get the model only when needed, not at module level
-                StockIndexWatchlist = apps.get_model("dashboard", "StockIndexWatchlist")
-
-                # Fetch the stock index watchlist for the customer
-                watchlist = await self.get_watchlist(
-                    StockIndexWatchlist, self.customer_id
-                )
+# TopEquityLosersQuotes20Consumer class
+class TopEquityLosersQuotes20Consumer(TopicConsumer):
+    # Attributes
+    topic_name = "topEquityLosersQuotes20"
 
-                # Get list of symbols
-                symbols = [item.symbol for item in watchlist]
+    # Method to get the topic arguments
+    def get_topic_args(self) -> tuple:
+        # Get values from the query parameters
+        return (self.query_params.get("stock_exchange", "NSE"),)
 
-                # Get the quotes
-                quotes = get_bookmarked_quotes(symbols)
 
-                # Send the quotes to the WebSocket client
-                await self.send(json.dumps(quotes))
+# BookmarkQuotes class
+class BookmarkQuotes(TopicConsumer):
+    # Method to subscribe to the topics
+    async def subscribe(self):
+        # Extract the customer_id from the URL
+        self.customer_id = self.scope["url_route"]["kwargs"]["customer_id"]
 
-                # Wait for 2.0 second before sending the next update
-                await anyio.sleep(2.0)
+        # Get the model only when needed, not at module level
+        StockIndexWatchlist = apps.get_model("dashboard", "StockIndexWatchlist")
 
-        # If any exception occurs
-        except Exception as e:
-            # Print the error
-            print(f"Error in send_quotes: {e}")
+        # Fetch the stock index watchlist for the customer
+        watchlist = await self.get_watchlist(StockIndexWatchlist, self.customer_id)
 
-            # Stop sending updates
-            self.keep_sending = False
+        # Subscribe to the quote topic of every bookmarked symbol, so that
+        # symbols followed by many users are only polled once
+        for item in watchlist:
+            await self.subscribe_topic("quote", item.symbol)
 
     # Static method to get watchlist
     @staticmethod
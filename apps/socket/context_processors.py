@@ -0,0 +1,17 @@
+# Imports
+from apps.socket.finders import PLOTLY_JS_PATH
+
+
+# Context processor for the plotly.js static path
+def plotly_js(request):
+    """Add the static path of plotly.js to the template context
+
+    Args:
+        request (HttpRequest): The request object
+
+    Returns:
+        dict: The context
+    """
+
+    # Return the context
+    return {"plotly_js": PLOTLY_JS_PATH}
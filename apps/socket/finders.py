@@ -0,0 +1,64 @@
+# Imports
+from pathlib import Path
+
+import plotly
+from django.contrib.staticfiles.finders import BaseFinder
+from django.core.files.storage import FileSystemStorage
+from plotly.offline import get_plotlyjs_version
+
+# Bundled plotly.js of the installed plotly package
+PLOTLY_JS_FILE = Path(plotly.__file__).parent / "package_data" / "plotly.min.js"
+
+# Static path of plotly.js, versioned so that it can be cached forever
+PLOTLY_JS_DIR = f"vendor/plotly/{get_plotlyjs_version()}"
+PLOTLY_JS_PATH = f"{PLOTLY_JS_DIR}/plotly.min.js"
+
+
+# PlotlyJsFinder class
+class PlotlyJsFinder(BaseFinder):
+    """Static files finder serving the plotly.js bundled with plotly
+
+    The charts are rendered without plotly.js, the pages load this file once
+    from the static storage instead.
+
+    Attributes:
+        storage (FileSystemStorage): Storage of the plotly package data
+    """
+
+    # Constructor
+    def __init__(self, *args, **kwargs):
+        # Call the parent constructor
+        super().__init__(*args, **kwargs)
+
+        # Storage of the file, collected under the versioned directory
+        self.storage = FileSystemStorage(location=str(PLOTLY_JS_FILE.parent))
+        self.storage.prefix = PLOTLY_JS_DIR
+
+    # Method to check the finder
+    def check(self, **kwargs):
+        # Nothing to configure
+        return []
+
+    # Method to find a static file
+    def find(self, path, all=False):
+        """Find the absolute path of a static file
+
+        Args:
+            path (str): The static path
+            all (bool, optional): Return a list of matches. Defaults to False.
+
+        Returns:
+            The absolute path, a list of paths if all is set, or no match
+        """
+
+        # If the path is not plotly.js
+        if path != PLOTLY_JS_PATH:
+            return [] if all else None
+
+        # Return the bundled file
+        return [str(PLOTLY_JS_FILE)] if all else str(PLOTLY_JS_FILE)
+
+    # Method to list the static files
+    def list(self, ignore_patterns):
+        # Only plotly.js, not the rest of the package data
+        yield PLOTLY_JS_FILE.name, self.storage
@@ -1,5 +1,7 @@
 # Imports
+from .async_helper import *
 from .candlestick_chart_helper import *
+from .chart_cache_helper import *
 from .index_quotes_helper import *
 from .quote_helper import *
 from .top_equity_gainers_helper import *
@@ -0,0 +1,28 @@
+# Imports
+from apps.socket.utils import to_async
+
+from .candlestick_chart_helper import generate_candlestick_chart
+from .chart_cache_helper import get_candlestick_chart_html
+from .index_quotes_helper import get_index_quotes
+from .quote_helper import get_bookmarked_quotes, get_quote
+from .top_equity_gainers_helper import (
+    get_top_equity_gainers_20_quotes,
+    get_top_equity_gainers_quotes,
+)
+from .top_equity_losers_helper import (
+    get_top_equity_losers_20_quotes,
+    get_top_equity_losers_quotes,
+)
+from .top_index_quotes_helper import get_top_index_quotes
+
+# Async versions of the helpers, running in the shared fetch executor
+aget_top_index_quotes = to_async(get_top_index_quotes)
+aget_index_quotes = to_async(get_index_quotes)
+aget_quote = to_async(get_quote)
+aget_bookmarked_quotes = to_async(get_bookmarked_quotes)
+aget_top_equity_gainers_quotes = to_async(get_top_equity_gainers_quotes)
+aget_top_equity_losers_quotes = to_async(get_top_equity_losers_quotes)
+aget_top_equity_gainers_20_quotes = to_async(get_top_equity_gainers_20_quotes)
+aget_top_equity_losers_20_quotes = to_async(get_top_equity_losers_20_quotes)
+agenerate_candlestick_chart = to_async(generate_candlestick_chart)
+aget_candlestick_chart_html = to_async(get_candlestick_chart_html)
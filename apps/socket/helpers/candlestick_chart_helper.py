@@ -1,11 +1,172 @@
 # Imports
-from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+import pandas as pd
 import plotly.graph_objects as go
-import yfinance as yf
+from django.conf import settings
 
 from apps.socket.helpers.chart_indicator_helpers import *
-from apps.socket.utils import fetch_ticker_data
+from apps.socket.utils import (
+    TTLCache,
+    bucket_size,
+    build_candle_hover_text,
+    downsample_line,
+    downsample_ohlc,
+    fetch_ticker_data,
+    get_executor,
+    get_ticker,
+    quote_cache,
+)
+
+# Indicator streams of the charts, kept while the charts are polled
+indicator_streams = TTLCache(maxsize=settings.INDICATOR_STREAM_MAX_ENTRIES)
+
+
+# Function to get the indicator stream of a chart
+def get_indicator_stream(
+    symbol: str, period: str, interval: str, name: str, params: Dict[str, Any]
+) -> IndicatorStream:
+    """Get the stream keeping an indicator of a chart up to date
+
+    Args:
+        symbol (str): Symbol of the chart
+        period (str): Period of the chart
+        interval (str): Interval of the chart
+        name (str): Name of the indicator
+        params (Dict[str, Any]): Parameters of the indicator
+
+    Returns:
+        IndicatorStream: The stream, created on the first call
+    """
+
+    # Get the stream of the chart, or create it
+    key = (symbol, period, interval, name, tuple(sorted(params.items())))
+    stream = indicator_streams.get(key, None)
+    if stream is None:
+        stream = IndicatorStream(name, **params)
+
+    # Keep the stream for another TTL
+    indicator_streams.set(key, stream, settings.INDICATOR_STREAM_TTL)
+
+    # Return the stream
+    return stream
+
+
+# Function to get an indicator of a chart
+def get_chart_indicator(
+    symbol: str,
+    period: str,
+    interval: str,
+    history_df: pd.DataFrame,
+    name: str,
+    params: Dict[str, Any],
+) -> IndicatorResult:
+    """Get an indicator of a chart, computed once per history
+
+    Args:
+        symbol (str): Symbol of the chart
+        period (str): Period of the chart
+        interval (str): Interval of the chart
+        history_df (pd.DataFrame): The history of the chart
+        name (str): Name of the indicator
+        params (Dict[str, Any]): Parameters of the indicator
+
+    Returns:
+        IndicatorResult: The indicator over the whole history
+    """
+
+    # Serve identical requests from the cache, else update the stream
+    return indicator_cache.get_or_compute(
+        symbol,
+        interval,
+        history_df,
+        name,
+        params,
+        lambda: get_indicator_stream(symbol, period, interval, name, params).update(
+            history_df
+        ),
+    )
+
+
+# Function to keep the zoomed window of a chart
+def select_chart_window(
+    history_df: pd.DataFrame,
+    results: List[IndicatorResult],
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+) -> Tuple[pd.DataFrame, List[IndicatorResult]]:
+    """Keep the bars and the indicator values between two timestamps
+
+    Naive timestamps, like the ranges of a zoomed chart, are taken in the
+    timezone of the history.
+
+    Args:
+        history_df (pd.DataFrame): The history of the chart
+        results (List[IndicatorResult]): The indicators of the history
+        start (Optional[str], optional): First timestamp. Defaults to None.
+        end (Optional[str], optional): Last timestamp. Defaults to None.
+
+    Returns:
+        Tuple[pd.DataFrame, List[IndicatorResult]]: The window of the history
+            and of the indicators
+    """
+
+    # If the whole history is shown
+    if not start and not end:
+        return history_df, results
+
+    # Dict to store the bounds of the window
+    bounds = {}
+
+    # For each bound
+    for name, value in (("start", start), ("end", end)):
+        # Skip the missing bound
+        if not value:
+            continue
+
+        # Parse the timestamp in the timezone of the history
+        timestamp = pd.Timestamp(value)
+        if timestamp.tzinfo is None and history_df.index.tz is not None:
+            timestamp = timestamp.tz_localize(history_df.index.tz)
+        bounds[name] = timestamp
+
+    # Select the bars of the window
+    mask = np.ones(len(history_df), dtype=bool)
+    if "start" in bounds:
+        mask &= history_df.index >= bounds["start"]
+    if "end" in bounds:
+        mask &= history_df.index <= bounds["end"]
+
+    # Return the window of the history and of the indicators
+    return history_df[mask], [
+        IndicatorResult(
+            result.spec,
+            result.params,
+            {key: values[mask] for key, values in result.values.items()},
+        )
+        for result in results
+    ]
+
+
+# Function to downsample an indicator
+def downsample_indicator(result: IndicatorResult, size: int) -> IndicatorResult:
+    """Downsample the lines of an indicator to the buckets of the chart
+
+    Args:
+        result (IndicatorResult): The indicator
+        size (int): The number of bars per bucket
+
+    Returns:
+        IndicatorResult: The indicator with the selected points of its lines
+    """
+
+    # Return the indicator with its downsampled lines
+    return IndicatorResult(
+        result.spec,
+        result.params,
+        {key: downsample_line(values, size) for key, values in result.values.items()},
+    )
 
 
 # Function to generate candlestick chart
@@ -15,26 +176,86 @@ def generate_candlestick_chart(
     interval: str = "5m",
     indicator: str = "none",
     height: int = 650,
+    max_points: Optional[int] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
 ) -> go.Figure:
-    """Generate a candlestick plot for the given stock symbol."""
+    """Generate a candlestick plot for the given stock symbol.
+
+    The indicator argument holds one or more indicators with their
+    parameters, for example "rsi:window=10,macd", see parse_indicators.
+
+    Histories longer than max_points, capped by the CHART_MAX_POINTS setting,
+    are drawn as OHLC buckets with downsampled indicator lines. A zoomed
+    window between start and end is drawn at full resolution when it fits.
+    """
 
     # Initialize the ticker
-    ticker = yf.Ticker(symbol)
+    ticker = get_ticker(symbol)
 
-    # Use ThreadPoolExecutor to fetch info and history concurrently
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        future_info = executor.submit(fetch_ticker_data, ticker, "info")
-        future_history = executor.submit(
-            fetch_ticker_data, ticker, "history", period, interval
-        )
+    # Use the shared upstream executor to fetch info and history concurrently,
+    # the info is served from the quote cache when fresh
+    executor = get_executor("upstream")
+    future_info = executor.submit(
+        quote_cache.get_or_fetch,
+        "info",
+        symbol,
+        lambda: fetch_ticker_data(ticker, "info"),
+    )
+    future_history = executor.submit(
+        fetch_ticker_data, ticker, "history", period, interval
+    )
 
-        # Wait for both futures to complete
-        info = future_info.result()
-        history_df = future_history.result()
+    # Wait for both futures to complete
+    info = future_info.result()
+    history_df = future_history.result()
 
     # Round the values to 2 decimal places
     history_df = history_df.round(2)
 
+    # Get every indicator of the whole history, computing the intermediate
+    # series they have in common once
+    with shared_intermediates(history_df):
+        results = [
+            get_chart_indicator(symbol, period, interval, history_df, name, params)
+            for name, params in parse_indicators(indicator)
+        ]
+
+    # Keep the zoomed window
+    history_df, results = select_chart_window(history_df, results, start, end)
+
+    # Aggregate the bars and the indicators that do not fit the chart
+    max_points = min(max_points or settings.CHART_MAX_POINTS, settings.CHART_MAX_POINTS)
+    size = bucket_size(len(history_df), max_points)
+    history_df = downsample_ohlc(history_df, size)
+    results = [downsample_indicator(result, size) for result in results]
+
+    # Return the figure
+    return build_candlestick_figure(
+        history_df, results, info.get("previousClose", None), height
+    )
+
+
+# Function to build the candlestick figure
+def build_candlestick_figure(
+    history_df: pd.DataFrame,
+    results: List[IndicatorResult],
+    previous_close: Optional[float] = None,
+    height: int = 650,
+) -> go.Figure:
+    """Build the candlestick figure of the bars and the indicators to draw
+
+    Args:
+        history_df (pd.DataFrame): The bars to draw
+        results (List[IndicatorResult]): The indicators to draw
+        previous_close (Optional[float], optional): The previous close line.
+            Defaults to None.
+        height (int, optional): Height of the chart. Defaults to 650.
+
+    Returns:
+        go.Figure: The figure
+    """
+
     # Create the candlestick plot
     fig = go.Figure(
         data=[
@@ -50,7 +271,6 @@ def generate_candlestick_chart(
     )
 
     # Add a horizontal line for the previous close
-    previous_close = info.get("previousClose", None)
     if previous_close:
         fig.add_shape(
             type="line",
@@ -77,58 +297,8 @@ def generate_candlestick_chart(
             xanchor="left",
         )
 
-    # Define a mapping of indicators to functions
-    indicator_functions = {
-        "sma": add_sma_indicator,
-        "ema": add_ema_indicator,
-        "wma": add_wma_indicator,
-        "dema": add_dema_indicator,
-        "tema": add_tema_indicator,
-        "trima": add_trima_indicator,
-        "kama": add_kama_indicator,
-        "mama": add_mama_indicator,
-        "t3": add_t3_indicator,
-        "macd": add_macd_indicator,
-        "stoch": add_stochastic_indicator,
-        "stochf": add_stochastic_fast_indicator,
-        "rsi": add_rsi_indicator,
-        "stochrsi": add_stochastic_rsi_indicator,
-        "willr": add_williams_r_indicator,
-        "adxr": add_adxr_indicator,
-        "apo": add_apo_indicator,
-        "ppo": add_ppo_indicator,
-        "mom": add_mom_indicator,
-        "bop": add_bop_indicator,
-        "cci": add_cci_indicator,
-        "cmo": add_cmo_indicator,
-        "roc": add_roc_indicator,
-        "rocr": add_rocr_indicator,
-        "aroon": add_aroon_indicator,
-        "aroonosc": add_aroonosc_indicator,
-        "trix": add_trix_indicator,
-        "ultosc": add_ultosc_indicator,
-        "dx": add_dx_indicator,
-        "minus_di": add_minus_di_indicator,
-        "plus_di": add_plus_di_indicator,
-        "minus_dm": add_minus_dm_indicator,
-        "plus_dm": add_plus_dm_indicator,
-        "bbands": add_bbands_indicator,
-        "midpoint": add_midpoint_indicator,
-        "midprice": add_midprice_indicator,
-        "sar": add_sar_indicator,
-        "trange": add_trange_indicator,
-        "atr": add_atr_indicator,
-        "natr": add_natr_indicator,
-        "ad": add_chaikin_ad_indicator,
-        "adosc": add_adosc_indicator,
-        "obv": add_price_based_obv_indicator,
-        "ht_trendline": add_ht_trendline,
-    }
-
-    # If the indicator is in the mapping
-    if indicator in indicator_functions:
-        # Call the function to add the indicator to the figure
-        fig = indicator_functions[indicator](fig, history_df)
+    # Add the indicators to the figure
+    fig = render_indicators(fig, results)
 
     # Update the layout with Tailwind bg-base-100 color
     fig.update_layout(
@@ -159,21 +329,8 @@ def generate_candlestick_chart(
         height=height,
     )
 
-    # Update the hover labels to be capitalized
-    fig.data[0].text = [
-        f"Date: {x}<br>"
-        + f"Open: {o}<br>"
-        + f"High: {h}<br>"
-        + f"Low: {l}<br>"
-        + f"Close: {c}"
-        for x, o, h, l, c in zip(
-            history_df.index,
-            history_df["Open"],
-            history_df["High"],
-            history_df["Low"],
-            history_df["Close"],
-        )
-    ]
+    # Update the hover labels to be capitalized, formatted column by column
+    fig.data[0].text = build_candle_hover_text(history_df)
     fig.data[0].hoverinfo = "text"
 
     # Return the figure
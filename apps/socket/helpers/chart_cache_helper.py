@@ -0,0 +1,232 @@
+# Imports
+import datetime
+import time
+from typing import Iterable, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from apps.socket.constants import TOP_INDICES
+from apps.socket.utils import (
+    MISSING,
+    TTLCache,
+    get_executor,
+    interval_minutes,
+    is_market_open,
+    singleflight,
+)
+
+from .candlestick_chart_helper import generate_candlestick_chart
+
+# Rendered charts of the HTML views
+chart_html_cache = TTLCache(maxsize=settings.CHART_CACHE_MAX_ENTRIES)
+
+# Session hours of the market
+SESSION_START = datetime.time(9, 15)
+SESSION_END = datetime.time(15, 30)
+
+
+# Function to get the TTL of a rendered chart
+def bar_aligned_ttl(interval: str, now: Optional[datetime.datetime] = None) -> float:
+    """Get the seconds until the last bar of a chart closes
+
+    Intraday bars are counted from the session start, daily and longer bars
+    close with the session. While the market is closed the chart only
+    changes on corrections, so the closed TTL is used.
+
+    Args:
+        interval (str): Interval of the chart
+        now (Optional[datetime.datetime], optional): The current local time.
+            Defaults to None.
+
+    Returns:
+        float: Time to live in seconds, at least one second
+    """
+
+    # If the market is closed
+    if not is_market_open():
+        return float(settings.CHART_CACHE_CLOSED_TTL)
+
+    # Get the current time and the session bounds
+    now = now or timezone.localtime()
+    session_start = now.replace(
+        hour=SESSION_START.hour, minute=SESSION_START.minute, second=0, microsecond=0
+    )
+    session_end = now.replace(
+        hour=SESSION_END.hour, minute=SESSION_END.minute, second=0, microsecond=0
+    )
+    until_close = (session_end - now).total_seconds()
+
+    # Daily and longer bars close with the session
+    minutes = interval_minutes(interval)
+    if minutes is None:
+        return max(until_close, 1.0)
+
+    # Length of the intraday bars
+    step = minutes * 60
+
+    # Seconds until the next bar, or the session end
+    elapsed = (now - session_start).total_seconds()
+    return max(min(step - elapsed % step, until_close), 1.0)
+
+
+# Function to build the cache key of a rendered chart
+def chart_html_key(
+    symbol: str, period: str, interval: str, indicator: str, height: int
+) -> str:
+    # Return the key
+    return f"chart:html:{symbol}:{period}:{interval}:{indicator}:{height}"
+
+
+# Function to render a chart and cache it
+def render_candlestick_chart_html(
+    symbol: str,
+    period: str = "1d",
+    interval: str = "5m",
+    indicator: str = "none",
+    height: int = 650,
+) -> str:
+    """Render the candlestick chart of the HTML views and cache it until its
+    last bar closes
+
+    Args:
+        symbol (str): Symbol of the chart
+        period (str, optional): Period of the chart. Defaults to "1d".
+        interval (str, optional): Interval of the chart. Defaults to "5m".
+        indicator (str, optional): Indicators of the chart. Defaults to "none".
+        height (int, optional): Height of the chart. Defaults to 650.
+
+    Returns:
+        str: The chart HTML
+    """
+
+    # Render the chart div, plotly.js is served as a static file
+    html = generate_candlestick_chart(
+        symbol, period, interval, indicator, height
+    ).to_html(include_plotlyjs=False, full_html=False)
+
+    # Cache the chart in both levels until its last bar closes
+    key = chart_html_key(symbol, period, interval, indicator, height)
+    ttl = bar_aligned_ttl(interval)
+    chart_html_cache.set(key, html, ttl)
+    try:
+        cache.set(key, (time.time() + ttl, html), ttl)
+
+    # If the shared cache is unavailable
+    except Exception:
+        pass
+
+    # Return the chart
+    return html
+
+
+# Function to load a chart missing from the in-process cache
+def load_candlestick_chart_html(
+    symbol: str, period: str, interval: str, indicator: str, height: int
+) -> str:
+    """Load a rendered chart from the shared cache or render it
+
+    Args:
+        symbol (str): Symbol of the chart
+        period (str): Period of the chart
+        interval (str): Interval of the chart
+        indicator (str): Indicators of the chart
+        height (int): Height of the chart
+
+    Returns:
+        str: The chart HTML
+    """
+
+    # Look in the shared cache
+    key = chart_html_key(symbol, period, interval, indicator, height)
+    try:
+        item = cache.get(key)
+
+    # If the shared cache is unavailable
+    except Exception:
+        item = None
+
+    # If the chart is cached and fresh
+    if item is not None and item[0] > time.time():
+        # Keep it locally for the rest of its lifetime
+        chart_html_cache.set(key, item[1], item[0] - time.time())
+        return item[1]
+
+    # Render the chart
+    return render_candlestick_chart_html(symbol, period, interval, indicator, height)
+
+
+# Function to get a rendered chart
+def get_candlestick_chart_html(
+    symbol: str,
+    period: str = "1d",
+    interval: str = "5m",
+    indicator: str = "none",
+    height: int = 650,
+) -> str:
+    """Get the candlestick chart of the HTML views, rendered once per bar
+
+    Args:
+        symbol (str): Symbol of the chart
+        period (str, optional): Period of the chart. Defaults to "1d".
+        interval (str, optional): Interval of the chart. Defaults to "5m".
+        indicator (str, optional): Indicators of the chart. Defaults to "none".
+        height (int, optional): Height of the chart. Defaults to 650.
+
+    Returns:
+        str: The chart HTML
+    """
+
+    # Look in the in-process cache
+    key = chart_html_key(symbol, period, interval, indicator, height)
+    html = chart_html_cache.get(key)
+    if html is not MISSING:
+        return html
+
+    # Load the chart once for all the concurrent callers of every worker
+    return singleflight.do(
+        key,
+        lambda: load_candlestick_chart_html(
+            symbol, period, interval, indicator, height
+        ),
+        shared=True,
+    )
+
+
+# Function to pre-warm the charts of the top indices
+def warm_candlestick_charts(symbols: Iterable[str] = TOP_INDICES) -> List[str]:
+    """Render the default charts of the symbols ahead of the page views
+
+    Args:
+        symbols (Iterable[str], optional): The symbols. Defaults to TOP_INDICES.
+
+    Returns:
+        List[str]: The symbols whose chart was rendered
+    """
+
+    # Render the charts concurrently
+    executor = get_executor("fetch")
+    futures = {
+        symbol: executor.submit(render_candlestick_chart_html, symbol)
+        for symbol in symbols
+    }
+
+    # List to store the rendered symbols
+    rendered = []
+
+    # For each chart
+    for symbol, future in futures.items():
+        # Try
+        try:
+            # Wait for the chart
+            future.result()
+            rendered.append(symbol)
+
+        # If any exception occurs
+        except Exception as e:
+            # Print the error
+            print(f"Error warming the chart of {symbol}: {e}")
+
+    # Return the rendered symbols
+    return rendered
@@ -8,6 +8,11 @@ from apps.socket.helpers.chart_indicator_helpers.aroonosc import add_aroonosc_in
 from apps.socket.helpers.chart_indicator_helpers.atr import add_atr_indicator
 from apps.socket.helpers.chart_indicator_helpers.bbands import add_bbands_indicator
 from apps.socket.helpers.chart_indicator_helpers.bop import add_bop_indicator
+from apps.socket.helpers.chart_indicator_helpers.cache import (
+    IndicatorCache,
+    history_fingerprint,
+    indicator_cache,
+)
 from apps.socket.helpers.chart_indicator_helpers.cci import add_cci_indicator
 from apps.socket.helpers.chart_indicator_helpers.cmo import add_cmo_indicator
 from apps.socket.helpers.chart_indicator_helpers.dema import add_dema_indicator
@@ -29,10 +34,31 @@ from apps.socket.helpers.chart_indicator_helpers.obv import (
 from apps.socket.helpers.chart_indicator_helpers.plus_di import add_plus_di_indicator
 from apps.socket.helpers.chart_indicator_helpers.plus_dm import add_plus_dm_indicator
 from apps.socket.helpers.chart_indicator_helpers.ppo import add_ppo_indicator
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    INDICATOR_REGISTRY,
+    IndicatorResult,
+    IndicatorSeries,
+    IndicatorSpec,
+    compute_indicator,
+    evaluate_indicators,
+    format_indicators,
+    parse_indicators,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import (
+    add_indicator,
+    render_indicator,
+    render_indicators,
+)
 from apps.socket.helpers.chart_indicator_helpers.roc import add_roc_indicator
 from apps.socket.helpers.chart_indicator_helpers.rocr import add_rocr_indicator
 from apps.socket.helpers.chart_indicator_helpers.rsi import add_rsi_indicator
 from apps.socket.helpers.chart_indicator_helpers.sar import add_sar_indicator
+from apps.socket.helpers.chart_indicator_helpers.shared import (
+    shared,
+    shared_intermediates,
+)
 from apps.socket.helpers.chart_indicator_helpers.sma import add_sma_indicator
 from apps.socket.helpers.chart_indicator_helpers.stoch import add_stochastic_indicator
 from apps.socket.helpers.chart_indicator_helpers.stochf import (
@@ -41,6 +67,11 @@ from apps.socket.helpers.chart_indicator_helpers.stochf import (
 from apps.socket.helpers.chart_indicator_helpers.stochrsi import (
     add_stochastic_rsi_indicator,
 )
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    IndicatorStream,
+    StreamingIndicator,
+)
 from apps.socket.helpers.chart_indicator_helpers.t3 import add_t3_indicator
 from apps.socket.helpers.chart_indicator_helpers.tema import add_tema_indicator
 from apps.socket.helpers.chart_indicator_helpers.trange import add_trange_indicator
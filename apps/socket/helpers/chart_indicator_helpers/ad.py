@@ -1,9 +1,75 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    CumulativeSum,
+    StreamingIndicator,
+)
+
 
 # Function for Chaikin-like indicator without volume
+@register_indicator(
+    "ad",
+    series=[
+        IndicatorSeries("ad", "Chaikin A/D Approx (No Volume)", "#FF8C00"),
+    ],
+    axis_title="Chaikin A/D Approx (No Volume)",
+)
+def compute_ad(history_df: pd.DataFrame) -> Dict[str, pd.Series]:
+    """Calculate a price-movement-based Chaikin-like indicator.
+
+    This is a workaround when volume data is not available.
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the modified Chaikin A/D-like indicator by key.
+    """
+
+    # Calculate the price range multiplier, a flat bar counts as a range of 1
+    multiplier = (2 * history_df["Close"] - history_df["Low"] - history_df["High"]) / (
+        history_df["High"] - history_df["Low"]
+    ).replace(0, 1)
+
+    # Use the price range as a pseudo volume
+    pseudo_volume = history_df["High"] - history_df["Low"]
+
+    # Return the accumulated flow
+    return {"ad": (multiplier * pseudo_volume).cumsum()}
+
+
+# AdStream class
+@register_stream("ad")
+class AdStream(StreamingIndicator):
+    """Incremental Chaikin A/D line without volume, matching compute_ad"""
+
+    # Constructor
+    def __init__(self):
+        # Operators
+        self.ad = CumulativeSum()
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Calculate the money flow multiplier and the pseudo volume
+        pseudo_volume = bar.high - bar.low
+        multiplier = (2 * bar.close - bar.low - bar.high) / (pseudo_volume or 1)
+
+        # Return the accumulated money flow
+        return {"ad": self.ad.update(multiplier * pseudo_volume, revise)}
+
+
+# Function to add the modified Chaikin A/D-like indicator to a plot
 def add_chaikin_ad_indicator(fig: go.Figure, history_df: pd.DataFrame) -> go.Figure:
     """Add a price-movement-based Chaikin-like indicator to the given plot.
 
@@ -17,42 +83,5 @@ def add_chaikin_ad_indicator(fig: go.Figure, history_df: pd.DataFrame) -> go.Fig
         go.Figure: The plot with the modified Chaikin A/D-like indicator added.
     """
 
-    # Calculate Price Range Multiplier
-    history_df["PriceRangeMultiplier"] = (
-        2 * history_df["Close"] - history_df["Low"] - history_df["High"]
-    ) / (history_df["High"] - history_df["Low"]).replace(0, 1)
-
-    # Estimate "pseudo-volume" as the range between high and low prices
-    history_df["PseudoVolume"] = history_df["High"] - history_df["Low"]
-
-    # Calculate the price-movement-based Chaikin A/D approximation
-    history_df["ChaikinAD_NoVolume"] = (
-        history_df["PriceRangeMultiplier"] * history_df["PseudoVolume"]
-    ).cumsum()
-
-    # Add the trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["ChaikinAD_NoVolume"],
-            mode="lines",
-            line=dict(color="#FF8C00", width=2),
-            name="Chaikin A/D Approx (No Volume)",
-            yaxis="y2",
-        )
-    )
-
-    # Update layout for secondary Y-axis
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="Chaikin A/D Approx (No Volume)",
-            overlaying="y",
-            side="right",
-        ),
-    )
-
-    return fig
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "ad")
@@ -1,9 +1,80 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.ad import AdStream, compute_ad
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    Ema,
+    StreamingIndicator,
+)
+
 
 # Function to calculate and plot Chaikin A/D Oscillator (ADOSC) without volume
+@register_indicator(
+    "adosc",
+    series=[
+        IndicatorSeries("adosc", "ADOSC ({short_period}, {long_period})", "#FF1493"),
+    ],
+    axis_title="Chaikin A/D Oscillator (No Volume)",
+)
+def compute_adosc(
+    history_df: pd.DataFrame, short_period: int = 3, long_period: int = 10
+) -> Dict[str, pd.Series]:
+    """Calculate the Chaikin A/D Oscillator (ADOSC) approximation (without volume).
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        short_period (int, optional): The short period EMA for ADOSC calculation. Defaults to 3.
+        long_period (int, optional): The long period EMA for ADOSC calculation. Defaults to 10.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the ADOSC by key.
+    """
+
+    # Calculate the Chaikin A/D line without volume
+    ad = compute_ad(history_df)["ad"]
+
+    # Return the difference of the short and long period EMAs of the A/D line
+    return {
+        "adosc": ad.ewm(span=short_period, adjust=False).mean()
+        - ad.ewm(span=long_period, adjust=False).mean()
+    }
+
+
+# AdoscStream class
+@register_stream("adosc")
+class AdoscStream(StreamingIndicator):
+    """Incremental Chaikin A/D Oscillator (ADOSC) without volume, matching compute_adosc"""
+
+    # Constructor
+    def __init__(self, short_period: int = 3, long_period: int = 10):
+        # Operators
+        self.ad = AdStream()
+        self.short_ema = Ema(short_period)
+        self.long_ema = Ema(long_period)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Calculate the Chaikin A/D line
+        ad = self.ad.update(bar, revise)["ad"]
+
+        # Return the difference of the EMAs
+        return {
+            "adosc": self.short_ema.update(ad, revise)
+            - self.long_ema.update(ad, revise)
+        }
+
+
+# Function to add the ADOSC to a plot
 def add_adosc_indicator(
     fig: go.Figure,
     history_df: pd.DataFrame,
@@ -22,48 +93,7 @@ def add_adosc_indicator(
         go.Figure: The plot with ADOSC approximation added.
     """
 
-    # Calculate Price Range Multiplier (Money Flow Multiplier approximation)
-    history_df["PriceRangeMultiplier"] = (
-        2 * history_df["Close"] - history_df["Low"] - history_df["High"]
-    ) / (history_df["High"] - history_df["Low"]).replace(0, 1)
-
-    # Use price range as a pseudo-volume approximation
-    history_df["PseudoVolume"] = history_df["High"] - history_df["Low"]
-
-    # Calculate Chaikin A/D approximation
-    history_df["ChaikinAD_NoVolume"] = (
-        history_df["PriceRangeMultiplier"] * history_df["PseudoVolume"]
-    ).cumsum()
-
-    # Calculate short and long period EMAs for ADOSC
-    history_df["ADOSC"] = (
-        history_df["ChaikinAD_NoVolume"].ewm(span=short_period, adjust=False).mean()
-        - history_df["ChaikinAD_NoVolume"].ewm(span=long_period, adjust=False).mean()
-    )
-
-    # Add ADOSC trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["ADOSC"],
-            mode="lines",
-            line=dict(color="#FF1493", width=2),
-            name=f"ADOSC ({short_period}, {long_period})",
-            yaxis="y2",
-        )
+    # Compute and render the indicator
+    return add_indicator(
+        fig, history_df, "adosc", short_period=short_period, long_period=long_period
     )
-
-    # Update layout for secondary Y-axis
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="Chaikin A/D Oscillator (No Volume)",
-            overlaying="y",
-            side="right",
-        ),
-    )
-
-    return fig
@@ -1,100 +1,133 @@
 # Imports
+from typing import Dict
+
 import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.atr import compute_atr
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    Lag,
+    RollingMean,
+    StreamingIndicator,
+    divide,
+    nanmax,
+)
+
 
 # Function to calculate the ADXR Indicator
-def add_adxr_indicator(
-    fig: go.Figure, history_df: pd.DataFrame, window: int = 14
-) -> go.Figure:
-    """Add the Average Directional Movement Rating (ADXR) indicator to the given plot.
+@register_indicator(
+    "adxr",
+    series=[
+        IndicatorSeries("adx", "ADX {window}", "#1f77b4", dash="dot"),
+        IndicatorSeries("adxr", "ADXR {window}", "#FFA500"),
+    ],
+    axis_title="ADX / ADXR",
+)
+def compute_adxr(history_df: pd.DataFrame, window: int = 14) -> Dict[str, pd.Series]:
+    """Calculate the Average Directional Movement Rating (ADXR) indicator.
 
     Args:
-        fig (go.Figure): The plot to which the indicator will be added.
         history_df (pd.DataFrame): The historical stock data.
         window (int, optional): The window size for calculating the ADX and ADXR. Defaults to 14.
 
     Returns:
-        go.Figure: The plot with the ADXR indicator added.
+        Dict[str, pd.Series]: The series of the ADXR indicator by key.
     """
 
-    # Calculate True Range (TR)
-    history_df["H-L"] = history_df["High"] - history_df["Low"]
-    history_df["H-PC"] = abs(history_df["High"] - history_df["Close"].shift(1))
-    history_df["L-PC"] = abs(history_df["Low"] - history_df["Close"].shift(1))
-    history_df["TR"] = history_df[["H-L", "H-PC", "L-PC"]].max(axis=1)
-
     # Calculate +DM and -DM
-    history_df["+DM"] = np.where(
-        (history_df["High"].diff() > history_df["Low"].diff())
-        & (history_df["High"].diff() > 0),
-        history_df["High"].diff(),
-        0,
+    high_diff = history_df["High"].diff()
+    low_diff = history_df["Low"].diff()
+    plus_dm = pd.Series(
+        np.where((high_diff > low_diff) & (high_diff > 0), high_diff, 0),
+        index=history_df.index,
     )
-    history_df["-DM"] = np.where(
-        (history_df["Low"].diff() > history_df["High"].diff())
-        & (history_df["Low"].diff() > 0),
-        -history_df["Low"].diff(),
-        0,
+    minus_dm = pd.Series(
+        np.where((low_diff > high_diff) & (low_diff > 0), -low_diff, 0),
+        index=history_df.index,
     )
 
-    # Smooth TR, +DM, and -DM
-    history_df["TR_smoothed"] = history_df["TR"].rolling(window).mean()
-    history_df["+DM_smoothed"] = history_df["+DM"].rolling(window).mean()
-    history_df["-DM_smoothed"] = history_df["-DM"].rolling(window).mean()
+    # Smooth TR, the ATR shared with the ATR indicators
+    tr_smoothed = compute_atr(history_df, window)["atr"]
 
     # Calculate +DI and -DI
-    history_df["+DI"] = 100 * (history_df["+DM_smoothed"] / history_df["TR_smoothed"])
-    history_df["-DI"] = 100 * (history_df["-DM_smoothed"] / history_df["TR_smoothed"])
+    plus_di = 100 * (plus_dm.rolling(window).mean() / tr_smoothed)
+    minus_di = 100 * (minus_dm.rolling(window).mean() / tr_smoothed)
 
     # Calculate DX and ADX
-    history_df["DX"] = (
-        100
-        * abs(history_df["+DI"] - history_df["-DI"])
-        / (history_df["+DI"] + history_df["-DI"])
-    )
-    history_df["ADX"] = history_df["DX"].rolling(window).mean()
-
-    # Calculate ADXR (average of current and past ADX values)
-    history_df["ADXR"] = (history_df["ADX"] + history_df["ADX"].shift(window)) / 2
-
-    # Add ADX trace to the plot for reference
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["ADX"],
-            mode="lines",
-            line=dict(color="#1f77b4", width=2, dash="dot"),
-            name=f"ADX {window}",
-            yaxis="y2",
-        )
-    )
+    dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
+    adx = dx.rolling(window).mean()
+
+    # Return ADX and ADXR (average of current and past ADX values)
+    return {"adx": adx, "adxr": (adx + adx.shift(window)) / 2}
+
 
-    # Add ADXR trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["ADXR"],
-            mode="lines",
-            line=dict(color="#FFA500", width=2),
-            name=f"ADXR {window}",
-            yaxis="y2",
+# AdxrStream class
+@register_stream("adxr")
+class AdxrStream(StreamingIndicator):
+    """Incremental ADX and ADXR, matching compute_adxr"""
+
+    # Constructor
+    def __init__(self, window: int = 14):
+        # Operators
+        self.previous_close = Lag()
+        self.previous_high = Lag()
+        self.previous_low = Lag()
+        self.tr = RollingMean(window)
+        self.plus_dm = RollingMean(window)
+        self.minus_dm = RollingMean(window)
+        self.adx = RollingMean(window)
+        self.previous_adx = Lag(window)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Calculate the True Range (TR)
+        previous_close = self.previous_close.update(bar.close, revise)
+        tr = nanmax(
+            nanmax(bar.high - bar.low, abs(bar.high - previous_close)),
+            abs(bar.low - previous_close),
         )
-    )
 
-    # Update layout for visibility
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="ADX / ADXR",
-            overlaying="y",
-            side="right",
-        ),
-    )
+        # Calculate the directional movements
+        high_diff = bar.high - self.previous_high.update(bar.high, revise)
+        low_diff = bar.low - self.previous_low.update(bar.low, revise)
+        plus_dm = high_diff if high_diff > low_diff and high_diff > 0 else 0.0
+        minus_dm = -low_diff if low_diff > high_diff and low_diff > 0 else 0.0
+
+        # Calculate the smoothed TR, +DI and -DI
+        tr_smoothed = self.tr.update(tr, revise)
+        plus_di = 100 * divide(self.plus_dm.update(plus_dm, revise), tr_smoothed)
+        minus_di = 100 * divide(self.minus_dm.update(minus_dm, revise), tr_smoothed)
+
+        # Calculate the DX and the ADX
+        dx = divide(100 * abs(plus_di - minus_di), plus_di + minus_di)
+        adx = self.adx.update(dx, revise)
+
+        # Return the ADX and the ADXR
+        return {"adx": adx, "adxr": (adx + self.previous_adx.update(adx, revise)) / 2}
+
+
+# Function to add the ADXR indicator to a plot
+def add_adxr_indicator(
+    fig: go.Figure, history_df: pd.DataFrame, window: int = 14
+) -> go.Figure:
+    """Add the Average Directional Movement Rating (ADXR) indicator to the given plot.
+
+    Args:
+        fig (go.Figure): The plot to which the indicator will be added.
+        history_df (pd.DataFrame): The historical stock data.
+        window (int, optional): The window size for calculating the ADX and ADXR. Defaults to 14.
+
+    Returns:
+        go.Figure: The plot with the ADXR indicator added.
+    """
 
-    # Return the figure
-    return fig
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "adxr", window=window)
@@ -1,9 +1,74 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.shared import close_ema
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    Ema,
+    StreamingIndicator,
+)
+
 
 # Function to calculate the APO (Absolute Price Oscillator) Indicator
+@register_indicator(
+    "apo",
+    series=[
+        IndicatorSeries("apo", "APO ({fast_period}, {slow_period})", "#FFA500"),
+    ],
+    axis_title="APO",
+)
+def compute_apo(
+    history_df: pd.DataFrame, fast_period: int = 12, slow_period: int = 26
+) -> Dict[str, pd.Series]:
+    """Calculate the Absolute Price Oscillator (APO) indicator.
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        fast_period (int, optional): The period for the fast EMA. Defaults to 12.
+        slow_period (int, optional): The period for the slow EMA. Defaults to 26.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the APO indicator by key.
+    """
+
+    # Calculate the fast and slow EMAs
+    ema_fast = close_ema(history_df, fast_period)
+    ema_slow = close_ema(history_df, slow_period)
+
+    # Return the APO as the difference of the EMAs
+    return {"apo": ema_fast - ema_slow}
+
+
+# ApoStream class
+@register_stream("apo")
+class ApoStream(StreamingIndicator):
+    """Incremental Absolute Price Oscillator (APO), matching compute_apo"""
+
+    # Constructor
+    def __init__(self, fast_period: int = 12, slow_period: int = 26):
+        # Operators
+        self.fast_ema = Ema(fast_period)
+        self.slow_ema = Ema(slow_period)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Return the difference of the EMAs
+        return {
+            "apo": self.fast_ema.update(bar.close, revise)
+            - self.slow_ema.update(bar.close, revise)
+        }
+
+
+# Function to add the APO indicator to a plot
 def add_apo_indicator(
     fig: go.Figure,
     history_df: pd.DataFrame,
@@ -22,41 +87,7 @@ def add_apo_indicator(
         go.Figure: The plot with the APO indicator added.
     """
 
-    # Calculate the fast and slow EMAs
-    history_df["EMA_Fast"] = (
-        history_df["Close"].ewm(span=fast_period, adjust=False).mean()
+    # Compute and render the indicator
+    return add_indicator(
+        fig, history_df, "apo", fast_period=fast_period, slow_period=slow_period
     )
-    history_df["EMA_Slow"] = (
-        history_df["Close"].ewm(span=slow_period, adjust=False).mean()
-    )
-
-    # Calculate the APO
-    history_df["APO"] = history_df["EMA_Fast"] - history_df["EMA_Slow"]
-
-    # Add APO trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["APO"],
-            mode="lines",
-            line=dict(color="#FFA500", width=2),
-            name=f"APO ({fast_period}, {slow_period})",
-            yaxis="y2",
-        )
-    )
-
-    # Update layout for visibility
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="APO",
-            overlaying="y",
-            side="right",
-        ),
-    )
-
-    # Return the figure
-    return fig
@@ -1,9 +1,81 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers import kernels
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    RollingExtremeAge,
+    StreamingIndicator,
+)
+
 
 # Function to calculate the Aroon Indicator
+@register_indicator(
+    "aroon",
+    series=[
+        IndicatorSeries("up", "Aroon Up ({period})", "#1E90FF"),
+        IndicatorSeries("down", "Aroon Down ({period})", "#FF6347"),
+    ],
+    axis_title="Aroon Indicator",
+)
+def compute_aroon(history_df: pd.DataFrame, period: int = 14) -> Dict[str, pd.Series]:
+    """Calculate the Aroon Indicator.
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        period (int, optional): The lookback period for calculating the Aroon. Defaults to 14.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the Aroon indicator by key.
+    """
+
+    # Get the number of bars since the highest and the lowest close
+    high_age, low_age = kernels.rolling_extreme_age(
+        history_df["Close"].to_numpy(), period
+    )
+
+    # Return Aroon Up and Aroon Down
+    return {
+        "up": pd.Series(100 * (period - high_age) / period, index=history_df.index),
+        "down": pd.Series(100 * (period - low_age) / period, index=history_df.index),
+    }
+
+
+# AroonStream class
+@register_stream("aroon")
+class AroonStream(StreamingIndicator):
+    """Incremental Aroon indicator, matching compute_aroon"""
+
+    # Constructor
+    def __init__(self, period: int = 14):
+        # Operators
+        self.period = period
+        self.high_age = RollingExtremeAge(period)
+        self.low_age = RollingExtremeAge(period, largest=False)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Get the number of bars since the highest and the lowest close
+        high_age = self.high_age.update(bar.close, revise)
+        low_age = self.low_age.update(bar.close, revise)
+
+        # Return the Aroon Up and Aroon Down
+        return {
+            "up": 100 * (self.period - high_age) / self.period,
+            "down": 100 * (self.period - low_age) / self.period,
+        }
+
+
+# Function to add the Aroon indicator to a plot
 def add_aroon_indicator(
     fig: go.Figure, history_df: pd.DataFrame, period: int = 14
 ) -> go.Figure:
@@ -18,64 +90,5 @@ def add_aroon_indicator(
         go.Figure: The plot with the Aroon indicator added.
     """
 
-    # Calculate Aroon Up and Aroon Down
-    history_df["Aroon Up"] = (
-        100
-        * (
-            period
-            - history_df["Close"]
-            .rolling(window=period)
-            .apply(lambda x: x[::-1].argmax(), raw=False)
-        )
-        / period
-    )
-    history_df["Aroon Down"] = (
-        100
-        * (
-            period
-            - history_df["Close"]
-            .rolling(window=period)
-            .apply(lambda x: x[::-1].argmin(), raw=False)
-        )
-        / period
-    )
-
-    # Add Aroon Up trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["Aroon Up"],
-            mode="lines",
-            line=dict(color="#1E90FF", width=2),
-            name=f"Aroon Up ({period})",
-            yaxis="y2",
-        )
-    )
-
-    # Add Aroon Down trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["Aroon Down"],
-            mode="lines",
-            line=dict(color="#FF6347", width=2),
-            name=f"Aroon Down ({period})",
-            yaxis="y2",
-        )
-    )
-
-    # Update layout to add secondary Y-axis for Aroon
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="Aroon Indicator",
-            overlaying="y",
-            side="right",
-        ),
-    )
-
-    # Return the figure
-    return fig
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "aroon", period=period)
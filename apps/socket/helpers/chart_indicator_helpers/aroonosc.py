@@ -1,9 +1,70 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.aroon import AroonStream, compute_aroon
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    StreamingIndicator,
+)
+
 
 # Function to calculate the Aroon Oscillator
+@register_indicator(
+    "aroonosc",
+    series=[
+        IndicatorSeries("oscillator", "Aroon Oscillator ({period})", "#FF8C00"),
+    ],
+    axis_title="Aroon Oscillator",
+)
+def compute_aroonosc(
+    history_df: pd.DataFrame, period: int = 14
+) -> Dict[str, pd.Series]:
+    """Calculate the Aroon Oscillator (AroonOsc) indicator.
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        period (int, optional): The lookback period for calculating the Aroon Oscillator. Defaults to 14.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the Aroon Oscillator indicator by key.
+    """
+
+    # Calculate Aroon Up and Aroon Down
+    aroon = compute_aroon(history_df, period)
+
+    # Return the Aroon Oscillator
+    return {"oscillator": aroon["up"] - aroon["down"]}
+
+
+# AroonoscStream class
+@register_stream("aroonosc")
+class AroonoscStream(StreamingIndicator):
+    """Incremental Aroon Oscillator, matching compute_aroonosc"""
+
+    # Constructor
+    def __init__(self, period: int = 14):
+        # Operators
+        self.aroon = AroonStream(period)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Calculate the Aroon Up and Aroon Down
+        aroon = self.aroon.update(bar, revise)
+
+        # Return the oscillator
+        return {"oscillator": aroon["up"] - aroon["down"]}
+
+
+# Function to add the Aroon Oscillator indicator to a plot
 def add_aroonosc_indicator(
     fig: go.Figure, history_df: pd.DataFrame, period: int = 14
 ) -> go.Figure:
@@ -18,58 +79,5 @@ def add_aroonosc_indicator(
         go.Figure: The plot with the Aroon Oscillator indicator added.
     """
 
-    # Calculate Aroon Up and Aroon Down
-    history_df["Aroon Up"] = (
-        100
-        * (
-            period
-            - history_df["Close"]
-            .rolling(window=period)
-            .apply(lambda x: x[::-1].argmax(), raw=False)
-        )
-        / period
-    )
-    history_df["Aroon Down"] = (
-        100
-        * (
-            period
-            - history_df["Close"]
-            .rolling(window=period)
-            .apply(lambda x: x[::-1].argmin(), raw=False)
-        )
-        / period
-    )
-
-    # Calculate Aroon Oscillator
-    history_df["Aroon Oscillator"] = history_df["Aroon Up"] - history_df["Aroon Down"]
-
-    # Define unique color for Aroon Oscillator line
-    aroon_osc_color = "#FF8C00"  # Dark Orange
-
-    # Add Aroon Oscillator trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["Aroon Oscillator"],
-            mode="lines",
-            line=dict(color=aroon_osc_color, width=2),
-            name=f"Aroon Oscillator ({period})",
-            yaxis="y2",
-        )
-    )
-
-    # Update layout to add secondary Y-axis for Aroon Oscillator
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="Aroon Oscillator",
-            overlaying="y",
-            side="right",
-        ),
-    )
-
-    # Return the figure
-    return fig
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "aroonosc", period=period)
@@ -1,9 +1,72 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    RollingMean,
+    StreamingIndicator,
+)
+from apps.socket.helpers.chart_indicator_helpers.trange import (
+    TrangeStream,
+    compute_trange,
+)
+
 
 # Function to calculate the Average True Range (ATR) indicator
+@register_indicator(
+    "atr",
+    series=[
+        IndicatorSeries("atr", "ATR ({period})", "#00BFFF"),
+    ],
+    axis_title="ATR Indicator",
+)
+def compute_atr(history_df: pd.DataFrame, period: int = 14) -> Dict[str, pd.Series]:
+    """Calculate the Average True Range (ATR) indicator.
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        period (int, optional): The period for calculating the ATR. Defaults to 14.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the ATR indicator by key.
+    """
+
+    # Calculate the True Range (TR)
+    tr = compute_trange(history_df)["trange"]
+
+    # Return the ATR as the moving average of the TR
+    return {"atr": tr.rolling(window=period).mean()}
+
+
+# AtrStream class
+@register_stream("atr")
+class AtrStream(StreamingIndicator):
+    """Incremental Average True Range (ATR), matching compute_atr"""
+
+    # Constructor
+    def __init__(self, period: int = 14):
+        # Operators
+        self.trange = TrangeStream()
+        self.atr = RollingMean(period)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Return the mean of the True Range
+        return {
+            "atr": self.atr.update(self.trange.update(bar, revise)["trange"], revise)
+        }
+
+
+# Function to add the ATR indicator to a plot
 def add_atr_indicator(
     fig: go.Figure, history_df: pd.DataFrame, period: int = 14
 ) -> go.Figure:
@@ -18,43 +81,5 @@ def add_atr_indicator(
         go.Figure: The plot with the ATR indicator added.
     """
 
-    # Calculate True Range (TR)
-    history_df["TR"] = pd.concat(
-        [
-            history_df["High"] - history_df["Low"],
-            abs(history_df["High"] - history_df["Close"].shift(1)),
-            abs(history_df["Low"] - history_df["Close"].shift(1)),
-        ],
-        axis=1,
-    ).max(axis=1)
-
-    # Calculate ATR (Simple Moving Average of True Range)
-    history_df["ATR"] = history_df["TR"].rolling(window=period).mean()
-
-    # Add ATR trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["ATR"],
-            mode="lines",
-            line=dict(color="#00BFFF", width=2),
-            name=f"ATR ({period})",
-            yaxis="y2",
-        )
-    )
-
-    # Update layout to add secondary Y-axis for ATR
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="ATR Indicator",
-            overlaying="y",
-            side="right",
-        ),
-    )
-
-    # Return the figure
-    return fig
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "atr", period=period)
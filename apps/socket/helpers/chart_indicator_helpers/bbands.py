@@ -1,9 +1,88 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.shared import close_sma
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    RollingMean,
+    RollingStd,
+    StreamingIndicator,
+)
+
 
 # Function to calculate the Bollinger Bands (BBands) indicator
+@register_indicator(
+    "bbands",
+    series=[
+        IndicatorSeries("upper", "Upper Band ({period})", "#FF6347", dash="dot"),
+        IndicatorSeries("lower", "Lower Band ({period})", "#1E90FF", dash="dot"),
+        IndicatorSeries("sma", "SMA ({period})", "#FFD700"),
+    ],
+    axis_title="Bollinger Bands",
+    bounds={"std_dev": (1, 5)},
+)
+def compute_bbands(
+    history_df: pd.DataFrame, period: int = 20, std_dev: int = 2
+) -> Dict[str, pd.Series]:
+    """Calculate the Bollinger Bands (BBands).
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        period (int, optional): The period for calculating the moving average and bands. Defaults to 20.
+        std_dev (int, optional): The number of standard deviations for the bands. Defaults to 2.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the Bollinger Bands indicator by key.
+    """
+
+    # Calculate the moving average (SMA) and standard deviation
+    sma = close_sma(history_df, period)
+    std = history_df["Close"].rolling(window=period).std()
+
+    # Return the bands and the moving average
+    return {
+        "upper": sma + (std * std_dev),
+        "lower": sma - (std * std_dev),
+        "sma": sma,
+    }
+
+
+# BbandsStream class
+@register_stream("bbands")
+class BbandsStream(StreamingIndicator):
+    """Incremental Bollinger Bands, matching compute_bbands"""
+
+    # Constructor
+    def __init__(self, period: int = 20, std_dev: int = 2):
+        # Operators
+        self.std_dev = std_dev
+        self.sma = RollingMean(period)
+        self.std = RollingStd(period)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Calculate the SMA and the standard deviation
+        sma = self.sma.update(bar.close, revise)
+        std = self.std.update(bar.close, revise)
+
+        # Return the bands
+        return {
+            "upper": sma + (std * self.std_dev),
+            "lower": sma - (std * self.std_dev),
+            "sma": sma,
+        }
+
+
+# Function to add the Bollinger Bands indicator to a plot
 def add_bbands_indicator(
     fig: go.Figure, history_df: pd.DataFrame, period: int = 20, std_dev: int = 2
 ) -> go.Figure:
@@ -19,62 +98,5 @@ def add_bbands_indicator(
         go.Figure: The plot with the Bollinger Bands indicator added.
     """
 
-    # Calculate the moving average (SMA) and standard deviation
-    history_df["SMA"] = history_df["Close"].rolling(window=period).mean()
-    history_df["STD"] = history_df["Close"].rolling(window=period).std()
-
-    # Calculate the upper and lower Bollinger Bands
-    history_df["UpperBand"] = history_df["SMA"] + (history_df["STD"] * std_dev)
-    history_df["LowerBand"] = history_df["SMA"] - (history_df["STD"] * std_dev)
-
-    # Add Upper Band trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["UpperBand"],
-            mode="lines",
-            line=dict(color="#FF6347", width=2, dash="dot"),
-            name=f"Upper Band ({period})",
-            yaxis="y2",
-        )
-    )
-
-    # Add Lower Band trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["LowerBand"],
-            mode="lines",
-            line=dict(color="#1E90FF", width=2, dash="dot"),
-            name=f"Lower Band ({period})",
-            yaxis="y2",
-        )
-    )
-
-    # Add SMA trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["SMA"],
-            mode="lines",
-            line=dict(color="#FFD700", width=2),
-            name=f"SMA ({period})",
-            yaxis="y2",
-        )
-    )
-
-    # Update layout to add secondary Y-axis for Bollinger Bands
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="Bollinger Bands",
-            overlaying="y",
-            side="right",
-        ),
-    )
-
-    # Return the figure
-    return fig
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "bbands", period=period, std_dev=std_dev)
@@ -1,53 +1,75 @@
 # Imports
+import math
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    StreamingIndicator,
+    divide,
+)
+
 
 # Function to calculate the BOP (Balance of Power) Indicator
-def add_bop_indicator(fig: go.Figure, history_df: pd.DataFrame) -> go.Figure:
-    """Add the Balance of Power (BOP) indicator to the given plot.
+@register_indicator(
+    "bop",
+    series=[
+        IndicatorSeries("bop", "Balance of Power (BOP)", "#FFA500"),
+    ],
+    axis_title="Balance of Power (BOP)",
+)
+def compute_bop(history_df: pd.DataFrame) -> Dict[str, pd.Series]:
+    """Calculate the Balance of Power (BOP) indicator.
 
     Args:
-        fig (go.Figure): The plot to which the indicator will be added.
         history_df (pd.DataFrame): The historical stock data.
 
     Returns:
-        go.Figure: The plot with the BOP indicator added.
+        Dict[str, pd.Series]: The series of the BOP indicator by key.
     """
 
-    # Calculate the BOP indicator
-    history_df["BOP"] = (history_df["Close"] - history_df["Open"]) / (
+    # Calculate the Balance of Power
+    bop = (history_df["Close"] - history_df["Open"]) / (
         history_df["High"] - history_df["Low"]
     )
 
-    # Handle division by zero in BOP calculation
-    history_df["BOP"].replace([float("inf"), -float("inf")], 0, inplace=True)
-    history_df["BOP"].fillna(0, inplace=True)
-
-    # Add BOP trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["BOP"],
-            mode="lines",
-            line=dict(color="#FFA500", width=2),
-            name="Balance of Power (BOP)",
-            yaxis="y2",
-        )
-    )
+    # Return the BOP, flat bars count as 0
+    return {"bop": bop.replace([float("inf"), -float("inf")], 0).fillna(0)}
 
-    # Update layout for visibility
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="Balance of Power (BOP)",
-            overlaying="y",
-            side="right",
-        ),
-    )
 
-    # Return the figure
-    return fig
+# BopStream class
+@register_stream("bop")
+class BopStream(StreamingIndicator):
+    """Incremental Balance of Power (BOP), matching compute_bop"""
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Calculate the BOP
+        bop = divide(bar.close - bar.open, bar.high - bar.low)
+
+        # Return the BOP, with infinite and missing values set to zero
+        return {"bop": bop if math.isfinite(bop) else 0.0}
+
+
+# Function to add the BOP indicator to a plot
+def add_bop_indicator(fig: go.Figure, history_df: pd.DataFrame) -> go.Figure:
+    """Add the Balance of Power (BOP) indicator to the given plot.
+
+    Args:
+        fig (go.Figure): The plot to which the indicator will be added.
+        history_df (pd.DataFrame): The historical stock data.
+
+    Returns:
+        go.Figure: The plot with the BOP indicator added.
+    """
+
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "bop")
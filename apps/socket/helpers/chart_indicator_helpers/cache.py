@@ -0,0 +1,287 @@
+# Imports
+import hashlib
+import threading
+import time
+from typing import Any, Callable, Dict
+
+import numpy as np
+import pandas as pd
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    INDICATOR_REGISTRY,
+    IndicatorResult,
+)
+from apps.socket.helpers.chart_indicator_helpers.shared import shared
+from apps.socket.utils import MISSING, TTLCache
+
+
+# Function to fingerprint a history frame
+@shared
+def history_fingerprint(history_df: pd.DataFrame) -> str:
+    """Build a digest of the bars and timestamps of a history frame
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data
+
+    Returns:
+        str: The digest, equal for histories with the same bars
+    """
+
+    # Hash the timestamps, the columns and the values
+    digest = hashlib.blake2b(digest_size=12)
+    digest.update(np.asarray(history_df.index.asi8).tobytes())
+    digest.update(",".join(map(str, history_df.columns)).encode())
+    digest.update(np.ascontiguousarray(history_df.to_numpy(dtype=float)).tobytes())
+
+    # Return the digest
+    return digest.hexdigest()
+
+
+# IndicatorCache class
+class IndicatorCache:
+    """Two level indicator result cache, in-process LRU optionally backed by
+    the shared Django cache
+
+    Results are keyed by the symbol, the interval, the timestamp of the last
+    bar, the indicator with its parameters and a fingerprint of the history,
+    so a revised or a new bar is a new key and the entries never go stale.
+
+    Attributes:
+        prefix (str): Prefix of the cache keys
+        ttl (float): Time to live of the entries in seconds
+        use_shared (bool): Whether the results are shared through Redis
+        local (TTLCache): The in-process cache
+        counters (Dict[str, int]): Hit and miss counters
+    """
+
+    # Constructor
+    def __init__(
+        self,
+        prefix: str = "indicator",
+        maxsize: int = None,
+        ttl: float = None,
+        use_shared: bool = None,
+    ):
+        # Attributes
+        self.prefix = prefix
+        self.ttl = ttl or getattr(settings, "INDICATOR_CACHE_TTL", 60 * 15)
+        self.use_shared = (
+            getattr(settings, "INDICATOR_CACHE_SHARED", False)
+            if use_shared is None
+            else use_shared
+        )
+        self.local = TTLCache(
+            maxsize or getattr(settings, "INDICATOR_CACHE_MAX_ENTRIES", 512)
+        )
+        self.counters = {"local_hits": 0, "shared_hits": 0, "misses": 0}
+        self._counters_lock = threading.Lock()
+
+    # Method to increment a counter
+    def count(self, name: str) -> None:
+        # Lock the counters and increment
+        with self._counters_lock:
+            self.counters[name] += 1
+
+    # Method to build a cache key
+    def key(
+        self,
+        symbol: str,
+        interval: str,
+        history_df: pd.DataFrame,
+        name: str,
+        params: Dict[str, Any],
+    ) -> str:
+        """Build the key of an indicator of a history
+
+        Args:
+            symbol (str): Symbol of the history
+            interval (str): Interval of the bars
+            history_df (pd.DataFrame): The historical stock data
+            name (str): Name of the indicator
+            params (Dict[str, Any]): Parameters of the indicator
+
+        Returns:
+            str: The key
+        """
+
+        # Get the timestamp of the last bar
+        last_bar = history_df.index[-1].isoformat() if len(history_df) else "empty"
+
+        # Format the parameters in a stable order
+        params = ";".join(f"{key}={value}" for key, value in sorted(params.items()))
+
+        # Return the key
+        return ":".join(
+            [
+                self.prefix,
+                symbol,
+                interval,
+                last_bar,
+                name,
+                params,
+                history_fingerprint(history_df),
+            ]
+        )
+
+    # Method to get a result from the shared cache
+    def get_shared(self, key: str, history_df: pd.DataFrame) -> Any:
+        # Look in the shared cache
+        try:
+            item = cache.get(key)
+
+        # If the shared cache is unavailable
+        except Exception:
+            item = None
+
+        # If the result is missing or expired
+        if item is None or item[0] <= time.time():
+            return MISSING
+
+        # Rebuild the result on the index of the history
+        name, params, values = item[1]
+        result = IndicatorResult(
+            INDICATOR_REGISTRY[name],
+            params,
+            {
+                series_key: pd.Series(series_values, index=history_df.index)
+                for series_key, series_values in values.items()
+            },
+        )
+
+        # Keep it locally for the rest of its lifetime
+        self.local.set(key, result, item[0] - time.time())
+
+        # Count the hit and return the result
+        self.count("shared_hits")
+        return result
+
+    # Method to get a result
+    def get(self, key: str, history_df: pd.DataFrame) -> Any:
+        """Get a cached result from the in-process or the shared cache
+
+        Args:
+            key (str): The key of the result
+            history_df (pd.DataFrame): The history the key was built from
+
+        Returns:
+            Any: The IndicatorResult or MISSING
+        """
+
+        # Look in the in-process cache
+        result = self.local.get(key)
+        if result is not MISSING:
+            self.count("local_hits")
+            return result
+
+        # Look in the shared cache
+        if self.use_shared:
+            return self.get_shared(key, history_df)
+
+        # Return the miss
+        return MISSING
+
+    # Method to set a result
+    def set(self, key: str, result: IndicatorResult) -> None:
+        """Cache a result in the in-process and, if enabled, the shared cache
+
+        Args:
+            key (str): The key of the result
+            result (IndicatorResult): The result
+        """
+
+        # Cache the result in process
+        self.local.set(key, result, self.ttl)
+
+        # If the results are not shared
+        if not self.use_shared:
+            return
+
+        # Cache the raw values, the index is rebuilt from the history
+        values = {
+            series_key: series.to_numpy(dtype=float)
+            for series_key, series in result.values.items()
+        }
+        item = (time.time() + self.ttl, (result.spec.name, result.params, values))
+        try:
+            cache.set(key, item, self.ttl)
+
+        # If the shared cache is unavailable
+        except Exception:
+            pass
+
+    # Method to get a result or compute it
+    def get_or_compute(
+        self,
+        symbol: str,
+        interval: str,
+        history_df: pd.DataFrame,
+        name: str,
+        params: Dict[str, Any],
+        compute: Callable[[], IndicatorResult],
+    ) -> IndicatorResult:
+        """Get a cached indicator result or compute and cache it
+
+        Args:
+            symbol (str): Symbol of the history
+            interval (str): Interval of the bars
+            history_df (pd.DataFrame): The historical stock data
+            name (str): Name of the indicator
+            params (Dict[str, Any]): Parameters of the indicator
+            compute (Callable[[], IndicatorResult]): Function computing it
+
+        Returns:
+            IndicatorResult: The result
+        """
+
+        # Look for the result
+        key = self.key(symbol, interval, history_df, name, params)
+        result = self.get(key, history_df)
+        if result is not MISSING:
+            return result
+
+        # Count the miss and compute the result
+        self.count("misses")
+        result = compute()
+
+        # Cache the result
+        self.set(key, result)
+
+        # Return the result
+        return result
+
+    # Method to get the statistics
+    def stats(self) -> Dict[str, Any]:
+        """Get the hit and miss counters of the cache
+
+        Returns:
+            Dict[str, Any]: The counters, the hit ratio and the local size
+        """
+
+        # Copy the counters
+        with self._counters_lock:
+            stats = dict(self.counters)
+
+        # Calculate the hit ratio
+        total = stats["local_hits"] + stats["shared_hits"] + stats["misses"]
+        stats["hit_ratio"] = (
+            (stats["local_hits"] + stats["shared_hits"]) / total if total else 0.0
+        )
+        stats["local_size"] = len(self.local)
+
+        # Return the statistics
+        return stats
+
+    # Method to clear the in-process cache and the counters
+    def clear(self) -> None:
+        # Clear the local cache
+        self.local.clear()
+
+        # Reset the counters
+        with self._counters_lock:
+            self.counters = {key: 0 for key in self.counters}
+
+
+# Process wide indicator result cache
+indicator_cache = IndicatorCache()
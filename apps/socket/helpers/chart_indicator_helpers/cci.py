@@ -1,9 +1,80 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers import kernels
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    RollingMean,
+    RollingMeanDeviation,
+    StreamingIndicator,
+    divide,
+)
+
 
 # Function to calculate the CCI (Commodity Channel Index) Indicator
+@register_indicator(
+    "cci",
+    series=[
+        IndicatorSeries("cci", "CCI ({window})", "#FFA500"),
+    ],
+    axis_title="Commodity Channel Index (CCI)",
+)
+def compute_cci(history_df: pd.DataFrame, window: int = 20) -> Dict[str, pd.Series]:
+    """Calculate the Commodity Channel Index (CCI) indicator.
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        window (int, optional): The lookback period for calculating the CCI. Defaults to 20.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the CCI indicator by key.
+    """
+
+    # Calculate the typical price
+    typical_price = (history_df["High"] + history_df["Low"] + history_df["Close"]) / 3
+
+    # Calculate the moving average and the mean deviation of the typical price
+    moving_average = typical_price.rolling(window).mean()
+    mean_deviation = kernels.rolling_mean_deviation(typical_price.to_numpy(), window)
+
+    # Return the CCI
+    return {"cci": (typical_price - moving_average) / (0.015 * mean_deviation)}
+
+
+# CciStream class
+@register_stream("cci")
+class CciStream(StreamingIndicator):
+    """Incremental Commodity Channel Index (CCI), matching compute_cci"""
+
+    # Constructor
+    def __init__(self, window: int = 20):
+        # Operators
+        self.moving_average = RollingMean(window)
+        self.mean_deviation = RollingMeanDeviation(window)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Calculate the typical price
+        typical_price = (bar.high + bar.low + bar.close) / 3
+
+        # Calculate the moving average and the mean deviation
+        moving_average = self.moving_average.update(typical_price, revise)
+        mean_deviation = self.mean_deviation.update(typical_price, revise)
+
+        # Return the CCI
+        return {"cci": divide(typical_price - moving_average, 0.015 * mean_deviation)}
+
+
+# Function to add the CCI indicator to a plot
 def add_cci_indicator(
     fig: go.Figure, history_df: pd.DataFrame, window: int = 20
 ) -> go.Figure:
@@ -18,50 +89,5 @@ def add_cci_indicator(
         go.Figure: The plot with the CCI indicator added.
     """
 
-    # Calculate the typical price
-    history_df["Typical_Price"] = (
-        history_df["High"] + history_df["Low"] + history_df["Close"]
-    ) / 3
-
-    # Calculate the moving average of the typical price
-    history_df["TP_MA"] = history_df["Typical_Price"].rolling(window).mean()
-
-    # Calculate the mean deviation using a custom method
-    history_df["Mean_Deviation"] = (
-        history_df["Typical_Price"]
-        .rolling(window)
-        .apply(lambda x: abs(x - x.mean()).mean(), raw=False)
-    )
-
-    # Calculate the CCI
-    history_df["CCI"] = (history_df["Typical_Price"] - history_df["TP_MA"]) / (
-        0.015 * history_df["Mean_Deviation"]
-    )
-
-    # Add CCI trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["CCI"],
-            mode="lines",
-            line=dict(color="#FFA500", width=2),
-            name=f"CCI ({window})",
-            yaxis="y2",
-        )
-    )
-
-    # Update layout for visibility
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="Commodity Channel Index (CCI)",
-            overlaying="y",
-            side="right",
-        ),
-    )
-
-    # Return the figure
-    return fig
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "cci", window=window)
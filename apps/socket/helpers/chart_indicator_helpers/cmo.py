@@ -1,9 +1,81 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    Lag,
+    RollingSum,
+    StreamingIndicator,
+    divide,
+    is_nan,
+)
+
 
 # Function to calculate the CMO (Chande Momentum Oscillator) Indicator
+@register_indicator(
+    "cmo",
+    series=[
+        IndicatorSeries("cmo", "CMO ({period})", "#FFA500"),
+    ],
+    axis_title="Chande Momentum Oscillator (CMO)",
+)
+def compute_cmo(history_df: pd.DataFrame, period: int = 14) -> Dict[str, pd.Series]:
+    """Calculate the Chande Momentum Oscillator (CMO) indicator.
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        period (int, optional): The lookback period for calculating the CMO. Defaults to 14.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the CMO indicator by key.
+    """
+
+    # Calculate the gains and the losses
+    price_change = history_df["Close"].diff()
+    sum_gain = price_change.clip(lower=0).rolling(period).sum()
+    sum_loss = (-price_change.clip(upper=0)).rolling(period).sum()
+
+    # Return the CMO
+    return {"cmo": 100 * (sum_gain - sum_loss) / (sum_gain + sum_loss)}
+
+
+# CmoStream class
+@register_stream("cmo")
+class CmoStream(StreamingIndicator):
+    """Incremental Chande Momentum Oscillator (CMO), matching compute_cmo"""
+
+    # Constructor
+    def __init__(self, period: int = 14):
+        # Operators
+        self.previous_close = Lag()
+        self.sum_gain = RollingSum(period)
+        self.sum_loss = RollingSum(period)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Calculate the price change, missing at the first bar
+        price_change = bar.close - self.previous_close.update(bar.close, revise)
+        gain = price_change if is_nan(price_change) else max(price_change, 0.0)
+        loss = price_change if is_nan(price_change) else -min(price_change, 0.0)
+
+        # Calculate the sums of the gains and the losses
+        sum_gain = self.sum_gain.update(gain, revise)
+        sum_loss = self.sum_loss.update(loss, revise)
+
+        # Return the CMO
+        return {"cmo": divide(100 * (sum_gain - sum_loss), sum_gain + sum_loss)}
+
+
+# Function to add the CMO indicator to a plot
 def add_cmo_indicator(
     fig: go.Figure, history_df: pd.DataFrame, period: int = 14
 ) -> go.Figure:
@@ -18,48 +90,5 @@ def add_cmo_indicator(
         go.Figure: The plot with the CMO indicator added.
     """
 
-    # Calculate price changes
-    history_df["Price_Change"] = history_df["Close"].diff()
-
-    # Calculate gains and losses
-    history_df["Gain"] = history_df["Price_Change"].clip(lower=0)
-    history_df["Loss"] = -history_df["Price_Change"].clip(upper=0)
-
-    # Calculate sum of gains and losses over the lookback period
-    history_df["Sum_Gain"] = history_df["Gain"].rolling(period).sum()
-    history_df["Sum_Loss"] = history_df["Loss"].rolling(period).sum()
-
-    # Calculate CMO
-    history_df["CMO"] = (
-        100
-        * (history_df["Sum_Gain"] - history_df["Sum_Loss"])
-        / (history_df["Sum_Gain"] + history_df["Sum_Loss"])
-    )
-
-    # Add CMO trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["CMO"],
-            mode="lines",
-            line=dict(color="#FFA500", width=2),
-            name=f"CMO ({period})",
-            yaxis="y2",
-        )
-    )
-
-    # Update layout for visibility
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="Chande Momentum Oscillator (CMO)",
-            overlaying="y",
-            side="right",
-        ),
-    )
-
-    # Return the figure
-    return fig
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "cmo", period=period)
@@ -1,9 +1,73 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.shared import close_ema
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    Ema,
+    StreamingIndicator,
+)
+
 
 # Function to calculate the Double Exponential Moving Average (DEMA)
+@register_indicator(
+    "dema",
+    series=[
+        IndicatorSeries("dema", "DEMA {window}", "#00BFFF"),
+    ],
+)
+def compute_dema(history_df: pd.DataFrame, window: int = 20) -> Dict[str, pd.Series]:
+    """Calculate the Double Exponential Moving Average (DEMA) indicator.
+
+    DEMA is a smoother moving average compared to the traditional EMA by reducing lag.
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        window (int, optional): The window size for the DEMA calculation. Defaults to 20.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the DEMA indicator by key.
+    """
+
+    # Calculate the EMA and the EMA of the EMA
+    ema1 = close_ema(history_df, window)
+    ema2 = close_ema(history_df, window, 2)
+
+    # Return the DEMA
+    return {"dema": 2 * ema1 - ema2}
+
+
+# DemaStream class
+@register_stream("dema")
+class DemaStream(StreamingIndicator):
+    """Incremental Double Exponential Moving Average (DEMA), matching compute_dema"""
+
+    # Constructor
+    def __init__(self, window: int = 20):
+        # Operators
+        self.ema1 = Ema(window)
+        self.ema2 = Ema(window)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Calculate the EMA and the EMA of the EMA
+        ema1 = self.ema1.update(bar.close, revise)
+        ema2 = self.ema2.update(ema1, revise)
+
+        # Return the DEMA
+        return {"dema": 2 * ema1 - ema2}
+
+
+# Function to add the DEMA indicator to a plot
 def add_dema_indicator(
     fig: go.Figure, history_df: pd.DataFrame, window: int = 20
 ) -> go.Figure:
@@ -20,25 +84,5 @@ def add_dema_indicator(
         go.Figure: The plot with the DEMA indicator added.
     """
 
-    # Calculate the first EMA
-    ema1 = history_df["Close"].ewm(span=window, adjust=False).mean()
-
-    # Calculate the second EMA on the previously calculated EMA
-    ema2 = ema1.ewm(span=window, adjust=False).mean()
-
-    # Calculate the DEMA
-    history_df["DEMA"] = 2 * ema1 - ema2
-
-    # Add DEMA trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["DEMA"],
-            mode="lines",
-            line=dict(color="#00BFFF", width=2),
-            name=f"DEMA {window}",
-        )
-    )
-
-    # Return the figure
-    return fig
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "dema", window=window)
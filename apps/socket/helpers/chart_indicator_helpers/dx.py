@@ -1,80 +1,171 @@
 # Imports
+from typing import Dict, Tuple
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers import kernels
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.shared import shared
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    Lag,
+    RollingSum,
+    StreamingIndicator,
+    divide,
+)
 
-# Function to calculate the DX (Directional Movement) indicator
-def add_dx_indicator(
-    fig: go.Figure, history_df: pd.DataFrame, period: int = 14
-) -> go.Figure:
-    """Add the DX (Directional Movement) indicator to the given plot.
+
+# Function to calculate the smoothed directional movements
+@shared
+def directional_sums(
+    history_df: pd.DataFrame, period: int
+) -> Tuple[pd.Series, pd.Series, pd.Series]:
+    """Calculate the +DM, the -DM and the True Range summed over the period
 
     Args:
-        fig (go.Figure): The plot to which the indicator will be added.
         history_df (pd.DataFrame): The historical stock data.
-        period (int, optional): The period for calculating the DX. Defaults to 14.
+        period (int): The period of the sums.
 
     Returns:
-        go.Figure: The plot with the DX indicator added.
+        Tuple[pd.Series, pd.Series, pd.Series]: The smoothed +DM, -DM and TR.
     """
 
-    # Calculate +DM and -DM
-    history_df["+DM"] = history_df["High"].diff()
-    history_df["-DM"] = history_df["Low"].diff().abs()
-
     # Calculate the True Range (TR)
-    history_df["TR"] = history_df[["High", "Low", "Close"]].max(axis=1) - history_df[
+    tr = history_df[["High", "Low", "Close"]].max(axis=1) - history_df[
         ["High", "Low", "Close"]
     ].min(axis=1)
 
     # Apply the conditions for +DM and -DM
-    history_df["+DM"] = history_df.apply(
-        lambda x: x["+DM"] if x["+DM"] > 0 and x["+DM"] > x["-DM"] else 0, axis=1
+    plus_dm, minus_dm = kernels.directional_movement(
+        history_df["High"].to_numpy(), history_df["Low"].to_numpy()
     )
-    history_df["-DM"] = history_df.apply(
-        lambda x: x["-DM"] if x["-DM"] > 0 and x["-DM"] > x["+DM"] else 0, axis=1
+
+    # Return the +DM, -DM and TR summed over the period
+    return (
+        pd.Series(plus_dm, index=history_df.index).rolling(window=period).sum(),
+        pd.Series(minus_dm, index=history_df.index).rolling(window=period).sum(),
+        tr.rolling(window=period).sum(),
     )
 
-    # Smooth the +DM, -DM, and TR over the period
-    history_df["+DM_smooth"] = history_df["+DM"].rolling(window=period).sum()
-    history_df["-DM_smooth"] = history_df["-DM"].rolling(window=period).sum()
-    history_df["TR_smooth"] = history_df["TR"].rolling(window=period).sum()
+
+# Function to calculate the DX (Directional Movement) indicator
+@register_indicator(
+    "dx",
+    series=[
+        IndicatorSeries("dx", "DX ({period})", "#FFD500"),
+    ],
+    axis_title="DX (Directional Movement)",
+)
+def compute_dx(history_df: pd.DataFrame, period: int = 14) -> Dict[str, pd.Series]:
+    """Calculate the DX (Directional Movement) indicator.
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        period (int, optional): The period for calculating the DX. Defaults to 14.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the DX indicator by key.
+    """
+
+    # Calculate the smoothed +DM, -DM and TR
+    plus_dm, minus_dm, tr = directional_sums(history_df, period)
 
     # Calculate +DI and -DI
-    history_df["+DI"] = (history_df["+DM_smooth"] / history_df["TR_smooth"]) * 100
-    history_df["-DI"] = (history_df["-DM_smooth"] / history_df["TR_smooth"]) * 100
-
-    # Calculate DX
-    history_df["DX"] = (
-        abs(history_df["+DI"] - history_df["-DI"])
-        / (history_df["+DI"] + history_df["-DI"])
-        * 100
-    )
+    plus_di = (plus_dm / tr) * 100
+    minus_di = (minus_dm / tr) * 100
+
+    # Return the DX
+    return {"dx": abs(plus_di - minus_di) / (plus_di + minus_di) * 100}
+
+
+# DirectionalSumsStream class
+class DirectionalSumsStream:
+    """Incremental version of directional_sums"""
+
+    # Constructor
+    def __init__(self, period: int):
+        # Operators
+        self.previous_high = Lag()
+        self.previous_low = Lag()
+        self.plus_dm = RollingSum(period)
+        self.minus_dm = RollingSum(period)
+        self.tr = RollingSum(period)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Tuple[float, float, float]:
+        """Feed a new bar, or the new prices of the latest bar
 
-    # Add DX trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["DX"],
-            mode="lines",
-            line=dict(color="#FFD500", width=2),
-            name=f"DX ({period})",
-            yaxis="y2",
+        Args:
+            bar (Bar): The prices of the bar
+            revise (bool, optional): Replace the latest bar instead of
+                appending a new one. Defaults to False.
+
+        Returns:
+            Tuple[float, float, float]: The smoothed +DM, -DM and TR.
+        """
+
+        # Calculate the raw movements, missing at the first bar
+        plus_dm = bar.high - self.previous_high.update(bar.high, revise)
+        minus_dm = abs(bar.low - self.previous_low.update(bar.low, revise))
+
+        # Apply the conditions for +DM and -DM
+        plus_dm = plus_dm if plus_dm > 0 and plus_dm > minus_dm else 0.0
+        minus_dm = minus_dm if minus_dm > 0 and minus_dm > plus_dm else 0.0
+
+        # Calculate the True Range (TR)
+        tr = max(bar.high, bar.low, bar.close) - min(bar.high, bar.low, bar.close)
+
+        # Return the +DM, -DM and TR summed over the period
+        return (
+            self.plus_dm.update(plus_dm, revise),
+            self.minus_dm.update(minus_dm, revise),
+            self.tr.update(tr, revise),
         )
-    )
 
-    # Update layout to add secondary Y-axis for DX
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="DX (Directional Movement)",
-            overlaying="y",
-            side="right",
-        ),
-    )
 
-    # Return the figure
-    return fig
+# DxStream class
+@register_stream("dx")
+class DxStream(StreamingIndicator):
+    """Incremental DX (Directional Movement) indicator, matching compute_dx"""
+
+    # Constructor
+    def __init__(self, period: int = 14):
+        # Operators
+        self.sums = DirectionalSumsStream(period)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Calculate the smoothed +DM, -DM and TR
+        plus_dm, minus_dm, tr = self.sums.update(bar, revise)
+
+        # Calculate +DI and -DI
+        plus_di = divide(plus_dm, tr) * 100
+        minus_di = divide(minus_dm, tr) * 100
+
+        # Return the DX
+        return {"dx": divide(abs(plus_di - minus_di), plus_di + minus_di) * 100}
+
+
+# Function to add the DX indicator to a plot
+def add_dx_indicator(
+    fig: go.Figure, history_df: pd.DataFrame, period: int = 14
+) -> go.Figure:
+    """Add the DX (Directional Movement) indicator to the given plot.
+
+    Args:
+        fig (go.Figure): The plot to which the indicator will be added.
+        history_df (pd.DataFrame): The historical stock data.
+        period (int, optional): The period for calculating the DX. Defaults to 14.
+
+    Returns:
+        go.Figure: The plot with the DX indicator added.
+    """
+
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "dx", period=period)
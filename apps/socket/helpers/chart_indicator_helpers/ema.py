@@ -1,9 +1,62 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.shared import close_ema
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    Ema,
+    StreamingIndicator,
+)
+
 
 # Function to calculate the Expontential Moving Average (EMA)
+@register_indicator(
+    "ema",
+    series=[
+        IndicatorSeries("ema", "EMA {window}", "#FF7F50"),
+    ],
+)
+def compute_ema(history_df: pd.DataFrame, window: int = 20) -> Dict[str, pd.Series]:
+    """Calculate the Expontential Moving Average (EMA) indicator.
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        window (int, optional): The window size for the EMA calculation. Defaults to 20.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the EMA indicator by key.
+    """
+
+    # Return the EMA of the close prices
+    return {"ema": close_ema(history_df, window)}
+
+
+# EmaStream class
+@register_stream("ema")
+class EmaStream(StreamingIndicator):
+    """Incremental Exponential Moving Average (EMA), matching compute_ema"""
+
+    # Constructor
+    def __init__(self, window: int = 20):
+        # Operators
+        self.ema = Ema(window)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Return the EMA
+        return {"ema": self.ema.update(bar.close, revise)}
+
+
+# Function to add the EMA indicator to a plot
 def add_ema_indicator(
     fig: go.Figure, history_df: pd.DataFrame, window: int = 20
 ) -> go.Figure:
@@ -18,19 +71,5 @@ def add_ema_indicator(
         go.Figure: The plot with the EMA indicator added.
     """
 
-    # Calculate the EMA
-    history_df["EMA"] = history_df["Close"].ewm(span=window, adjust=False).mean()
-
-    # Add EMA trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["EMA"],
-            mode="lines",
-            line=dict(color="#FF7F50", width=2),
-            name=f"EMA {window}",
-        )
-    )
-
-    # Return the figure
-    return fig
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "ema", window=window)
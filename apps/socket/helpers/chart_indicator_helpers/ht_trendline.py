@@ -1,10 +1,59 @@
 # Imports
+from typing import Dict
+
 import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    StreamingIndicator,
+)
+
 
 # Function to calculate the HT_TRENDLINE (Hilbert Transform - Instantaneous Trendline)
+@register_indicator(
+    "ht_trendline",
+    series=[
+        IndicatorSeries("trendline", "HT Trendline", "#FFD700"),
+    ],
+    axis_title="Hilbert Transform - Instantaneous Trendline",
+)
+def compute_ht_trendline(history_df: pd.DataFrame) -> Dict[str, pd.Series]:
+    """Calculate the HT_TRENDLINE (Hilbert Transform - Instantaneous Trendline).
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the HT_TRENDLINE indicator by key.
+    """
+
+    # Apply the Fourier transform and its inverse to the close prices
+    transform = np.fft.ifft(np.fft.fft(history_df["Close"].to_numpy()))
+
+    # Return the real part as the trendline
+    return {"trendline": pd.Series(transform.real, index=history_df.index)}
+
+
+# HtTrendlineStream class
+@register_stream("ht_trendline")
+class HtTrendlineStream(StreamingIndicator):
+    """Incremental HT_TRENDLINE, matching compute_ht_trendline"""
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # The inverse transform of the transform of the closes is the closes
+        return {"trendline": bar.close}
+
+
+# Function to add the HT_TRENDLINE indicator to a plot
 def add_ht_trendline(fig: go.Figure, history_df: pd.DataFrame) -> go.Figure:
     """Add the HT_TRENDLINE (Hilbert Transform - Instantaneous Trendline) to the given plot.
 
@@ -16,45 +65,5 @@ def add_ht_trendline(fig: go.Figure, history_df: pd.DataFrame) -> go.Figure:
         go.Figure: The plot with the HT_TRENDLINE indicator added.
     """
 
-    # Calculate the Hilbert Transform - Instantaneous Trendline (HT_TRENDLINE)
-    # First, calculate the Hilbert Transform of the Close price
-    close_prices = history_df["Close"].values
-    n = len(close_prices)
-
-    # Applying the Hilbert Transform
-    HT = np.fft.fft(close_prices)
-    transform = np.fft.ifft(HT)
-
-    # Extract the real part of the transform (this represents the trendline)
-    trendline = transform.real
-
-    # Add the trendline to the dataframe
-    history_df["HT_TRENDLINE"] = trendline
-
-    # Add the HT_TRENDLINE trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["HT_TRENDLINE"],
-            mode="lines",
-            line=dict(color="#FFD700", width=2),
-            name="HT Trendline",
-            yaxis="y2",
-        )
-    )
-
-    # Update layout for secondary Y-axis
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="Hilbert Transform - Instantaneous Trendline",
-            overlaying="y",
-            side="right",
-        ),
-    )
-
-    # Return the figure
-    return fig
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "ht_trendline")
@@ -1,72 +1,116 @@
 # Imports
-import numpy as np
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers import kernels
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    AdaptiveFilter,
+    Bar,
+    ForwardFill,
+    Lag,
+    RollingSum,
+    StreamingIndicator,
+)
 
-# Refined KAMA Function with fixes for deprecation warnings and visibility issue
-def add_kama_indicator(
-    fig: go.Figure,
-    history_df: pd.DataFrame,
-    window: int = 10,
-    fast: int = 2,
-    slow: int = 30,
-) -> go.Figure:
-    """Add the Kaufman's Adaptive Moving Average (KAMA) indicator to the given plot.
+
+# Function to calculate the KAMA indicator (Kaufman's Adaptive Moving Average)
+@register_indicator(
+    "kama",
+    series=[
+        IndicatorSeries("kama", "KAMA {window}", "#4B0082"),
+    ],
+)
+def compute_kama(
+    history_df: pd.DataFrame, window: int = 10, fast: int = 2, slow: int = 30
+) -> Dict[str, pd.Series]:
+    """Calculate the Kaufman's Adaptive Moving Average (KAMA) indicator.
 
     KAMA adapts to market conditions by considering both price volatility and trends.
 
     Args:
-        fig (go.Figure): The plot to which the indicator will be added.
         history_df (pd.DataFrame): The historical stock data.
         window (int, optional): The efficiency ratio period. Defaults to 10.
         fast (int, optional): The fastest smoothing constant period. Defaults to 2.
         slow (int, optional): The slowest smoothing constant period. Defaults to 30.
 
     Returns:
-        go.Figure: The plot with the KAMA indicator added.
+        Dict[str, pd.Series]: The series of the KAMA indicator by key.
     """
 
-    # Calculate price changes over the window period
-    change = abs(history_df["Close"].diff(window))
+    # Calculate KAMA from the first closing price after the window
+    kama = kernels.kama(history_df["Close"].to_numpy(), window, fast, slow)
+
+    # Return KAMA, forward filling missing values
+    return {"kama": pd.Series(kama, index=history_df.index).ffill()}
 
-    # Calculate the efficiency ratio (ER)
-    volatility = abs(history_df["Close"].diff()).rolling(window=window).sum()
-    er = np.divide(change, volatility, out=np.zeros_like(change), where=volatility != 0)
 
-    # Calculate smoothing constants
-    fast_sc = 2 / (fast + 1)
-    slow_sc = 2 / (slow + 1)
-    smoothing_constant = (er * (fast_sc - slow_sc) + slow_sc) ** 2
+# KamaStream class
+@register_stream("kama")
+class KamaStream(StreamingIndicator):
+    """Incremental Kaufman Adaptive Moving Average (KAMA), matching compute_kama"""
 
-    # Initialize KAMA series with NaNs
-    kama = np.full_like(history_df["Close"], np.nan)
+    # Constructor
+    def __init__(self, window: int = 10, fast: int = 2, slow: int = 30):
+        # Smoothing constants of the fastest and the slowest EMA
+        self.fast_sc = 2 / (fast + 1)
+        self.slow_sc = 2 / (slow + 1)
 
-    # Initialize first KAMA value to be the first closing price after the window
-    kama[window] = history_df["Close"].iloc[window]
+        # Operators
+        self.previous_close = Lag()
+        self.window_close = Lag(window)
+        self.volatility = RollingSum(window)
+        self.kama = AdaptiveFilter(window)
+        self.fill = ForwardFill()
 
-    # Apply KAMA calculation iteratively
-    for i in range(window + 1, len(history_df)):
-        kama[i] = kama[i - 1] + smoothing_constant[i] * (
-            history_df["Close"].iloc[i] - kama[i - 1]
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Calculate the net change and the volatility over the window
+        change = abs(bar.close - self.window_close.update(bar.close, revise))
+        volatility = self.volatility.update(
+            abs(bar.close - self.previous_close.update(bar.close, revise)), revise
         )
 
-    # Store KAMA in the DataFrame and drop initial NaN values
-    kama_series = pd.Series(kama, index=history_df.index)
+        # Calculate the efficiency ratio, zero when the price did not move
+        er = 0.0 if volatility == 0 else change / volatility
 
-    # Forward fill missing values (bfill can be used depending on the use case)
-    kama_series = kama_series.ffill()
+        # Calculate the smoothing constant
+        smoothing_constant = (er * (self.fast_sc - self.slow_sc) + self.slow_sc) ** 2
 
-    # Add KAMA trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=kama_series,
-            mode="lines",
-            line=dict(color="#4B0082", width=2),
-            name=f"KAMA {window}",
-        )
-    )
+        # Return the filtered close
+        kama = self.kama.update((bar.close, smoothing_constant), revise)
+        return {"kama": self.fill.update(kama, revise)}
+
+
+# Function to add the KAMA indicator to a plot
+def add_kama_indicator(
+    fig: go.Figure,
+    history_df: pd.DataFrame,
+    window: int = 10,
+    fast: int = 2,
+    slow: int = 30,
+) -> go.Figure:
+    """Add the Kaufman's Adaptive Moving Average (KAMA) indicator to the given plot.
+
+    KAMA adapts to market conditions by considering both price volatility and trends.
+
+    Args:
+        fig (go.Figure): The plot to which the indicator will be added.
+        history_df (pd.DataFrame): The historical stock data.
+        window (int, optional): The efficiency ratio period. Defaults to 10.
+        fast (int, optional): The fastest smoothing constant period. Defaults to 2.
+        slow (int, optional): The slowest smoothing constant period. Defaults to 30.
+
+    Returns:
+        go.Figure: The plot with the KAMA indicator added.
+    """
 
-    # Return the figure
-    return fig
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "kama", window=window, fast=fast, slow=slow)
@@ -0,0 +1,368 @@
+# Imports
+from typing import Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import lfilter
+
+# Number of bars solved at once by the adaptive filter, small enough that the
+# running product of the decays cannot underflow
+ADAPTIVE_FILTER_BLOCK = 32
+
+
+# Function to pad a windowed result to the length of the input
+def pad_window(values: np.ndarray, length: int) -> np.ndarray:
+    """Prepend NaNs to the result of a windowed computation
+
+    Args:
+        values (np.ndarray): One value per complete window
+        length (int): Length of the input
+
+    Returns:
+        np.ndarray: The values aligned with the input
+    """
+
+    # Create the output filled with NaNs
+    result = np.full(length, np.nan)
+
+    # Place the values at the end of their windows
+    if len(values):
+        result[length - len(values) :] = values
+
+    # Return the output
+    return result
+
+
+# Function to compute a weighted moving window
+def convolve_window(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Compute the weighted sum of every complete window
+
+    Args:
+        values (np.ndarray): The input
+        weights (np.ndarray): Weights of the window, oldest bar first
+
+    Returns:
+        np.ndarray: The weighted sums, NaN until the first complete window
+    """
+
+    # Convert the input
+    values = np.asarray(values, dtype=float)
+
+    # If there is no complete window
+    if len(values) < len(weights):
+        return np.full(len(values), np.nan)
+
+    # Convolve with the reversed weights, keeping the complete windows
+    return pad_window(np.convolve(values, weights[::-1], "valid"), len(values))
+
+
+# Function to compute the Simple Moving Average
+def sma(values: np.ndarray, window: int) -> np.ndarray:
+    # Return the mean of every window
+    return convolve_window(values, np.full(window, 1 / window))
+
+
+# Function to compute the Weighted Moving Average
+def wma(values: np.ndarray, window: int) -> np.ndarray:
+    # Linear weights, the latest bar weighs the most
+    weights = np.arange(1, window + 1, dtype=float)
+
+    # Return the weighted mean of every window
+    return convolve_window(values, weights / weights.sum())
+
+
+# Function to compute the Triangular Moving Average
+def trima(values: np.ndarray, window: int) -> np.ndarray:
+    """Compute the SMA of the SMA as a single triangular convolution
+
+    Args:
+        values (np.ndarray): The input
+        window (int): Window of both moving averages
+
+    Returns:
+        np.ndarray: The TRIMA, NaN for the first 2 * window - 2 bars
+    """
+
+    # Build the triangular window, the convolution of two box windows
+    weights = np.minimum(np.arange(1, 2 * window), np.arange(2 * window - 1, 0, -1))
+
+    # Return the weighted mean of every window
+    return convolve_window(values, weights / window**2)
+
+
+# Function to compute the Exponential Moving Average
+def ema(values: np.ndarray, window: int) -> np.ndarray:
+    """Compute the EMA like pandas ewm(span=window, adjust=False)
+
+    The recursion runs as a first order IIR filter, it starts at the first
+    valid value, the input is expected to have no NaNs after it.
+
+    Args:
+        values (np.ndarray): The input
+        window (int): Span of the EMA
+
+    Returns:
+        np.ndarray: The EMA
+    """
+
+    # Convert the input
+    values = np.asarray(values, dtype=float)
+    result = np.full(len(values), np.nan)
+
+    # Get the first valid value
+    valid = np.flatnonzero(~np.isnan(values))
+    if not len(valid):
+        return result
+
+    # Smoothing factor of the span
+    alpha = 2 / (window + 1)
+
+    # Filter from the first valid value, which is the initial state
+    start = valid[0]
+    result[start:], _ = lfilter(
+        [alpha], [1, alpha - 1], values[start:], zi=[(1 - alpha) * values[start]]
+    )
+
+    # Return the EMA
+    return result
+
+
+# Function to compute the T3 moving average
+def t3(values: np.ndarray, window: int, vfactor: float) -> np.ndarray:
+    # Compute the chained EMAs
+    e1 = ema(values, window)
+    e2 = ema(e1, window)
+
+    # Return the smoothed combination of the first two EMAs
+    return ema((1 + vfactor) * e1 - vfactor * e2, window)
+
+
+# Function to run an adaptive exponential filter
+def adaptive_filter(values: np.ndarray, alpha: np.ndarray, start: int) -> np.ndarray:
+    """Run y[i] = y[i - 1] + alpha[i] * (x[i] - y[i - 1]) with y[start] = x[start]
+
+    The smoothing factor changes on every bar, so the recursion is not a
+    fixed IIR filter. It is solved in closed form over blocks of bars,
+    y[n] = P[n] * (y[s - 1] + sum(alpha[k] * x[k] / P[k])) where P is the
+    running product of the decays 1 - alpha inside the block. A NaN factor
+    makes every later value NaN, like the recursion does. The factors must
+    be lower than 1.
+
+    Args:
+        values (np.ndarray): The input
+        alpha (np.ndarray): Smoothing factor of every bar
+        start (int): Position of the first value
+
+    Returns:
+        np.ndarray: The filtered values, NaN before the start
+    """
+
+    # Convert the inputs
+    values = np.asarray(values, dtype=float)
+    alpha = np.asarray(alpha, dtype=float)
+    result = np.full(len(values), np.nan)
+
+    # If the input is shorter than the start
+    if start >= len(values):
+        return result
+
+    # Set the first value
+    result[start] = previous = values[start]
+
+    # For each block of bars
+    for block_start in range(start + 1, len(values), ADAPTIVE_FILTER_BLOCK):
+        # Get the bars of the block
+        block = slice(block_start, block_start + ADAPTIVE_FILTER_BLOCK)
+        block_alpha = alpha[block]
+
+        # Running product of the decays
+        decay = np.cumprod(1 - block_alpha)
+
+        # Solve the block from the last value of the previous one
+        result[block] = decay * (
+            previous + np.cumsum(block_alpha * values[block] / decay)
+        )
+        previous = result[block][-1]
+
+    # Return the filtered values
+    return result
+
+
+# Function to compute the Kaufman Adaptive Moving Average
+def kama(close: np.ndarray, window: int, fast: int, slow: int) -> np.ndarray:
+    """Compute the KAMA, starting at the close of bar window
+
+    Args:
+        close (np.ndarray): The closing prices
+        window (int): The efficiency ratio period
+        fast (int): The fastest smoothing constant period
+        slow (int): The slowest smoothing constant period
+
+    Returns:
+        np.ndarray: The KAMA, NaN before the first complete window
+    """
+
+    # Convert the input
+    close = np.asarray(close, dtype=float)
+
+    # Net change and volatility over the window
+    change = np.full(len(close), np.nan)
+    change[window:] = np.abs(close[window:] - close[:-window])
+    volatility = np.full(len(close), np.nan)
+    volatility[1:] = np.abs(np.diff(close))
+    volatility = pad_window(
+        sliding_window_view(volatility[1:], window).sum(axis=1)
+        if len(close) > window
+        else np.empty(0),
+        len(close),
+    )
+
+    # Efficiency ratio, zero when the price did not move
+    er = np.divide(change, volatility, out=np.zeros_like(change), where=volatility != 0)
+
+    # Smoothing constant between the slowest and the fastest EMA
+    fast_sc = 2 / (fast + 1)
+    slow_sc = 2 / (slow + 1)
+    smoothing_constant = (er * (fast_sc - slow_sc) + slow_sc) ** 2
+
+    # Return the filtered closes
+    return adaptive_filter(close, smoothing_constant, window)
+
+
+# Function to compute the MESA Adaptive Moving Average
+def mama(
+    close: np.ndarray, window: int, fast_limit: float, slow_limit: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute the MAMA and the FAMA, starting at the close of bar window
+
+    Args:
+        close (np.ndarray): The closing prices
+        window (int): The window of the smoothing constant
+        fast_limit (float): The fast limit constant
+        slow_limit (float): The slow limit constant
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The MAMA and the FAMA
+    """
+
+    # Convert the input
+    close = np.asarray(close, dtype=float)
+
+    # Absolute price changes and their sum over the window
+    change = np.full(len(close), np.nan)
+    change[1:] = np.abs(np.diff(close))
+    total = pad_window(
+        sliding_window_view(change, window).sum(axis=1)
+        if len(close) >= window
+        else np.empty(0),
+        len(close),
+    )
+
+    # Smoothing constant between the limits
+    with np.errstate(divide="ignore", invalid="ignore"):
+        smoothing_constant = (change / total) * (fast_limit - slow_limit) + slow_limit
+
+    # Return the MAMA and the FAMA
+    return (
+        adaptive_filter(close, 1 - smoothing_constant, window),
+        adaptive_filter(close, smoothing_constant, window),
+    )
+
+
+# Function to compute the price based OBV
+def price_obv(close: np.ndarray) -> np.ndarray:
+    """Count the rising bars minus the falling bars
+
+    Args:
+        close (np.ndarray): The closing prices
+
+    Returns:
+        np.ndarray: The running count, 0 at the first bar
+    """
+
+    # Direction of every bar, unchanged or unknown prices count as 0
+    direction = np.nan_to_num(np.sign(np.diff(np.asarray(close, dtype=float))))
+
+    # Return the running count
+    return np.concatenate([[0.0], np.cumsum(direction)])
+
+
+# Function to get the age of the rolling extremes
+def rolling_extreme_age(
+    values: np.ndarray, window: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Get the number of bars since the highest and the lowest value of every
+    window, the latest one on ties
+
+    Args:
+        values (np.ndarray): The input
+        window (int): The window
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The ages of the maximum and the minimum
+    """
+
+    # Convert the input
+    values = np.asarray(values, dtype=float)
+
+    # If there is no complete window
+    if len(values) < window:
+        return np.full(len(values), np.nan), np.full(len(values), np.nan)
+
+    # Windows with the latest bar first
+    windows = sliding_window_view(values, window)[:, ::-1]
+
+    # Return the ages
+    return (
+        pad_window(windows.argmax(axis=1).astype(float), len(values)),
+        pad_window(windows.argmin(axis=1).astype(float), len(values)),
+    )
+
+
+# Function to compute the rolling mean absolute deviation
+def rolling_mean_deviation(values: np.ndarray, window: int) -> np.ndarray:
+    # Convert the input
+    values = np.asarray(values, dtype=float)
+
+    # If there is no complete window
+    if len(values) < window:
+        return np.full(len(values), np.nan)
+
+    # Get the windows and their means
+    windows = sliding_window_view(values, window)
+    means = windows.mean(axis=1, keepdims=True)
+
+    # Return the mean absolute deviation of every window
+    return pad_window(np.abs(windows - means).mean(axis=1), len(values))
+
+
+# Function to compute the directional movements
+def directional_movement(
+    high: np.ndarray, low: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute the +DM from the high and the -DM from the low, each kept when
+    it is positive and larger than the other one
+
+    Args:
+        high (np.ndarray): The high prices
+        low (np.ndarray): The low prices
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The +DM and the -DM, 0 at the first bar
+    """
+
+    # Raw movements, unknown at the first bar
+    plus = np.full(len(high), np.nan)
+    minus = np.full(len(low), np.nan)
+    plus[1:] = np.diff(np.asarray(high, dtype=float))
+    minus[1:] = np.abs(np.diff(np.asarray(low, dtype=float)))
+
+    # Keep the +DM larger than the raw -DM
+    with np.errstate(invalid="ignore"):
+        plus = np.where((plus > 0) & (plus > minus), plus, 0.0)
+
+        # Keep the -DM larger than the kept +DM
+        minus = np.where((minus > 0) & (minus > plus), minus, 0.0)
+
+    # Return the movements
+    return plus, minus
@@ -1,81 +1,113 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.shared import close_ema
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    Ema,
+    StreamingIndicator,
+)
+
 
 # Function to calculate the MACD indicator
-def add_macd_indicator(
-    fig: go.Figure,
+@register_indicator(
+    "macd",
+    series=[
+        IndicatorSeries("macd", "MACD", "blue"),
+        IndicatorSeries("signal", "Signal", "orange"),
+    ],
+    axis_title="MACD",
+)
+def compute_macd(
     history_df: pd.DataFrame,
     short_window: int = 12,
     long_window: int = 26,
     signal_window: int = 9,
-) -> go.Figure:
-    """Add the MACD (Moving Average Convergence Divergence) indicator to the given plot.
+) -> Dict[str, pd.Series]:
+    """Calculate the MACD (Moving Average Convergence Divergence) indicator.
 
     Args:
-        fig (go.Figure): The plot to which the indicator will be added.
         history_df (pd.DataFrame): The historical stock data.
         short_window (int, optional): The short window size for the MACD calculation. Defaults to 12.
         long_window (int, optional): The long window size for the MACD calculation. Defaults to 26.
         signal_window (int, optional): The window size for the signal line calculation. Defaults to 9.
 
     Returns:
-        go.Figure: The plot with the MACD indicator added.
+        Dict[str, pd.Series]: The series of the MACD indicator by key.
     """
 
     # Calculate the short-term and long-term EMA
-    history_df["EMA_short"] = (
-        history_df["Close"].ewm(span=short_window, adjust=False).mean()
-    )
-    history_df["EMA_long"] = (
-        history_df["Close"].ewm(span=long_window, adjust=False).mean()
-    )
+    ema_short = close_ema(history_df, short_window)
+    ema_long = close_ema(history_df, long_window)
 
     # Calculate MACD line
-    history_df["MACD"] = history_df["EMA_short"] - history_df["EMA_long"]
+    macd = ema_short - ema_long
 
-    # Calculate Signal line
-    history_df["Signal"] = (
-        history_df["MACD"].ewm(span=signal_window, adjust=False).mean()
-    )
+    # Return the MACD and Signal lines
+    return {"macd": macd, "signal": macd.ewm(span=signal_window, adjust=False).mean()}
 
-    # Add MACD trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["MACD"],
-            mode="lines",
-            line=dict(color="blue", width=2),
-            name="MACD",
-            yaxis="y2",
-        )
-    )
 
-    # Add Signal line trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["Signal"],
-            mode="lines",
-            line=dict(color="orange", width=2),
-            name="Signal",
-            yaxis="y2",
+# MacdStream class
+@register_stream("macd")
+class MacdStream(StreamingIndicator):
+    """Incremental MACD, matching compute_macd"""
+
+    # Constructor
+    def __init__(
+        self, short_window: int = 12, long_window: int = 26, signal_window: int = 9
+    ):
+        # Operators
+        self.ema_short = Ema(short_window)
+        self.ema_long = Ema(long_window)
+        self.signal = Ema(signal_window)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Calculate the MACD line
+        macd = self.ema_short.update(bar.close, revise) - self.ema_long.update(
+            bar.close, revise
         )
-    )
 
-    # Update layout to add secondary Y-axis
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="MACD",
-            overlaying="y",
-            side="right",
-        ),
-    )
+        # Return the MACD and the signal line
+        return {"macd": macd, "signal": self.signal.update(macd, revise)}
+
 
-    # Return the figure
-    return fig
+# Function to add the MACD indicator to a plot
+def add_macd_indicator(
+    fig: go.Figure,
+    history_df: pd.DataFrame,
+    short_window: int = 12,
+    long_window: int = 26,
+    signal_window: int = 9,
+) -> go.Figure:
+    """Add the MACD (Moving Average Convergence Divergence) indicator to the given plot.
+
+    Args:
+        fig (go.Figure): The plot to which the indicator will be added.
+        history_df (pd.DataFrame): The historical stock data.
+        short_window (int, optional): The short window size for the MACD calculation. Defaults to 12.
+        long_window (int, optional): The long window size for the MACD calculation. Defaults to 26.
+        signal_window (int, optional): The window size for the signal line calculation. Defaults to 9.
+
+    Returns:
+        go.Figure: The plot with the MACD indicator added.
+    """
+
+    # Compute and render the indicator
+    return add_indicator(
+        fig,
+        history_df,
+        "macd",
+        short_window=short_window,
+        long_window=long_window,
+        signal_window=signal_window,
+    )
@@ -1,89 +1,140 @@
 # Imports
-import numpy as np
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers import kernels
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    AdaptiveFilter,
+    Bar,
+    ForwardFill,
+    Lag,
+    RollingSum,
+    StreamingIndicator,
+    divide,
+)
+
 
 # Function to calculate the MAMA indicator (Mature Adaptive Moving Average)
-def add_mama_indicator(
-    fig: go.Figure,
+@register_indicator(
+    "mama",
+    series=[
+        IndicatorSeries("mama", "MAMA {window}", "#8A2BE2"),
+        IndicatorSeries("fama", "FAMA {window}", "#7FFF00"),
+    ],
+)
+def compute_mama(
     history_df: pd.DataFrame,
     window: int = 10,
     fast_limit: float = 0.5,
     slow_limit: float = 0.05,
-) -> go.Figure:
-    """Add the MAMA (Mature Adaptive Moving Average) indicator to the given plot.
+) -> Dict[str, pd.Series]:
+    """Calculate the MAMA (Mature Adaptive Moving Average) indicator.
 
     The MAMA indicator adjusts to the market's volatility and trends, providing a smoother moving average.
 
     Args:
-        fig (go.Figure): The plot to which the indicator will be added.
         history_df (pd.DataFrame): The historical stock data.
         window (int, optional): The window size for calculating the moving averages. Defaults to 10.
         fast_limit (float, optional): The fast limit constant. Defaults to 0.5.
         slow_limit (float, optional): The slow limit constant. Defaults to 0.05.
 
     Returns:
-        go.Figure: The plot with the MAMA indicator added.
+        Dict[str, pd.Series]: The series of the MAMA indicator by key.
     """
 
-    # Calculate the price change
-    price_change = history_df["Close"].diff()
+    # Calculate MAMA and FAMA from the first closing price after the window
+    mama, fama = kernels.mama(
+        history_df["Close"].to_numpy(), window, fast_limit, slow_limit
+    )
 
-    # Calculate the absolute value of price changes
-    abs_price_change = abs(price_change)
+    # Return MAMA and FAMA, forward filling missing values
+    return {
+        "mama": pd.Series(mama, index=history_df.index).ffill(),
+        "fama": pd.Series(fama, index=history_df.index).ffill(),
+    }
+
+
+# MamaStream class
+@register_stream("mama")
+class MamaStream(StreamingIndicator):
+    """Incremental MESA Adaptive Moving Average (MAMA) and FAMA, matching compute_mama"""
+
+    # Constructor
+    def __init__(
+        self, window: int = 10, fast_limit: float = 0.5, slow_limit: float = 0.05
+    ):
+        # Attributes
+        self.fast_limit = fast_limit
+        self.slow_limit = slow_limit
+
+        # Operators
+        self.previous_close = Lag()
+        self.total = RollingSum(window)
+        self.mama = AdaptiveFilter(window)
+        self.fama = AdaptiveFilter(window)
+        self.mama_fill = ForwardFill()
+        self.fama_fill = ForwardFill()
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Calculate the absolute price change and its sum over the window
+        change = abs(bar.close - self.previous_close.update(bar.close, revise))
+        total = self.total.update(change, revise)
+
+        # Calculate the smoothing constant
+        smoothing_constant = (
+            divide(change, total) * (self.fast_limit - self.slow_limit)
+            + self.slow_limit
+        )
 
-    # Calculate the smoothing constants for FAMA and MAMA
-    smoothing_constant = (
-        abs_price_change / abs_price_change.rolling(window=window).sum()
-    ) * (fast_limit - slow_limit) + slow_limit
+        # Filter the close
+        mama = self.mama.update((bar.close, 1 - smoothing_constant), revise)
+        fama = self.fama.update((bar.close, smoothing_constant), revise)
 
-    # Initialize MAMA and FAMA arrays
-    fama = np.full_like(history_df["Close"], np.nan)
-    mama = np.full_like(history_df["Close"], np.nan)
+        # Return the MAMA and the FAMA
+        return {
+            "mama": self.mama_fill.update(mama, revise),
+            "fama": self.fama_fill.update(fama, revise),
+        }
 
-    # First values of FAMA and MAMA will be the same as the first closing price
-    fama[window] = history_df["Close"].iloc[window]
-    mama[window] = history_df["Close"].iloc[window]
 
-    # Apply MAMA and FAMA calculations
-    for i in range(window + 1, len(history_df)):
-        # Calculate FAMA and MAMA based on the smoothing constant
-        fama[i] = fama[i - 1] + smoothing_constant[i] * (
-            history_df["Close"].iloc[i] - fama[i - 1]
-        )
-        mama[i] = mama[i - 1] + (1 - smoothing_constant[i]) * (
-            history_df["Close"].iloc[i] - mama[i - 1]
-        )
+# Function to add the MAMA indicator to a plot
+def add_mama_indicator(
+    fig: go.Figure,
+    history_df: pd.DataFrame,
+    window: int = 10,
+    fast_limit: float = 0.5,
+    slow_limit: float = 0.05,
+) -> go.Figure:
+    """Add the MAMA (Mature Adaptive Moving Average) indicator to the given plot.
 
-    # Store MAMA and FAMA in the DataFrame and drop initial NaN values
-    mama_series = pd.Series(mama, index=history_df.index)
-    fama_series = pd.Series(fama, index=history_df.index)
-
-    # Forward fill missing values (bfill can be used depending on the use case)
-    mama_series = mama_series.ffill()
-    fama_series = fama_series.ffill()
-
-    # Add MAMA and FAMA traces to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=mama_series,
-            mode="lines",
-            line=dict(color="#8A2BE2", width=2),
-            name=f"MAMA {window}",
-        )
-    )
+    The MAMA indicator adjusts to the market's volatility and trends, providing a smoother moving average.
 
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=fama_series,
-            mode="lines",
-            line=dict(color="#7FFF00", width=2),
-            name=f"FAMA {window}",
-        )
-    )
+    Args:
+        fig (go.Figure): The plot to which the indicator will be added.
+        history_df (pd.DataFrame): The historical stock data.
+        window (int, optional): The window size for calculating the moving averages. Defaults to 10.
+        fast_limit (float, optional): The fast limit constant. Defaults to 0.5.
+        slow_limit (float, optional): The slow limit constant. Defaults to 0.05.
 
-    # Return the figure
-    return fig
+    Returns:
+        go.Figure: The plot with the MAMA indicator added.
+    """
+
+    # Compute and render the indicator
+    return add_indicator(
+        fig,
+        history_df,
+        "mama",
+        window=window,
+        fast_limit=fast_limit,
+        slow_limit=slow_limit,
+    )
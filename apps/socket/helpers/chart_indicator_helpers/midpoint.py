@@ -1,9 +1,75 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.shared import price_channel
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    RollingExtreme,
+    StreamingIndicator,
+)
+
 
 # Function to calculate the MidPoint indicator
+@register_indicator(
+    "midpoint",
+    series=[
+        IndicatorSeries("midpoint", "MidPoint ({period})", "#FF8C00"),
+    ],
+    axis_title="MidPoint Indicator",
+)
+def compute_midpoint(
+    history_df: pd.DataFrame, period: int = 14
+) -> Dict[str, pd.Series]:
+    """Calculate the MidPoint indicator.
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        period (int, optional): The period over which to calculate the midpoint. Defaults to 14.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the MidPoint indicator by key.
+    """
+
+    # Calculate the highest high and the lowest low over the period
+    highest_high, lowest_low = price_channel(history_df, period)
+
+    # Return the average of the highest high and the lowest low
+    return {"midpoint": (highest_high + lowest_low) / 2}
+
+
+# MidpointStream class
+@register_stream("midpoint")
+class MidpointStream(StreamingIndicator):
+    """Incremental MIDPOINT, matching compute_midpoint"""
+
+    # Constructor
+    def __init__(self, period: int = 14):
+        # Operators
+        self.highest_high = RollingExtreme(period)
+        self.lowest_low = RollingExtreme(period, largest=False)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Return the middle of the highest high and the lowest low
+        return {
+            "midpoint": (
+                self.highest_high.update(bar.high, revise)
+                + self.lowest_low.update(bar.low, revise)
+            )
+            / 2
+        }
+
+
+# Function to add the MidPoint indicator to a plot
 def add_midpoint_indicator(
     fig: go.Figure, history_df: pd.DataFrame, period: int = 14
 ) -> go.Figure:
@@ -18,36 +84,5 @@ def add_midpoint_indicator(
         go.Figure: The plot with the MidPoint indicator added.
     """
 
-    # Calculate the MidPoint (highest high + lowest low) / 2 over the period
-    history_df["MidPoint"] = (
-        history_df["High"].rolling(window=period).max()
-        + history_df["Low"].rolling(window=period).min()
-    ) / 2
-
-    # Add MidPoint trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["MidPoint"],
-            mode="lines",
-            line=dict(color="#FF8C00", width=2),
-            name=f"MidPoint ({period})",
-            yaxis="y2",
-        )
-    )
-
-    # Update layout to add secondary Y-axis for MidPoint
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="MidPoint Indicator",
-            overlaying="y",
-            side="right",
-        ),
-    )
-
-    # Return the figure
-    return fig
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "midpoint", period=period)
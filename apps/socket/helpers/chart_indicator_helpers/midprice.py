@@ -1,9 +1,75 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.shared import price_channel
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    RollingExtreme,
+    StreamingIndicator,
+)
+
 
 # Function to calculate the MidPrice indicator
+@register_indicator(
+    "midprice",
+    series=[
+        IndicatorSeries("midprice", "MidPrice ({period})", "#FFA500"),
+    ],
+    axis_title="MidPrice Indicator",
+)
+def compute_midprice(
+    history_df: pd.DataFrame, period: int = 14
+) -> Dict[str, pd.Series]:
+    """Calculate the MidPrice indicator.
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        period (int, optional): The period over which to calculate the mid price. Defaults to 14.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the MidPrice indicator by key.
+    """
+
+    # Calculate the highest high and the lowest low over the period
+    highest_high, lowest_low = price_channel(history_df, period)
+
+    # Return the average of the highest high and the lowest low
+    return {"midprice": (highest_high + lowest_low) / 2}
+
+
+# MidpriceStream class
+@register_stream("midprice")
+class MidpriceStream(StreamingIndicator):
+    """Incremental MIDPRICE, matching compute_midprice"""
+
+    # Constructor
+    def __init__(self, period: int = 14):
+        # Operators
+        self.highest_high = RollingExtreme(period)
+        self.lowest_low = RollingExtreme(period, largest=False)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Return the middle of the highest high and the lowest low
+        return {
+            "midprice": (
+                self.highest_high.update(bar.high, revise)
+                + self.lowest_low.update(bar.low, revise)
+            )
+            / 2
+        }
+
+
+# Function to add the MidPrice indicator to a plot
 def add_midprice_indicator(
     fig: go.Figure, history_df: pd.DataFrame, period: int = 14
 ) -> go.Figure:
@@ -18,36 +84,5 @@ def add_midprice_indicator(
         go.Figure: The plot with the MidPrice indicator added.
     """
 
-    # Calculate the MidPrice (average of highest high and lowest low over the period)
-    history_df["MidPrice"] = (
-        history_df["High"].rolling(window=period).max()
-        + history_df["Low"].rolling(window=period).min()
-    ) / 2
-
-    # Add MidPrice trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["MidPrice"],
-            mode="lines",
-            line=dict(color="#FFA500", width=2),
-            name=f"MidPrice ({period})",
-            yaxis="y2",
-        )
-    )
-
-    # Update layout to add secondary Y-axis for MidPrice
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="MidPrice Indicator",
-            overlaying="y",
-            side="right",
-        ),
-    )
-
-    # Return the figure
-    return fig
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "midprice", period=period)
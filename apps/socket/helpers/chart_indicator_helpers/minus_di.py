@@ -1,9 +1,74 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.dx import (
+    DirectionalSumsStream,
+    directional_sums,
+)
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    StreamingIndicator,
+    divide,
+)
+
 
 # Function to calculate the -DI (Negative Directional Indicator) indicator
+@register_indicator(
+    "minus_di",
+    series=[
+        IndicatorSeries("minus_di", "-DI ({period})", "#00FFFF"),
+    ],
+    axis_title="-DI (Negative Directional Indicator)",
+)
+def compute_minus_di(
+    history_df: pd.DataFrame, period: int = 14
+) -> Dict[str, pd.Series]:
+    """Calculate the -DI (Negative Directional Indicator).
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        period (int, optional): The period for calculating the -DI. Defaults to 14.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the -DI indicator by key.
+    """
+
+    # Calculate the smoothed -DM and TR
+    _, minus_dm, tr = directional_sums(history_df, period)
+
+    # Return the -DI
+    return {"minus_di": (minus_dm / tr) * 100}
+
+
+# MinusDiStream class
+@register_stream("minus_di")
+class MinusDiStream(StreamingIndicator):
+    """Incremental Minus Directional Indicator (-DI), matching compute_minus_di"""
+
+    # Constructor
+    def __init__(self, period: int = 14):
+        # Operators
+        self.sums = DirectionalSumsStream(period)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Calculate the smoothed -DM and TR
+        _, minus_dm, tr = self.sums.update(bar, revise)
+
+        # Return the -DI
+        return {"minus_di": divide(minus_dm, tr) * 100}
+
+
+# Function to add the -DI indicator to a plot
 def add_minus_di_indicator(
     fig: go.Figure, history_df: pd.DataFrame, period: int = 14
 ) -> go.Figure:
@@ -18,54 +83,5 @@ def add_minus_di_indicator(
         go.Figure: The plot with the -DI indicator added.
     """
 
-    # Calculate +DM and -DM
-    history_df["+DM"] = history_df["High"].diff()
-    history_df["-DM"] = history_df["Low"].diff().abs()
-
-    # Calculate the True Range (TR)
-    history_df["TR"] = history_df[["High", "Low", "Close"]].max(axis=1) - history_df[
-        ["High", "Low", "Close"]
-    ].min(axis=1)
-
-    # Apply the conditions for +DM and -DM
-    history_df["+DM"] = history_df.apply(
-        lambda x: x["+DM"] if x["+DM"] > 0 and x["+DM"] > x["-DM"] else 0, axis=1
-    )
-    history_df["-DM"] = history_df.apply(
-        lambda x: x["-DM"] if x["-DM"] > 0 and x["-DM"] > x["+DM"] else 0, axis=1
-    )
-
-    # Smooth the -DM and TR over the period
-    history_df["-DM_smooth"] = history_df["-DM"].rolling(window=period).sum()
-    history_df["TR_smooth"] = history_df["TR"].rolling(window=period).sum()
-
-    # Calculate -DI
-    history_df["-DI"] = (history_df["-DM_smooth"] / history_df["TR_smooth"]) * 100
-
-    # Add -DI trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["-DI"],
-            mode="lines",
-            line=dict(color="#00FFFF", width=2),
-            name=f"-DI ({period})",
-            yaxis="y2",
-        )
-    )
-
-    # Update layout to add secondary Y-axis for -DI
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="-DI (Negative Directional Indicator)",
-            overlaying="y",
-            side="right",
-        ),
-    )
-
-    # Return the figure
-    return fig
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "minus_di", period=period)
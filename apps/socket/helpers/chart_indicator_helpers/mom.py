@@ -1,9 +1,62 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    Lag,
+    StreamingIndicator,
+)
+
 
 # Function to calculate the MOM (Momentum) Indicator
+@register_indicator(
+    "mom",
+    series=[
+        IndicatorSeries("mom", "MOM ({period})", "#FFA500"),
+    ],
+    axis_title="Momentum (MOM)",
+)
+def compute_mom(history_df: pd.DataFrame, period: int = 10) -> Dict[str, pd.Series]:
+    """Calculate the Momentum (MOM) indicator.
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        period (int, optional): The lookback period for calculating the MOM. Defaults to 10.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the MOM indicator by key.
+    """
+
+    # Return the change of the close price over the period
+    return {"mom": history_df["Close"] - history_df["Close"].shift(period)}
+
+
+# MomStream class
+@register_stream("mom")
+class MomStream(StreamingIndicator):
+    """Incremental Momentum (MOM) indicator, matching compute_mom"""
+
+    # Constructor
+    def __init__(self, period: int = 10):
+        # Operators
+        self.previous_close = Lag(period)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Return the change of the close over the period
+        return {"mom": bar.close - self.previous_close.update(bar.close, revise)}
+
+
+# Function to add the MOM indicator to a plot
 def add_mom_indicator(
     fig: go.Figure, history_df: pd.DataFrame, period: int = 10
 ) -> go.Figure:
@@ -18,33 +71,5 @@ def add_mom_indicator(
         go.Figure: The plot with the MOM indicator added.
     """
 
-    # Calculate the MOM indicator
-    history_df["MOM"] = history_df["Close"] - history_df["Close"].shift(period)
-
-    # Add MOM trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["MOM"],
-            mode="lines",
-            line=dict(color="#FFA500", width=2),
-            name=f"MOM ({period})",
-            yaxis="y2",
-        )
-    )
-
-    # Update layout for visibility
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="Momentum (MOM)",
-            overlaying="y",
-            side="right",
-        ),
-    )
-
-    # Return the figure
-    return fig
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "mom", period=period)
@@ -1,9 +1,66 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.atr import AtrStream, compute_atr
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    StreamingIndicator,
+    divide,
+)
+
+
+# Function to calculate the NATR indicator
+@register_indicator(
+    "natr",
+    series=[
+        IndicatorSeries("natr", "NATR ({period})", "#DAA520"),
+    ],
+    axis_title="NATR Indicator",
+)
+def compute_natr(history_df: pd.DataFrame, period: int = 14) -> Dict[str, pd.Series]:
+    """Calculate the Normalized Average True Range (NATR) indicator.
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        period (int, optional): The period for calculating the NATR. Defaults to 14.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the NATR indicator by key.
+    """
+
+    # Calculate the ATR
+    atr = compute_atr(history_df, period)["atr"]
+
+    # Return the ATR as a percentage of the close price
+    return {"natr": (atr / history_df["Close"]) * 100}
+
+
+# NatrStream class
+@register_stream("natr")
+class NatrStream(StreamingIndicator):
+    """Incremental Normalized Average True Range (NATR), matching compute_natr"""
+
+    # Constructor
+    def __init__(self, period: int = 14):
+        # Operators
+        self.atr = AtrStream(period)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Return the ATR as a percentage of the close
+        return {"natr": divide(self.atr.update(bar, revise)["atr"], bar.close) * 100}
+
 
-# Function to calculate and add the NATR indicator
+# Function to add the NATR indicator to a plot
 def add_natr_indicator(
     fig: go.Figure, history_df: pd.DataFrame, period: int = 14
 ) -> go.Figure:
@@ -18,46 +75,5 @@ def add_natr_indicator(
         go.Figure: The plot with the NATR indicator added.
     """
 
-    # Calculate True Range (TR)
-    history_df["TR"] = pd.concat(
-        [
-            history_df["High"] - history_df["Low"],
-            abs(history_df["High"] - history_df["Close"].shift(1)),
-            abs(history_df["Low"] - history_df["Close"].shift(1)),
-        ],
-        axis=1,
-    ).max(axis=1)
-
-    # Calculate ATR (Simple Moving Average of True Range)
-    history_df["ATR"] = history_df["TR"].rolling(window=period).mean()
-
-    # Calculate NATR as (ATR / Close) * 100
-    history_df["NATR"] = (history_df["ATR"] / history_df["Close"]) * 100
-
-    # Add NATR trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["NATR"],
-            mode="lines",
-            line=dict(color="#DAA520", width=2),
-            name=f"NATR ({period})",
-            yaxis="y2",
-        )
-    )
-
-    # Update layout to add secondary Y-axis for NATR
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="NATR Indicator",
-            overlaying="y",
-            side="right",
-        ),
-    )
-
-    # Return the figure
-    return fig
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "natr", period=period)
@@ -1,9 +1,71 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers import kernels
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    CumulativeSum,
+    Lag,
+    StreamingIndicator,
+)
+
 
 # Function to calculate a price-based OBV-like indicator
+@register_indicator(
+    "obv",
+    series=[
+        IndicatorSeries("obv", "Price-Based OBV", "#00BFFF"),
+    ],
+    axis_title="Price-Based OBV-Like",
+)
+def compute_obv(history_df: pd.DataFrame) -> Dict[str, pd.Series]:
+    """Calculate a price-based OBV-like indicator (without volume data).
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the price-based OBV-like indicator by key.
+    """
+
+    # Count the rising bars minus the falling bars, starting at 0
+    obv = kernels.price_obv(history_df["Close"].to_numpy())
+
+    # Return the price-based OBV-like
+    return {"obv": pd.Series(obv, index=history_df.index)}
+
+
+# ObvStream class
+@register_stream("obv")
+class ObvStream(StreamingIndicator):
+    """Incremental price-based OBV-like indicator, matching compute_obv"""
+
+    # Constructor
+    def __init__(self):
+        # Operators
+        self.previous_close = Lag()
+        self.obv = CumulativeSum()
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Direction of the bar, unchanged or unknown prices count as 0
+        change = bar.close - self.previous_close.update(bar.close, revise)
+        direction = float((change > 0) - (change < 0))
+
+        # Return the running count
+        return {"obv": self.obv.update(direction, revise)}
+
+
+# Function to add the price-based OBV-like indicator to a plot
 def add_price_based_obv_indicator(
     fig: go.Figure, history_df: pd.DataFrame
 ) -> go.Figure:
@@ -17,47 +79,5 @@ def add_price_based_obv_indicator(
         go.Figure: The plot with the price-based OBV-like indicator added.
     """
 
-    # Initialize OBV-like with 0 for the first value
-    obv_like = [0]
-
-    # Loop through historical data to calculate the price-based OBV-like
-    for i in range(1, len(history_df)):
-        if history_df["Close"].iloc[i] > history_df["Close"].iloc[i - 1]:
-            obv_like.append(obv_like[-1] + 1)  # Increment for price rise
-        elif history_df["Close"].iloc[i] < history_df["Close"].iloc[i - 1]:
-            obv_like.append(obv_like[-1] - 1)  # Decrement for price fall
-        else:
-            obv_like.append(obv_like[-1])  # No change if price is unchanged
-
-    # Add price-based OBV-like as a new column
-    history_df["PriceBasedOBV"] = obv_like
-
-    # Define a bright color for the price-based OBV-like line
-    obv_color = "#00BFFF"  # Deep Sky Blue
-
-    # Add the price-based OBV-like trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["PriceBasedOBV"],
-            mode="lines",
-            line=dict(color=obv_color, width=2),
-            name="Price-Based OBV",
-            yaxis="y2",
-        )
-    )
-
-    # Update layout for secondary Y-axis
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="Price-Based OBV-Like",
-            overlaying="y",
-            side="right",
-        ),
-    )
-
-    return fig
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "obv")
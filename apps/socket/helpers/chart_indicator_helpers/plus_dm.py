@@ -1,9 +1,65 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.dx import (
+    DirectionalSumsStream,
+    directional_sums,
+)
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    StreamingIndicator,
+)
+
 
 # Function to calculate the +DM (Positive Directional Movement) indicator
+@register_indicator(
+    "plus_dm",
+    series=[
+        IndicatorSeries("plus_dm", "+DM ({period})", "#00FF00"),
+    ],
+    axis_title="+DM (Positive Directional Movement)",
+)
+def compute_plus_dm(history_df: pd.DataFrame, period: int = 14) -> Dict[str, pd.Series]:
+    """Calculate the +DM (Positive Directional Movement).
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        period (int, optional): The period for calculating the +DM. Defaults to 14.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the +DM indicator by key.
+    """
+
+    # Return the smoothed +DM
+    return {"plus_dm": directional_sums(history_df, period)[0]}
+
+
+# PlusDmStream class
+@register_stream("plus_dm")
+class PlusDmStream(StreamingIndicator):
+    """Incremental Plus Directional Movement (+DM), matching compute_plus_dm"""
+
+    # Constructor
+    def __init__(self, period: int = 14):
+        # Operators
+        self.sums = DirectionalSumsStream(period)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Return the smoothed +DM
+        return {"plus_dm": self.sums.update(bar, revise)[0]}
+
+
+# Function to add the +DM indicator to a plot
 def add_plus_dm_indicator(
     fig: go.Figure, history_df: pd.DataFrame, period: int = 14
 ) -> go.Figure:
@@ -18,51 +74,5 @@ def add_plus_dm_indicator(
         go.Figure: The plot with the +DM indicator added.
     """
 
-    # Calculate +DM and -DM
-    history_df["+DM"] = history_df["High"].diff()
-    history_df["-DM"] = history_df["Low"].diff().abs()
-
-    # Calculate the True Range (TR)
-    history_df["TR"] = history_df[["High", "Low", "Close"]].max(axis=1) - history_df[
-        ["High", "Low", "Close"]
-    ].min(axis=1)
-
-    # Apply the conditions for +DM and -DM
-    history_df["+DM"] = history_df.apply(
-        lambda x: x["+DM"] if x["+DM"] > 0 and x["+DM"] > x["-DM"] else 0, axis=1
-    )
-    history_df["-DM"] = history_df.apply(
-        lambda x: x["-DM"] if x["-DM"] > 0 and x["-DM"] > x["+DM"] else 0, axis=1
-    )
-
-    # Smooth the +DM and TR over the period
-    history_df["+DM_smooth"] = history_df["+DM"].rolling(window=period).sum()
-    history_df["TR_smooth"] = history_df["TR"].rolling(window=period).sum()
-
-    # Add +DM trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["+DM_smooth"],
-            mode="lines",
-            line=dict(color="#00FF00", width=2),
-            name=f"+DM ({period})",
-            yaxis="y2",
-        )
-    )
-
-    # Update layout to add secondary Y-axis for +DM
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="+DM (Positive Directional Movement)",
-            overlaying="y",
-            side="right",
-        ),
-    )
-
-    # Return the figure
-    return fig
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "plus_dm", period=period)
@@ -1,83 +1,118 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.shared import close_ema
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    Ema,
+    StreamingIndicator,
+    divide,
+)
+
 
 # Function to calculate the PPO (Percentage Price Oscillator) Indicator
-def add_ppo_indicator(
-    fig: go.Figure,
+@register_indicator(
+    "ppo",
+    series=[
+        IndicatorSeries("ppo", "PPO ({fast_period}, {slow_period})", "#FFA500"),
+        IndicatorSeries(
+            "signal", "PPO Signal ({signal_period})", "#1f77b4", dash="dot"
+        ),
+    ],
+    axis_title="PPO / Signal Line",
+)
+def compute_ppo(
     history_df: pd.DataFrame,
     fast_period: int = 12,
     slow_period: int = 26,
     signal_period: int = 9,
-) -> go.Figure:
-    """Add the Percentage Price Oscillator (PPO) indicator to the given plot.
+) -> Dict[str, pd.Series]:
+    """Calculate the Percentage Price Oscillator (PPO) indicator.
 
     Args:
-        fig (go.Figure): The plot to which the indicator will be added.
         history_df (pd.DataFrame): The historical stock data.
         fast_period (int, optional): The period for the fast EMA. Defaults to 12.
         slow_period (int, optional): The period for the slow EMA. Defaults to 26.
         signal_period (int, optional): The period for the signal line EMA. Defaults to 9.
 
     Returns:
-        go.Figure: The plot with the PPO indicator added.
+        Dict[str, pd.Series]: The series of the PPO indicator by key.
     """
 
     # Calculate the fast and slow EMAs
-    history_df["EMA_Fast"] = (
-        history_df["Close"].ewm(span=fast_period, adjust=False).mean()
-    )
-    history_df["EMA_Slow"] = (
-        history_df["Close"].ewm(span=slow_period, adjust=False).mean()
-    )
+    ema_fast = close_ema(history_df, fast_period)
+    ema_slow = close_ema(history_df, slow_period)
 
     # Calculate the PPO
-    history_df["PPO"] = (
-        (history_df["EMA_Fast"] - history_df["EMA_Slow"]) / history_df["EMA_Slow"]
-    ) * 100
+    ppo = ((ema_fast - ema_slow) / ema_slow) * 100
 
-    # Calculate the PPO signal line (EMA of PPO)
-    history_df["PPO_Signal"] = (
-        history_df["PPO"].ewm(span=signal_period, adjust=False).mean()
-    )
+    # Return the PPO and its signal line
+    return {"ppo": ppo, "signal": ppo.ewm(span=signal_period, adjust=False).mean()}
 
-    # Add PPO trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["PPO"],
-            mode="lines",
-            line=dict(color="#FFA500", width=2),
-            name=f"PPO ({fast_period}, {slow_period})",
-            yaxis="y2",
-        )
-    )
 
-    # Add PPO signal line trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["PPO_Signal"],
-            mode="lines",
-            line=dict(color="#1f77b4", width=2, dash="dot"),
-            name=f"PPO Signal ({signal_period})",
-            yaxis="y2",
-        )
-    )
+# PpoStream class
+@register_stream("ppo")
+class PpoStream(StreamingIndicator):
+    """Incremental Percentage Price Oscillator (PPO), matching compute_ppo"""
 
-    # Update layout for visibility
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="PPO / Signal Line",
-            overlaying="y",
-            side="right",
-        ),
-    )
+    # Constructor
+    def __init__(
+        self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9
+    ):
+        # Operators
+        self.fast_ema = Ema(fast_period)
+        self.slow_ema = Ema(slow_period)
+        self.signal = Ema(signal_period)
 
-    # Return the figure
-    return fig
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Calculate the EMAs
+        ema_fast = self.fast_ema.update(bar.close, revise)
+        ema_slow = self.slow_ema.update(bar.close, revise)
+
+        # Calculate the PPO
+        ppo = divide(ema_fast - ema_slow, ema_slow) * 100
+
+        # Return the PPO and the signal line
+        return {"ppo": ppo, "signal": self.signal.update(ppo, revise)}
+
+
+# Function to add the PPO indicator to a plot
+def add_ppo_indicator(
+    fig: go.Figure,
+    history_df: pd.DataFrame,
+    fast_period: int = 12,
+    slow_period: int = 26,
+    signal_period: int = 9,
+) -> go.Figure:
+    """Add the Percentage Price Oscillator (PPO) indicator to the given plot.
+
+    Args:
+        fig (go.Figure): The plot to which the indicator will be added.
+        history_df (pd.DataFrame): The historical stock data.
+        fast_period (int, optional): The period for the fast EMA. Defaults to 12.
+        slow_period (int, optional): The period for the slow EMA. Defaults to 26.
+        signal_period (int, optional): The period for the signal line EMA. Defaults to 9.
+
+    Returns:
+        go.Figure: The plot with the PPO indicator added.
+    """
+
+    # Compute and render the indicator
+    return add_indicator(
+        fig,
+        history_df,
+        "ppo",
+        fast_period=fast_period,
+        slow_period=slow_period,
+        signal_period=signal_period,
+    )
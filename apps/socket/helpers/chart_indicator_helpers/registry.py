@@ -0,0 +1,331 @@
+# Imports
+import inspect
+import math
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from apps.socket.constants import INDICATOR_PARAM_BOUNDS, MAX_CHART_INDICATORS
+from apps.socket.helpers.chart_indicator_helpers.shared import (
+    shared,
+    shared_intermediates,
+)
+
+
+# IndicatorSeries class
+class IndicatorSeries:
+    """Description of one output series of an indicator
+
+    Attributes:
+        key (str): Key of the series in the computed values
+        name (str): Display name, formatted with the parameters of the indicator
+        color (Optional[str]): Line color, None for the default color
+        dash (Optional[str]): Line dash style, None for a solid line
+        marker (Optional[Dict]): Marker style, None for no marker style
+    """
+
+    # Constructor
+    def __init__(
+        self,
+        key: str,
+        name: str,
+        color: Optional[str] = None,
+        dash: Optional[str] = None,
+        marker: Optional[Dict] = None,
+    ):
+        # Attributes
+        self.key = key
+        self.name = name
+        self.color = color
+        self.dash = dash
+        self.marker = marker
+
+    # Method to get the metadata
+    def meta(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        # Return the JSON serializable description of the series
+        return {
+            "key": self.key,
+            "name": self.name.format(**params),
+            "color": self.color,
+            "dash": self.dash,
+            "marker": self.marker,
+        }
+
+
+# IndicatorSpec class
+class IndicatorSpec:
+    """Description of an indicator and of the function computing it
+
+    Attributes:
+        name (str): Name of the indicator, as in INDICATORS
+        compute (Callable[..., Dict[str, pd.Series]]): Pure function computing
+            the series from the history, it never modifies the history and
+            its results are shared while the history is evaluated
+        series (List[IndicatorSeries]): The output series
+        axis_title (Optional[str]): Title of the secondary axis, None if the
+            series overlay the price axis
+        axis_range (Optional[List[float]]): Fixed range of the secondary axis
+        defaults (Dict[str, Any]): Default parameters of the compute function
+        bounds (Dict[str, Tuple[float, float]]): Allowed range of every
+            parameter, both ends included
+        stream (Optional[type]): Incremental version of the indicator, built
+            from the same parameters as the compute function
+    """
+
+    # Constructor
+    def __init__(
+        self,
+        name: str,
+        compute: Callable[..., Dict[str, pd.Series]],
+        series: List[IndicatorSeries],
+        axis_title: Optional[str] = None,
+        axis_range: Optional[List[float]] = None,
+        bounds: Optional[Dict[str, Tuple[float, float]]] = None,
+    ):
+        # Attributes
+        self.name = name
+        self.compute = compute
+        self.series = series
+        self.axis_title = axis_title
+        self.axis_range = axis_range
+        self.defaults = {
+            parameter.name: parameter.default
+            for parameter in list(inspect.signature(compute).parameters.values())[1:]
+        }
+        self.bounds = {
+            key: (bounds or {}).get(key, INDICATOR_PARAM_BOUNDS[type(default)])
+            for key, default in self.defaults.items()
+        }
+        self.stream: Optional[type] = None
+
+    # Property to check if the series overlay the price axis
+    @property
+    def overlay(self) -> bool:
+        # Return True if there is no secondary axis
+        return self.axis_title is None
+
+    # Method to get the metadata
+    def meta(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        # Return the JSON serializable description of the indicator
+        return {
+            "name": self.name,
+            "params": params,
+            "overlay": self.overlay,
+            "axis_title": self.axis_title,
+            "axis_range": self.axis_range,
+            "series": [series.meta(params) for series in self.series],
+        }
+
+
+# IndicatorResult class
+class IndicatorResult:
+    """Computed series of an indicator with their metadata
+
+    Attributes:
+        spec (IndicatorSpec): The indicator
+        params (Dict[str, Any]): The parameters used, defaults included
+        values (Dict[str, pd.Series]): The computed series by key
+    """
+
+    # Constructor
+    def __init__(
+        self, spec: IndicatorSpec, params: Dict[str, Any], values: Dict[str, pd.Series]
+    ):
+        # Attributes
+        self.spec = spec
+        self.params = params
+        self.values = values
+
+    # Method to get the metadata
+    def meta(self) -> Dict[str, Any]:
+        # Return the metadata of the indicator with these parameters
+        return self.spec.meta(self.params)
+
+
+# Registry of the indicators by name
+INDICATOR_REGISTRY: Dict[str, IndicatorSpec] = {}
+
+
+# Decorator to register an indicator
+def register_indicator(
+    name: str,
+    series: List[IndicatorSeries],
+    axis_title: Optional[str] = None,
+    axis_range: Optional[List[float]] = None,
+    bounds: Optional[Dict[str, Tuple[float, float]]] = None,
+) -> Callable:
+    """Register a compute function under the name of its indicator
+
+    Args:
+        name (str): Name of the indicator, as in INDICATORS
+        series (List[IndicatorSeries]): The output series
+        axis_title (Optional[str], optional): Title of the secondary axis, None
+            to overlay the price axis. Defaults to None.
+        axis_range (Optional[List[float]], optional): Fixed range of the
+            secondary axis. Defaults to None.
+        bounds (Optional[Dict[str, Tuple[float, float]]], optional): Allowed
+            range of the parameters, the range of their type in
+            INDICATOR_PARAM_BOUNDS for the others. Defaults to None.
+
+    Returns:
+        Callable: The decorator, which returns the compute function with its
+            results shared, so indicators built on it reuse them
+    """
+
+    # Decorator
+    def decorator(compute: Callable) -> Callable:
+        # Share the results of the compute function
+        compute = shared(compute)
+
+        # Register the indicator
+        INDICATOR_REGISTRY[name] = IndicatorSpec(
+            name, compute, series, axis_title, axis_range, bounds
+        )
+
+        # Return the compute function
+        return compute
+
+    # Return the decorator
+    return decorator
+
+
+# Decorator to register the incremental version of an indicator
+def register_stream(name: str) -> Callable:
+    """Register a streaming class under the name of its indicator
+
+    Args:
+        name (str): Name of the indicator, registered before
+
+    Returns:
+        Callable: The decorator, which returns the class unchanged
+    """
+
+    # Decorator
+    def decorator(stream: type) -> type:
+        # Attach the class to the indicator
+        INDICATOR_REGISTRY[name].stream = stream
+
+        # Return the class
+        return stream
+
+    # Return the decorator
+    return decorator
+
+
+# Function to compute an indicator
+def compute_indicator(
+    name: str, history_df: pd.DataFrame, **params: Any
+) -> IndicatorResult:
+    """Compute an indicator without building a figure
+
+    Args:
+        name (str): Name of the indicator, as in INDICATORS
+        history_df (pd.DataFrame): The historical stock data, left unchanged
+        **params (Any): Parameters overriding the defaults of the indicator
+
+    Returns:
+        IndicatorResult: The computed series and their metadata
+    """
+
+    # Get the indicator and its parameters
+    spec = INDICATOR_REGISTRY[name]
+    params = {**spec.defaults, **params}
+
+    # Return the computed series
+    return IndicatorResult(spec, params, spec.compute(history_df, **params))
+
+
+# Function to parse a list of indicators
+def parse_indicators(value: str) -> List[Tuple[str, Dict[str, Any]]]:
+    """Parse indicators written as "name:param=value;param=value,name"
+
+    Unknown indicators, unknown parameters and parameters that are not
+    finite numbers within the bounds of the indicator are skipped, like
+    "none".
+
+    Args:
+        value (str): The indicators, for example "rsi:window=10,macd"
+
+    Returns:
+        List[Tuple[str, Dict[str, Any]]]: The names and the parameters of the
+            indicators, without duplicates
+    """
+
+    # List to store the indicators
+    indicators = []
+
+    # For each indicator
+    for item in value.split(","):
+        # Get the indicator
+        name, _, arguments = item.strip().partition(":")
+        spec = INDICATOR_REGISTRY.get(name)
+        if spec is None:
+            continue
+
+        # Get the parameters, with the type of their defaults
+        params = {}
+        for argument in filter(None, arguments.split(";")):
+            key, _, raw = argument.partition("=")
+            if key not in spec.defaults:
+                continue
+            try:
+                param = type(spec.defaults[key])(raw)
+            except ValueError:
+                continue
+            minimum, maximum = spec.bounds[key]
+            if math.isfinite(param) and minimum <= param <= maximum:
+                params[key] = param
+
+        # Add the indicator once
+        if (name, params) not in indicators:
+            indicators.append((name, params))
+
+    # Return the indicators, up to the maximum
+    return indicators[:MAX_CHART_INDICATORS]
+
+
+# Function to format a list of indicators
+def format_indicators(indicators: List[Tuple[str, Dict[str, Any]]]) -> str:
+    """Format indicators the way parse_indicators reads them
+
+    Args:
+        indicators (List[Tuple[str, Dict[str, Any]]]): The names and the
+            parameters of the indicators
+
+    Returns:
+        str: The indicators, "none" if there are none
+    """
+
+    # Format every indicator with its parameters
+    items = [
+        ":".join([name, ";".join(f"{key}={value}" for key, value in params.items())])
+        if params
+        else name
+        for name, params in indicators
+    ]
+
+    # Return the indicators
+    return ",".join(items) or "none"
+
+
+# Function to compute several indicators
+def evaluate_indicators(
+    history_df: pd.DataFrame, indicators: List[Tuple[str, Dict[str, Any]]]
+) -> List[IndicatorResult]:
+    """Compute several indicators of the same history, computing the
+    intermediate series they have in common once
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data, left unchanged
+        indicators (List[Tuple[str, Dict[str, Any]]]): The names and the
+            parameters of the indicators
+
+    Returns:
+        List[IndicatorResult]: The computed indicators, in the same order
+    """
+
+    # Share the intermediate results while the indicators are computed
+    with shared_intermediates(history_df):
+        return [
+            compute_indicator(name, history_df, **params) for name, params in indicators
+        ]
@@ -0,0 +1,132 @@
+# Imports
+from typing import Any, List
+
+import pandas as pd
+import plotly.graph_objects as go
+
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorResult,
+    compute_indicator,
+)
+
+
+# Function to render a computed indicator
+def render_indicator(
+    fig: go.Figure, result: IndicatorResult, axis: int = 2
+) -> go.Figure:
+    """Add the traces of a computed indicator to the given plot
+
+    Args:
+        fig (go.Figure): The plot to which the indicator will be added
+        result (IndicatorResult): The computed indicator
+        axis (int, optional): Number of the Y-axis of the indicator when it
+            does not overlay the price axis. Defaults to 2.
+
+    Returns:
+        go.Figure: The plot with the indicator added
+    """
+
+    # Get the indicator and the name of its axis
+    spec = result.spec
+    yaxis = f"y{axis}"
+
+    # For each output series
+    for series in spec.series:
+        # Get the values and the style of the series
+        values = result.values[series.key]
+        style = {}
+        if series.color is not None:
+            style["line"] = dict(color=series.color, width=2)
+            if series.dash is not None:
+                style["line"]["dash"] = series.dash
+        if series.marker is not None:
+            style["marker"] = series.marker
+
+        # Plot the series on the price axis or on the axis of the indicator
+        if not spec.overlay:
+            style["yaxis"] = yaxis
+
+        # Add the trace
+        fig.add_trace(
+            go.Scatter(
+                x=values.index,
+                y=values,
+                mode="lines",
+                name=series.name.format(**result.params),
+                **style,
+            )
+        )
+
+    # If the indicator has its own axis
+    if not spec.overlay:
+        # Build the axis
+        layout = dict(
+            gridcolor="#888888",
+            zerolinecolor="#888888",
+            title_font=dict(family="JetBrains Mono"),
+            tickfont=dict(family="JetBrains Mono"),
+            title=spec.axis_title,
+            overlaying="y",
+            side="right",
+        )
+        if spec.axis_range is not None:
+            layout["range"] = spec.axis_range
+
+        # Shift the axes after the first one so they do not overlap
+        if axis > 2:
+            layout.update(anchor="free", autoshift=True)
+
+        # Update layout to add the Y-axis
+        fig.update_layout({f"yaxis{axis}": layout})
+
+    # Return the figure
+    return fig
+
+
+# Function to render several computed indicators
+def render_indicators(fig: go.Figure, results: List[IndicatorResult]) -> go.Figure:
+    """Add the traces of several computed indicators to the given plot, each
+    indicator that does not overlay the price axis gets its own Y-axis
+
+    Args:
+        fig (go.Figure): The plot to which the indicators will be added
+        results (List[IndicatorResult]): The computed indicators
+
+    Returns:
+        go.Figure: The plot with the indicators added
+    """
+
+    # Number of the next free Y-axis
+    axis = 2
+
+    # For each indicator
+    for result in results:
+        # Render the indicator
+        fig = render_indicator(fig, result, axis)
+
+        # Move to the next axis if the indicator used this one
+        if not result.spec.overlay:
+            axis += 1
+
+    # Return the figure
+    return fig
+
+
+# Function to compute and render an indicator
+def add_indicator(
+    fig: go.Figure, history_df: pd.DataFrame, name: str, **params: Any
+) -> go.Figure:
+    """Compute an indicator from the registry and add it to the given plot
+
+    Args:
+        fig (go.Figure): The plot to which the indicator will be added
+        history_df (pd.DataFrame): The historical stock data
+        name (str): Name of the indicator, as in INDICATORS
+        **params (Any): Parameters overriding the defaults of the indicator
+
+    Returns:
+        go.Figure: The plot with the indicator added
+    """
+
+    # Compute and render the indicator
+    return render_indicator(fig, compute_indicator(name, history_df, **params))
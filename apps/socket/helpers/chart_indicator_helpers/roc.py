@@ -1,9 +1,69 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    Lag,
+    StreamingIndicator,
+    divide,
+)
+
 
 # Function to calculate the ROC (Rate of Change) Indicator
+@register_indicator(
+    "roc",
+    series=[
+        IndicatorSeries("roc", "ROC ({period})", "#FFA500"),
+    ],
+    axis_title="Rate of Change (ROC)",
+)
+def compute_roc(history_df: pd.DataFrame, period: int = 14) -> Dict[str, pd.Series]:
+    """Calculate the Rate of Change (ROC) indicator.
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        period (int, optional): The lookback period for calculating the ROC. Defaults to 14.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the ROC indicator by key.
+    """
+
+    # Get the close price at the start of the period
+    previous_close = history_df["Close"].shift(period)
+
+    # Return the ROC
+    return {"roc": ((history_df["Close"] - previous_close) / previous_close) * 100}
+
+
+# RocStream class
+@register_stream("roc")
+class RocStream(StreamingIndicator):
+    """Incremental Rate of Change (ROC), matching compute_roc"""
+
+    # Constructor
+    def __init__(self, period: int = 14):
+        # Operators
+        self.previous_close = Lag(period)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Get the close of the period before
+        previous_close = self.previous_close.update(bar.close, revise)
+
+        # Return the ROC
+        return {"roc": divide(bar.close - previous_close, previous_close) * 100}
+
+
+# Function to add the ROC indicator to a plot
 def add_roc_indicator(
     fig: go.Figure, history_df: pd.DataFrame, period: int = 14
 ) -> go.Figure:
@@ -18,36 +78,5 @@ def add_roc_indicator(
         go.Figure: The plot with the ROC indicator added.
     """
 
-    # Calculate ROC
-    history_df["ROC"] = (
-        (history_df["Close"] - history_df["Close"].shift(period))
-        / history_df["Close"].shift(period)
-    ) * 100
-
-    # Add ROC trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["ROC"],
-            mode="lines",
-            line=dict(color="#FFA500", width=2),
-            name=f"ROC ({period})",
-            yaxis="y2",
-        )
-    )
-
-    # Update layout for visibility
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="Rate of Change (ROC)",
-            overlaying="y",
-            side="right",
-        ),
-    )
-
-    # Return the figure
-    return fig
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "roc", period=period)
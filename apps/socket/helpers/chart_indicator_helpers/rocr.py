@@ -1,9 +1,65 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    Lag,
+    StreamingIndicator,
+    divide,
+)
+
 
 # Function to calculate the ROCR (Rate of Change Ratio) Indicator
+@register_indicator(
+    "rocr",
+    series=[
+        IndicatorSeries("rocr", "ROCR ({period})", "#1E90FF"),
+    ],
+    axis_title="Rate of Change Ratio (ROCR)",
+)
+def compute_rocr(history_df: pd.DataFrame, period: int = 14) -> Dict[str, pd.Series]:
+    """Calculate the Rate of Change Ratio (ROCR) indicator.
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        period (int, optional): The lookback period for calculating the ROCR. Defaults to 14.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the ROCR indicator by key.
+    """
+
+    # Return the ratio of the close price to the close price at the start of the period
+    return {"rocr": history_df["Close"] / history_df["Close"].shift(period)}
+
+
+# RocrStream class
+@register_stream("rocr")
+class RocrStream(StreamingIndicator):
+    """Incremental Rate of Change Ratio (ROCR), matching compute_rocr"""
+
+    # Constructor
+    def __init__(self, period: int = 14):
+        # Operators
+        self.previous_close = Lag(period)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Return the ratio of the close to the close of the period before
+        return {
+            "rocr": divide(bar.close, self.previous_close.update(bar.close, revise))
+        }
+
+
+# Function to add the ROCR indicator to a plot
 def add_rocr_indicator(
     fig: go.Figure, history_df: pd.DataFrame, period: int = 14
 ) -> go.Figure:
@@ -18,33 +74,5 @@ def add_rocr_indicator(
         go.Figure: The plot with the ROCR indicator added.
     """
 
-    # Calculate ROCR
-    history_df["ROCR"] = history_df["Close"] / history_df["Close"].shift(period)
-
-    # Add ROCR trace to the plot with a unique color
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["ROCR"],
-            mode="lines",
-            line=dict(color="#1E90FF", width=2),
-            name=f"ROCR ({period})",
-            yaxis="y2",
-        )
-    )
-
-    # Update layout for visibility
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="Rate of Change Ratio (ROCR)",
-            overlaying="y",
-            side="right",
-        ),
-    )
-
-    # Return the figure
-    return fig
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "rocr", period=period)
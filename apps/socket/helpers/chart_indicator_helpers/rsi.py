@@ -1,9 +1,83 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    Lag,
+    RollingMean,
+    StreamingIndicator,
+    divide,
+)
+
 
 # Function to calculate the Relative Strength Index (RSI)
+@register_indicator(
+    "rsi",
+    series=[
+        IndicatorSeries("rsi", "RSI {window}", "#FF6347"),
+    ],
+    axis_title="RSI",
+    axis_range=[0, 100],
+)
+def compute_rsi(history_df: pd.DataFrame, window: int = 14) -> Dict[str, pd.Series]:
+    """Calculate the Relative Strength Index (RSI) indicator.
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        window (int, optional): The window size for the RSI calculation. Defaults to 14.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the RSI indicator by key.
+    """
+
+    # Calculate the gains and the losses
+    delta = history_df["Close"].diff()
+    gain = delta.where(delta > 0, 0)
+    loss = -delta.where(delta < 0, 0)
+
+    # Calculate the relative strength
+    rs = gain.rolling(window).mean() / loss.rolling(window).mean()
+
+    # Return the RSI
+    return {"rsi": 100 - (100 / (1 + rs))}
+
+
+# RsiStream class
+@register_stream("rsi")
+class RsiStream(StreamingIndicator):
+    """Incremental Relative Strength Index (RSI), matching compute_rsi"""
+
+    # Constructor
+    def __init__(self, window: int = 14):
+        # Operators
+        self.previous_close = Lag()
+        self.gain = RollingMean(window)
+        self.loss = RollingMean(window)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Calculate the gain and the loss, zero at the first bar
+        delta = bar.close - self.previous_close.update(bar.close, revise)
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+
+        # Calculate the relative strength
+        rs = divide(self.gain.update(gain, revise), self.loss.update(loss, revise))
+
+        # Return the RSI
+        return {"rsi": 100 - (100 / (1 + rs))}
+
+
+# Function to add the RSI indicator to a plot
 def add_rsi_indicator(
     fig: go.Figure, history_df: pd.DataFrame, window: int = 14
 ) -> go.Figure:
@@ -18,48 +92,5 @@ def add_rsi_indicator(
         go.Figure: The plot with the RSI indicator added.
     """
 
-    # Calculate price changes
-    delta = history_df["Close"].diff()
-
-    # Calculate gains (positive price changes) and losses (negative price changes)
-    gain = delta.where(delta > 0, 0)
-    loss = -delta.where(delta < 0, 0)
-
-    # Calculate the rolling averages of gains and losses
-    avg_gain = gain.rolling(window).mean()
-    avg_loss = loss.rolling(window).mean()
-
-    # Calculate the Relative Strength (RS)
-    rs = avg_gain / avg_loss
-
-    # Calculate the RSI
-    history_df["RSI"] = 100 - (100 / (1 + rs))
-
-    # Add RSI trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["RSI"],
-            mode="lines",
-            line=dict(color="#FF6347", width=2),
-            name=f"RSI {window}",
-            yaxis="y2",
-        )
-    )
-
-    # Update layout to add secondary Y-axis
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="RSI",
-            overlaying="y",
-            side="right",
-            range=[0, 100],
-        ),
-    )
-
-    # Return the figure
-    return fig
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "rsi", window=window)
@@ -1,26 +1,50 @@
 # Imports
+from typing import Dict, Optional
+
 import pandas as pd
 import plotly.graph_objects as go
 from ta.trend import PSARIndicator
 
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    StreamingIndicator,
+    StreamingOperator,
+)
 
-# Function to calculate and add the SAR indicator
-def add_sar_indicator(
-    fig: go.Figure, history_df: pd.DataFrame, step: float = 0.02, max_step: float = 0.2
-) -> go.Figure:
-    """Add the SAR (Parabolic Stop and Reverse) indicator to the given plot.
+
+# Function to calculate the SAR indicator
+@register_indicator(
+    "sar",
+    series=[
+        IndicatorSeries(
+            "sar",
+            "SAR Indicator",
+            marker=dict(color="#6A80B9", size=6, symbol="circle"),
+        ),
+    ],
+    axis_title="SAR (Stop and Reverse)",
+)
+def compute_sar(
+    history_df: pd.DataFrame, step: float = 0.02, max_step: float = 0.2
+) -> Dict[str, pd.Series]:
+    """Calculate the SAR (Parabolic Stop and Reverse) indicator.
 
     Args:
-        fig (go.Figure): The plot to which the indicator will be added.
         history_df (pd.DataFrame): The historical stock data.
         step (float, optional): The step increment for the SAR calculation. Defaults to 0.02.
         max_step (float, optional): The maximum step increment for the SAR calculation. Defaults to 0.2.
 
     Returns:
-        go.Figure: The plot with the SAR indicator added.
+        Dict[str, pd.Series]: The series of the SAR indicator by key.
     """
 
-    # Calculate the SAR values using ta library
+    # Calculate the Parabolic SAR
     psar = PSARIndicator(
         high=history_df["High"],
         low=history_df["Low"],
@@ -29,30 +53,137 @@ def add_sar_indicator(
         max_step=max_step,
     )
 
-    # Add the SAR trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=psar.psar(),
-            mode="lines",
-            marker=dict(color="#6A80B9", size=6, symbol="circle"),
-            name="SAR Indicator",
-            yaxis="y2",
+    # Return the SAR
+    return {"sar": psar.psar()}
+
+
+# ParabolicSar class
+class ParabolicSar(StreamingOperator):
+    """Parabolic SAR fed with one bar at a time, following the loop of the
+    ta PSARIndicator
+    """
+
+    # Constructor
+    def __init__(self, step: float, max_step: float):
+        # Attributes
+        super().__init__()
+        self.step = step
+        self.max_step = max_step
+
+        # Position, trend, acceleration factor, extremes of the trend, SAR and
+        # the highs and lows of the two previous bars after the committed bars
+        self._state: Optional[tuple] = None
+
+    # Method to run one step of the loop
+    def _step(self, bar: Bar) -> tuple:
+        # The SAR of the first two bars is the close
+        if self._state is None:
+            return (1, True, self.step, bar.high, bar.low, bar.close, bar, None)
+        position, up_trend, factor, trend_high, trend_low, sar, bar1, bar2 = self._state
+        if position == 1:
+            return (2, up_trend, factor, trend_high, trend_low, bar.close, bar, bar1)
+
+        # If the trend is up
+        reversal = False
+        if up_trend:
+            # Move the SAR towards the highest high
+            sar = sar + factor * (trend_high - sar)
+
+            # If the low crosses the SAR, reverse
+            if bar.low < sar:
+                reversal = True
+                sar = trend_high
+                trend_low = bar.low
+                factor = self.step
+            else:
+                # Accelerate on a new high
+                if bar.high > trend_high:
+                    trend_high = bar.high
+                    factor = min(factor + self.step, self.max_step)
+
+                # Keep the SAR below the two previous lows
+                if bar2.low < sar:
+                    sar = bar2.low
+                elif bar1.low < sar:
+                    sar = bar1.low
+
+        # Else the trend is down
+        else:
+            # Move the SAR towards the lowest low
+            sar = sar - factor * (sar - trend_low)
+
+            # If the high crosses the SAR, reverse
+            if bar.high > sar:
+                reversal = True
+                sar = trend_low
+                trend_high = bar.high
+                factor = self.step
+            else:
+                # Accelerate on a new low
+                if bar.low < trend_low:
+                    trend_low = bar.low
+                    factor = min(factor + self.step, self.max_step)
+
+                # Keep the SAR above the two previous highs
+                if bar2.high > sar:
+                    sar = bar2.high
+                elif bar1.high > sar:
+                    sar = bar1.high
+
+        # Return the new state
+        return (
+            position + 1,
+            up_trend != reversal,
+            factor,
+            trend_high,
+            trend_low,
+            sar,
+            bar,
+            bar1,
         )
-    )
 
-    # Update layout to add secondary Y-axis for SAR
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="SAR (Stop and Reverse)",
-            overlaying="y",
-            side="right",
-        ),
-    )
+    # Method to add a bar to the state
+    def _commit(self, bar: Bar) -> None:
+        # Move the loop forward
+        self._state = self._step(bar)
+
+    # Method to compute the output of the pending bar
+    def _evaluate(self, bar: Bar) -> float:
+        # Return the SAR of the pending bar
+        return self._step(bar)[5]
+
+
+# SarStream class
+@register_stream("sar")
+class SarStream(StreamingIndicator):
+    """Incremental Parabolic SAR, matching compute_sar"""
+
+    # Constructor
+    def __init__(self, step: float = 0.02, max_step: float = 0.2):
+        # Operators
+        self.sar = ParabolicSar(step, max_step)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Return the SAR
+        return {"sar": self.sar.update(bar, revise)}
+
+
+# Function to add the SAR indicator to a plot
+def add_sar_indicator(
+    fig: go.Figure, history_df: pd.DataFrame, step: float = 0.02, max_step: float = 0.2
+) -> go.Figure:
+    """Add the SAR (Parabolic Stop and Reverse) indicator to the given plot.
+
+    Args:
+        fig (go.Figure): The plot to which the indicator will be added.
+        history_df (pd.DataFrame): The historical stock data.
+        step (float, optional): The step increment for the SAR calculation. Defaults to 0.02.
+        max_step (float, optional): The maximum step increment for the SAR calculation. Defaults to 0.2.
+
+    Returns:
+        go.Figure: The plot with the SAR indicator added.
+    """
 
-    # Return the figure
-    return fig
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "sar", step=step, max_step=max_step)
@@ -0,0 +1,150 @@
+# Imports
+import contextlib
+import contextvars
+import functools
+import inspect
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+import pandas as pd
+
+
+# SharedResults class
+class SharedResults:
+    """Results of the shared functions for one history frame
+
+    Attributes:
+        history_df (pd.DataFrame): The history frame the results belong to
+        results (Dict[Tuple, Any]): The results by function and arguments
+    """
+
+    # Constructor
+    def __init__(self, history_df: pd.DataFrame):
+        # Attributes
+        self.history_df = history_df
+        self.results: Dict[Tuple, Any] = {}
+
+
+# Shared results of the history frame being evaluated in the current context
+_shared_results: contextvars.ContextVar[Optional[SharedResults]] = (
+    contextvars.ContextVar("shared_results", default=None)
+)
+
+
+# Context manager to share the intermediate results
+@contextlib.contextmanager
+def shared_intermediates(history_df: pd.DataFrame) -> Iterator[SharedResults]:
+    """Compute every shared function once per set of arguments while the
+    indicators of a history frame are evaluated
+
+    Args:
+        history_df (pd.DataFrame): The history frame
+
+    Yields:
+        SharedResults: The results computed so far
+    """
+
+    # Start sharing the results of the history frame
+    shared_results = SharedResults(history_df)
+    token = _shared_results.set(shared_results)
+
+    # Stop sharing them on exit
+    try:
+        yield shared_results
+    finally:
+        _shared_results.reset(token)
+
+
+# Decorator to share the results of a function of the history
+def shared(func: Callable) -> Callable:
+    """Share the results of a function of the history frame
+
+    Inside shared_intermediates, calls with the same history frame and the
+    same arguments, defaults included, compute the result once. Outside, the
+    function is called as is. The shared results must not be modified.
+
+    Args:
+        func (Callable): Function taking the history frame first
+
+    Returns:
+        Callable: The wrapped function
+    """
+
+    # Signature used to fill in the defaults
+    signature = inspect.signature(func)
+
+    # Wrapper
+    @functools.wraps(func)
+    def wrapper(history_df: pd.DataFrame, *args: Any, **kwargs: Any) -> Any:
+        # If the results of this history frame are not shared
+        shared_results = _shared_results.get()
+        if shared_results is None or shared_results.history_df is not history_df:
+            return func(history_df, *args, **kwargs)
+
+        # Key of the call, with the defaults
+        arguments = signature.bind(history_df, *args, **kwargs)
+        arguments.apply_defaults()
+        key = (
+            func.__module__,
+            func.__qualname__,
+            *list(arguments.arguments.items())[1:],
+        )
+
+        # Compute the result on the first call
+        if key not in shared_results.results:
+            shared_results.results[key] = func(history_df, *args, **kwargs)
+
+        # Return the shared result
+        return shared_results.results[key]
+
+    # Return the wrapper
+    return wrapper
+
+
+# Function to calculate the EMA of the closing prices
+@shared
+def close_ema(history_df: pd.DataFrame, span: int, depth: int = 1) -> pd.Series:
+    """Calculate the EMA of the closing prices, applied depth times
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        span (int): The span of the EMA.
+        depth (int, optional): The number of chained EMAs. Defaults to 1.
+
+    Returns:
+        pd.Series: The EMA of the previous depth.
+    """
+
+    # Smooth the closing prices or the previous EMA
+    values = (
+        history_df["Close"] if depth == 1 else close_ema(history_df, span, depth - 1)
+    )
+
+    # Return the EMA
+    return values.ewm(span=span, adjust=False).mean()
+
+
+# Function to calculate the SMA of the closing prices
+@shared
+def close_sma(history_df: pd.DataFrame, window: int) -> pd.Series:
+    # Return the mean of the closing prices over the window
+    return history_df["Close"].rolling(window=window).mean()
+
+
+# Function to calculate the price channel
+@shared
+def price_channel(history_df: pd.DataFrame, window: int) -> Tuple[pd.Series, pd.Series]:
+    """Calculate the highest high and the lowest low over the window
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        window (int): The window of the channel.
+
+    Returns:
+        Tuple[pd.Series, pd.Series]: The highest high and the lowest low.
+    """
+
+    # Return the extremes of the window
+    return (
+        history_df["High"].rolling(window=window).max(),
+        history_df["Low"].rolling(window=window).min(),
+    )
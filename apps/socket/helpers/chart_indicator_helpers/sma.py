@@ -1,9 +1,62 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.shared import close_sma
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    RollingMean,
+    StreamingIndicator,
+)
+
 
 # Function to calculate the Simple Moving Average (SMA)
+@register_indicator(
+    "sma",
+    series=[
+        IndicatorSeries("sma", "SMA {window}", "#FFA500"),
+    ],
+)
+def compute_sma(history_df: pd.DataFrame, window: int = 20) -> Dict[str, pd.Series]:
+    """Calculate the Simple Moving Average (SMA) indicator.
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        window (int, optional): The window size for the SMA calculation. Defaults to 20.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the SMA indicator by key.
+    """
+
+    # Return the moving average of the close prices
+    return {"sma": close_sma(history_df, window)}
+
+
+# SmaStream class
+@register_stream("sma")
+class SmaStream(StreamingIndicator):
+    """Incremental Simple Moving Average (SMA), matching compute_sma"""
+
+    # Constructor
+    def __init__(self, window: int = 20):
+        # Operators
+        self.sma = RollingMean(window)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Return the SMA
+        return {"sma": self.sma.update(bar.close, revise)}
+
+
+# Function to add the SMA indicator to a plot
 def add_sma_indicator(
     fig: go.Figure, history_df: pd.DataFrame, window: int = 20
 ) -> go.Figure:
@@ -18,19 +71,5 @@ def add_sma_indicator(
         go.Figure: The plot with the SMA indicator added.
     """
 
-    # Calculate the SMA
-    history_df["SMA"] = history_df["Close"].rolling(window=window).mean()
-
-    # Add SMA trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["SMA"],
-            mode="lines",
-            line=dict(color="#FFA500", width=2),
-            name=f"SMA {window}",
-        )
-    )
-
-    # Return the figure
-    return fig
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "sma", window=window)
@@ -1,9 +1,84 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.shared import price_channel
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    RollingExtreme,
+    RollingMean,
+    StreamingIndicator,
+    divide,
+)
+
 
 # Function to calculate the Stochastic Oscillator (Stoch)
+@register_indicator(
+    "stoch",
+    series=[
+        IndicatorSeries("k", "%K {window}", "#1f77b4"),
+        IndicatorSeries("d", "%D {smooth_window}", "#FF6347"),
+    ],
+    axis_title="Stochastic Oscillator",
+)
+def compute_stoch(
+    history_df: pd.DataFrame, window: int = 14, smooth_window: int = 3
+) -> Dict[str, pd.Series]:
+    """Calculate the Stochastic Oscillator (Stoch) indicator.
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        window (int, optional): The window size for calculating the %K. Defaults to 14.
+        smooth_window (int, optional): The window size for smoothing the %K to get %D. Defaults to 3.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the Stochastic Oscillator (Stoch) indicator by key.
+    """
+
+    # Calculate the lowest low and the highest high over the window
+    highest_high, lowest_low = price_channel(history_df, window)
+
+    # Calculate %K
+    k = 100 * (history_df["Close"] - lowest_low) / (highest_high - lowest_low)
+
+    # Return %K and %D
+    return {"k": k, "d": k.rolling(smooth_window).mean()}
+
+
+# StochStream class
+@register_stream("stoch")
+class StochStream(StreamingIndicator):
+    """Incremental Stochastic Oscillator, matching compute_stoch"""
+
+    # Constructor
+    def __init__(self, window: int = 14, smooth_window: int = 3):
+        # Operators
+        self.lowest_low = RollingExtreme(window, largest=False)
+        self.highest_high = RollingExtreme(window)
+        self.d = RollingMean(smooth_window)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Calculate the lowest low and the highest high
+        lowest_low = self.lowest_low.update(bar.low, revise)
+        highest_high = self.highest_high.update(bar.high, revise)
+
+        # Calculate %K
+        k = divide(100 * (bar.close - lowest_low), highest_high - lowest_low)
+
+        # Return %K and %D
+        return {"k": k, "d": self.d.update(k, revise)}
+
+
+# Function to add the Stochastic Oscillator (Stoch) indicator to a plot
 def add_stochastic_indicator(
     fig: go.Figure, history_df: pd.DataFrame, window: int = 14, smooth_window: int = 3
 ) -> go.Figure:
@@ -19,54 +94,7 @@ def add_stochastic_indicator(
         go.Figure: The plot with the Stochastic Oscillator (Stoch) indicator added.
     """
 
-    # Calculate the %K (Stochastic Oscillator)
-    history_df["lowest_low"] = history_df["Low"].rolling(window).min()
-    history_df["highest_high"] = history_df["High"].rolling(window).max()
-    history_df["%K"] = (
-        100
-        * (history_df["Close"] - history_df["lowest_low"])
-        / (history_df["highest_high"] - history_df["lowest_low"])
+    # Compute and render the indicator
+    return add_indicator(
+        fig, history_df, "stoch", window=window, smooth_window=smooth_window
     )
-
-    # Calculate the %D (smoothed %K)
-    history_df["%D"] = history_df["%K"].rolling(smooth_window).mean()
-
-    # Add %K trace
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["%K"],
-            mode="lines",
-            line=dict(color="#1f77b4", width=2),
-            name=f"%K {window}",
-            yaxis="y2",
-        )
-    )
-
-    # Add %D trace
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["%D"],
-            mode="lines",
-            line=dict(color="#FF6347", width=2),
-            name=f"%D {smooth_window}",
-            yaxis="y2",
-        )
-    )
-
-    # Update layout to add secondary Y-axis
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="Stochastic Oscillator",
-            overlaying="y",
-            side="right",
-        ),
-    )
-
-    # Return the figure
-    return fig
@@ -1,9 +1,65 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.stoch import StochStream, compute_stoch
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    StreamingIndicator,
+)
+
 
 # Function to calculate the Stochastic Fast (%K) Indicator (StochF)
+@register_indicator(
+    "stochf",
+    series=[
+        IndicatorSeries("k", "%K {window}", "#1f77b4"),
+    ],
+    axis_title="Stochastic Fast (%K)",
+)
+def compute_stochf(
+    history_df: pd.DataFrame, window: int = 14, smooth_window: int = 3
+) -> Dict[str, pd.Series]:
+    """Calculate the Stochastic Fast (%K) indicator.
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        window (int, optional): The window size for calculating the %K. Defaults to 14.
+        smooth_window (int, optional): The window size for smoothing the %K to get the %D. Defaults to 3.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the Stochastic Fast (%K) indicator by key.
+    """
+
+    # Return %K of the stochastic oscillator
+    return {"k": compute_stoch(history_df, window, smooth_window)["k"]}
+
+
+# StochfStream class
+@register_stream("stochf")
+class StochfStream(StreamingIndicator):
+    """Incremental Fast Stochastic Oscillator, matching compute_stochf"""
+
+    # Constructor
+    def __init__(self, window: int = 14, smooth_window: int = 3):
+        # Operators
+        self.stoch = StochStream(window, smooth_window)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Return %K
+        return {"k": self.stoch.update(bar, revise)["k"]}
+
+
+# Function to add the Stochastic Fast (%K) indicator to a plot
 def add_stochastic_fast_indicator(
     fig: go.Figure, history_df: pd.DataFrame, window: int = 14, smooth_window: int = 3
 ) -> go.Figure:
@@ -19,39 +75,7 @@ def add_stochastic_fast_indicator(
         go.Figure: The plot with the Stochastic Fast (%K) indicator added.
     """
 
-    # Calculate the %K (Stochastic Fast)
-    history_df["lowest_low"] = history_df["Low"].rolling(window).min()
-    history_df["highest_high"] = history_df["High"].rolling(window).max()
-    history_df["%K"] = (
-        100
-        * (history_df["Close"] - history_df["lowest_low"])
-        / (history_df["highest_high"] - history_df["lowest_low"])
+    # Compute and render the indicator
+    return add_indicator(
+        fig, history_df, "stochf", window=window, smooth_window=smooth_window
     )
-
-    # Add the %K trace to the plot (Stochastic Fast)
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["%K"],
-            mode="lines",
-            line=dict(color="#1f77b4", width=2),
-            name=f"%K {window}",
-            yaxis="y2",
-        )
-    )
-
-    # Update layout to add secondary Y-axis
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="Stochastic Fast (%K)",
-            overlaying="y",
-            side="right",
-        ),
-    )
-
-    # Return the figure
-    return fig
@@ -1,9 +1,93 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.rsi import RsiStream, compute_rsi
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    RollingExtreme,
+    RollingMean,
+    StreamingIndicator,
+    divide,
+)
+
 
 # Function to calculate the Stochastic RSI (StochRSI) with dual Y-axis
+@register_indicator(
+    "stochrsi",
+    series=[
+        IndicatorSeries("stochrsi", "StochRSI {window}", "#FF6347"),
+        IndicatorSeries(
+            "signal", "StochRSI Signal {smooth_window}", "#32CD32", dash="dot"
+        ),
+    ],
+    axis_title="Stochastic RSI",
+    axis_range=[0, 1],
+)
+def compute_stochrsi(
+    history_df: pd.DataFrame, window: int = 14, smooth_window: int = 3
+) -> Dict[str, pd.Series]:
+    """Calculate the Stochastic RSI (StochRSI) indicator with a dual Y-axis.
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        window (int, optional): The window size for calculating the RSI. Defaults to 14.
+        smooth_window (int, optional): The window size for smoothing the StochRSI to get the signal line. Defaults to 3.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the Stochastic RSI (StochRSI) indicator by key.
+    """
+
+    # Calculate the RSI
+    rsi = compute_rsi(history_df, window)["rsi"]
+
+    # Calculate the lowest and highest RSI over the window
+    lowest_rsi = rsi.rolling(window).min()
+    highest_rsi = rsi.rolling(window).max()
+
+    # Calculate the StochRSI
+    stochrsi = (rsi - lowest_rsi) / (highest_rsi - lowest_rsi)
+
+    # Return the StochRSI and its signal line
+    return {"stochrsi": stochrsi, "signal": stochrsi.rolling(smooth_window).mean()}
+
+
+# StochrsiStream class
+@register_stream("stochrsi")
+class StochrsiStream(StreamingIndicator):
+    """Incremental Stochastic RSI (StochRSI), matching compute_stochrsi"""
+
+    # Constructor
+    def __init__(self, window: int = 14, smooth_window: int = 3):
+        # Operators
+        self.rsi = RsiStream(window)
+        self.lowest_rsi = RollingExtreme(window, largest=False)
+        self.highest_rsi = RollingExtreme(window)
+        self.signal = RollingMean(smooth_window)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Calculate the RSI and its extremes over the window
+        rsi = self.rsi.update(bar, revise)["rsi"]
+        lowest_rsi = self.lowest_rsi.update(rsi, revise)
+        highest_rsi = self.highest_rsi.update(rsi, revise)
+
+        # Calculate the StochRSI
+        stochrsi = divide(rsi - lowest_rsi, highest_rsi - lowest_rsi)
+
+        # Return the StochRSI and the signal line
+        return {"stochrsi": stochrsi, "signal": self.signal.update(stochrsi, revise)}
+
+
+# Function to add the Stochastic RSI (StochRSI) indicator to a plot
 def add_stochastic_rsi_indicator(
     fig: go.Figure, history_df: pd.DataFrame, window: int = 14, smooth_window: int = 3
 ) -> go.Figure:
@@ -19,62 +103,7 @@ def add_stochastic_rsi_indicator(
         go.Figure: The plot with the Stochastic RSI (StochRSI) indicator added and dual Y-axis.
     """
 
-    # Calculate the RSI (Relative Strength Index)
-    delta = history_df["Close"].diff()
-    gain = delta.where(delta > 0, 0)
-    loss = -delta.where(delta < 0, 0)
-    avg_gain = gain.rolling(window).mean()
-    avg_loss = loss.rolling(window).mean()
-    rs = avg_gain / avg_loss
-    history_df["RSI"] = 100 - (100 / (1 + rs))
-
-    # Calculate the Stochastic RSI
-    lowest_rsi = history_df["RSI"].rolling(window).min()
-    highest_rsi = history_df["RSI"].rolling(window).max()
-    history_df["StochRSI"] = (history_df["RSI"] - lowest_rsi) / (
-        highest_rsi - lowest_rsi
+    # Compute and render the indicator
+    return add_indicator(
+        fig, history_df, "stochrsi", window=window, smooth_window=smooth_window
     )
-
-    # Smooth the Stochastic RSI to get the signal line
-    history_df["StochRSI_Smooth"] = history_df["StochRSI"].rolling(smooth_window).mean()
-
-    # Add Stochastic RSI trace (using secondary y-axis)
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["StochRSI"],
-            mode="lines",
-            line=dict(color="#FF6347", width=2),
-            name=f"StochRSI {window}",
-            yaxis="y2",
-        )
-    )
-
-    # Add the Stochastic RSI smoothed signal line (using secondary y-axis)
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["StochRSI_Smooth"],
-            mode="lines",
-            line=dict(color="#32CD32", width=2, dash="dot"),
-            name=f"StochRSI Signal {smooth_window}",
-            yaxis="y2",
-        )
-    )
-
-    # Update layout to add secondary Y-axis
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="Stochastic RSI",
-            overlaying="y",
-            side="right",
-            range=[0, 1],
-        ),
-    )
-
-    # Return the figure
-    return fig
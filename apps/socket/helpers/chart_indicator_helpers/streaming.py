@@ -0,0 +1,745 @@
+# Imports
+import math
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    INDICATOR_REGISTRY,
+    IndicatorResult,
+    compute_indicator,
+)
+
+# Missing value of the streamed series
+NAN = float("nan")
+
+# Columns of the history fed to the streams
+BAR_COLUMNS = ["Open", "High", "Low", "Close"]
+
+
+# Bar class
+class Bar(NamedTuple):
+    """Prices of one bar of the history"""
+
+    # Attributes
+    open: float
+    high: float
+    low: float
+    close: float
+
+
+# Function to check for a missing value
+def is_nan(value: float) -> bool:
+    # NaN is the only value not equal to itself
+    return value != value
+
+
+# Function to divide like NumPy does
+def divide(numerator: float, denominator: float) -> float:
+    """Divide two floats, returning NaN or an infinity instead of raising
+    on a zero denominator, like the batch computations do
+
+    Args:
+        numerator (float): The numerator
+        denominator (float): The denominator
+
+    Returns:
+        float: The quotient
+    """
+
+    # If the denominator is not zero
+    if denominator != 0:
+        return numerator / denominator
+
+    # Zero or missing over zero is missing
+    if numerator == 0 or is_nan(numerator):
+        return NAN
+
+    # Return the signed infinity
+    return math.copysign(math.inf, numerator) * math.copysign(1, denominator)
+
+
+# Function to get the lowest of two values like pandas min(axis=1)
+def nanmin(first: float, second: float) -> float:
+    # Skip the missing values
+    if is_nan(first):
+        return second
+    if is_nan(second):
+        return first
+
+    # Return the lowest value
+    return min(first, second)
+
+
+# Function to get the highest of two values like pandas max(axis=1)
+def nanmax(first: float, second: float) -> float:
+    # Skip the missing values
+    if is_nan(first):
+        return second
+    if is_nan(second):
+        return first
+
+    # Return the highest value
+    return max(first, second)
+
+
+# StreamingOperator class
+class StreamingOperator(ABC):
+    """Stateful operator fed with one value per bar
+
+    The state only covers the committed bars, the latest bar stays pending
+    until the next bar is appended. Revising the latest bar evaluates the
+    new value against the same committed state, so appends and revisions
+    both cost O(1).
+    """
+
+    # Constructor
+    def __init__(self):
+        # Attributes
+        self._pending: Any = None
+        self._has_pending = False
+
+    # Method to feed a bar
+    def update(self, value: Any, revise: bool = False) -> float:
+        """Feed the value of a new bar, or the new value of the latest bar
+
+        Args:
+            value (Any): The value
+            revise (bool, optional): Replace the latest bar instead of
+                appending a new one. Defaults to False.
+
+        Returns:
+            float: The output of the latest bar
+        """
+
+        # Commit the previous bar when a new bar is appended
+        if self._has_pending and not revise:
+            self._commit(self._pending)
+
+        # Keep the latest bar pending
+        self._pending = value
+        self._has_pending = True
+
+        # Return the output of the latest bar
+        return self._evaluate(value)
+
+    # Method to add a bar to the state
+    @abstractmethod
+    def _commit(self, value: Any) -> None:
+        """Add a committed bar to the state
+
+        Args:
+            value (Any): The value of the bar
+        """
+
+    # Method to compute the output of the pending bar
+    @abstractmethod
+    def _evaluate(self, value: Any) -> float:
+        """Compute the output of the pending bar from the committed state
+
+        Args:
+            value (Any): The value of the pending bar
+
+        Returns:
+            float: The output of the bar
+        """
+
+
+# Lag class
+class Lag(StreamingOperator):
+    """Value of the bar periods bars before, like pandas shift(periods)"""
+
+    # Constructor
+    def __init__(self, periods: int = 1):
+        # Attributes
+        super().__init__()
+        self._values: deque = deque(maxlen=periods)
+
+    # Method to add a bar to the state
+    def _commit(self, value: float) -> None:
+        # Keep the last values
+        self._values.append(value)
+
+    # Method to compute the output of the pending bar
+    def _evaluate(self, value: float) -> float:
+        # Return the oldest kept value once enough bars were seen
+        if len(self._values) < self._values.maxlen:
+            return NAN
+        return self._values[0]
+
+
+# RollingSum class
+class RollingSum(StreamingOperator):
+    """Sum over a window, NaN until the window is complete or while it holds
+    a missing value, like pandas rolling(window).sum()
+
+    The committed part of the window is kept as a running sum, which is
+    summed again exactly once per window to bound the rounding drift.
+    """
+
+    # Constructor
+    def __init__(self, window: int):
+        # Attributes
+        super().__init__()
+        self.window = window
+        self._tail: deque = deque()
+        self._sum = 0.0
+        self._missing = 0
+        self._commits = 0
+
+    # Method to add a bar to the state
+    def _commit(self, value: float) -> None:
+        # Add the value to the committed part of the window
+        self._tail.append(value)
+        if is_nan(value):
+            self._missing += 1
+        else:
+            self._sum += value
+
+        # Drop the value leaving the window
+        if len(self._tail) >= self.window:
+            oldest = self._tail.popleft()
+            if is_nan(oldest):
+                self._missing -= 1
+            else:
+                self._sum -= oldest
+
+        # Sum the window again once per window
+        self._commits += 1
+        if self._commits % self.window == 0:
+            self._sum = math.fsum(value for value in self._tail if not is_nan(value))
+
+    # Method to compute the output of the pending bar
+    def _evaluate(self, value: float) -> float:
+        # If the window is not complete or holds a missing value
+        if len(self._tail) < self.window - 1 or self._missing or is_nan(value):
+            return NAN
+
+        # Return the sum of the window
+        return self._sum + value
+
+
+# RollingMean class
+class RollingMean(RollingSum):
+    """Mean over a window, like pandas rolling(window).mean()"""
+
+    # Method to compute the output of the pending bar
+    def _evaluate(self, value: float) -> float:
+        # Return the sum divided by the window
+        return super()._evaluate(value) / self.window
+
+
+# RollingStd class
+class RollingStd(StreamingOperator):
+    """Sample standard deviation over a window, like pandas
+    rolling(window).std()
+
+    The committed part of the window is kept as a count, a mean and a sum of
+    squared deviations updated with Welford's method, so a flat window gives
+    exactly zero.
+    """
+
+    # Constructor
+    def __init__(self, window: int, ddof: int = 1):
+        # Attributes
+        super().__init__()
+        self.window = window
+        self.ddof = ddof
+        self._tail: deque = deque()
+        self._missing = 0
+        self._commits = 0
+        self._count = 0
+        self._mean = 0.0
+        self._squares = 0.0
+
+    # Method to add a value to the moments
+    def _add(self, value: float) -> None:
+        # Update the count, the mean and the squared deviations
+        self._count += 1
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._squares += delta * (value - self._mean)
+
+    # Method to remove a value from the moments
+    def _remove(self, value: float) -> None:
+        # If the value is the last one
+        if self._count == 1:
+            self._count, self._mean, self._squares = 0, 0.0, 0.0
+            return
+
+        # Update the count, the mean and the squared deviations
+        self._count -= 1
+        delta = value - self._mean
+        self._mean -= delta / self._count
+        self._squares = max(self._squares - delta * (value - self._mean), 0.0)
+
+    # Method to add a bar to the state
+    def _commit(self, value: float) -> None:
+        # Add the value to the committed part of the window
+        self._tail.append(value)
+        if is_nan(value):
+            self._missing += 1
+        else:
+            self._add(value)
+
+        # Drop the value leaving the window
+        if len(self._tail) >= self.window:
+            oldest = self._tail.popleft()
+            if is_nan(oldest):
+                self._missing -= 1
+            else:
+                self._remove(oldest)
+
+        # Compute the moments again once per window
+        self._commits += 1
+        if self._commits % self.window == 0:
+            values = [value for value in self._tail if not is_nan(value)]
+            self._count = len(values)
+            self._mean = math.fsum(values) / len(values) if values else 0.0
+            self._squares = math.fsum((value - self._mean) ** 2 for value in values)
+
+    # Method to compute the output of the pending bar
+    def _evaluate(self, value: float) -> float:
+        # If the window is not complete or holds a missing value
+        if len(self._tail) < self.window - 1 or self._missing or is_nan(value):
+            return NAN
+
+        # Add the pending value to the squared deviations of the window
+        delta = value - self._mean
+        squares = self._squares + delta * delta * self._count / self.window
+
+        # Return the standard deviation
+        return math.sqrt(divide(squares, self.window - self.ddof))
+
+
+# RollingExtreme class
+class RollingExtreme(StreamingOperator):
+    """Highest or lowest value over a window, like pandas rolling(window).max()
+
+    The committed part of the window is kept as a monotonic deque of the
+    values that can still become the extreme, the latest one on ties.
+    """
+
+    # Constructor
+    def __init__(self, window: int, largest: bool = True):
+        # Attributes
+        super().__init__()
+        self.window = window
+        self.largest = largest
+        self._candidates: deque = deque()
+        self._last_missing = -math.inf
+        self._commits = 0
+
+    # Method to check if a value beats or ties another one
+    def _beats(self, value: float, other: float) -> bool:
+        # Compare in the direction of the extreme
+        return value >= other if self.largest else value <= other
+
+    # Method to add a bar to the state
+    def _commit(self, value: float) -> None:
+        # Position of the bar
+        position = self._commits
+        self._commits += 1
+
+        # Keep the position of the missing values, the others become candidates
+        if is_nan(value):
+            self._last_missing = position
+        else:
+            # Drop the candidates beaten by the value
+            while self._candidates and self._beats(value, self._candidates[-1][1]):
+                self._candidates.pop()
+            self._candidates.append((position, value))
+
+        # Drop the candidates leaving the window of the next bar
+        while self._candidates and self._candidates[0][0] <= position + 1 - self.window:
+            self._candidates.popleft()
+
+    # Method to get the extreme of the window and its age
+    def _extreme(self, value: float) -> Tuple[float, float]:
+        # If the window is not complete or holds a missing value
+        position = self._commits
+        if (
+            position < self.window - 1
+            or self._last_missing > position - self.window
+            or is_nan(value)
+        ):
+            return NAN, NAN
+
+        # The pending value wins ties, being the latest
+        if not self._candidates or self._beats(value, self._candidates[0][1]):
+            return value, 0.0
+
+        # Return the oldest candidate and its age
+        candidate_position, candidate = self._candidates[0]
+        return candidate, float(position - candidate_position)
+
+    # Method to compute the output of the pending bar
+    def _evaluate(self, value: float) -> float:
+        # Return the extreme of the window
+        return self._extreme(value)[0]
+
+
+# RollingExtremeAge class
+class RollingExtremeAge(RollingExtreme):
+    """Number of bars since the extreme of the window, the latest one on ties"""
+
+    # Method to compute the output of the pending bar
+    def _evaluate(self, value: float) -> float:
+        # Return the age of the extreme of the window
+        return self._extreme(value)[1]
+
+
+# RollingMeanDeviation class
+class RollingMeanDeviation(StreamingOperator):
+    """Mean absolute deviation over a window
+
+    The deviations depend on the mean of the whole window, so they are
+    summed again on every bar in O(window).
+    """
+
+    # Constructor
+    def __init__(self, window: int):
+        # Attributes
+        super().__init__()
+        self.window = window
+        self._tail: deque = deque(maxlen=max(window - 1, 0))
+
+    # Method to add a bar to the state
+    def _commit(self, value: float) -> None:
+        # Keep the committed part of the window
+        if self.window > 1:
+            self._tail.append(value)
+
+    # Method to compute the output of the pending bar
+    def _evaluate(self, value: float) -> float:
+        # If the window is not complete
+        if len(self._tail) < self.window - 1:
+            return NAN
+
+        # Return the mean absolute deviation of the window
+        values = [*self._tail, value]
+        mean = sum(values) / self.window
+        return sum(abs(item - mean) for item in values) / self.window
+
+
+# WeightedMean class
+class WeightedMean(StreamingOperator):
+    """Linearly weighted mean over a window, the latest bar weighs the most
+
+    The committed part of the window is kept as its sum and its weighted
+    sum, both shifted by one weight when a bar is committed.
+    """
+
+    # Constructor
+    def __init__(self, window: int):
+        # Attributes
+        super().__init__()
+        self.window = window
+        self._tail: deque = deque()
+        self._sum = 0.0
+        self._weighted = 0.0
+        self._commits = 0
+
+    # Method to add a bar to the state
+    def _commit(self, value: float) -> None:
+        # If the committed part of the window is full, shift the weights
+        if len(self._tail) == self.window - 1:
+            self._weighted += (self.window - 1) * value - self._sum
+            self._sum += value - self._tail.popleft()
+        else:
+            self._weighted += (len(self._tail) + 1) * value
+            self._sum += value
+        self._tail.append(value)
+
+        # Sum the window again once per window
+        self._commits += 1
+        if self._commits % self.window == 0:
+            self._sum = math.fsum(self._tail)
+            self._weighted = math.fsum(
+                weight * item for weight, item in enumerate(self._tail, start=1)
+            )
+
+    # Method to compute the output of the pending bar
+    def _evaluate(self, value: float) -> float:
+        # If the window is not complete
+        if len(self._tail) < self.window - 1:
+            return NAN
+
+        # Return the weighted mean of the window
+        return (self._weighted + self.window * value) / (
+            self.window * (self.window + 1) / 2
+        )
+
+
+# Ema class
+class Ema(StreamingOperator):
+    """Exponential moving average, like pandas ewm(span=span, adjust=False)"""
+
+    # Constructor
+    def __init__(self, span: int):
+        # Attributes
+        super().__init__()
+        self.alpha = 2 / (span + 1)
+        self._weighted = NAN
+        self._old_weight = 1.0
+
+    # Method to run one step of the recursion
+    def _step(self, value: float) -> Tuple[float, float]:
+        # Start at the first valid value
+        if is_nan(self._weighted):
+            return value, 1.0
+
+        # Decay the weight of the previous average, skipping missing values
+        old_weight = self._old_weight * (1 - self.alpha)
+        if is_nan(value):
+            return self._weighted, old_weight
+
+        # Return the new average, computed like pandas to round the same way
+        weighted = self._weighted
+        if weighted != value:
+            weighted = (old_weight * weighted + self.alpha * value) / (
+                old_weight + self.alpha
+            )
+        return weighted, 1.0
+
+    # Method to add a bar to the state
+    def _commit(self, value: float) -> None:
+        # Move the recursion forward
+        self._weighted, self._old_weight = self._step(value)
+
+    # Method to compute the output of the pending bar
+    def _evaluate(self, value: float) -> float:
+        # Return the average including the pending value
+        return self._step(value)[0]
+
+
+# CumulativeSum class
+class CumulativeSum(StreamingOperator):
+    """Running total, like pandas cumsum()"""
+
+    # Constructor
+    def __init__(self):
+        # Attributes
+        super().__init__()
+        self._total = 0.0
+
+    # Method to add a bar to the state
+    def _commit(self, value: float) -> None:
+        # Add the value, skipping missing values
+        if not is_nan(value):
+            self._total += value
+
+    # Method to compute the output of the pending bar
+    def _evaluate(self, value: float) -> float:
+        # Return the total including the pending value
+        return NAN if is_nan(value) else self._total + value
+
+
+# AdaptiveFilter class
+class AdaptiveFilter(StreamingOperator):
+    """Exponential filter whose smoothing factor changes on every bar, fed
+    with (value, factor) pairs, like kernels.adaptive_filter
+    """
+
+    # Constructor
+    def __init__(self, start: int):
+        # Attributes
+        super().__init__()
+        self.start = start
+        self._previous = NAN
+        self._commits = 0
+
+    # Method to run one step of the recursion
+    def _step(self, pair: Tuple[float, float]) -> float:
+        # Get the value and its smoothing factor
+        value, factor = pair
+
+        # Nothing before the start, the value itself at the start
+        if self._commits < self.start:
+            return NAN
+        if self._commits == self.start:
+            return value
+
+        # Return the filtered value
+        return self._previous + factor * (value - self._previous)
+
+    # Method to add a bar to the state
+    def _commit(self, pair: Tuple[float, float]) -> None:
+        # Move the recursion forward
+        self._previous = self._step(pair)
+        self._commits += 1
+
+    # Method to compute the output of the pending bar
+    def _evaluate(self, pair: Tuple[float, float]) -> float:
+        # Return the filtered pending value
+        return self._step(pair)
+
+
+# ForwardFill class
+class ForwardFill(StreamingOperator):
+    """Replace missing values with the last valid one, like pandas ffill()"""
+
+    # Constructor
+    def __init__(self):
+        # Attributes
+        super().__init__()
+        self._last = NAN
+
+    # Method to add a bar to the state
+    def _commit(self, value: float) -> None:
+        # Keep the last valid value
+        if not is_nan(value):
+            self._last = value
+
+    # Method to compute the output of the pending bar
+    def _evaluate(self, value: float) -> float:
+        # Return the value or the last valid one
+        return self._last if is_nan(value) else value
+
+
+# StreamingIndicator class
+class StreamingIndicator(ABC):
+    """Incremental version of a registered indicator
+
+    Subclasses create their operators in the constructor, from the same
+    parameters as the compute function, and feed every operator exactly
+    once per bar with the same revise flag.
+    """
+
+    # Method to feed a bar
+    @abstractmethod
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        """Feed a new bar, or the new prices of the latest bar
+
+        Args:
+            bar (Bar): The prices of the bar
+            revise (bool, optional): Replace the latest bar instead of
+                appending a new one. Defaults to False.
+
+        Returns:
+            Dict[str, float]: The values of the output series for the bar
+        """
+
+
+# IndicatorStream class
+class IndicatorStream:
+    """Keeps a registered indicator up to date with a growing history
+
+    A new history is computed in one pass by the batch compute function.
+    When a later history only appends bars to the previous one or revises
+    its last bar, the streaming indicator is built from the previous history
+    once, then only the changed bars are fed to it. Any other change goes
+    back to the batch computation.
+
+    Attributes:
+        spec (IndicatorSpec): The indicator
+        params (Dict[str, Any]): The parameters, defaults included
+    """
+
+    # Constructor
+    def __init__(self, name: str, **params: Any):
+        # Attributes
+        self.spec = INDICATOR_REGISTRY[name]
+        self.params = {**self.spec.defaults, **params}
+        self._indicator: Optional[StreamingIndicator] = None
+        self._index: Optional[pd.Index] = None
+        self._bars: Optional[np.ndarray] = None
+        self._values: Dict[str, List[float]] = {}
+        self._result: Dict[str, pd.Series] = {}
+        self._lock = threading.Lock()
+
+    # Method to check if a history extends the previous one
+    def _extends(self, index: pd.Index, bars: np.ndarray) -> bool:
+        # If nothing was computed yet
+        if self._index is None or not len(self._index):
+            return False
+
+        # Every previous bar but the last one must be unchanged
+        length = len(self._index)
+        return (
+            len(index) >= length
+            and index[:length].equals(self._index)
+            and np.array_equal(bars[: length - 1], self._bars[: length - 1], True)
+        )
+
+    # Method to feed a bar
+    def _feed(self, bar: List[float], revise: bool) -> None:
+        # Compute the outputs of the bar
+        outputs = self._indicator.update(Bar(*bar), revise)
+
+        # Replace or append the values
+        for key, value in outputs.items():
+            if revise:
+                self._values[key][-1] = value
+            else:
+                self._values[key].append(value)
+
+    # Method to build the streaming indicator
+    def _replay(self, bars: np.ndarray) -> None:
+        # Feed every bar to a new streaming indicator
+        self._indicator = self.spec.stream(**self.params)
+        self._values = {series.key: [] for series in self.spec.series}
+        for bar in bars.tolist():
+            self._feed(bar, revise=False)
+
+    # Method to update the indicator
+    def update(self, history_df: pd.DataFrame) -> IndicatorResult:
+        """Update the indicator with the latest history
+
+        Args:
+            history_df (pd.DataFrame): The historical stock data
+
+        Returns:
+            IndicatorResult: The indicator over the whole history
+        """
+
+        # Get the bars
+        index = history_df.index
+        bars = np.column_stack(
+            [history_df[column].to_numpy(dtype=float) for column in BAR_COLUMNS]
+        )
+
+        # Lock the stream
+        with self._lock:
+            # If the history extends the previous one
+            if self._extends(index, bars):
+                # Check if the last previous bar changed
+                length = len(self._index)
+                revised = not np.array_equal(
+                    bars[length - 1], self._bars[length - 1], True
+                )
+
+                # If there are changes
+                if revised or len(index) > length:
+                    # Build the streaming indicator on the first change
+                    if self._indicator is None:
+                        self._replay(self._bars)
+
+                    # Revise the last previous bar, then append the new bars
+                    if revised:
+                        self._feed(bars[length - 1].tolist(), revise=True)
+                    for bar in bars[length:].tolist():
+                        self._feed(bar, revise=False)
+
+                    # Keep the streamed series
+                    self._result = {
+                        key: pd.Series(values, index=index, dtype=float)
+                        for key, values in self._values.items()
+                    }
+
+            # Else compute the whole history in one pass
+            else:
+                self._indicator = None
+                self._result = compute_indicator(
+                    self.spec.name, history_df, **self.params
+                ).values
+
+            # Keep the history
+            self._index, self._bars = index, bars
+
+            # Return the computed series
+            return IndicatorResult(self.spec, self.params, self._result)
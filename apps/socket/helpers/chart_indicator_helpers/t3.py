@@ -1,10 +1,79 @@
 # Imports
-import numpy as np
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers import kernels
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    Ema,
+    StreamingIndicator,
+)
+
 
 # Function to calculate the T3 indicator (Triple Exponential Moving Average)
+@register_indicator(
+    "t3",
+    series=[
+        IndicatorSeries("t3", "T3 {window}", "#FF6347"),
+    ],
+)
+def compute_t3(
+    history_df: pd.DataFrame, window: int = 10, vfactor: float = 0.7
+) -> Dict[str, pd.Series]:
+    """Calculate the T3 (Triple Exponential Moving Average) indicator.
+
+    The T3 indicator smooths the price data three times using an exponential moving average, with an additional volume factor to control smoothness.
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        window (int, optional): The window size for calculating the moving average. Defaults to 10.
+        vfactor (float, optional): The volume factor that influences the degree of smoothing. Defaults to 0.7.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the T3 indicator by key.
+    """
+
+    # Calculate the T3 as the smoothed weighted combination of the chained EMAs
+    t3 = kernels.t3(history_df["Close"].to_numpy(), window, vfactor)
+
+    # Return the T3
+    return {"t3": pd.Series(t3, index=history_df.index)}
+
+
+# T3Stream class
+@register_stream("t3")
+class T3Stream(StreamingIndicator):
+    """Incremental T3 moving average, matching compute_t3"""
+
+    # Constructor
+    def __init__(self, window: int = 10, vfactor: float = 0.7):
+        # Operators
+        self.vfactor = vfactor
+        self.ema1 = Ema(window)
+        self.ema2 = Ema(window)
+        self.ema3 = Ema(window)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Calculate the chained EMAs
+        e1 = self.ema1.update(bar.close, revise)
+        e2 = self.ema2.update(e1, revise)
+
+        # Return the smoothed combination of the first two EMAs
+        return {
+            "t3": self.ema3.update((1 + self.vfactor) * e1 - self.vfactor * e2, revise)
+        }
+
+
+# Function to add the T3 indicator to a plot
 def add_t3_indicator(
     fig: go.Figure,
     history_df: pd.DataFrame,
@@ -25,36 +94,5 @@ def add_t3_indicator(
         go.Figure: The plot with the T3 indicator added.
     """
 
-    # Calculate the Exponential Moving Average (EMA) of the close prices
-    def ema(series, window):
-        """Calculate the Exponential Moving Average (EMA)."""
-        return series.ewm(span=window, adjust=False).mean()
-
-    # Calculate the first EMA (e1)
-    e1 = ema(history_df["Close"], window)
-
-    # Calculate the second EMA (e2) of e1
-    e2 = ema(e1, window)
-
-    # Calculate the third EMA (e3) of e2
-    e3 = ema(e2, window)
-
-    # Calculate the T3 as a weighted combination of e1, e2, and e3
-    t3 = (1 + vfactor) * e1 - vfactor * e2
-
-    # Apply EMA again to the T3 to get smoother results (apply it to the combination, not individual EMAs)
-    t3 = ema(t3, window)
-
-    # Add T3 trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=t3,
-            mode="lines",
-            line=dict(color="#FF6347", width=2),
-            name=f"T3 {window}",
-        )
-    )
-
-    # Return the figure
-    return fig
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "t3", window=window, vfactor=vfactor)
@@ -1,9 +1,77 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.shared import close_ema
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    Ema,
+    StreamingIndicator,
+)
+
 
 # Function to calculate the Triple Exponential Moving Average (TEMA)
+@register_indicator(
+    "tema",
+    series=[
+        IndicatorSeries("tema", "TEMA {window}", "#8A2BE2"),
+    ],
+)
+def compute_tema(history_df: pd.DataFrame, window: int = 20) -> Dict[str, pd.Series]:
+    """Calculate the Triple Exponential Moving Average (TEMA) indicator.
+
+    TEMA is a smoother and faster-moving indicator compared to traditional EMA by
+    reducing lag further.
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        window (int, optional): The window size for the TEMA calculation. Defaults to 20.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the TEMA indicator by key.
+    """
+
+    # Calculate the three chained EMAs
+    ema1 = close_ema(history_df, window)
+    ema2 = close_ema(history_df, window, 2)
+    ema3 = close_ema(history_df, window, 3)
+
+    # Return the TEMA
+    return {"tema": 3 * ema1 - 3 * ema2 + ema3}
+
+
+# TemaStream class
+@register_stream("tema")
+class TemaStream(StreamingIndicator):
+    """Incremental Triple Exponential Moving Average (TEMA), matching compute_tema"""
+
+    # Constructor
+    def __init__(self, window: int = 20):
+        # Operators
+        self.ema1 = Ema(window)
+        self.ema2 = Ema(window)
+        self.ema3 = Ema(window)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Calculate the chained EMAs
+        ema1 = self.ema1.update(bar.close, revise)
+        ema2 = self.ema2.update(ema1, revise)
+        ema3 = self.ema3.update(ema2, revise)
+
+        # Return the TEMA
+        return {"tema": 3 * ema1 - 3 * ema2 + ema3}
+
+
+# Function to add the TEMA indicator to a plot
 def add_tema_indicator(
     fig: go.Figure, history_df: pd.DataFrame, window: int = 20
 ) -> go.Figure:
@@ -21,28 +89,5 @@ def add_tema_indicator(
         go.Figure: The plot with the TEMA indicator added.
     """
 
-    # Calculate the first EMA
-    ema1 = history_df["Close"].ewm(span=window, adjust=False).mean()
-
-    # Calculate the second EMA from the first EMA
-    ema2 = ema1.ewm(span=window, adjust=False).mean()
-
-    # Calculate the third EMA from the second EMA
-    ema3 = ema2.ewm(span=window, adjust=False).mean()
-
-    # Calculate the TEMA
-    history_df["TEMA"] = 3 * ema1 - 3 * ema2 + ema3
-
-    # Add TEMA trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["TEMA"],
-            mode="lines",
-            line=dict(color="#8A2BE2", width=2),
-            name=f"TEMA {window}",
-        )
-    )
-
-    # Return the figure
-    return fig
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "tema", window=window)
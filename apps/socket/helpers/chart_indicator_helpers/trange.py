@@ -1,9 +1,82 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    Lag,
+    StreamingIndicator,
+    nanmax,
+)
+
 
 # Function to calculate the True Range (TRANGE) indicator
+@register_indicator(
+    "trange",
+    series=[
+        IndicatorSeries("trange", "True Range", "#FFD700"),
+    ],
+    axis_title="True Range Indicator",
+)
+def compute_trange(history_df: pd.DataFrame) -> Dict[str, pd.Series]:
+    """Calculate the True Range (TRANGE) indicator.
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the True Range (TRANGE) indicator by key.
+    """
+
+    # Get the previous close price
+    previous_close = history_df["Close"].shift(1)
+
+    # Return the largest of the range and the gaps from the previous close
+    return {
+        "trange": pd.concat(
+            [
+                history_df["High"] - history_df["Low"],
+                abs(history_df["High"] - previous_close),
+                abs(history_df["Low"] - previous_close),
+            ],
+            axis=1,
+        ).max(axis=1)
+    }
+
+
+# TrangeStream class
+@register_stream("trange")
+class TrangeStream(StreamingIndicator):
+    """Incremental True Range (TRANGE), matching compute_trange"""
+
+    # Constructor
+    def __init__(self):
+        # Operators
+        self.previous_close = Lag()
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Get the previous close, missing at the first bar
+        previous_close = self.previous_close.update(bar.close, revise)
+
+        # Return the largest of the three ranges
+        return {
+            "trange": nanmax(
+                nanmax(bar.high - bar.low, abs(bar.high - previous_close)),
+                abs(bar.low - previous_close),
+            )
+        }
+
+
+# Function to add the True Range (TRANGE) indicator to a plot
 def add_trange_indicator(fig: go.Figure, history_df: pd.DataFrame) -> go.Figure:
     """Add the True Range (TRANGE) indicator to the given plot.
 
@@ -15,40 +88,5 @@ def add_trange_indicator(fig: go.Figure, history_df: pd.DataFrame) -> go.Figure:
         go.Figure: The plot with the True Range (TRANGE) indicator added.
     """
 
-    # Calculate the True Range (TRANGE)
-    history_df["TrueRange"] = pd.concat(
-        [
-            history_df["High"] - history_df["Low"],
-            abs(history_df["High"] - history_df["Close"].shift(1)),
-            abs(history_df["Low"] - history_df["Close"].shift(1)),
-        ],
-        axis=1,
-    ).max(axis=1)
-
-    # Add TRANGE trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["TrueRange"],
-            mode="lines",
-            line=dict(color="#FFD700", width=2),
-            name="True Range",
-            yaxis="y2",
-        )
-    )
-
-    # Update layout to add secondary Y-axis for True Range
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="True Range Indicator",
-            overlaying="y",
-            side="right",
-        ),
-    )
-
-    # Return the figure
-    return fig
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "trange")
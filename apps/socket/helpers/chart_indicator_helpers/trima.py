@@ -1,9 +1,68 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers import kernels
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    RollingMean,
+    StreamingIndicator,
+)
+
 
 # Function to calculate the Triangular Moving Average (TRIMA)
+@register_indicator(
+    "trima",
+    series=[
+        IndicatorSeries("trima", "TRIMA {window}", "#FF6347"),
+    ],
+)
+def compute_trima(history_df: pd.DataFrame, window: int = 20) -> Dict[str, pd.Series]:
+    """Calculate the Triangular Moving Average (TRIMA) indicator.
+
+    TRIMA smooths price data by applying a double smoothing process, making it less sensitive to market noise.
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        window (int, optional): The window size for the TRIMA calculation. Defaults to 20.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the TRIMA indicator by key.
+    """
+
+    # Calculate the simple moving average (SMA) of the simple moving average
+    trima = kernels.trima(history_df["Close"].to_numpy(), window)
+
+    # Return the TRIMA
+    return {"trima": pd.Series(trima, index=history_df.index)}
+
+
+# TrimaStream class
+@register_stream("trima")
+class TrimaStream(StreamingIndicator):
+    """Incremental Triangular Moving Average (TRIMA), matching compute_trima"""
+
+    # Constructor
+    def __init__(self, window: int = 20):
+        # Operators
+        self.sma = RollingMean(window)
+        self.trima = RollingMean(window)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Return the SMA of the SMA
+        return {"trima": self.trima.update(self.sma.update(bar.close, revise), revise)}
+
+
+# Function to add the TRIMA indicator to a plot
 def add_trima_indicator(
     fig: go.Figure, history_df: pd.DataFrame, window: int = 20
 ) -> go.Figure:
@@ -20,23 +79,5 @@ def add_trima_indicator(
         go.Figure: The plot with the TRIMA indicator added.
     """
 
-    # Calculate the simple moving average (SMA) of the simple moving average to get TRIMA
-    sma1 = history_df["Close"].rolling(window=window).mean()
-    trima = sma1.rolling(window=window).mean()
-
-    # Store TRIMA in the DataFrame
-    history_df["TRIMA"] = trima
-
-    # Add TRIMA trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["TRIMA"],
-            mode="lines",
-            line=dict(color="#FF6347", width=2),
-            name=f"TRIMA {window}",
-        )
-    )
-
-    # Return the figure
-    return fig
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "trima", window=window)
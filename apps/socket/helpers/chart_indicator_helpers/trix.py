@@ -1,77 +1,104 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.shared import close_ema
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    Ema,
+    Lag,
+    StreamingIndicator,
+    divide,
+)
+
 
 # Function to calculate the TRIX (Triple Exponential Moving Average) indicator
-def add_trix_indicator(
-    fig: go.Figure, history_df: pd.DataFrame, period: int = 14, signal_period: int = 9
-) -> go.Figure:
-    """Add the TRIX (Triple Exponential Moving Average) indicator to the given plot.
+@register_indicator(
+    "trix",
+    series=[
+        IndicatorSeries("trix", "TRIX ({period})", "#1E90FF"),
+        IndicatorSeries("signal", "Signal ({signal_period})", "#FF6347", dash="dash"),
+    ],
+    axis_title="TRIX",
+)
+def compute_trix(
+    history_df: pd.DataFrame, period: int = 14, signal_period: int = 9
+) -> Dict[str, pd.Series]:
+    """Calculate the TRIX (Triple Exponential Moving Average) indicator.
 
     Args:
-        fig (go.Figure): The plot to which the indicator will be added.
         history_df (pd.DataFrame): The historical stock data.
         period (int, optional): The lookback period for calculating the TRIX. Defaults to 14.
         signal_period (int, optional): The period for the signal line (smoothed TRIX). Defaults to 9.
 
     Returns:
-        go.Figure: The plot with the TRIX indicator added.
+        Dict[str, pd.Series]: The series of the TRIX indicator by key.
     """
 
-    # Calculate the first EMA
-    history_df["EMA1"] = history_df["Close"].ewm(span=period, adjust=False).mean()
+    # Calculate the three chained EMAs
+    ema3 = close_ema(history_df, period, 3)
 
-    # Calculate the second EMA (of EMA1)
-    history_df["EMA2"] = history_df["EMA1"].ewm(span=period, adjust=False).mean()
+    # Calculate the TRIX as the rate of change of the triple EMA
+    trix = ema3.pct_change() * 100
 
-    # Calculate the third EMA (of EMA2)
-    history_df["EMA3"] = history_df["EMA2"].ewm(span=period, adjust=False).mean()
+    # Return the TRIX and its signal line
+    return {"trix": trix, "signal": trix.ewm(span=signal_period, adjust=False).mean()}
 
-    # Calculate the TRIX line as the percentage rate of change of EMA3
-    history_df["TRIX"] = history_df["EMA3"].pct_change() * 100
 
-    # Calculate the signal line (smoothed TRIX)
-    history_df["Signal"] = (
-        history_df["TRIX"].ewm(span=signal_period, adjust=False).mean()
-    )
+# TrixStream class
+@register_stream("trix")
+class TrixStream(StreamingIndicator):
+    """Incremental TRIX, matching compute_trix"""
 
-    # Add TRIX trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["TRIX"],
-            mode="lines",
-            line=dict(color="#1E90FF", width=2),
-            name=f"TRIX ({period})",
-            yaxis="y2",
-        )
-    )
+    # Constructor
+    def __init__(self, period: int = 14, signal_period: int = 9):
+        # Operators
+        self.ema1 = Ema(period)
+        self.ema2 = Ema(period)
+        self.ema3 = Ema(period)
+        self.previous_ema3 = Lag()
+        self.signal = Ema(signal_period)
 
-    # Add Signal line trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["Signal"],
-            mode="lines",
-            line=dict(color="#FF6347", width=2, dash="dash"),
-            name=f"Signal ({signal_period})",
-            yaxis="y2",
-        )
-    )
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Calculate the triple smoothed EMA
+        ema1 = self.ema1.update(bar.close, revise)
+        ema2 = self.ema2.update(ema1, revise)
+        ema3 = self.ema3.update(ema2, revise)
 
-    # Update layout to add secondary Y-axis for TRIX and Signal
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="TRIX",
-            overlaying="y",
-            side="right",
-        ),
-    )
+        # Calculate the percentage change of the triple smoothed EMA
+        previous_ema3 = self.previous_ema3.update(ema3, revise)
+        trix = (divide(ema3, previous_ema3) - 1) * 100
+
+        # Return the TRIX and the signal line
+        return {"trix": trix, "signal": self.signal.update(trix, revise)}
+
+
+# Function to add the TRIX indicator to a plot
+def add_trix_indicator(
+    fig: go.Figure, history_df: pd.DataFrame, period: int = 14, signal_period: int = 9
+) -> go.Figure:
+    """Add the TRIX (Triple Exponential Moving Average) indicator to the given plot.
 
-    # Return the figure
-    return fig
+    Args:
+        fig (go.Figure): The plot to which the indicator will be added.
+        history_df (pd.DataFrame): The historical stock data.
+        period (int, optional): The lookback period for calculating the TRIX. Defaults to 14.
+        signal_period (int, optional): The period for the signal line (smoothed TRIX). Defaults to 9.
+
+    Returns:
+        go.Figure: The plot with the TRIX indicator added.
+    """
+
+    # Compute and render the indicator
+    return add_indicator(
+        fig, history_df, "trix", period=period, signal_period=signal_period
+    )
@@ -1,9 +1,129 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    Lag,
+    RollingSum,
+    StreamingIndicator,
+    divide,
+    nanmax,
+    nanmin,
+)
+from apps.socket.helpers.chart_indicator_helpers.trange import compute_trange
+
 
 # Function to calculate the Ultimate Oscillator (UltOsc) indicator
+@register_indicator(
+    "ultosc",
+    series=[
+        IndicatorSeries(
+            "ultosc",
+            "Ultimate Oscillator ({short_period}, {medium_period}, {long_period})",
+            "#FFD700",
+        ),
+    ],
+    axis_title="Ultimate Oscillator",
+)
+def compute_ultosc(
+    history_df: pd.DataFrame,
+    short_period: int = 7,
+    medium_period: int = 14,
+    long_period: int = 28,
+) -> Dict[str, pd.Series]:
+    """Calculate the Ultimate Oscillator (UltOsc) indicator.
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        short_period (int, optional): The short period for calculating the BP and TR. Defaults to 7.
+        medium_period (int, optional): The medium period for calculating the BP and TR. Defaults to 14.
+        long_period (int, optional): The long period for calculating the BP and TR. Defaults to 28.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the Ultimate Oscillator indicator by key.
+    """
+
+    # Get the previous close price
+    previous_close = history_df["Close"].shift(1)
+
+    # Calculate the buying pressure (BP)
+    bp = history_df["Close"] - pd.concat(
+        [history_df["Low"], previous_close], axis=1
+    ).min(axis=1)
+
+    # Get the true range (TR), shared with the TRANGE indicator
+    tr = compute_trange(history_df)["trange"]
+
+    # Calculate the smoothed BP and TR for the three periods
+    bp_short = bp.rolling(window=short_period).sum()
+    tr_short = tr.rolling(window=short_period).sum()
+    bp_medium = bp.rolling(window=medium_period).sum()
+    tr_medium = tr.rolling(window=medium_period).sum()
+    bp_long = bp.rolling(window=long_period).sum()
+    tr_long = tr.rolling(window=long_period).sum()
+
+    # Return the Ultimate Oscillator
+    return {
+        "ultosc": (
+            4 * bp_short * tr_short + 2 * bp_medium * tr_medium + bp_long * tr_long
+        )
+        / (4 * tr_short + 2 * tr_medium + tr_long)
+    }
+
+
+# UltoscStream class
+@register_stream("ultosc")
+class UltoscStream(StreamingIndicator):
+    """Incremental Ultimate Oscillator (ULTOSC), matching compute_ultosc"""
+
+    # Constructor
+    def __init__(
+        self, short_period: int = 7, medium_period: int = 14, long_period: int = 28
+    ):
+        # Operators
+        self.previous_close = Lag()
+        self.bp_sums = [
+            RollingSum(period) for period in (short_period, medium_period, long_period)
+        ]
+        self.tr_sums = [
+            RollingSum(period) for period in (short_period, medium_period, long_period)
+        ]
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Calculate the buying pressure and the true range
+        previous_close = self.previous_close.update(bar.close, revise)
+        true_low = nanmin(bar.low, previous_close)
+        bp = bar.close - true_low
+        tr = nanmax(bar.high, previous_close) - true_low
+
+        # Calculate the sums over the short, medium and long periods
+        bp_short, bp_medium, bp_long = [
+            bp_sum.update(bp, revise) for bp_sum in self.bp_sums
+        ]
+        tr_short, tr_medium, tr_long = [
+            tr_sum.update(tr, revise) for tr_sum in self.tr_sums
+        ]
+
+        # Return the Ultimate Oscillator
+        return {
+            "ultosc": divide(
+                4 * bp_short * tr_short + 2 * bp_medium * tr_medium + bp_long * tr_long,
+                4 * tr_short + 2 * tr_medium + tr_long,
+            )
+        }
+
+
+# Function to add the Ultimate Oscillator indicator to a plot
 def add_ultosc_indicator(
     fig: go.Figure,
     history_df: pd.DataFrame,
@@ -24,63 +144,12 @@ def add_ultosc_indicator(
         go.Figure: The plot with the Ultimate Oscillator indicator added.
     """
 
-    # Calculate the Buying Pressure (BP)
-    history_df["Prev_Close"] = history_df["Close"].shift(
-        1
-    )  # Create shifted column for previous Close
-    history_df["BP"] = history_df["Close"] - history_df[["Low", "Prev_Close"]].min(
-        axis=1
+    # Compute and render the indicator
+    return add_indicator(
+        fig,
+        history_df,
+        "ultosc",
+        short_period=short_period,
+        medium_period=medium_period,
+        long_period=long_period,
     )
-
-    # Calculate the True Range (TR)
-    history_df["Prev_Close_Shifted"] = history_df["Close"].shift(1)
-    history_df["TR"] = history_df[["High", "Prev_Close_Shifted"]].max(
-        axis=1
-    ) - history_df[["Low", "Prev_Close_Shifted"]].min(axis=1)
-
-    # Calculate the smoothed BP and TR for the three different periods (short, medium, long)
-    history_df["BP_short"] = history_df["BP"].rolling(window=short_period).sum()
-    history_df["TR_short"] = history_df["TR"].rolling(window=short_period).sum()
-
-    history_df["BP_medium"] = history_df["BP"].rolling(window=medium_period).sum()
-    history_df["TR_medium"] = history_df["TR"].rolling(window=medium_period).sum()
-
-    history_df["BP_long"] = history_df["BP"].rolling(window=long_period).sum()
-    history_df["TR_long"] = history_df["TR"].rolling(window=long_period).sum()
-
-    # Calculate the Ultimate Oscillator (UltOsc)
-    history_df["UltOsc"] = (
-        4 * history_df["BP_short"] * history_df["TR_short"]
-        + 2 * history_df["BP_medium"] * history_df["TR_medium"]
-        + history_df["BP_long"] * history_df["TR_long"]
-    ) / (
-        4 * history_df["TR_short"] + 2 * history_df["TR_medium"] + history_df["TR_long"]
-    )
-
-    # Add UltOsc trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["UltOsc"],
-            mode="lines",
-            line=dict(color="#FFD700", width=2),
-            name=f"Ultimate Oscillator ({short_period}, {medium_period}, {long_period})",
-            yaxis="y2",
-        )
-    )
-
-    # Update layout to add secondary Y-axis for UltOsc
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="Ultimate Oscillator",
-            overlaying="y",
-            side="right",
-        ),
-    )
-
-    # Return the figure
-    return fig
@@ -1,9 +1,80 @@
 # Imports
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.shared import price_channel
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    RollingExtreme,
+    StreamingIndicator,
+    divide,
+)
+
 
 # Function to calculate the Williams %R (WillR) Indicator
+@register_indicator(
+    "willr",
+    series=[
+        IndicatorSeries("willr", "WillR {window}", "#1F77B4"),
+    ],
+    axis_title="Williams %R",
+)
+def compute_willr(history_df: pd.DataFrame, window: int = 14) -> Dict[str, pd.Series]:
+    """Calculate the Williams %R (WillR) indicator.
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        window (int, optional): The window size for the WillR calculation. Defaults to 14.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the Williams %R (WillR) indicator by key.
+    """
+
+    # Calculate the highest high and the lowest low over the window
+    highest_high, lowest_low = price_channel(history_df, window)
+
+    # Return the Williams %R
+    return {
+        "willr": -100
+        * (highest_high - history_df["Close"])
+        / (highest_high - lowest_low)
+    }
+
+
+# WillrStream class
+@register_stream("willr")
+class WillrStream(StreamingIndicator):
+    """Incremental Williams %R, matching compute_willr"""
+
+    # Constructor
+    def __init__(self, window: int = 14):
+        # Operators
+        self.highest_high = RollingExtreme(window)
+        self.lowest_low = RollingExtreme(window, largest=False)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Calculate the highest high and the lowest low
+        highest_high = self.highest_high.update(bar.high, revise)
+        lowest_low = self.lowest_low.update(bar.low, revise)
+
+        # Return the Williams %R
+        return {
+            "willr": divide(
+                -100 * (highest_high - bar.close), highest_high - lowest_low
+            )
+        }
+
+
+# Function to add the Williams %R (WillR) indicator to a plot
 def add_williams_r_indicator(
     fig: go.Figure, history_df: pd.DataFrame, window: int = 14
 ) -> go.Figure:
@@ -18,39 +89,5 @@ def add_williams_r_indicator(
         go.Figure: The plot with the Williams %R (WillR) indicator added.
     """
 
-    # Calculate the highest high and lowest low over the window period
-    highest_high = history_df["High"].rolling(window).max()
-    lowest_low = history_df["Low"].rolling(window).min()
-
-    # Calculate Williams %R (WillR)
-    history_df["WillR"] = (
-        -100 * (highest_high - history_df["Close"]) / (highest_high - lowest_low)
-    )
-
-    # Add Williams %R trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["WillR"],
-            mode="lines",
-            line=dict(color="#1F77B4", width=2),
-            name=f"WillR {window}",
-            yaxis="y2",
-        )
-    )
-
-    # Update layout to add secondary Y-axis
-    fig.update_layout(
-        yaxis2=dict(
-            gridcolor="#888888",
-            zerolinecolor="#888888",
-            title_font=dict(family="JetBrains Mono"),
-            tickfont=dict(family="JetBrains Mono"),
-            title="Williams %R",
-            overlaying="y",
-            side="right",
-        ),
-    )
-
-    # Return the figure
-    return fig
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "willr", window=window)
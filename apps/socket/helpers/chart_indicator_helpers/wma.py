@@ -1,10 +1,65 @@
 # Imports
-import numpy as np
+from typing import Dict
+
 import pandas as pd
 import plotly.graph_objects as go
 
+from apps.socket.helpers.chart_indicator_helpers import kernels
+from apps.socket.helpers.chart_indicator_helpers.registry import (
+    IndicatorSeries,
+    register_indicator,
+    register_stream,
+)
+from apps.socket.helpers.chart_indicator_helpers.renderer import add_indicator
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    Bar,
+    StreamingIndicator,
+    WeightedMean,
+)
+
 
 # Function to calculate the Weighted Moving Average (WMA)
+@register_indicator(
+    "wma",
+    series=[
+        IndicatorSeries("wma", "WMA {window}", "#FFD700"),
+    ],
+)
+def compute_wma(history_df: pd.DataFrame, window: int = 20) -> Dict[str, pd.Series]:
+    """Calculate the Weighted Moving Average (WMA) indicator.
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data.
+        window (int, optional): The window size for the WMA calculation. Defaults to 20.
+
+    Returns:
+        Dict[str, pd.Series]: The series of the WMA indicator by key.
+    """
+
+    # Calculate WMA based on the 'Close' prices
+    wma = kernels.wma(history_df["Close"].to_numpy(), window)
+
+    # Return the WMA
+    return {"wma": pd.Series(wma, index=history_df.index)}
+
+
+# WmaStream class
+@register_stream("wma")
+class WmaStream(StreamingIndicator):
+    """Incremental Weighted Moving Average (WMA), matching compute_wma"""
+
+    # Constructor
+    def __init__(self, window: int = 20):
+        # Operators
+        self.wma = WeightedMean(window)
+
+    # Method to feed a bar
+    def update(self, bar: Bar, revise: bool = False) -> Dict[str, float]:
+        # Return the WMA
+        return {"wma": self.wma.update(bar.close, revise)}
+
+
+# Function to add the WMA indicator to a plot
 def add_wma_indicator(
     fig: go.Figure, history_df: pd.DataFrame, window: int = 20
 ) -> go.Figure:
@@ -19,26 +74,5 @@ def add_wma_indicator(
         go.Figure: The plot with the WMA indicator added.
     """
 
-    # Calculate WMA based on the 'Close' prices
-    weights = list(range(1, window + 1))
-
-    # Add WMA trace to the plot
-    history_df["WMA"] = (
-        history_df["Close"]
-        .rolling(window)
-        .apply(lambda prices: np.dot(prices, weights) / sum(weights), raw=True)
-    )
-
-    # Add WMA trace to the plot
-    fig.add_trace(
-        go.Scatter(
-            x=history_df.index,
-            y=history_df["WMA"],
-            mode="lines",
-            line=dict(color="#FFD700", width=2),
-            name=f"WMA {window}",
-        )
-    )
-
-    # Return the figure
-    return fig
+    # Compute and render the indicator
+    return add_indicator(fig, history_df, "wma", window=window)
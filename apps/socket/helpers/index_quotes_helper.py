@@ -1,8 +1,6 @@
 # Imports
-from concurrent.futures import ThreadPoolExecutor, as_completed
-
 from apps.socket.constants import STOCK_INDICES
-from apps.socket.utils import fetch_and_process_quote
+from apps.socket.utils import fetch_and_process_quotes
 
 
 # Function to get index quotes
@@ -20,25 +18,8 @@ def get_index_quotes(stock_exchange: str, category: str) -> dict[str, dict]:
     # Get the indices
     indices = STOCK_INDICES.get(stock_exchange, "NSE").get(category, "broad-market")
 
-    # Dict to store the quotes
-    quotes = {}
-
-    # Use ThreadPoolExecutor for parallel processing
-    with ThreadPoolExecutor(max_workers=min(len(indices), 4)) as executor:
-        # Submit all tasks at once and map results to indices
-        future_to_index = {
-            executor.submit(fetch_and_process_quote, index): index for index in indices
-        }
-
-        # Process results as they complete instead of waiting for all
-        for future in as_completed(future_to_index):
-            # Get the index and data
-            index, data = future.result()
-
-            # If data is available
-            if data:
-                # Update the quotes
-                quotes[index] = data
+    # Fetch the quotes of all the indices in one batch
+    quotes = fetch_and_process_quotes(indices)
 
-    # Return the dictionary
-    return quotes
+    # Return the dictionary of the available quotes
+    return {index: data for index, data in quotes.items() if data}
@@ -1,7 +1,5 @@
 # Imports
-from concurrent.futures import ThreadPoolExecutor
-
-from apps.socket.utils import fetch_and_process_quote
+from apps.socket.utils import fetch_and_process_quotes
 
 
 # Function to get index quote
@@ -16,12 +14,12 @@ def get_quote(symbol: str) -> dict:
     """
 
     # Fetch and process the index
-    return fetch_and_process_quote(symbol, filter=False)
+    return symbol, fetch_and_process_quotes([symbol], filter=False)[symbol]
 
 
 # Function to get bookmarked quotes
 def get_bookmarked_quotes(symbols: list) -> dict:
-    """Function to get bookmarked quotes in parallel.
+    """Function to get bookmarked quotes in batches.
 
     Args:
         symbols (list): List of symbols.
@@ -30,15 +28,5 @@ def get_bookmarked_quotes(symbols: list) -> dict:
         dict: Dictionary containing the quotes of the symbols.
     """
 
-    # Dict to store the quotes
-    quotes = {}
-
-    # Use ThreadPoolExecutor to fetch quotes in parallel
-    with ThreadPoolExecutor() as executor:
-        results = executor.map(get_quote, symbols)
-
-    # Convert results to dictionary
-    quotes = dict(results)
-
-    # Return the quotes
-    return quotes
+    # Fetch the quotes of all the symbols in one batch
+    return fetch_and_process_quotes(symbols, filter=False)
@@ -1,9 +1,10 @@
 # Imports
-from concurrent.futures import ThreadPoolExecutor, as_completed
-
-from nsepython import nse_get_advances_declines, nse_get_top_gainers
-
-from apps.socket.utils import fetch_and_process_quote
+from apps.socket.utils import (
+    breadth_snapshot,
+    fetch_ranked_quotes,
+    nse_breadth_quotes,
+    nse_get_top_gainers,
+)
 
 
 # Function to get top equity gainers quotes
@@ -15,31 +16,16 @@ def get_top_equity_gainers_quotes() -> dict[str, dict]:
     """
 
     # Get the top gainers
-    top_gainers = nse_get_top_gainers()["symbol"]
+    top_gainers_df = nse_get_top_gainers()
+    top_gainers = top_gainers_df["symbol"]
 
-    # Dict to store the quotes
-    quotes = {}
-
-    # Use ThreadPoolExecutor for parallel processing
-    with ThreadPoolExecutor(max_workers=min(len(top_gainers), 4)) as executor:
-        # Submit all the tasks at once and map results to indices
-        future_to_index = {
-            executor.submit(fetch_and_process_quote, f"{index}.NS"): index
-            for index in top_gainers
-        }
-
-        # Process results as they complete instead of waiting for all
-        for future in as_completed(future_to_index):
-            # Get the index and data
-            index, data = future.result()
-
-            # If data is available
-            if data:
-                # Update the quotes
-                quotes[index] = data
+    # Build the quotes from the breadth table
+    quotes = nse_breadth_quotes(top_gainers_df)
 
-    # Return the dictionary
-    return quotes
+    # Return the dictionary of the available quotes
+    return {
+        index: quotes[f"{index}.NS"] for index in top_gainers if quotes[f"{index}.NS"]
+    }
 
 
 # Function to get top equity gainers 20 quotes
@@ -53,12 +39,9 @@ def get_top_equity_gainers_20_quotes(stock_exchange: str) -> dict[str, dict]:
         dict[str, dict]: Dictionary containing the quotes of top equity gainers 20
     """
 
-    # Get the top gainers 22
-    top_gainers = (
-        nse_get_advances_declines()
-        .sort_values(by="pChange", ascending=False)
-        .head(22)["symbol"]
-    )
+    # Get the top gainers 22 from the shared breadth snapshot
+    top_gainers_df = breadth_snapshot.top(22)
+    top_gainers = top_gainers_df["symbol"]
 
     # Exchange symbol
     if stock_exchange == "NSE":
@@ -66,28 +49,32 @@ def get_top_equity_gainers_20_quotes(stock_exchange: str) -> dict[str, dict]:
     elif stock_exchange == "BSE":
         exchange_symbol = "BO"
 
+    # Build the NSE quotes from the breadth table
+    if exchange_symbol == "NS":
+        quotes = nse_breadth_quotes(top_gainers_df)
+
+    # Fetch the BSE quotes until 20 are available
+    else:
+        quotes = fetch_ranked_quotes(
+            [f"{index}.{exchange_symbol}" for index in top_gainers], 20
+        )
+
     # Dict to store the quotes
-    quotes = {}
-
-    # Use ThreadPoolExecutor for parallel processing
-    with ThreadPoolExecutor(max_workers=min(len(top_gainers), 4)) as executor:
-        # Submit all the tasks at once and map results to indices
-        future_to_index = {
-            executor.submit(
-                fetch_and_process_quote, f"{index}.{exchange_symbol}"
-            ): index
-            for index in top_gainers
-        }
-
-        # Process results as they complete instead of waiting for all
-        for future in as_completed(future_to_index):
-            # Get the index and data
-            index, data = future.result()
-
-            # If data is available and less than 20
-            if data and len(quotes) < 20:
-                # Update the quotes
-                quotes[index] = data
+    top_gainers_quotes = {}
+
+    # Keep the first 20 available quotes, in rank order
+    for index in top_gainers:
+        # If 20 quotes are kept
+        if len(top_gainers_quotes) >= 20:
+            break
+
+        # Get the data
+        data = quotes.get(f"{index}.{exchange_symbol}")
+
+        # If data is available
+        if data:
+            # Update the quotes
+            top_gainers_quotes[index] = data
 
     # Return the dictionary
-    return quotes
+    return top_gainers_quotes
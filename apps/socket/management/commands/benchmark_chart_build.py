@@ -0,0 +1,17 @@
+# Imports
+from django.core.management.base import BaseCommand
+
+from apps.socket.benchmarks.chart_build import run
+
+
+# Command class
+class Command(BaseCommand):
+    """Benchmark the candlestick chart build path"""
+
+    # Help message
+    help = "Benchmark the hover labels and the chart build across period sizes"
+
+    # Method to handle the command
+    def handle(self, *args, **options):
+        # Run the benchmark
+        run(self.stdout.write)
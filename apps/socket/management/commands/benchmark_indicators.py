@@ -0,0 +1,17 @@
+# Imports
+from django.core.management.base import BaseCommand
+
+from apps.socket.benchmarks.indicator_kernels import run
+
+
+# Command class
+class Command(BaseCommand):
+    """Benchmark the indicator kernels against the reference implementations"""
+
+    # Help message
+    help = "Benchmark the indicator kernels on 10y daily and 5d minute series"
+
+    # Method to handle the command
+    def handle(self, *args, **options):
+        # Run the benchmark
+        run(self.stdout.write)
@@ -0,0 +1,52 @@
+# Imports
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.socket.utils import breadth_snapshot, is_market_open
+
+
+# Command class
+class Command(BaseCommand):
+    """Refresh the shared NSE breadth snapshot of the gainers and losers"""
+
+    # Help message
+    help = "Refresh the NSE breadth snapshot, once or on the refresh schedule"
+
+    # Method to add the arguments
+    def add_arguments(self, parser):
+        # Keep refreshing the snapshot
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Refresh the snapshot again every time it gets stale",
+        )
+
+    # Method to handle the command
+    def handle(self, *args, **options):
+        # Refresh until interrupted
+        while True:
+            # Try
+            try:
+                # Refresh the snapshot
+                entry = breadth_snapshot.refresh()
+
+                # Report the single refreshes, the loop would flood the logs
+                if not options["loop"]:
+                    self.stdout.write(
+                        f"Refreshed the breadth snapshot of {len(entry['frame'])} securities"
+                    )
+
+            # If any exception occurs
+            except Exception as e:
+                # Print the error
+                self.stderr.write(f"Error refreshing the breadth snapshot: {e}")
+
+            # If the snapshot is refreshed once
+            if not options["loop"]:
+                return
+
+            # Wait until the snapshot gets stale
+            ttls = settings.BREADTH_REFRESH_TTLS
+            time.sleep(ttls["open" if is_market_open() else "closed"])
@@ -0,0 +1,38 @@
+# Imports
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.socket.helpers import bar_aligned_ttl, warm_candlestick_charts
+
+
+# Command class
+class Command(BaseCommand):
+    """Pre-warm the rendered charts of the top indices"""
+
+    # Help message
+    help = "Render the charts of the top indices, once or at every bar close"
+
+    # Method to add the arguments
+    def add_arguments(self, parser):
+        # Keep warming the charts at every bar close
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Warm the charts again every time their last bar closes",
+        )
+
+    # Method to handle the command
+    def handle(self, *args, **options):
+        # Warm until interrupted
+        while True:
+            # Render the charts
+            rendered = warm_candlestick_charts()
+            self.stdout.write(f"Warmed the charts of {', '.join(rendered) or 'none'}")
+
+            # If the charts are warmed once
+            if not options["loop"]:
+                return
+
+            # Wait for the next bar of the charts
+            time.sleep(bar_aligned_ttl("5m"))
@@ -0,0 +1,548 @@
+# Imports
+import asyncio
+import hashlib
+import re
+import uuid
+from dataclasses import dataclass
+from typing import Any, Callable, Coroutine, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.socket.helpers import (
+    aget_index_quotes,
+    aget_top_equity_gainers_20_quotes,
+    aget_top_equity_gainers_quotes,
+    aget_top_equity_losers_20_quotes,
+    aget_top_equity_losers_quotes,
+    aget_top_index_quotes,
+    generate_candlestick_chart,
+    get_quote,
+)
+from apps.socket.utils import (
+    build_stream_message,
+    diff_chart_payload,
+    diff_payload,
+    figure_to_payload,
+    to_async,
+)
+
+
+# Topic class
+@dataclass(frozen=True)
+class Topic:
+    """A pollable data source that is broadcast to a channel layer group
+
+    Attributes:
+        fetch (Callable[..., Coroutine]): Async function that fetches the topic data
+        interval (float): Seconds to wait between two polls
+        diff (Callable[[dict, dict], tuple]): Function that computes the changes
+            between two payloads and the new key order, None changes mean that
+            a new snapshot must be sent
+        page_snapshot (bool): Keep the last payload for the pages rendered
+            from it, see get_page_snapshot
+    """
+
+    # Attributes
+    fetch: Callable[..., Coroutine[Any, Any, Any]]
+    interval: float
+    diff: Callable[[dict, dict], tuple] = diff_payload
+    page_snapshot: bool = False
+
+
+# Function to get the quote chart payload
+def get_quote_chart_payload(
+    symbol: str,
+    period: str,
+    interval: str,
+    indicator: str,
+    points: str = "",
+    start: str = "",
+    end: str = "",
+) -> dict:
+    """Get the candlestick chart of a symbol as a columnar payload
+
+    Args:
+        symbol (str): Symbol of the quote
+        period (str): Period of the chart
+        interval (str): Interval of the chart
+        indicator (str): Indicator to add to the chart
+        points (str, optional): Maximum number of points, empty for the
+            default. Defaults to "".
+        start (str, optional): Start of the zoomed window. Defaults to "".
+        end (str, optional): End of the zoomed window. Defaults to "".
+
+    Returns:
+        dict: The traces, the columns and the layout of the chart
+    """
+
+    # Generate the chart and convert it to columns
+    return figure_to_payload(
+        generate_candlestick_chart(
+            symbol,
+            period,
+            interval,
+            indicator,
+            max_points=int(points) if points else None,
+            start=start or None,
+            end=end or None,
+        )
+    )
+
+
+# Function to get the quote payload
+def get_quote_payload(symbol: str) -> dict:
+    """Get the quote of a symbol keyed by its symbol
+
+    Args:
+        symbol (str): Symbol of the quote
+
+    Returns:
+        dict: The quote by symbol, empty if the quote is not available
+    """
+
+    # Get the quote
+    symbol, quote = get_quote(symbol)
+
+    # Return the quote by symbol
+    return {symbol: quote} if quote else {}
+
+
+# Registry of the topics that can be subscribed to
+TOPICS = {
+    "topIndexQuotes": Topic(fetch=aget_top_index_quotes, interval=2.0),
+    "indexQuotes": Topic(fetch=aget_index_quotes, interval=2.0, page_snapshot=True),
+    "quote": Topic(fetch=to_async(get_quote_payload), interval=2.0, page_snapshot=True),
+    "quoteChart": Topic(
+        fetch=to_async(get_quote_chart_payload), interval=5.0, diff=diff_chart_payload
+    ),
+    "topEquityGainersQuotes": Topic(fetch=aget_top_equity_gainers_quotes, interval=2.0),
+    "topEquityLosersQuotes": Topic(fetch=aget_top_equity_losers_quotes, interval=2.0),
+    "topEquityGainersQuotes20": Topic(
+        fetch=aget_top_equity_gainers_20_quotes, interval=2.0, page_snapshot=True
+    ),
+    "topEquityLosersQuotes20": Topic(
+        fetch=aget_top_equity_losers_20_quotes, interval=2.0, page_snapshot=True
+    ),
+}
+
+
+# Function to build a channel layer group name
+def build_group_name(topic_name: str, *args: str) -> str:
+    """Build a valid channel layer group name for a topic and its arguments
+
+    Channel layer group names only allow ASCII alphanumerics, hyphens,
+    underscores and periods, so symbols like "^NSEI" are sanitized and a
+    digest of the raw key is appended to keep the names unique.
+
+    Args:
+        topic_name (str): Name of the topic
+        *args (str): Arguments of the topic
+
+    Returns:
+        str: The group name
+    """
+
+    # Build the raw key of the topic
+    raw_key = "|".join([topic_name, *args])
+
+    # Sanitize the key and truncate it
+    readable = re.sub(r"[^a-zA-Z0-9\-_.]", "-", ".".join([topic_name, *args]))[:72]
+
+    # Digest of the raw key
+    digest = hashlib.sha1(raw_key.encode()).hexdigest()[:12]
+
+    # Return the group name
+    return f"topic.{readable}.{digest}"
+
+
+# QuotePublisher class
+class QuotePublisher:
+    """Poll every distinct topic once per tick and fan the result out
+
+    Each worker process keeps one polling task per topic that has at least one
+    local subscriber. A short lived lease in the shared cache makes sure that
+    only one worker polls the upstream for a topic, the result is broadcast to
+    every subscriber on every worker through the channel layer group.
+
+    Dict payloads are streamed as a snapshot followed by deltas holding only
+    the changed fields, numbered with a sequence so that clients can detect a
+    gap and resync, nothing is sent when nothing changed.
+
+    Attributes:
+        worker_id (str): Unique id of this worker process
+        subscribers (dict[str, int]): Local subscriber count per group
+        tasks (dict[str, asyncio.Task]): Polling task per group
+    """
+
+    # Constructor
+    def __init__(self):
+        # Attributes
+        self.worker_id = uuid.uuid4().hex
+        self.subscribers: dict[str, int] = {}
+        self.tasks: dict[str, asyncio.Task] = {}
+
+    # Static method to get the lease cache key
+    @staticmethod
+    def lease_key(group: str) -> str:
+        """Cache key of the polling lease of a group"""
+
+        # Return the key
+        return f"publisher:lease:{group}"
+
+    # Static method to get the state cache key
+    @staticmethod
+    def state_key(group: str) -> str:
+        """Cache key of the last published payload and sequence of a group"""
+
+        # Return the key
+        return f"publisher:state:{group}"
+
+    # Static method to get the page snapshot cache key
+    @staticmethod
+    def page_key(group: str) -> str:
+        """Cache key of the last published payload of a group for the pages"""
+
+        # Return the key
+        return f"publisher:page:{group}"
+
+    # Method to subscribe a channel to a topic
+    async def subscribe(
+        self, channel_layer, channel_name: str, topic_name: str, *args: str
+    ) -> str:
+        """Subscribe a channel to a topic and start polling it if needed
+
+        Args:
+            channel_layer: The channel layer of the consumer
+            channel_name (str): The channel name of the consumer
+            topic_name (str): Name of the topic in TOPICS
+            *args (str): Arguments passed to the topic fetch function
+
+        Returns:
+            str: The group name of the topic
+        """
+
+        # Build the group name
+        group = build_group_name(topic_name, *args)
+
+        # Add the channel to the group
+        await channel_layer.group_add(group, channel_name)
+
+        # Increment the local subscriber count
+        self.subscribers[group] = self.subscribers.get(group, 0) + 1
+
+        # If the topic is not being polled by this worker
+        task = self.tasks.get(group)
+        if task is None or task.done():
+            # Start polling the topic
+            self.tasks[group] = asyncio.create_task(
+                self.poll(channel_layer, group, TOPICS[topic_name], args)
+            )
+
+        # Return the group name
+        return group
+
+    # Method to unsubscribe a channel from a topic
+    async def unsubscribe(self, channel_layer, channel_name: str, group: str) -> None:
+        """Unsubscribe a channel and stop polling once no subscriber is left
+
+        Args:
+            channel_layer: The channel layer of the consumer
+            channel_name (str): The channel name of the consumer
+            group (str): The group name of the topic
+        """
+
+        # Remove the channel from the group
+        await channel_layer.group_discard(group, channel_name)
+
+        # Decrement the local subscriber count
+        self.subscribers[group] = self.subscribers.get(group, 1) - 1
+
+        # If there are still subscribers
+        if self.subscribers[group] > 0:
+            # Keep polling
+            return
+
+        # Forget the group
+        self.subscribers.pop(group, None)
+        task = self.tasks.pop(group, None)
+
+        # Stop the polling task
+        if task is not None:
+            task.cancel()
+
+        # Release the lease so that another worker can take over immediately
+        try:
+            if await cache.aget(self.lease_key(group)) == self.worker_id:
+                await cache.adelete(self.lease_key(group))
+
+        # If the cache is unavailable
+        except Exception:
+            pass
+
+    # Method to get the stream state of a group
+    async def get_state(self, group: str) -> Optional[dict]:
+        """Get the last published payload and sequence number of a group
+
+        Args:
+            group (str): The group name of the topic
+
+        Returns:
+            Optional[dict]: {"seq": int, "data": Any} or None
+        """
+
+        # Try
+        try:
+            # Return the state
+            return await cache.aget(self.state_key(group))
+
+        # If the cache is unavailable
+        except Exception:
+            return None
+
+    # Method to get the snapshot message of a group
+    async def get_snapshot(self, group: str) -> Optional[str]:
+        """Get the snapshot message of the last published payload of a group
+
+        Args:
+            group (str): The group name of the topic
+
+        Returns:
+            Optional[str]: The message or None if nothing was published yet
+        """
+
+        # Get the state
+        state = await self.get_state(group)
+
+        # If nothing was published yet
+        if state is None:
+            return None
+
+        # Return the snapshot message
+        return build_stream_message("snapshot", group, state["seq"], state["data"])
+
+    # Method to acquire the polling lease of a group
+    async def acquire_lease(self, group: str, timeout: float) -> bool:
+        """Acquire or renew the polling lease of a group
+
+        Args:
+            group (str): The group name of the topic
+            timeout (float): Lifetime of the lease in seconds
+
+        Returns:
+            bool: True if this worker should poll the topic
+        """
+
+        # Try
+        try:
+            # Take the lease if nobody holds it
+            if await cache.aadd(self.lease_key(group), self.worker_id, timeout):
+                return True
+
+            # If this worker already holds the lease
+            if await cache.aget(self.lease_key(group)) == self.worker_id:
+                # Renew the lease
+                await cache.atouch(self.lease_key(group), timeout)
+                return True
+
+            # Another worker is polling the topic
+            return False
+
+        # If the cache is unavailable, poll locally
+        except Exception:
+            return True
+
+    # Method to poll a topic
+    async def poll(self, channel_layer, group: str, topic: Topic, args: tuple) -> None:
+        """Poll a topic and broadcast the result to its group
+
+        Args:
+            channel_layer: The channel layer to broadcast on
+            group (str): The group name of the topic
+            topic (Topic): The topic to poll
+            args (tuple): Arguments passed to the topic fetch function
+        """
+
+        # Poll until cancelled
+        while True:
+            # Try
+            try:
+                # If this worker holds the lease
+                if await self.acquire_lease(group, topic.interval * 3):
+                    # Fetch the data off the event loop
+                    data = await topic.fetch(*args)
+
+                    # Publish the changes
+                    await self.publish(
+                        channel_layer,
+                        group,
+                        data,
+                        topic.interval * 3,
+                        topic.diff,
+                        topic.page_snapshot,
+                    )
+
+            # If the task is cancelled
+            except asyncio.CancelledError:
+                raise
+
+            # If any exception occurs
+            except Exception as e:
+                # Print the error
+                print(f"Error in poll {group}: {e}")
+
+            # Wait before the next poll
+            await asyncio.sleep(topic.interval)
+
+    # Method to publish a payload
+    async def publish(
+        self,
+        channel_layer,
+        group: str,
+        data: dict,
+        ttl: float,
+        diff: Callable[[dict, dict], tuple] = diff_payload,
+        page_snapshot: bool = False,
+    ) -> None:
+        """Broadcast what changed since the last payload published for a group
+
+        Args:
+            channel_layer: The channel layer to broadcast on
+            group (str): The group name of the topic
+            data (dict): The payload
+            ttl (float): Lifetime of the stored state in seconds
+            diff (Callable[[dict, dict], tuple], optional): Function that
+                computes the changes. Defaults to diff_payload.
+            page_snapshot (bool, optional): Keep the payload for the pages.
+                Defaults to False.
+        """
+
+        # Get the last published state, possibly published by another worker
+        state = await self.get_state(group) or {"seq": 0, "data": None}
+        previous = state["data"]
+
+        # Compute the changes if there is a previous payload
+        delta, order = (
+            diff(previous, data) if isinstance(previous, dict) else (None, None)
+        )
+
+        # If the changes can be applied by the clients
+        if delta is not None:
+            # Build the delta message
+            text = build_stream_message("delta", group, state["seq"] + 1, delta, order)
+            changed = bool(delta) or order is not None
+
+        # Otherwise send a new snapshot
+        else:
+            text = build_stream_message("snapshot", group, state["seq"] + 1, data)
+            changed = True
+
+        # Try
+        try:
+            # If nothing changed
+            if not changed:
+                # Keep the state alive for new subscribers
+                await cache.atouch(self.state_key(group), ttl)
+                return
+
+            # Store the new state for new subscribers and the next poll
+            await cache.aset(
+                self.state_key(group), {"seq": state["seq"] + 1, "data": data}, ttl
+            )
+
+            # Keep the payload long after the stream stops for the pages
+            if page_snapshot:
+                await cache.aset(self.page_key(group), data, settings.PAGE_SNAPSHOT_TTL)
+
+        # If the cache is unavailable
+        except Exception:
+            # Send the changes anyway
+            if not changed:
+                return
+
+        # Broadcast the changes to the group
+        await channel_layer.group_send(
+            group, {"type": "topic.message", "group": group, "text": text}
+        )
+
+
+# Process wide publisher
+publisher = QuotePublisher()
+
+
+# Function to get the page snapshot of a topic
+def get_page_snapshot(topic_name: str, *args: str) -> Optional[Any]:
+    """Get the last payload published for a topic, to render a page from
+
+    Args:
+        topic_name (str): Name of the topic
+        *args (str): Arguments of the topic
+
+    Returns:
+        Optional[Any]: The payload, None if nothing was published recently
+    """
+
+    # Try
+    try:
+        # Return the payload
+        return cache.get(QuotePublisher.page_key(build_group_name(topic_name, *args)))
+
+    # If the cache is unavailable
+    except Exception:
+        return None
+
+
+# Function to get the page snapshots of many arguments of a topic
+def get_page_snapshots(topic_name: str, args_list: List[Tuple[str, ...]]) -> list:
+    """Get the last payloads published for a topic, with one cache round trip
+
+    Args:
+        topic_name (str): Name of the topic
+        args_list (List[Tuple[str, ...]]): Arguments of every payload
+
+    Returns:
+        list: The payloads in the same order, None for the ones not published
+            recently
+    """
+
+    # Build the keys of the payloads
+    keys = [
+        QuotePublisher.page_key(build_group_name(topic_name, *args))
+        for args in args_list
+    ]
+
+    # Try
+    try:
+        # Get the payloads at once
+        snapshots = cache.get_many(keys)
+
+    # If the cache is unavailable
+    except Exception:
+        snapshots = {}
+
+    # Return the payloads in order
+    return [snapshots.get(key) for key in keys]
+
+
+# Function to get the page snapshot of a topic asynchronously
+async def aget_page_snapshot(topic_name: str, *args: str) -> Optional[Any]:
+    """Get the last payload published for a topic, to render a page from
+
+    Args:
+        topic_name (str): Name of the topic
+        *args (str): Arguments of the topic
+
+    Returns:
+        Optional[Any]: The payload, None if nothing was published recently
+    """
+
+    # Try
+    try:
+        # Return the payload
+        return await cache.aget(
+            QuotePublisher.page_key(build_group_name(topic_name, *args))
+        )
+
+    # If the cache is unavailable
+    except Exception:
+        return None
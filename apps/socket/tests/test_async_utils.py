@@ -0,0 +1,98 @@
+# Imports
+import asyncio
+import time
+
+from apps.socket.utils import get_fetch_executor, run_blocking, with_timeout
+
+
+# Function to measure the event loop latency while a workload runs
+def measure_event_loop_lag(workload) -> float:
+    """Run a workload and return the worst event loop lag seen meanwhile"""
+
+    # Run the scenario
+    async def scenario():
+        # Get the event loop
+        loop = asyncio.get_running_loop()
+
+        # Lags seen by the monitor
+        lags = [0.0]
+
+        # Monitor that should wake up every 10 ms
+        async def monitor(stop):
+            while not stop.is_set():
+                start = loop.time()
+                await asyncio.sleep(0.01)
+                lags.append(loop.time() - start - 0.01)
+
+        # Start the monitor
+        stop = asyncio.Event()
+        task = asyncio.create_task(monitor(stop))
+        await asyncio.sleep(0.02)
+
+        # Run the workload
+        await workload()
+
+        # Stop the monitor
+        stop.set()
+        await task
+
+        # Return the worst lag
+        return max(lags)
+
+    # Return the worst lag
+    return asyncio.run(scenario())
+
+
+# Function to test the event loop stays responsive while fetches are in flight
+def test_run_blocking_keeps_event_loop_latency_flat():
+    # Slow upstream call
+    def slow_fetch():
+        time.sleep(0.2)
+
+    # Workload running the fetches in the shared executor
+    async def offloaded():
+        await asyncio.gather(*(run_blocking(slow_fetch) for _ in range(8)))
+
+    # Workload running the fetches on the event loop
+    async def inline():
+        for _ in range(2):
+            slow_fetch()
+
+    # Assert the event loop latency stays flat when offloaded
+    assert measure_event_loop_lag(offloaded) < 0.05
+
+    # Assert the same fetches stall the loop when run inline
+    assert measure_event_loop_lag(inline) >= 0.2
+
+
+# Function to test the executor is shared and bounded
+def test_fetch_executor_is_shared_and_bounded(settings):
+    # Assert the same executor is returned
+    assert get_fetch_executor() is get_fetch_executor()
+
+    # Assert the executor is bounded
+    assert get_fetch_executor()._max_workers == settings.SOCKET_FETCH_MAX_WORKERS
+
+
+# Function to test the sources are gathered with their own timeout
+def test_with_timeout_bounds_each_source():
+    # Sources answering after a delay, or failing
+    async def source(delay, value):
+        await asyncio.sleep(delay)
+        return value
+
+    async def failing():
+        raise ValueError("upstream down")
+
+    # Gather the sources
+    async def scenario():
+        return await asyncio.gather(
+            with_timeout(source(0.1, "fast"), 1),
+            with_timeout(source(5, "slow"), 0.2, {}),
+            with_timeout(failing(), 1, "default"),
+        )
+
+    # The late and failed sources fall back, waiting for the slowest timeout
+    started = time.monotonic()
+    assert asyncio.run(scenario()) == ["fast", {}, "default"]
+    assert time.monotonic() - started < 1
@@ -0,0 +1,201 @@
+# Imports
+import threading
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from apps.socket.constants import REQUIRED_FIELDS
+from apps.socket.utils import quote_utils
+from apps.socket.utils.cache_utils import quote_cache
+from apps.socket.utils.executor_utils import ExecutorQueueFull
+
+
+# Fixture to use an in-memory shared cache
+@pytest.fixture(autouse=True)
+def locmem_cache(settings):
+    # Override the cache settings
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    settings.QUOTE_BATCH_SIZE = 10
+
+    # Start from an empty quote cache
+    quote_cache.clear()
+    yield
+    quote_cache.clear()
+
+
+# Function to build a fake raw batch quote
+def raw_quote(symbol: str) -> dict:
+    # Return the quote
+    return {
+        "symbol": symbol,
+        "shortName": symbol,
+        "longName": f"{symbol} Index",
+        "regularMarketPrice": 110.0,
+        "regularMarketPreviousClose": 100.0,
+        "regularMarketOpen": 101.0,
+        "regularMarketDayLow": float("nan"),
+        "regularMarketDayHigh": 111.0,
+    }
+
+
+# Function to test the quotes are fetched in batches
+def test_quotes_are_fetched_in_batches(monkeypatch):
+    # Record the upstream batches
+    batches = []
+
+    # Fake batch endpoint
+    def fetch_batch_quote_data(symbols):
+        batches.append(symbols)
+        return {symbol: raw_quote(symbol) for symbol in symbols}
+
+    # Patch the upstream
+    monkeypatch.setattr(quote_utils, "fetch_batch_quote_data", fetch_batch_quote_data)
+
+    # Fetch 25 symbols, with a duplicate
+    symbols = [f"SYM{i}.NS" for i in range(25)]
+    quotes = quote_utils.fetch_and_process_quotes(symbols + ["SYM0.NS"])
+
+    # Assert one upstream request per batch of 10
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+
+    # Assert the shape matches process_quote
+    assert list(quotes) == symbols
+    assert quotes["SYM0.NS"] == {
+        **{key: raw_quote("SYM0.NS").get(key) for key in REQUIRED_FIELDS},
+        "lastPrice": 110.0,
+        "previousClose": 100.0,
+        "open": 101.0,
+        "dayLow": None,
+        "dayHigh": 111.0,
+        "dayChange": 10.0,
+        "dayChangePercentage": 10.0,
+        "colorClass": "text-green-500",
+    }
+
+    # Assert a second call is served from the cache
+    quote_utils.fetch_and_process_quotes(symbols)
+    assert len(batches) == 3
+
+
+# Function to test the symbols missing from the batch fall back
+def test_missing_symbols_fall_back_to_single_fetch(monkeypatch):
+    # Fake batch endpoint that does not know one symbol
+    monkeypatch.setattr(
+        quote_utils,
+        "fetch_batch_quote_data",
+        lambda symbols: {s: raw_quote(s) for s in symbols if s != "^NSEBANK"},
+    )
+
+    # Fake single symbol fetch
+    monkeypatch.setattr(
+        quote_utils, "fetch_and_process_quote", lambda symbol, filter: (symbol, None)
+    )
+
+    # Fetch the quotes
+    quotes = quote_utils.fetch_and_process_quotes(["^NSEI", "^NSEBANK"])
+
+    # Assert the missing symbol went through the fallback
+    assert quotes["^NSEI"]["dayChange"] == 10.0
+    assert quotes["^NSEBANK"] is None
+
+
+# Function to test the ranked quotes keep the rank order and stop early
+def test_fetch_ranked_quotes_keeps_rank_order(monkeypatch):
+    # Fake batch endpoint that does not know B and D
+    monkeypatch.setattr(
+        quote_utils,
+        "fetch_batch_quote_data",
+        lambda symbols: {
+            symbol: raw_quote(symbol) for symbol in symbols if symbol not in "BD"
+        },
+    )
+
+    # Fallbacks, B answers after the deadline and D at once
+    release = threading.Event()
+
+    def fetch_and_process_quote(symbol, filter=True):
+        if symbol == "B":
+            release.wait(1)
+        return symbol, {"symbol": symbol}
+
+    monkeypatch.setattr(quote_utils, "fetch_and_process_quote", fetch_and_process_quote)
+
+    # The late fallback is skipped and the ranking stops at the limit
+    quotes = quote_utils.fetch_ranked_quotes(["A", "B", "C", "D", "E"], 3, 0.1)
+    release.set()
+    assert list(quotes) == ["A", "C", "D"]
+
+    # The ranking does not wait for the fallbacks after the limit
+    started = time.monotonic()
+    release.clear()
+    quotes = quote_utils.fetch_ranked_quotes(["A", "C", "B"], 2, 5)
+    release.set()
+    assert list(quotes) == ["A", "C"]
+    assert time.monotonic() - started < 1
+
+
+# Function to test the info of unfiltered quotes is fetched concurrently
+def test_unfiltered_quotes_fetch_info_concurrently(monkeypatch):
+    # Fake batch endpoint
+    monkeypatch.setattr(
+        quote_utils,
+        "fetch_batch_quote_data",
+        lambda symbols: {symbol: raw_quote(symbol) for symbol in symbols},
+    )
+
+    # Fake slow info endpoint
+    def fetch_ticker_data(ticker, kind):
+        time.sleep(0.2)
+        return {"sector": f"{ticker} sector"}
+
+    monkeypatch.setattr(quote_utils, "get_ticker", lambda symbol: symbol)
+    monkeypatch.setattr(quote_utils, "fetch_ticker_data", fetch_ticker_data)
+
+    # Fetch 5 unfiltered quotes
+    started = time.monotonic()
+    symbols = [f"SYM{i}.NS" for i in range(5)]
+    quotes = quote_utils.fetch_and_process_quotes(symbols, filter=False)
+
+    # Assert the info was fetched concurrently and merged with the batch quote
+    assert time.monotonic() - started < 0.6
+    assert quotes["SYM1.NS"]["sector"] == "SYM1.NS sector"
+    assert quotes["SYM1.NS"]["longName"] == "SYM1.NS Index"
+    assert quotes["SYM1.NS"]["dayChange"] == 10.0
+
+
+# Function to test the ranked fallbacks run on their own executor
+def test_fetch_ranked_quotes_skips_rejected_fallbacks(monkeypatch):
+    # Fake batch endpoint that does not know B and D
+    monkeypatch.setattr(
+        quote_utils,
+        "fetch_batch_quote_data",
+        lambda symbols: {
+            symbol: raw_quote(symbol) for symbol in symbols if symbol not in "BD"
+        },
+    )
+
+    # Fake executor that runs the fallbacks at once, with a full queue for B
+    class Executor:
+        def submit(self, fn, symbol):
+            if symbol == "B":
+                raise ExecutorQueueFull("full")
+            future = Future()
+            future.set_result((symbol, {"symbol": symbol}))
+            return future
+
+    # Record the executors asked for
+    names = []
+
+    def get_executor(name):
+        names.append(name)
+        return Executor()
+
+    monkeypatch.setattr(quote_utils, "get_executor", get_executor)
+
+    # The rejected fallback is skipped like a late one
+    quotes = quote_utils.fetch_ranked_quotes(["A", "B", "C", "D"], 3, 1)
+    assert list(quotes) == ["A", "C", "D"]
+    assert names == ["ranked"]
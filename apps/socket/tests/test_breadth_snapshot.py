@@ -0,0 +1,122 @@
+# Imports
+import pandas as pd
+import pytest
+from django.core.cache import cache
+
+from apps.socket.utils import nse_utils
+from apps.socket.utils.nse_utils import BreadthSnapshot
+
+
+# Fixture to use an in-memory shared cache
+@pytest.fixture(autouse=True)
+def locmem_cache(settings):
+    # Override the cache settings
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    settings.BREADTH_REFRESH_TTLS = {"open": 60, "closed": 60}
+
+
+# Fixture to count the breadth table fetches
+@pytest.fixture
+def fetches(monkeypatch):
+    # List to store the fetches
+    calls = []
+
+    # Fake breadth table, with a tie and a security without a change
+    def fetch():
+        calls.append(1)
+        return pd.DataFrame(
+            {
+                "symbol": ["A", "B", "C", "D", "E", "F"],
+                "pChange": [1.5, -2.0, 3.0, None, 1.5, -0.5],
+            }
+        )
+
+    # Replace the upstream fetch
+    monkeypatch.setattr(nse_utils, "nse_get_advances_declines", fetch)
+
+    # Return the calls
+    return calls
+
+
+# Function to test the rankings of the snapshot
+def test_breadth_snapshot_ranks_both_directions(fetches):
+    # Rank the securities
+    snapshot = BreadthSnapshot(prefix="test-breadth-rank")
+
+    # Ties keep the table order and missing changes are left out
+    assert snapshot.top(3)["symbol"].tolist() == ["C", "A", "E"]
+    assert snapshot.bottom(10)["symbol"].tolist() == ["B", "F", "A", "E", "C"]
+
+    # Both rankings were served from one fetch
+    assert len(fetches) == 1
+
+
+# Function to test the snapshot is shared between the workers
+def test_breadth_snapshot_is_shared(fetches):
+    # Two workers with their own snapshot
+    first = BreadthSnapshot(prefix="test-breadth-shared")
+    second = BreadthSnapshot(prefix="test-breadth-shared")
+
+    # The second worker reuses the table fetched by the first one
+    assert first.top(1)["symbol"].tolist() == ["C"]
+    assert second.bottom(1)["symbol"].tolist() == ["B"]
+    assert len(fetches) == 1
+
+    # Once stale everywhere, the table is fetched again
+    first._entry["refreshed_at"] = 0.0
+    cache.clear()
+    first.top(1)
+    assert len(fetches) == 2
+
+
+# Function to test the quotes are built from the breadth table
+def test_nse_breadth_quotes_only_fetch_missing_prices(monkeypatch):
+    # Two rows, the second one without a previous close
+    rows = pd.DataFrame(
+        [
+            {
+                "symbol": "A",
+                "meta": {"companyName": "A Limited"},
+                "lastPrice": 110.0,
+                "previousClose": 100.0,
+                "open": 101.0,
+                "dayLow": 99.0,
+                "dayHigh": 111.0,
+            },
+            {
+                "symbol": "B",
+                "lastPrice": 90.0,
+                "previousClose": float("nan"),
+                "open": 99.0,
+                "dayLow": 89.0,
+                "dayHigh": 100.0,
+            },
+        ]
+    )
+
+    # Fake Yahoo quotes, recording the requested symbols
+    requested = []
+
+    def fetch(symbols, limit):
+        requested.append(symbols)
+        return {
+            symbol: {"previousClose": 100.0, "longName": "B Limited"}
+            for symbol in symbols
+        }
+
+    # Replace the Yahoo quotes
+    monkeypatch.setattr(nse_utils, "fetch_ranked_quotes", fetch)
+
+    # Build the quotes
+    quotes = nse_utils.nse_breadth_quotes(rows)
+
+    # Only the missing fields were fetched, in one request
+    assert requested == [["B.NS"]]
+    assert list(quotes) == ["A.NS", "B.NS"]
+    assert quotes["A.NS"]["longName"] == "A Limited"
+    assert quotes["A.NS"]["dayChange"] == 10.0
+    assert quotes["B.NS"]["longName"] == "B Limited"
+    assert quotes["B.NS"]["lastPrice"] == 90.0
+    assert quotes["B.NS"]["colorClass"] == "text-red-500"
@@ -0,0 +1,94 @@
+# Imports
+import plotly.graph_objects as go
+import pytest
+from django.utils import timezone
+
+from apps.socket.helpers import chart_cache_helper
+from apps.socket.helpers.chart_cache_helper import (
+    bar_aligned_ttl,
+    get_candlestick_chart_html,
+    warm_candlestick_charts,
+)
+
+
+# Fixture to use an in-memory shared cache and an empty local cache
+@pytest.fixture(autouse=True)
+def locmem_cache(settings):
+    # Override the cache settings
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+
+    # Clear the rendered charts
+    chart_cache_helper.chart_html_cache.clear()
+
+
+# Fixture to count the chart renders
+@pytest.fixture
+def renders(monkeypatch):
+    # List to store the rendered charts
+    calls = []
+
+    # Fake chart generation
+    def generate(symbol, period, interval, indicator, height):
+        calls.append((symbol, period, interval, indicator, height))
+        return go.Figure(layout={"title": symbol, "height": height})
+
+    # Replace the chart generation and open the market
+    monkeypatch.setattr(chart_cache_helper, "generate_candlestick_chart", generate)
+    monkeypatch.setattr(chart_cache_helper, "is_market_open", lambda: True)
+
+    # Return the calls
+    return calls
+
+
+# Function to test that the TTL ends with the last bar
+def test_bar_aligned_ttl(monkeypatch):
+    # Open the market at 10:09:30
+    monkeypatch.setattr(chart_cache_helper, "is_market_open", lambda: True)
+    now = timezone.localtime().replace(hour=10, minute=9, second=30, microsecond=0)
+
+    # Intraday bars are counted from 09:15
+    assert bar_aligned_ttl("5m", now) == 30
+    assert bar_aligned_ttl("15m", now) == 5 * 60 + 30
+    assert bar_aligned_ttl("60m", now) == 5 * 60 + 30
+
+    # Daily bars and the last intraday bar end with the session
+    assert bar_aligned_ttl("1d", now) == (5 * 60 + 20) * 60 + 30
+    late = now.replace(hour=15, minute=20, second=0)
+    assert bar_aligned_ttl("60m", late) == 10 * 60
+
+    # The closed TTL is used while the market is closed
+    monkeypatch.setattr(chart_cache_helper, "is_market_open", lambda: False)
+    assert bar_aligned_ttl("5m", now) == 60 * 15
+
+
+# Function to test that the charts are rendered once per key
+def test_chart_html_is_rendered_once(renders):
+    # Get the same chart twice and a taller one
+    first = get_candlestick_chart_html("^NSEI")
+    second = get_candlestick_chart_html("^NSEI")
+    taller = get_candlestick_chart_html("^NSEI", height=800)
+
+    # Each chart was rendered once
+    assert first == second and first != taller
+    assert renders == [
+        ("^NSEI", "1d", "5m", "none", 650),
+        ("^NSEI", "1d", "5m", "none", 800),
+    ]
+
+    # Another worker gets the chart from the shared cache
+    chart_cache_helper.chart_html_cache.clear()
+    assert get_candlestick_chart_html("^NSEI") == first
+    assert len(renders) == 2
+
+
+# Function to test the pre-warming of the charts
+def test_warm_candlestick_charts(renders):
+    # Warm the charts of two indices
+    assert warm_candlestick_charts(["^NSEI", "^NSEBANK"]) == ["^NSEI", "^NSEBANK"]
+
+    # The page views are served from the cache
+    get_candlestick_chart_html("^NSEI")
+    get_candlestick_chart_html("^NSEBANK")
+    assert len(renders) == 2
@@ -0,0 +1,99 @@
+# Imports
+import json
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+
+from apps.socket.benchmarks.chart_build import reference_hover_text
+from apps.socket.benchmarks.indicator_kernels import build_history
+from apps.socket.utils.chart_utils import (
+    build_candle_hover_text,
+    diff_chart_payload,
+    figure_to_payload,
+)
+
+
+# Function to build a chart of the first bars
+def build_chart(bars: int, fifth_close: float = None) -> go.Figure:
+    # Build the history
+    index = pd.date_range("2024-01-01 09:15", periods=bars, freq="5min")
+    close = np.arange(bars, dtype=float) + 100
+    if fifth_close is not None:
+        close[4] = fifth_close
+
+    # Build the candlestick and a line trace on the same x axis
+    return go.Figure(
+        data=[
+            go.Candlestick(
+                x=index, open=close - 1, high=close + 1, low=close - 2, close=close
+            ),
+            go.Scatter(x=index, y=close, name="SMA"),
+        ]
+    )
+
+
+# Function to test the figure is converted to shared columns
+def test_figure_to_payload_shares_columns():
+    # Convert the chart
+    payload = figure_to_payload(build_chart(5))
+
+    # Assert the x axis is sent once for both traces
+    assert payload["traces"][0]["columns"]["x"] == "0.x"
+    assert payload["traces"][1]["columns"]["x"] == "0.x"
+    assert set(payload["columns"]) == {"0.x", "0.open", "0.high", "0.low", "0.close"}
+    assert payload["traces"][1]["columns"]["y"] == "0.close"
+
+
+# Function to test only the appended and updated bars are sent
+def test_diff_chart_payload_sends_changed_bars():
+    # Previous payload
+    old = figure_to_payload(build_chart(5))
+
+    # Assert nothing is sent when nothing changed
+    assert diff_chart_payload(old, figure_to_payload(build_chart(5))) == ({}, None)
+
+    # Revise the last bar and append a new one
+    new = figure_to_payload(build_chart(6, fifth_close=200.0))
+    delta, order = diff_chart_payload(old, new)
+
+    # Assert only the new bar is sent for the unchanged columns
+    assert delta["columns"]["0.x"]["start"] == 5
+    assert len(delta["columns"]["0.x"]["values"]) == 1
+
+    # Assert the close column restarts at the revised bar
+    assert delta["columns"]["0.close"] == {"start": 4, "values": [200.0, 105.0]}
+
+    # Assert the delta is a tiny fraction of the full payload
+    assert len(json.dumps(delta)) < len(json.dumps(new)) / 5
+
+
+# Function to test a change of traces needs a new snapshot
+def test_diff_chart_payload_requires_snapshot_when_traces_change():
+    # Payloads with a different number of traces
+    old = figure_to_payload(build_chart(5))
+    new = figure_to_payload(go.Figure(data=[build_chart(5).data[0]]))
+
+    # Assert a snapshot is required
+    assert diff_chart_payload(old, new) == (None, None)
+
+
+# Function to test the hover labels match the per bar f-strings
+@pytest.mark.parametrize("tz", [None, "Asia/Kolkata", "America/New_York"])
+def test_build_candle_hover_text(tz):
+    # Daily bars across daylight saving changes, with a missing price
+    history_df = build_history(400).round(2)
+    history_df.index = pd.date_range("2024-01-01", periods=400, freq="D", tz=tz)
+    history_df.iloc[3, 0] = np.nan
+
+    # The labels are the same as the f-strings
+    assert build_candle_hover_text(history_df).tolist() == reference_hover_text(
+        history_df
+    )
+
+    # Sub second timestamps are formatted like str(pd.Timestamp)
+    history_df.index += pd.Timedelta("1ms")
+    assert build_candle_hover_text(history_df).tolist() == reference_hover_text(
+        history_df
+    )
@@ -0,0 +1,49 @@
+# Imports
+from apps.socket.utils.delta_utils import diff_payload
+
+
+# Function to test only the changed fields are kept
+def test_diff_payload_keeps_changed_fields():
+    # Previous and current payloads
+    old = {
+        "^NSEI": {"lastPrice": 100.0, "dayLow": 99.0, "colorClass": "text-green-500"},
+        "^NSEBANK": {"lastPrice": 50.0},
+        "^BSESN": {"lastPrice": 70.0},
+    }
+    new = {
+        "^NSEI": {"lastPrice": 101.0, "colorClass": "text-green-500"},
+        "^NSEBANK": {"lastPrice": 50.0},
+        "^CNXIT": {"lastPrice": 30.0},
+    }
+
+    # Diff the payloads
+    delta, order = diff_payload(old, new)
+
+    # Assert the changed, removed and added values
+    assert delta == {
+        "^NSEI": {"lastPrice": 101.0, "dayLow": None},
+        "^CNXIT": {"lastPrice": 30.0},
+        "^BSESN": None,
+    }
+
+    # Assert the order is reproduced by applying the changes
+    assert order is None
+
+
+# Function to test nothing is sent when nothing changed
+def test_diff_payload_is_empty_when_unchanged():
+    # Payload
+    payload = {"^NSEI": {"lastPrice": 100.0}, "^NSEBANK": {"lastPrice": 50.0}}
+
+    # Assert the diff is empty
+    assert diff_payload(payload, dict(payload)) == ({}, None)
+
+
+# Function to test a rank change sends the new order
+def test_diff_payload_sends_new_order():
+    # Previous and current rankings
+    old = {"A": {"pChange": 2.0}, "B": {"pChange": 1.0}}
+    new = {"B": {"pChange": 3.0}, "A": {"pChange": 2.0}}
+
+    # Assert the new order is sent with the change
+    assert diff_payload(old, new) == ({"B": {"pChange": 3.0}}, ["B", "A"])
@@ -0,0 +1,133 @@
+# Imports
+import numpy as np
+import pandas as pd
+import pytest
+
+from apps.socket.benchmarks.indicator_kernels import build_history
+from apps.socket.consumers import QuoteChartConsumer
+from apps.socket.helpers import candlestick_chart_helper
+from apps.socket.utils import (
+    bucket_size,
+    downsample_line,
+    downsample_ohlc,
+    lttb_indices,
+)
+
+
+# Function to test the OHLC buckets
+def test_downsample_ohlc():
+    # Aggregate 10 bars with a volume into buckets of 4
+    longer_df = build_history(11).assign(Volume=np.arange(11))
+    history_df = longer_df.iloc[:10]
+    buckets = downsample_ohlc(history_df, bucket_size(len(history_df), 3))
+
+    # Every bucket keeps the open, the extremes, the close and the volume
+    assert list(buckets.index) == list(history_df.index[[0, 4, 8]])
+    assert buckets["Open"].tolist() == history_df["Open"].iloc[[0, 4, 8]].tolist()
+    assert buckets["High"].iloc[1] == history_df["High"].iloc[4:8].max()
+    assert buckets["Low"].iloc[1] == history_df["Low"].iloc[4:8].min()
+    assert buckets["Close"].tolist() == history_df["Close"].iloc[[3, 7, 9]].tolist()
+    assert buckets["Volume"].tolist() == [6, 22, 17]
+
+    # Appending a bar only changes the last bucket
+    longer = downsample_ohlc(longer_df, 4)
+    pd.testing.assert_frame_equal(longer.iloc[:2], buckets.iloc[:2])
+
+
+# Function to test the selection of the points of a line
+def test_lttb_keeps_the_shape():
+    # A flat line with two spikes
+    values = np.zeros(101)
+    values[[30, 70]] = [10, -10]
+
+    # The ends and the spikes are kept
+    selected = lttb_indices(values, 10)
+    assert len(selected) == 12
+    assert selected[0] == 0 and selected[-1] == 100
+    assert {30, 70} <= set(selected.tolist())
+
+    # Missing values are dropped and the timestamps are kept
+    series = pd.Series(values, index=pd.RangeIndex(101) * 2)
+    series.iloc[:30] = np.nan
+    line = downsample_line(series, 5)
+    assert line.notna().all() and line.index[0] == 60 and line.index[-1] == 200
+
+
+# Function to test the downsampled charts
+@pytest.mark.filterwarnings("ignore::FutureWarning")
+def test_generate_candlestick_chart_downsamples(monkeypatch):
+    # Serve a long history without the network
+    history_df = build_history(3000)
+    monkeypatch.setattr(candlestick_chart_helper, "get_ticker", lambda symbol: None)
+    monkeypatch.setattr(
+        candlestick_chart_helper,
+        "fetch_ticker_data",
+        lambda ticker, kind, *args: {} if kind == "info" else history_df,
+    )
+
+    # The whole history is drawn with at most the requested points
+    fig = candlestick_chart_helper.generate_candlestick_chart(
+        "TEST", "max", "1m", "sma", max_points=500
+    )
+    assert len(fig.data[0].x) == 500
+    assert len(fig.data[1].x) <= 500
+
+    # A zoomed window that fits is drawn at full resolution
+    start, end = history_df.index[1000], history_df.index[1299]
+    fig = candlestick_chart_helper.generate_candlestick_chart(
+        "TEST", "max", "1m", "sma", max_points=500, start=str(start), end=str(end)
+    )
+    assert len(fig.data[0].x) == len(fig.data[1].x) == 300
+
+
+# Function to test the normalization of the chart arguments
+def test_quote_chart_consumer_arguments(settings):
+    # The widths are rounded up to a bucket and capped
+    settings.CHART_MAX_POINTS = 1000
+    assert QuoteChartConsumer.parse_points("") == ""
+    assert QuoteChartConsumer.parse_points("300") == "500"
+    assert QuoteChartConsumer.parse_points("730") == "1000"
+    assert QuoteChartConsumer.parse_points("4000") == "1000"
+
+    # The bounds are snapped outwards to the bars of the interval
+    assert QuoteChartConsumer.parse_timestamp("2024-01-02 09:17:31", "5m") == (
+        "2024-01-02T09:15:00"
+    )
+    assert QuoteChartConsumer.parse_timestamp("2024-01-02 09:17:31", "5m", True) == (
+        "2024-01-02T09:20:00"
+    )
+    assert QuoteChartConsumer.parse_timestamp("2024-01-02 09:17", "1d") == (
+        "2024-01-02T00:00:00"
+    )
+
+    # Invalid values are rejected
+    for parse, value in [
+        (QuoteChartConsumer.parse_points, "wide"),
+        (QuoteChartConsumer.parse_points, "0"),
+        (lambda value: QuoteChartConsumer.parse_timestamp(value, "5m"), "soon"),
+        (lambda value: QuoteChartConsumer.parse_timestamp(value, "5m"), "NaT"),
+    ]:
+        with pytest.raises(ValueError):
+            parse(value)
+
+
+# Function to test close zooms share their topic and invalid windows are rejected
+def test_quote_chart_consumer_topic_args():
+    # Build a consumer for a chart with a zoomed window
+    def topic_args(**params):
+        consumer = QuoteChartConsumer()
+        consumer.scope = {"url_route": {"kwargs": {"symbol": "^NSEI"}}}
+        consumer.query_params = {"interval": "5m", "points": "900", **params}
+        return consumer.get_topic_args()
+
+    # Two close zooms of the same chart share their topic
+    first = topic_args(start="2024-01-02 09:16:10", end="2024-01-02 10:01:00")
+    second = topic_args(start="2024-01-02 09:19:59", end="2024-01-02 10:03:20")
+    assert first == second
+    assert first[-2:] == ("2024-01-02T09:15:00", "2024-01-02T10:05:00")
+
+    # Windows with a single bound or no bars are rejected
+    with pytest.raises(ValueError):
+        topic_args(start="2024-01-02 09:16:10")
+    with pytest.raises(ValueError):
+        topic_args(start="2024-01-02 10:00:00", end="2024-01-02 09:00:00")
@@ -0,0 +1,75 @@
+# Imports
+import threading
+
+import pytest
+from django.urls import reverse
+
+from apps.socket.utils.executor_utils import ExecutorQueueFull, InstrumentedExecutor
+
+
+# Function to test the queue depth is bounded and the metrics are recorded
+def test_executor_bounds_queue_and_records_metrics():
+    # Create an executor with one thread and one queue slot
+    executor = InstrumentedExecutor("test", max_workers=1, max_queue=1)
+    release = threading.Event()
+    started = threading.Event()
+
+    # Blocking task
+    def task():
+        started.set()
+        release.wait(1)
+        return 1
+
+    # Fill the thread and the queue
+    running = executor.submit(task)
+    started.wait(1)
+    queued = executor.submit(task)
+
+    # Assert the pool depth
+    assert executor.stats()["running"] == 1
+    assert executor.stats()["queued"] == 1
+
+    # Assert the next task is rejected instead of blocking
+    with pytest.raises(ExecutorQueueFull):
+        executor.submit(task)
+
+    # Assert a cancelled task frees its queue slot
+    assert queued.cancel()
+    assert executor.stats()["queued"] == 0
+    queued = executor.submit(task)
+
+    # Let the tasks finish
+    release.set()
+    assert running.result() == 1 and queued.result() == 1
+    executor.shutdown()
+
+    # Assert the counters and the wait times
+    stats = executor.stats()
+    assert stats["submitted"] == 3
+    assert stats["cancelled"] == 1
+    assert stats["completed"] == 2
+    assert stats["rejected"] == 1
+    assert stats["queued"] == 0 and stats["running"] == 0
+    assert stats["wait_time_max"] > 0
+    assert stats["wait_time_avg"] <= stats["wait_time_max"]
+
+
+# Function to test the metrics view is restricted to staff
+@pytest.mark.django_db
+def test_metrics_view(client, user):
+    # Authenticate a regular user
+    client.force_login(user)
+
+    # Assert the metrics are not exposed to regular users
+    assert client.get(reverse("socket:metrics")).status_code == 302
+
+    # Promote the user to staff
+    user.is_staff = True
+    user.save()
+
+    # Get the metrics
+    response = client.get(reverse("socket:metrics"))
+
+    # Assert the metrics are exposed
+    assert response.status_code == 200
+    assert set(response.json()) == {"executors", "quote_cache", "singleflight"}
@@ -0,0 +1,185 @@
+# Imports
+import pandas as pd
+import pytest
+
+from apps.socket.utils import history_utils
+from apps.socket.utils.history_utils import HistoryStore
+
+
+# Fixture to use an in-memory shared cache
+@pytest.fixture(autouse=True)
+def locmem_cache(settings):
+    # Override the cache settings
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    settings.HISTORY_REFRESH_TTLS = {"open": 60, "closed": 60}
+
+
+# Function to build a history frame
+def build_frame(times, close):
+    # Build the index from the session times of the last two days
+    today = pd.Timestamp.now(tz="Asia/Kolkata").normalize()
+    index = pd.DatetimeIndex(
+        [today - pd.Timedelta(days=days) + pd.Timedelta(time) for days, time in times]
+    )
+
+    # Return the frame
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close,
+            "Low": close,
+            "Close": close,
+            "Volume": [0.0] * len(close),
+        },
+        index=index,
+    )
+
+
+# FakeTicker class
+class FakeTicker:
+    # Constructor
+    def __init__(self, symbol, frames):
+        # Attributes
+        self.ticker = symbol
+        self.frames = list(frames)
+        self.calls = []
+
+    # Method to fetch the history
+    def history(self, **kwargs):
+        # Record the call and return the next frame
+        self.calls.append(kwargs)
+        return self.frames.pop(0)
+
+
+# Function to test the backfill, the tail refresh and the period slices
+def test_history_store_backfills_once_and_refreshes_the_tail(tmp_path, monkeypatch):
+    # Two sessions of bars, then the updated last bar and a new one
+    backfill = build_frame(
+        [(1, "09:15:00"), (1, "09:20:00"), (0, "09:15:00"), (0, "09:20:00")],
+        [1.0, 2.0, 3.0, 4.0],
+    )
+    tail = build_frame(
+        [(0, "09:15:00"), (0, "09:20:00"), (0, "09:25:00")], [3.0, 4.5, 5.0]
+    )
+    ticker = FakeTicker("^NSEI", [backfill, tail])
+    store = HistoryStore(root=str(tmp_path), prefix="test-history")
+
+    # Store the 5m series itself instead of resampling it
+    monkeypatch.setattr(history_utils, "HISTORY_BASE_INTERVALS", {})
+
+    # Get the last session, backfilling the series
+    frame = store.get(ticker, "1d", "5m")
+
+    # Assert the series was backfilled with the longest period of the interval
+    assert ticker.calls == [{"period": "60d", "interval": "5m"}]
+    assert frame["Close"].tolist() == [3.0, 4.0]
+    assert str(frame.index.tz) == "Asia/Kolkata"
+
+    # Get a longer period, served from the store
+    assert store.get(ticker, "5d", "5m")["Close"].tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert len(ticker.calls) == 1
+
+    # Let the series go stale
+    monkeypatch.setattr(store, "is_stale", lambda entry: True)
+
+    # Refresh the series
+    frame = store.get(ticker, "1d", "5m")
+
+    # Assert only the bars from the last complete stored one were fetched
+    assert ticker.calls[1]["start"] == backfill.index[-2]
+    assert frame["Close"].tolist() == [3.0, 4.5, 5.0]
+
+
+# Function to test that the disk copy survives the hot layer
+def test_history_store_loads_from_disk(tmp_path, monkeypatch):
+    # Backfill a 5m series
+    monkeypatch.setattr(history_utils, "HISTORY_BASE_INTERVALS", {})
+    backfill = build_frame([(0, "09:15:00"), (0, "09:20:00")], [1.0, 2.0])
+    ticker = FakeTicker("RELIANCE.NS", [backfill])
+    HistoryStore(root=str(tmp_path), prefix="test-history").get(ticker, "1d", "5m")
+
+    # Drop the hot layer, like a restart of the shared cache
+    history_utils.cache.clear()
+
+    # Load the series from the disk with another store
+    entry = HistoryStore(root=str(tmp_path), prefix="test-history").load(
+        "RELIANCE.NS", "5m"
+    )
+
+    # Assert the bars were memory mapped from the disk
+    assert entry["tz"] == "Asia/Kolkata"
+    assert entry["bars"]["close"].tolist() == [1.0, 2.0]
+
+
+# Function to test that the coarser intervals are resampled from the base one
+def test_history_store_resamples_the_base_interval(tmp_path):
+    # One minute bars of two sessions, the last one missing its first minute
+    times = [(1, f"09:{minute}:00") for minute in range(15, 45)]
+    times += [(0, f"09:{minute}:00") for minute in range(16, 40)]
+    backfill = build_frame(times, [float(close) for close in range(len(times))])
+    ticker = FakeTicker("^NSEI", [backfill.iloc[:0], backfill])
+    store = HistoryStore(root=str(tmp_path), prefix="test-history")
+
+    # Get the 5m, 15m and 1m bars of the last session and of both sessions
+    five = store.get(ticker, "1d", "5m")
+    fifteen = store.get(ticker, "5d", "15m")
+    store.get(ticker, "5d", "1m")
+
+    # Assert the one minute series was the only upstream series, backfilled
+    # in chunks of the longest window Yahoo serves
+    assert [call["interval"] for call in ticker.calls] == ["1m", "1m"]
+    assert ticker.calls[0]["end"] - ticker.calls[0]["start"] == pd.Timedelta(days=7)
+    assert ticker.calls[1]["end"] is None
+
+    # Assert the bars start on the session open and aggregate the minutes
+    assert [str(ts.time()) for ts in five.index] == [
+        "09:15:00",
+        "09:20:00",
+        "09:25:00",
+        "09:30:00",
+        "09:35:00",
+    ]
+    assert five["Open"].tolist() == [30.0, 34.0, 39.0, 44.0, 49.0]
+    assert five["Close"].tolist() == [33.0, 38.0, 43.0, 48.0, 53.0]
+    assert fifteen["High"].tolist() == [14.0, 29.0, 43.0, 53.0]
+    assert str(fifteen.index.tz) == "Asia/Kolkata"
+
+
+# Function to test the series is backfilled again after an adjustment
+def test_history_store_backfills_adjusted_series(tmp_path, monkeypatch):
+    # Daily bars, then a tail whose complete bar was halved by a split
+    monkeypatch.setattr(history_utils, "HISTORY_BASE_INTERVALS", {})
+    backfill = build_frame([(2, "00:00:00"), (1, "00:00:00")], [100.0, 102.0])
+    tail = build_frame([(2, "00:00:00"), (1, "00:00:00")], [50.0, 51.0])
+    adjusted = build_frame(
+        [(2, "00:00:00"), (1, "00:00:00"), (0, "00:00:00")], [50.0, 51.0, 52.0]
+    )
+    ticker = FakeTicker("RELIANCE.NS", [backfill, tail, adjusted])
+    store = HistoryStore(root=str(tmp_path), prefix="test-history")
+
+    # Backfill the series, then refresh it
+    store.get(ticker, "max", "1d")
+    monkeypatch.setattr(store, "is_stale", lambda entry: True)
+    frame = store.get(ticker, "max", "1d")
+
+    # Assert the whole series was fetched again instead of mixing prices
+    assert ticker.calls[2] == {"period": "max", "interval": "1d"}
+    assert frame["Close"].tolist() == [50.0, 51.0, 52.0]
+
+
+# Function to test the bars older than the backfill period are dropped
+def test_history_store_trims_old_bars(tmp_path, monkeypatch):
+    # Bars of a 5m series, the first one older than its backfill period
+    monkeypatch.setattr(history_utils, "HISTORY_BASE_INTERVALS", {})
+    backfill = build_frame(
+        [(61, "09:15:00"), (1, "09:15:00"), (0, "09:15:00")], [1.0, 2.0, 3.0]
+    )
+    ticker = FakeTicker("^NSEI", [backfill])
+
+    # Assert only the bars Yahoo still serves are stored
+    frame = HistoryStore(root=str(tmp_path), prefix="test-history").get(
+        ticker, "max", "5m"
+    )
+    assert frame["Close"].tolist() == [2.0, 3.0]
@@ -0,0 +1,69 @@
+# Imports
+import pytest
+
+from apps.socket.benchmarks.indicator_kernels import build_history
+from apps.socket.helpers.chart_indicator_helpers import (
+    IndicatorCache,
+    compute_indicator,
+)
+
+
+# Fixture to use an in-memory shared cache
+@pytest.fixture(autouse=True)
+def locmem_cache(settings):
+    # Override the cache settings
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+
+
+# Function to test that identical requests are computed once
+def test_indicator_cache_levels_and_counters():
+    # Count the computations
+    calls = []
+
+    # Compute the RSI of the history
+    def compute():
+        calls.append(1)
+        return compute_indicator("rsi", history_df)
+
+    # Create two caches sharing their results, like two worker processes
+    history_df = build_history(200).round(2)
+    first = IndicatorCache(prefix="test-indicator", maxsize=8, use_shared=True)
+    second = IndicatorCache(prefix="test-indicator", maxsize=8, use_shared=True)
+
+    # Request the same indicator from both workers, twice
+    for indicator_cache in (first, first, second, second):
+        result = indicator_cache.get_or_compute(
+            "^NSEI", "5m", history_df.copy(), "rsi", {}, compute
+        )
+        assert result.values["rsi"].equals(
+            compute_indicator("rsi", history_df).values["rsi"]
+        )
+
+    # The indicator was computed once, then served from both levels
+    assert len(calls) == 1
+    assert first.stats()["misses"] == 1 and first.stats()["local_hits"] == 1
+    assert second.stats()["shared_hits"] == 1 and second.stats()["local_hits"] == 1
+
+
+# Function to test that the keys follow the history
+def test_indicator_cache_keys():
+    # Build a history and the same history with a revised last bar
+    indicator_cache = IndicatorCache(prefix="test-indicator", maxsize=8)
+    history_df = build_history(100).round(2)
+    revised = history_df.copy()
+    revised.iloc[-1, revised.columns.get_loc("Close")] += 1
+
+    # Equal histories share their key
+    key = indicator_cache.key("^NSEI", "5m", history_df, "sma", {"window": 20})
+    assert key == indicator_cache.key(
+        "^NSEI", "5m", history_df.copy(), "sma", {"window": 20}
+    )
+
+    # A revised bar, other bars or other parameters change the key
+    assert key != indicator_cache.key("^NSEI", "5m", revised, "sma", {"window": 20})
+    assert key != indicator_cache.key(
+        "^NSEI", "5m", history_df.iloc[1:], "sma", {"window": 20}
+    )
+    assert key != indicator_cache.key("^NSEI", "5m", history_df, "sma", {"window": 10})
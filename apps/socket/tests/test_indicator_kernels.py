@@ -0,0 +1,51 @@
+# Imports
+import numpy as np
+import plotly.graph_objects as go
+import pytest
+
+from apps.socket.benchmarks.indicator_kernels import BENCHMARKS, build_history
+from apps.socket.helpers.chart_indicator_helpers import (
+    add_kama_indicator,
+    add_price_based_obv_indicator,
+    kernels,
+)
+
+
+# Function to test the kernels against the reference implementations
+@pytest.mark.parametrize("name", list(BENCHMARKS))
+@pytest.mark.parametrize("length", [30, 300, 2520])
+def test_kernel_matches_reference(name, length):
+    # Build a history with ties and flat stretches
+    history_df = build_history(length, seed=length)
+    history_df.iloc[15:22] = history_df.iloc[15]
+
+    # Compute both implementations
+    reference, kernel = BENCHMARKS[name]
+    expected = reference(history_df)
+    result = kernel(history_df)
+
+    # Compare every output series
+    if not isinstance(expected, tuple):
+        expected, result = (expected,), (result,)
+    for expected_values, values in zip(expected, result):
+        np.testing.assert_allclose(
+            np.asarray(values, dtype=float),
+            np.asarray(expected_values, dtype=float),
+            rtol=1e-9,
+            atol=1e-9,
+        )
+
+
+# Function to test that the indicators plot the kernel outputs
+def test_indicators_use_kernels():
+    # Build a history
+    history_df = build_history(500)
+    close = history_df["Close"].to_numpy()
+
+    # Add the indicators
+    fig = add_kama_indicator(go.Figure(), history_df.copy())
+    fig = add_price_based_obv_indicator(fig, history_df.copy())
+
+    # Assert the traces hold the kernel outputs
+    np.testing.assert_allclose(fig.data[0].y[10:], kernels.kama(close, 10, 2, 30)[10:])
+    np.testing.assert_array_equal(fig.data[1].y, kernels.price_obv(close))
@@ -0,0 +1,135 @@
+# Imports
+import json
+
+import plotly.graph_objects as go
+import pytest
+
+from apps.socket.benchmarks.indicator_kernels import build_history
+from apps.socket.constants import INDICATORS
+from apps.socket.helpers.chart_indicator_helpers import (
+    INDICATOR_REGISTRY,
+    add_indicator,
+    add_macd_indicator,
+    compute_indicator,
+    evaluate_indicators,
+    format_indicators,
+    parse_indicators,
+    render_indicators,
+    shared_intermediates,
+)
+from apps.socket.helpers.chart_indicator_helpers.shared import close_ema
+
+
+# Function to test that every indicator is registered
+def test_registry_covers_indicators():
+    # Every selectable indicator has a compute function
+    assert set(INDICATOR_REGISTRY) == {name for name, _ in INDICATORS} - {"none"}
+
+
+# Function to test that the compute functions are pure
+@pytest.mark.parametrize("name", sorted(INDICATOR_REGISTRY))
+def test_compute_leaves_history_unchanged(name):
+    # Build a history and keep a copy
+    history_df = build_history(300)
+    expected = history_df.copy()
+
+    # Compute the indicator
+    result = compute_indicator(name, history_df)
+
+    # The history is unchanged and every series is computed
+    assert history_df.equals(expected)
+    assert set(result.values) == {series.key for series in result.spec.series}
+    assert all(len(values) == len(history_df) for values in result.values.values())
+
+    # The metadata is JSON serializable
+    json.dumps(result.meta())
+
+
+# Function to test the metadata of the indicators
+def test_indicator_meta():
+    # Compute an overlay and an oscillator with custom parameters
+    history_df = build_history(100)
+    sma = compute_indicator("sma", history_df, window=50).meta()
+    rsi = compute_indicator("rsi", history_df).meta()
+
+    # The SMA overlays the price axis and its name uses the parameters
+    assert sma["overlay"] is True
+    assert sma["params"] == {"window": 50}
+    assert sma["series"][0]["name"] == "SMA 50"
+
+    # The RSI has its own axis with a fixed range
+    assert rsi["overlay"] is False
+    assert rsi["axis_range"] == [0, 100]
+
+
+# Function to test that the renderer builds the same plot as the helpers
+def test_add_indicator_matches_helper():
+    # Build the plot with the registry and with the helper
+    history_df = build_history(100)
+    fig = add_indicator(go.Figure(), history_df, "macd")
+    expected = add_macd_indicator(go.Figure(), history_df)
+
+    # The plots are the same
+    assert fig.to_json() == expected.to_json()
+    assert all(trace.yaxis == "y2" for trace in fig.data)
+
+
+# Function to test the parsing of the indicator lists
+def test_parse_indicators():
+    # Unknown names and parameters are skipped, and duplicates are dropped
+    indicators = parse_indicators("sma:window=50,rsi,bogus,rsi,ema:span=x,none")
+    assert indicators == [("sma", {"window": 50}), ("rsi", {}), ("ema", {})]
+
+    # The formatted list parses back to the same indicators
+    assert format_indicators(indicators) == "sma:window=50,rsi,ema"
+    assert parse_indicators(format_indicators(indicators)) == indicators
+    assert format_indicators(parse_indicators("none")) == "none"
+
+
+# Function to test that parameters out of their bounds are skipped
+def test_parse_indicators_bounds():
+    # Oversized and non-finite parameters are skipped
+    indicators = parse_indicators(
+        "sma:window=100000000,sar:step=inf;max_step=nan,bbands:std_dev=1000"
+    )
+    assert indicators == [("sma", {}), ("sar", {}), ("bbands", {})]
+
+    # Zero and negative windows and factors are skipped
+    assert parse_indicators("rsi:window=0,mama:fast_limit=-0.5") == [
+        ("rsi", {}),
+        ("mama", {}),
+    ]
+
+    # Parameters within their bounds are kept, both ends included
+    assert parse_indicators("sma:window=500,sar:step=0.1;max_step=1.0") == [
+        ("sma", {"window": 500}),
+        ("sar", {"step": 0.1, "max_step": 1.0}),
+    ]
+
+
+# Function to test that the indicators share their intermediates
+def test_evaluate_indicators_shares_intermediates():
+    # Compute the EMA of a history once while it is shared
+    history_df = build_history(200)
+    with shared_intermediates(history_df):
+        assert close_ema(history_df, 12) is close_ema(history_df, span=12)
+    assert close_ema(history_df, 12) is not close_ema(history_df, 12)
+
+    # The shared results are the same as the separate ones
+    results = evaluate_indicators(history_df, [("macd", {}), ("apo", {})])
+    for result in results:
+        expected = compute_indicator(result.spec.name, history_df, **result.params)
+        for key, values in expected.values.items():
+            assert values.equals(result.values[key])
+
+
+# Function to test that every oscillator gets its own axis
+def test_render_indicators_axes():
+    # Render an overlay and two oscillators
+    history_df = build_history(100)
+    results = evaluate_indicators(history_df, parse_indicators("sma,rsi,macd"))
+    fig = render_indicators(go.Figure(), results)
+
+    # The overlay uses the price axis and the oscillators the next ones
+    assert [trace.yaxis for trace in fig.data] == [None, "y2", "y3", "y3"]
+    assert fig.layout.yaxis3.anchor == "free"
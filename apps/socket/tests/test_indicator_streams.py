@@ -0,0 +1,105 @@
+# Imports
+import numpy as np
+import pytest
+
+from apps.socket.benchmarks.indicator_kernels import build_history
+from apps.socket.helpers.chart_indicator_helpers import (
+    INDICATOR_REGISTRY,
+    Bar,
+    IndicatorStream,
+    compute_indicator,
+)
+from apps.socket.helpers.chart_indicator_helpers.streaming import (
+    RollingExtremeAge,
+    RollingStd,
+    StreamingIndicator,
+    StreamingOperator,
+)
+
+
+# Function to compare streamed values with the batch series
+def assert_matches(values, series):
+    # Same missing values, and the same values up to rounding
+    np.testing.assert_allclose(
+        np.asarray(values, dtype=float),
+        series.to_numpy(dtype=float),
+        rtol=1e-9,
+        atol=1e-9,
+    )
+
+
+# Function to test the streams against the batch computations
+@pytest.mark.filterwarnings("ignore::FutureWarning")
+@pytest.mark.parametrize("name", sorted(INDICATOR_REGISTRY))
+def test_stream_matches_batch(name):
+    # Build a history with prices rounded like the charts
+    history_df = build_history(300, seed=7).round(2)
+    generator = np.random.default_rng(0)
+
+    # Stream every bar, first with other prices then revised to the real ones
+    spec = INDICATOR_REGISTRY[name]
+    stream = spec.stream(**spec.defaults)
+    values = {series.key: [] for series in spec.series}
+    for bar in history_df[["Open", "High", "Low", "Close"]].to_numpy().tolist():
+        stream.update(Bar(*(price + generator.normal() for price in bar)))
+        stream.update(Bar(*(price + generator.normal() for price in bar)), True)
+        for key, value in stream.update(Bar(*bar), revise=True).items():
+            values[key].append(value)
+
+    # Every series matches the batch result
+    expected = compute_indicator(name, history_df).values
+    for key in values:
+        assert_matches(values[key], expected[key])
+
+
+# Function to test that the history stream only feeds the new bars
+@pytest.mark.filterwarnings("ignore::FutureWarning")
+def test_indicator_stream_follows_history():
+    # Build a history and compute its first bars in batch
+    history_df = build_history(200).round(2)
+    stream = IndicatorStream("macd")
+    stream.update(history_df.iloc[:150])
+    assert stream._indicator is None
+
+    # Revise the last bar, which primes the indicator, then append the rest
+    revised = history_df.iloc[:150].copy()
+    revised.iloc[-1, revised.columns.get_loc("Close")] += 5
+    stream.update(revised)
+    indicator = stream._indicator
+    result = stream.update(history_df)
+
+    # The bars were fed to the same indicator and match the batch result
+    assert indicator is not None and stream._indicator is indicator
+    expected = compute_indicator("macd", history_df).values
+    for key in expected:
+        assert_matches(result.values[key], expected[key])
+
+    # Dropping the first bars computes the history again
+    result = stream.update(history_df.iloc[10:])
+    assert stream._indicator is None
+    assert_matches(
+        result.values["macd"],
+        compute_indicator("macd", history_df.iloc[10:]).values["macd"],
+    )
+
+
+# Function to test the edge cases of the window operators
+def test_window_operators():
+    # A flat window has exactly no deviation
+    std = RollingStd(3)
+    assert [std.update(value) for value in [1.1, 1.1, 1.1, 1.1]][2:] == [0.0, 0.0]
+
+    # The latest extreme wins ties, and revisions do not change the state
+    age = RollingExtremeAge(3)
+    assert [age.update(value) for value in [2.0, 1.0, 2.0]][2] == 0.0
+    assert age.update(1.0, revise=True) == 2.0
+    assert age.update(3.0) == 0.0
+
+
+# Function to test the streaming bases are abstract
+def test_streaming_bases_are_abstract():
+    # The bases cannot be instantiated without their abstract methods
+    with pytest.raises(TypeError):
+        StreamingOperator()
+    with pytest.raises(TypeError):
+        StreamingIndicator()
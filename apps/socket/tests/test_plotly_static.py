@@ -0,0 +1,46 @@
+# Imports
+import plotly.graph_objects as go
+from django.contrib.staticfiles import finders
+
+from apps.socket.finders import PLOTLY_JS_FILE, PLOTLY_JS_PATH
+from apps.socket.helpers import chart_cache_helper
+from config.storage import StaticStorage
+
+
+# Function to test that plotly.js is collected under its version
+def test_plotly_js_is_a_static_file():
+    # The versioned path resolves to the bundled file
+    assert finders.find(PLOTLY_JS_PATH) == str(PLOTLY_JS_FILE)
+
+    # Only plotly.js is collected from the package data
+    finder = finders.get_finder("apps.socket.finders.PlotlyJsFinder")
+    assert [(path, storage.prefix) for path, storage in finder.list([])] == [
+        ("plotly.min.js", PLOTLY_JS_PATH.rsplit("/", 1)[0])
+    ]
+
+
+# Function to test that the vendored files are cached forever
+def test_static_storage_cache_control():
+    # Get the upload parameters of plotly.js and of a project script
+    storage = StaticStorage()
+    vendored = storage.get_object_parameters(f"static/{PLOTLY_JS_PATH}")
+    project = storage.get_object_parameters("static/js/project.js")
+
+    # Only the versioned file is immutable
+    assert "immutable" in vendored["CacheControl"]
+    assert "CacheControl" not in project
+
+
+# Function to test that the rendered charts do not embed plotly.js
+def test_chart_html_without_plotly_js(monkeypatch):
+    # Render a chart
+    monkeypatch.setattr(
+        chart_cache_helper,
+        "generate_candlestick_chart",
+        lambda *args: go.Figure(go.Scatter(x=[1, 2], y=[3, 4])),
+    )
+    html = chart_cache_helper.render_candlestick_chart_html("^NSEI")
+
+    # Only the chart div and its script are rendered
+    assert html.startswith("<div>") and "<html>" not in html
+    assert len(html) < 10_000
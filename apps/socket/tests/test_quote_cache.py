@@ -0,0 +1,102 @@
+# Imports
+import time
+
+import pytest
+
+from apps.socket.utils import cache_utils
+from apps.socket.utils.cache_utils import MISSING, QuoteCache, TTLCache
+
+
+# Fixture to use an in-memory shared cache
+@pytest.fixture(autouse=True)
+def locmem_cache(settings):
+    # Override the cache settings
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+
+
+# Function to test the LRU eviction and the TTL expiry
+def test_ttl_cache_evicts_and_expires():
+    # Create a small cache
+    ttl_cache = TTLCache(maxsize=2)
+
+    # Fill the cache and touch the first key
+    ttl_cache.set("a", 1, ttl=60)
+    ttl_cache.set("b", 2, ttl=60)
+    ttl_cache.get("a")
+
+    # Add a third key, evicting the least recently used one
+    ttl_cache.set("c", 3, ttl=60)
+
+    # Assert the least recently used key was evicted
+    assert ttl_cache.get("b") is MISSING
+    assert ttl_cache.get("a") == 1
+
+    # Add an already expired key
+    ttl_cache.set("d", 4, ttl=-1)
+
+    # Assert the expired key is a miss
+    assert ttl_cache.get("d") is MISSING
+
+
+# Function to test the two cache levels and the counters
+def test_quote_cache_levels_and_counters():
+    # Count the upstream fetches
+    calls = []
+
+    # Fake upstream fetch
+    def fetch():
+        calls.append(1)
+        return {"lastPrice": 100.0}
+
+    # Create two caches, like two worker processes
+    first = QuoteCache(prefix="test-quote", maxsize=8)
+    second = QuoteCache(prefix="test-quote", maxsize=8)
+
+    # Fetch the same quote from both workers, twice
+    for quote_cache in (first, first, second, second):
+        assert quote_cache.get_or_fetch("fast_info", "^NSEI", fetch) == {
+            "lastPrice": 100.0
+        }
+
+    # Assert the upstream was hit once
+    assert len(calls) == 1
+
+    # Assert the counters of both workers
+    assert first.stats()["misses"] == 1
+    assert first.stats()["local_hits"] == 1
+    assert second.stats()["shared_hits"] == 1
+    assert second.stats()["local_hits"] == 1
+    assert second.stats()["hit_ratio"] == 1.0
+
+
+# Function to test the TTLs follow the market status
+def test_quote_cache_ttl_depends_on_market_status(settings, monkeypatch):
+    # Set the TTLs
+    settings.QUOTE_CACHE_TTLS = {
+        "info": {"open": 30, "closed": 3600},
+        "default": {"open": 2, "closed": 900},
+    }
+
+    # Create the cache
+    quote_cache = QuoteCache(prefix="test-ttl", maxsize=8)
+
+    # Market open
+    monkeypatch.setattr(cache_utils, "is_market_open", lambda: True)
+    assert quote_cache.get_ttl("info") == 30
+    assert quote_cache.get_ttl("fast_info") == 2
+
+    # Market closed
+    monkeypatch.setattr(cache_utils, "is_market_open", lambda: False)
+    assert quote_cache.get_ttl("info") == 3600
+    assert quote_cache.get_ttl("fast_info") == 900
+
+    # Assert empty responses are not cached
+    assert quote_cache.get_or_fetch("info", "BAD", dict) == {}
+    assert quote_cache.local.get("test-ttl:info:BAD") is MISSING
+
+    # Assert cached values expire
+    quote_cache.local.set("test-ttl:info:OLD", {"a": 1}, ttl=0.01)
+    time.sleep(0.02)
+    assert quote_cache.local.get("test-ttl:info:OLD") is MISSING
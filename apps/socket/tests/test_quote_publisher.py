@@ -0,0 +1,188 @@
+# Imports
+import asyncio
+import json
+
+import pytest
+from channels.layers import InMemoryChannelLayer
+
+from apps.socket import publishers
+from apps.socket.publishers import QuotePublisher, Topic, build_group_name
+
+
+# Fixture to use an in-memory cache
+@pytest.fixture(autouse=True)
+def locmem_cache(settings):
+    # Override the cache settings
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+
+
+# Function to test the group name is valid for the channel layer
+def test_build_group_name_is_valid():
+    # Create a channel layer
+    channel_layer = InMemoryChannelLayer()
+
+    # Build group names for symbols with special characters
+    first = build_group_name("quote", "^NSEI")
+    second = build_group_name("quote", "-NSEI")
+
+    # Assert the group names are valid and distinct
+    assert channel_layer.valid_group_name(first)
+    assert channel_layer.valid_group_name(second)
+    assert first != second
+
+
+# Function to test every subscriber shares one upstream fetch per tick
+def test_publisher_polls_each_topic_once(monkeypatch):
+    # Count the upstream fetches
+    calls = []
+
+    # Fake upstream fetch
+    async def fetch(symbol):
+        calls.append(symbol)
+        return {symbol: 1}
+
+    # Register a fake topic
+    monkeypatch.setitem(publishers.TOPICS, "fake", Topic(fetch=fetch, interval=0.05))
+
+    # Run the scenario
+    async def scenario():
+        # Create the publisher and the channel layer
+        publisher = QuotePublisher()
+        channel_layer = InMemoryChannelLayer()
+
+        # Subscribe many channels to the same topic
+        channels = [await channel_layer.new_channel() for _ in range(10)]
+        for channel in channels:
+            group = await publisher.subscribe(channel_layer, channel, "fake", "^NSEI")
+
+        # Every channel receives the broadcast
+        messages = [await channel_layer.receive(channel) for channel in channels]
+
+        # Unsubscribe every channel
+        for channel in channels:
+            await publisher.unsubscribe(channel_layer, channel, group)
+
+        # Return the messages
+        return publisher, messages
+
+    # Run the scenario
+    publisher, messages = asyncio.run(scenario())
+
+    # Assert a single fetch served all the subscribers with a snapshot
+    assert len(calls) == 1
+    assert all(
+        json.loads(message["text"])
+        == {
+            "type": "snapshot",
+            "stream": message["group"],
+            "seq": 1,
+            "data": {"^NSEI": 1},
+        }
+        for message in messages
+    )
+
+    # Assert the polling task was stopped
+    assert publisher.tasks == {}
+    assert publisher.subscribers == {}
+
+
+# Function to test only the changes are broadcast
+def test_publisher_sends_deltas_only_when_changed():
+    # Run the scenario
+    async def scenario():
+        # Create the publisher and the channel layer
+        publisher = QuotePublisher()
+        channel_layer = InMemoryChannelLayer()
+
+        # Subscribe a channel to a group
+        channel = await channel_layer.new_channel()
+        group = build_group_name("test", "deltas")
+        await channel_layer.group_add(group, channel)
+
+        # Publish a first payload, the same payload, then a changed one
+        quote = {"lastPrice": 100.0, "longName": "NIFTY 50", "dayChange": 1.0}
+        await publisher.publish(channel_layer, group, {"^NSEI": quote}, 10)
+        await publisher.publish(channel_layer, group, {"^NSEI": dict(quote)}, 10)
+        await publisher.publish(
+            channel_layer, group, {"^NSEI": {**quote, "lastPrice": 101.0}}, 10
+        )
+
+        # Receive the broadcasts
+        first = await channel_layer.receive(channel)
+        second = await channel_layer.receive(channel)
+
+        # Assert nothing else was sent
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(channel_layer.receive(channel), 0.05)
+
+        # Return the messages and the snapshot for new subscribers
+        return first, second, await publisher.get_snapshot(group)
+
+    # Run the scenario
+    first, second, snapshot = asyncio.run(scenario())
+
+    # Assert a snapshot then a delta holding only the changed field
+    assert json.loads(first["text"])["type"] == "snapshot"
+    assert json.loads(second["text"])["seq"] == 2
+    assert json.loads(second["text"])["data"] == {"^NSEI": {"lastPrice": 101.0}}
+
+    # Assert new subscribers get the up to date snapshot
+    assert json.loads(snapshot)["seq"] == 2
+    assert json.loads(snapshot)["data"]["^NSEI"]["lastPrice"] == 101.0
+
+
+# Function to test the pages keep the last payload after the stream state expires
+def test_publisher_keeps_page_snapshot(settings):
+    # Keep the page snapshots longer than the stream state
+    settings.PAGE_SNAPSHOT_TTL = 60
+
+    # Run the scenario
+    async def scenario():
+        # Create the publisher and the channel layer
+        publisher = QuotePublisher()
+        channel_layer = InMemoryChannelLayer()
+
+        # Nothing was published yet
+        assert await publishers.aget_page_snapshot("quote", "^NSEI") is None
+
+        # Publish a payload with a short lived stream state
+        group = build_group_name("quote", "^NSEI")
+        await publisher.publish(
+            channel_layer, group, {"^NSEI": {"lastPrice": 1}}, 0.01, page_snapshot=True
+        )
+        await asyncio.sleep(0.05)
+
+        # A topic that does not opt in keeps no page snapshot
+        chart = build_group_name("quoteChart", "^NSEI")
+        await publisher.publish(channel_layer, chart, {"traces": []}, 0.01)
+        assert await publishers.aget_page_snapshot("quoteChart", "^NSEI") is None
+
+        # Return the stream state and the page snapshot
+        return (
+            await publisher.get_state(group),
+            await publishers.aget_page_snapshot("quote", "^NSEI"),
+        )
+
+    # Run the scenario
+    state, snapshot = asyncio.run(scenario())
+
+    # Assert the stream state expired but the page snapshot is kept
+    assert state is None
+    assert snapshot == {"^NSEI": {"lastPrice": 1}}
+    assert publishers.get_page_snapshot("quote", "^NSEI") == snapshot
+    assert publishers.get_page_snapshots("quote", [("^NSEI",), ("^NSEBANK",)]) == [
+        snapshot,
+        None,
+    ]
+
+    # Only the topics rendered by the pages keep their payload
+    assert {
+        name for name, topic in publishers.TOPICS.items() if topic.page_snapshot
+    } == {
+        "indexQuotes",
+        "quote",
+        "topEquityGainersQuotes20",
+        "topEquityLosersQuotes20",
+    }
@@ -0,0 +1,78 @@
+# Imports
+import requests
+
+from apps.socket.utils import session_utils
+from apps.socket.utils.session_utils import get_session, get_ticker, get_yahoo_data
+
+
+# Function to test the sessions are shared and pooled
+def test_sessions_are_shared_and_pooled(settings):
+    # Get the Yahoo session twice
+    session = get_session("yahoo")
+    assert get_session("yahoo") is session
+
+    # Assert the connections are pooled and bounded per host
+    adapter = session.get_adapter("https://query1.finance.yahoo.com")
+    assert adapter._pool_maxsize == settings.UPSTREAM_POOL_MAXSIZE
+    assert adapter._pool_block is True
+
+    # Assert the tickers and the batch client reuse the session
+    assert get_ticker("^NSEI").session is session
+    assert get_yahoo_data()._session is session
+
+
+# Fake response class
+class FakeResponse:
+    # Constructor
+    def __init__(self, status_code: int, payload: dict = None):
+        # Attributes
+        self.status_code = status_code
+        self.payload = payload
+
+    # Method to raise for the status
+    def raise_for_status(self):
+        # Raise if the request was refused
+        if self.status_code >= 400:
+            raise requests.HTTPError(str(self.status_code))
+
+    # Method to decode the payload
+    def json(self):
+        # Return the payload
+        return self.payload
+
+
+# Function to test the NSE cookies are only refreshed when refused
+def test_nse_fetch_refreshes_cookies_when_refused(monkeypatch):
+    # Create a fresh NSE session
+    session = requests.Session()
+    monkeypatch.setitem(session_utils._sessions, "nse", session)
+
+    # Record the requested urls
+    urls = []
+    responses = iter(
+        [FakeResponse(200), FakeResponse(401), FakeResponse(200), FakeResponse(200)]
+    )
+
+    # Fake request that refuses the first API call
+    def get(url, timeout):
+        urls.append(url)
+        if url == session_utils.NSE_HOME_URL:
+            session.cookies.set("nsit", "cookie")
+        response = next(responses)
+        if url != session_utils.NSE_HOME_URL and response.status_code == 200:
+            response.payload = {"data": []}
+        return response
+
+    # Patch the session
+    monkeypatch.setattr(session, "get", get)
+
+    # Fetch the API
+    assert session_utils.nse_fetch("https://nse/api") == {"data": []}
+
+    # Assert the home page was visited again after the refusal
+    assert urls == [
+        session_utils.NSE_HOME_URL,
+        "https://nse/api",
+        session_utils.NSE_HOME_URL,
+        "https://nse/api",
+    ]
@@ -0,0 +1,106 @@
+# Imports
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.core.cache import cache
+
+from apps.socket.utils.singleflight_utils import SingleFlight
+
+
+# Fixture to use an in-memory shared cache
+@pytest.fixture(autouse=True)
+def locmem_cache(settings):
+    # Override the cache settings
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+
+
+# Function to test concurrent callers share one call
+def test_concurrent_callers_share_one_call():
+    # Count the upstream calls
+    calls = []
+    release = threading.Event()
+
+    # Slow upstream call
+    def fetch():
+        calls.append(1)
+        release.wait(1)
+        return {"lastPrice": 100.0}
+
+    # Create the single flight group
+    group = SingleFlight()
+
+    # Start many concurrent callers for the same key
+    with ThreadPoolExecutor(max_workers=20) as executor:
+        futures = [executor.submit(group.do, "^NSEBANK", fetch) for _ in range(20)]
+
+        # Let the callers pile up on the in-flight call
+        while group.stats()["leaders"] + group.stats()["followers"] < 20:
+            time.sleep(0.01)
+        release.set()
+
+        # Collect the results
+        results = [future.result() for future in futures]
+
+    # Assert the upstream was hit once and every caller got the result
+    assert len(calls) == 1
+    assert all(result == {"lastPrice": 100.0} for result in results)
+    assert group.stats() == {"leaders": 1, "followers": 19, "in_flight": 0}
+
+
+# Function to test exceptions reach every caller and are not remembered
+def test_exception_is_shared_and_not_cached():
+    # Create the single flight group
+    group = SingleFlight()
+
+    # Failing upstream call
+    def fail():
+        raise ValueError("upstream down")
+
+    # Assert the exception is raised
+    with pytest.raises(ValueError):
+        group.do("^NSEI", fail)
+
+    # Assert the next call runs again
+    assert group.do("^NSEI", lambda: 1) == 1
+
+
+# Function to test the shared lock makes other workers wait
+def test_shared_lock_waits_for_other_worker():
+    # Create the single flight group
+    group = SingleFlight(prefix="test-singleflight")
+
+    # Another worker holds the lock for a short time
+    lock_key = group.lock_key("^NSEI")
+    cache.add(lock_key, "other-worker", 10)
+    threading.Timer(0.2, cache.delete, [lock_key]).start()
+
+    # Run the call holding the shared lock
+    started = time.monotonic()
+    assert group.do("^NSEI", lambda: 1, shared=True) == 1
+
+    # Assert the call waited for the lock and released it afterwards
+    assert time.monotonic() - started >= 0.2
+    assert cache.get(lock_key) is None
+
+
+# Function to test the lock keys are valid cache keys
+def test_lock_key_is_a_valid_cache_key():
+    # Create the single flight group
+    group = SingleFlight(prefix="test-singleflight")
+
+    # Build the lock keys of tuple keys with spaces and quotes
+    first = group.lock_key(("quote", "^NSEI", True))
+    second = group.lock_key(("batch", ("A B", "C")))
+
+    # Assert the keys have no characters memcached rejects and are distinct
+    for key in (first, second):
+        assert re.fullmatch(r"[a-zA-Z0-9\-_.:]+", key)
+        assert len(key) < 250
+    assert first.startswith("test-singleflight:quote:-NSEI:True:")
+    assert first != group.lock_key(("quote", "-NSEI", True))
+    assert second != first
@@ -0,0 +1,12 @@
+# Imports
+from django.urls import path
+
+from apps.socket import views as socket_views
+
+# Set the app name
+app_name = "socket"
+
+# URL patterns
+urlpatterns = [
+    path("metrics/", socket_views.metrics_view, name="metrics"),
+]
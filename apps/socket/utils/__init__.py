@@ -1,4 +1,15 @@
 # Imports
+from .async_utils import *
+from .cache_utils import *
+from .chart_utils import *
+from .delta_utils import *
+from .downsample_utils import *
+from .executor_utils import *
+from .history_utils import *
 from .market_utils import *
+from .nse_utils import *
 from .quote_utils import *
+from .resample_utils import *
+from .session_utils import *
+from .singleflight_utils import *
 from .ticker_utils import *
@@ -0,0 +1,101 @@
+# Imports
+import asyncio
+from typing import Any, Awaitable, Callable, Coroutine
+
+from asgiref.sync import sync_to_async
+
+from .executor_utils import InstrumentedExecutor, get_executor
+
+# Sentinel for data sources that failed or were late
+UNAVAILABLE = object()
+
+
+# Function to get the shared fetch executor
+def get_fetch_executor() -> InstrumentedExecutor:
+    """Get the process wide executor used to run blocking upstream calls
+
+    The executor is bounded by the SOCKET_EXECUTORS["fetch"] setting, so a
+    burst of slow Yahoo/NSE responses can never spawn an unbounded number of
+    threads and never runs on the event loop itself.
+
+    Returns:
+        InstrumentedExecutor: The shared executor
+    """
+
+    # Return the fetch executor of the registry
+    return get_executor("fetch")
+
+
+# Function to run a blocking function off the event loop
+async def run_blocking(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking function in the shared fetch executor
+
+    Args:
+        func (Callable[..., Any]): The blocking function
+        *args (Any): Positional arguments of the function
+        **kwargs (Any): Keyword arguments of the function
+
+    Returns:
+        Any: The return value of the function
+    """
+
+    # Run the function in the shared executor
+    return await sync_to_async(
+        func, thread_sensitive=False, executor=get_fetch_executor()
+    )(*args, **kwargs)
+
+
+# Function to build an async version of a blocking function
+def to_async(func: Callable[..., Any]) -> Callable[..., Coroutine[Any, Any, Any]]:
+    """Wrap a blocking function so that it runs in the shared fetch executor
+
+    Args:
+        func (Callable[..., Any]): The blocking function
+
+    Returns:
+        Callable[..., Coroutine[Any, Any, Any]]: The async function
+    """
+
+    # Async wrapper
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        # Run the function off the event loop
+        return await run_blocking(func, *args, **kwargs)
+
+    # Keep the name of the wrapped function
+    wrapper.__name__ = f"a{func.__name__}"
+    wrapper.__doc__ = func.__doc__
+
+    # Return the wrapper
+    return wrapper
+
+
+# Function to await a data source with a timeout
+async def with_timeout(
+    awaitable: Awaitable[Any], timeout: float, default: Any = None
+) -> Any:
+    """Await a data source, falling back to a default if it fails or is late
+
+    Views gather their independent sources with this, so the page waits for
+    the slowest source at most timeout seconds and still renders without it.
+
+    Args:
+        awaitable (Awaitable[Any]): The data source
+        timeout (float): Seconds to wait
+        default (Any, optional): Value if the source fails. Defaults to None.
+
+    Returns:
+        Any: The value of the source, or the default
+    """
+
+    # Try
+    try:
+        # Wait for the source
+        return await asyncio.wait_for(awaitable, timeout)
+
+    # If the source is late or fails
+    except Exception as e:
+        # Print the error
+        print(f"Error awaiting a data source: {e!r}")
+
+        # Return the default
+        return default
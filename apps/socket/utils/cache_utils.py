@@ -0,0 +1,324 @@
+# Imports
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .market_utils import is_market_open
+from .singleflight_utils import singleflight
+
+# Sentinel for cache misses
+MISSING = object()
+
+
+# TTLCache class
+class TTLCache:
+    """Thread safe in-process LRU cache whose entries expire after a TTL
+
+    Attributes:
+        maxsize (int): Maximum number of entries kept in memory
+    """
+
+    # Constructor
+    def __init__(self, maxsize: int = 1024):
+        # Attributes
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    # Length method
+    def __len__(self) -> int:
+        # Return the number of entries
+        return len(self._data)
+
+    # Method to get a value
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        """Get a value if it is present and not expired
+
+        Args:
+            key (Hashable): The key
+            default (Any, optional): Returned on a miss. Defaults to MISSING.
+
+        Returns:
+            Any: The cached value or the default
+        """
+
+        # Lock the cache
+        with self._lock:
+            # Get the entry
+            item = self._data.get(key)
+
+            # If the entry does not exist
+            if item is None:
+                return default
+
+            # If the entry expired
+            expires_at, value = item
+            if expires_at <= time.time():
+                # Drop the entry
+                del self._data[key]
+                return default
+
+            # Mark the entry as recently used
+            self._data.move_to_end(key)
+
+            # Return the value
+            return value
+
+    # Method to set a value
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Set a value that expires after the TTL
+
+        Args:
+            key (Hashable): The key
+            value (Any): The value
+            ttl (float): Time to live in seconds
+        """
+
+        # Lock the cache
+        with self._lock:
+            # Store the value with its expiry time
+            self._data[key] = (time.time() + ttl, value)
+            self._data.move_to_end(key)
+
+            # Evict the least recently used entries
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    # Method to clear the cache
+    def clear(self) -> None:
+        # Lock the cache and drop every entry
+        with self._lock:
+            self._data.clear()
+
+
+# QuoteCache class
+class QuoteCache:
+    """Two level quote cache, in-process LRU backed by the shared Django cache
+
+    Values are grouped by field group ("info", "fast_info", ...), each group
+    has its own TTL while the market is open and after it closes, configured
+    by the QUOTE_CACHE_TTLS setting.
+
+    Attributes:
+        prefix (str): Prefix of the shared cache keys
+        local (TTLCache): The in-process cache
+        counters (Dict[str, int]): Hit and miss counters
+    """
+
+    # Constructor
+    def __init__(self, prefix: str = "quote", maxsize: int = None):
+        # Attributes
+        self.prefix = prefix
+        self.local = TTLCache(
+            maxsize or getattr(settings, "QUOTE_CACHE_MAX_ENTRIES", 2048)
+        )
+        self.counters = {"local_hits": 0, "shared_hits": 0, "misses": 0}
+        self._counters_lock = threading.Lock()
+
+    # Method to increment a counter
+    def count(self, name: str) -> None:
+        # Lock the counters and increment
+        with self._counters_lock:
+            self.counters[name] += 1
+
+    # Method to get the TTL of a field group
+    def get_ttl(self, group: str) -> float:
+        """Get the TTL of a field group for the current market status
+
+        Args:
+            group (str): The field group
+
+        Returns:
+            float: Time to live in seconds
+        """
+
+        # Get the TTLs of the group
+        ttls = settings.QUOTE_CACHE_TTLS.get(
+            group, settings.QUOTE_CACHE_TTLS["default"]
+        )
+
+        # Return the TTL for the market status
+        return ttls["open"] if is_market_open() else ttls["closed"]
+
+    # Method to build a cache key
+    def key(self, group: str, symbol: str) -> str:
+        # Return the key
+        return f"{self.prefix}:{group}:{symbol}"
+
+    # Method to get a value from the in-process cache
+    def get_local(self, key: str) -> Any:
+        # Look in the in-process cache
+        value = self.local.get(key)
+
+        # Count the hit
+        if value is not MISSING:
+            self.count("local_hits")
+
+        # Return the value or MISSING
+        return value
+
+    # Method to get a value from the shared cache
+    def get_shared(self, key: str) -> Any:
+        # Look in the shared cache
+        try:
+            item = cache.get(key)
+
+        # If the shared cache is unavailable
+        except Exception:
+            item = None
+
+        # If the value is missing or expired
+        if item is None or item[0] <= time.time():
+            return MISSING
+
+        # Keep it locally for the rest of its lifetime
+        self.local.set(key, item[1], item[0] - time.time())
+
+        # Count the hit and return the value
+        self.count("shared_hits")
+        return item[1]
+
+    # Method to get a value
+    def get(self, group: str, symbol: str) -> Any:
+        """Get a cached value from the in-process or the shared cache
+
+        Args:
+            group (str): The field group
+            symbol (str): The symbol
+
+        Returns:
+            Any: The value or MISSING, a miss is counted
+        """
+
+        # Build the key
+        key = self.key(group, symbol)
+
+        # Look in the in-process cache, then in the shared cache
+        value = self.get_local(key)
+        if value is MISSING:
+            value = self.get_shared(key)
+
+        # Count the miss
+        if value is MISSING:
+            self.count("misses")
+
+        # Return the value
+        return value
+
+    # Method to set a value
+    def set(self, group: str, symbol: str, value: Any) -> None:
+        """Cache a value in both levels with the TTL of its field group
+
+        Args:
+            group (str): The field group
+            symbol (str): The symbol
+            value (Any): The value, empty values are not cached
+        """
+
+        # Do not cache empty responses
+        if not value:
+            return
+
+        # Cache the value in both levels
+        key = self.key(group, symbol)
+        ttl = self.get_ttl(group)
+        self.local.set(key, value, ttl)
+        try:
+            cache.set(key, (time.time() + ttl, value), ttl)
+
+        # If the shared cache is unavailable
+        except Exception:
+            pass
+
+    # Method to get a value or fetch it
+    def get_or_fetch(self, group: str, symbol: str, fetch: Callable[[], Any]) -> Any:
+        """Get a cached value or fetch and cache it
+
+        Args:
+            group (str): The field group
+            symbol (str): The symbol
+            fetch (Callable[[], Any]): Function that fetches the value
+
+        Returns:
+            Any: The value
+        """
+
+        # Build the key
+        key = self.key(group, symbol)
+
+        # Look in the in-process cache
+        value = self.get_local(key)
+        if value is not MISSING:
+            return value
+
+        # Load the value once for all the concurrent callers of every worker
+        return singleflight.do(
+            key, lambda: self.load(group, symbol, fetch), shared=True
+        )
+
+    # Method to load a value missing from the in-process cache
+    def load(self, group: str, symbol: str, fetch: Callable[[], Any]) -> Any:
+        """Load a value from the shared cache or fetch and cache it
+
+        Args:
+            group (str): The field group
+            symbol (str): The symbol
+            fetch (Callable[[], Any]): Function that fetches the value
+
+        Returns:
+            Any: The value
+        """
+
+        # Look in the shared cache
+        value = self.get_shared(self.key(group, symbol))
+        if value is not MISSING:
+            return value
+
+        # Count the miss and fetch the value
+        self.count("misses")
+        value = fetch()
+
+        # Cache the value
+        self.set(group, symbol, value)
+
+        # Return the value
+        return value
+
+    # Method to get the statistics
+    def stats(self) -> Dict[str, Any]:
+        """Get the hit and miss counters of the cache
+
+        Returns:
+            Dict[str, Any]: The counters, the hit ratio and the local size
+        """
+
+        # Copy the counters
+        with self._counters_lock:
+            stats = dict(self.counters)
+
+        # Calculate the hit ratio
+        total = stats["local_hits"] + stats["shared_hits"] + stats["misses"]
+        stats["hit_ratio"] = (
+            (stats["local_hits"] + stats["shared_hits"]) / total if total else 0.0
+        )
+        stats["local_size"] = len(self.local)
+
+        # Return the statistics
+        return stats
+
+    # Method to clear the in-process cache and the counters
+    def clear(self) -> None:
+        # Clear the local cache
+        self.local.clear()
+
+        # Reset the counters
+        with self._counters_lock:
+            self.counters = {key: 0 for key in self.counters}
+
+
+# Process wide quote cache
+quote_cache = QuoteCache()
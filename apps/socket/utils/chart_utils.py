@@ -0,0 +1,207 @@
+# Imports
+import json
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+# Trace attributes holding one value per bar
+CHART_COLUMN_KEYS = ("x", "y", "open", "high", "low", "close", "text", "customdata")
+
+# Columns of the candlestick hover labels
+HOVER_COLUMNS = ("Open", "High", "Low", "Close")
+
+
+# Function to format timestamps like str(pd.Timestamp)
+def format_timestamps(index: pd.DatetimeIndex) -> np.ndarray:
+    """Format timestamps as "YYYY-MM-DD HH:MM:SS" followed by their UTC
+    offset, like str(pd.Timestamp), without a Python call per timestamp
+
+    Args:
+        index (pd.DatetimeIndex): The timestamps
+
+    Returns:
+        np.ndarray: The formatted timestamps, as an object array
+    """
+
+    # Local wall clock time of the timestamps
+    index = pd.DatetimeIndex(index)
+    local = index.tz_localize(None) if index.tz is not None else index
+
+    # Empty, sub second or missing timestamps are formatted one by one
+    if index.empty or index.hasnans or (local.asi8 % 10**9).any():
+        return np.array([str(timestamp) for timestamp in index], dtype=object)
+
+    # Format to whole seconds and replace the "T" separator with a space
+    text = np.datetime_as_string(local.to_numpy().astype("M8[s]"), unit="s")
+    text.view(np.uint32).reshape(len(text), -1)[:, 10] = ord(" ")
+    text = text.astype(object)
+
+    # Naive timestamps have no offset
+    if index.tz is None:
+        return text
+
+    # Format every distinct UTC offset once
+    offsets, inverse = np.unique(
+        (local.asi8 - index.asi8) // (60 * 10**9), return_inverse=True
+    )
+    suffixes = np.array(
+        [
+            f"{'-' if offset < 0 else '+'}{abs(offset) // 60:02d}:{abs(offset) % 60:02d}"
+            for offset in offsets.tolist()
+        ],
+        dtype=object,
+    )
+
+    # Return the timestamps with their offset
+    return text + suffixes[inverse]
+
+
+# Function to build the hover labels of a candlestick trace
+def build_candle_hover_text(history_df: pd.DataFrame) -> np.ndarray:
+    """Build the "Date: ...<br>Open: ...<br>...<br>Close: ..." hover labels
+    of the bars with one string operation per column
+
+    Args:
+        history_df (pd.DataFrame): The bars
+
+    Returns:
+        np.ndarray: One label per bar, as an object array
+    """
+
+    # Start with the dates
+    text = "Date: " + format_timestamps(history_df.index)
+
+    # Append every price column
+    for column in HOVER_COLUMNS:
+        text = (
+            text
+            + f"<br>{column}: "
+            + history_df[column].to_numpy().astype(str).astype(object)
+        )
+
+    # Return the labels
+    return text
+
+
+# Function to convert a figure to a columnar payload
+def figure_to_payload(fig: go.Figure) -> Dict:
+    """Convert a figure to a columnar payload that can be streamed
+
+    The per bar arrays of the traces are moved to a shared "columns" dict, each
+    trace only keeps the names of its columns, so that identical arrays like
+    the x axis of every trace are sent once.
+
+    Args:
+        fig (go.Figure): The figure
+
+    Returns:
+        Dict: {"traces": [...], "columns": {...}, "layout": {...}}
+    """
+
+    # Serialize the figure to plain JSON types
+    figure = json.loads(fig.to_json())
+
+    # Lists to store the traces and the columns
+    traces = []
+    columns = {}
+
+    # For each trace
+    for index, trace in enumerate(figure["data"]):
+        # Mapping of the trace attributes to the column names
+        trace_columns = {}
+
+        # For each per bar attribute of the trace
+        for key in CHART_COLUMN_KEYS:
+            # Get the values
+            values = trace.pop(key, None)
+            if not isinstance(values, list):
+                if values is not None:
+                    trace[key] = values
+                continue
+
+            # Reuse an identical column, or add a new one
+            name = next(
+                (name for name, column in columns.items() if column == values),
+                f"{index}.{key}",
+            )
+            columns.setdefault(name, values)
+            trace_columns[key] = name
+
+        # Keep the trace with the names of its columns
+        traces.append({**trace, "columns": trace_columns})
+
+    # Return the payload
+    return {"traces": traces, "columns": columns, "layout": figure["layout"]}
+
+
+# Function to get the length of the common prefix of two lists
+def common_prefix_length(old: List, new: List) -> int:
+    """Get the number of leading values that are equal in both lists
+
+    Args:
+        old (List): The previous values
+        new (List): The current values
+
+    Returns:
+        int: The length of the common prefix
+    """
+
+    # Length of the shortest list
+    length = min(len(old), len(new))
+
+    # Fast path, only bars after the shortest list changed
+    if old[:length] == new[:length]:
+        return length
+
+    # Find the first different value
+    return next(i for i in range(length) if old[i] != new[i])
+
+
+# Function to diff two chart payloads
+def diff_chart_payload(old: Dict, new: Dict) -> Tuple[Optional[Dict], None]:
+    """Compute the appended or updated bars between two chart payloads
+
+    Args:
+        old (Dict): The previous payload
+        new (Dict): The current payload
+
+    Returns:
+        Tuple[Optional[Dict], None]: The changes, None if the traces changed
+            and a new snapshot must be sent, and no key order
+    """
+
+    # If the traces or the columns changed, send a new snapshot
+    if old.get("traces") != new["traces"] or set(old["columns"]) != set(new["columns"]):
+        return None, None
+
+    # Dict to store the changes
+    delta = {}
+
+    # For each column
+    for name, values in new["columns"].items():
+        # Get the first changed bar
+        previous = old["columns"][name]
+        start = common_prefix_length(previous, values)
+
+        # If the column changed
+        if start < len(values) or len(previous) != len(values):
+            # Keep the bars from the first changed one
+            delta.setdefault("columns", {})[name] = {
+                "start": start,
+                "values": values[start:],
+            }
+
+    # Keep the changed top level layout attributes
+    layout = {
+        key: value
+        for key, value in new["layout"].items()
+        if old["layout"].get(key) != value
+    }
+    layout.update({key: None for key in old["layout"] if key not in new["layout"]})
+    if layout:
+        delta["layout"] = layout
+
+    # Return the changes
+    return delta, None
@@ -0,0 +1,93 @@
+# Imports
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from .cache_utils import MISSING
+
+
+# Function to diff two payloads
+def diff_payload(old: Dict, new: Dict) -> Tuple[Dict, Optional[List]]:
+    """Compute the changes between two payloads of the form {key: quote}
+
+    Quotes that are dicts are diffed field by field, any other value is sent
+    whole. Removed keys and fields are sent as None.
+
+    Args:
+        old (Dict): The previous payload
+        new (Dict): The current payload
+
+    Returns:
+        Tuple[Dict, Optional[List]]: The changed keys and fields, and the new
+            key order if applying the changes would not reproduce it
+    """
+
+    # Dict to store the changes
+    delta = {}
+
+    # For each key of the current payload
+    for key, value in new.items():
+        # Get the previous value
+        previous = old.get(key, MISSING)
+
+        # If both values are dicts
+        if isinstance(previous, dict) and isinstance(value, dict):
+            # Keep the changed fields
+            changed = {
+                field: field_value
+                for field, field_value in value.items()
+                if previous.get(field, MISSING) != field_value
+            }
+
+            # Mark the removed fields
+            changed.update({field: None for field in previous if field not in value})
+
+            # Keep the changes of the quote
+            if changed:
+                delta[key] = changed
+
+        # If the value changed
+        elif previous != value:
+            # Keep the whole value
+            delta[key] = value
+
+    # Mark the removed keys
+    delta.update({key: None for key in old if key not in new})
+
+    # Key order obtained by applying the changes, new keys are appended
+    applied_order = [key for key in old if key in new]
+    applied_order += [key for key in new if key not in old]
+
+    # Return the changes and the new order if it differs
+    return delta, list(new) if applied_order != list(new) else None
+
+
+# Function to build a stream message
+def build_stream_message(
+    message_type: str,
+    stream: str,
+    seq: int,
+    data: Any,
+    order: Optional[List] = None,
+) -> str:
+    """Build a message of the quote stream protocol
+
+    Args:
+        message_type (str): "snapshot" or "delta"
+        stream (str): Id of the stream, the group name of the topic
+        seq (int): Sequence number of the message in the stream
+        data (Any): The full payload or the changes
+        order (Optional[List], optional): New key order. Defaults to None.
+
+    Returns:
+        str: The serialized message
+    """
+
+    # Build the message
+    message = {"type": message_type, "stream": stream, "seq": seq, "data": data}
+
+    # Add the key order if it changed
+    if order is not None:
+        message["order"] = order
+
+    # Return the serialized message
+    return json.dumps(message)
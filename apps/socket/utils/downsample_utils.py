@@ -0,0 +1,176 @@
+# Imports
+import math
+
+import numpy as np
+import pandas as pd
+
+# Aggregation of the extremes and the volume inside a bucket
+OHLC_AGGREGATIONS = {"High": np.maximum, "Low": np.minimum, "Volume": np.add}
+
+
+# Function to get the bucket size
+def bucket_size(length: int, max_points: int) -> int:
+    """Get the number of bars per bucket to draw at most max_points buckets
+
+    Args:
+        length (int): The number of bars
+        max_points (int): The maximum number of points, 0 for no limit
+
+    Returns:
+        int: The bucket size, 1 when the bars fit
+    """
+
+    # If the bars fit, keep every bar
+    if max_points <= 0 or length <= max_points:
+        return 1
+
+    # Return the size of the buckets
+    return math.ceil(length / max_points)
+
+
+# Function to aggregate groups of consecutive bars
+def aggregate_ohlc(
+    history_df: pd.DataFrame, starts: np.ndarray, index: pd.Index
+) -> pd.DataFrame:
+    """Aggregate groups of consecutive bars into one bar per group
+
+    A group opens with its first bar, closes with its last bar, keeps the
+    highest high and the lowest low, and sums the volume.
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data
+        starts (np.ndarray): Position of the first bar of every group
+        index (pd.Index): Index of the aggregated bars
+
+    Returns:
+        pd.DataFrame: One bar per group
+    """
+
+    # Position of the last bar of every group
+    ends = np.append(starts[1:], len(history_df)) - 1
+
+    # Dict to store the aggregated columns
+    columns = {}
+
+    # For each column
+    for column in history_df.columns:
+        # Get the values
+        values = history_df[column].to_numpy()
+
+        # Aggregate the extremes and the volume of every group
+        if column in OHLC_AGGREGATIONS:
+            columns[column] = OHLC_AGGREGATIONS[column].reduceat(values, starts)
+
+        # Keep the first open of every group
+        elif column == "Open":
+            columns[column] = values[starts]
+
+        # Keep the last value of the other columns
+        else:
+            columns[column] = values[ends]
+
+    # Return the aggregated bars
+    return pd.DataFrame(columns, index=index)
+
+
+# Function to aggregate the bars into buckets
+def downsample_ohlc(history_df: pd.DataFrame, size: int) -> pd.DataFrame:
+    """Aggregate consecutive bars into OHLC buckets of a fixed size
+
+    The buckets start from the first bar, so appending bars only changes the
+    last bucket.
+
+    Args:
+        history_df (pd.DataFrame): The historical stock data
+        size (int): The number of bars per bucket
+
+    Returns:
+        pd.DataFrame: One bar per bucket, indexed by the first timestamp
+    """
+
+    # If every bar is kept
+    if size <= 1 or history_df.empty:
+        return history_df
+
+    # Return the buckets
+    starts = np.arange(0, len(history_df), size)
+    return aggregate_ohlc(history_df, starts, history_df.index[starts])
+
+
+# Function to select the points of a line
+def lttb_indices(values: np.ndarray, size: int) -> np.ndarray:
+    """Select the points of a line with Largest-Triangle-Three-Buckets
+
+    The first and the last points are kept, the points in between are split
+    into buckets of a fixed size starting from the second point. In every
+    bucket the point forming the largest triangle with the previous selected
+    point and the average of the next bucket is kept.
+
+    Args:
+        values (np.ndarray): The values of the line, without missing values
+        size (int): The number of points per bucket
+
+    Returns:
+        np.ndarray: The positions of the selected points
+    """
+
+    # If every point is kept
+    length = len(values)
+    if size <= 1 or length <= 2:
+        return np.arange(length)
+
+    # Start of every bucket between the first and the last points
+    starts = np.arange(1, length - 1, size)
+    ends = np.minimum(starts + size, length - 1)
+
+    # Averages of every bucket, the last point closes the list
+    counts = ends - starts
+    mean_x = np.append(starts + (counts - 1) / 2, length - 1).tolist()
+    mean_y = np.append(
+        np.add.reduceat(values[1 : length - 1], starts - 1) / counts, values[-1]
+    ).tolist()
+
+    # List to store the selected points
+    points = values.tolist()
+    selected = [0]
+
+    # For each bucket
+    for bucket, (start, end) in enumerate(zip(starts.tolist(), ends.tolist())):
+        # Get the previous point and the average of the next bucket
+        ax, ay = selected[-1], points[selected[-1]]
+        cx, cy = mean_x[bucket + 1], mean_y[bucket + 1]
+
+        # Keep the point forming the largest triangle
+        selected.append(
+            max(
+                range(start, end),
+                key=lambda x: abs((ax - cx) * (points[x] - ay) - (ax - x) * (cy - ay)),
+            )
+        )
+
+    # Keep the last point
+    selected.append(length - 1)
+
+    # Return the positions
+    return np.asarray(selected)
+
+
+# Function to downsample a line
+def downsample_line(series: pd.Series, size: int) -> pd.Series:
+    """Downsample a line with Largest-Triangle-Three-Buckets
+
+    Args:
+        series (pd.Series): The line, missing values are dropped
+        size (int): The number of points per bucket
+
+    Returns:
+        pd.Series: The selected points
+    """
+
+    # If every point is kept
+    if size <= 1:
+        return series
+
+    # Select the points of the values that are present
+    series = series.dropna()
+    return series.iloc[lttb_indices(series.to_numpy(dtype=float), size)]
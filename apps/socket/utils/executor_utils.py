@@ -0,0 +1,205 @@
+# Imports
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+from django.conf import settings
+
+
+# ExecutorQueueFull class
+class ExecutorQueueFull(RuntimeError):
+    """Raised when a task is submitted to an executor whose queue is full"""
+
+
+# InstrumentedExecutor class
+class InstrumentedExecutor(ThreadPoolExecutor):
+    """Thread pool with a bounded queue that records its depth and wait times
+
+    Submitting more than max_queue tasks that are not running yet raises
+    ExecutorQueueFull instead of blocking the caller, which may be the event
+    loop, so an upstream slowdown sheds load instead of piling up work.
+
+    Attributes:
+        name (str): Name of the executor
+        max_queue (int): Maximum number of tasks waiting for a thread
+    """
+
+    # Constructor
+    def __init__(self, name: str, max_workers: int, max_queue: int):
+        # Initialize the thread pool
+        super().__init__(max_workers=max_workers, thread_name_prefix=name)
+
+        # Attributes
+        self.name = name
+        self.max_queue = max_queue
+        self._metrics_lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._counters = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "rejected": 0,
+            "cancelled": 0,
+        }
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+
+    # Method to submit a task
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        # Lock the metrics
+        with self._metrics_lock:
+            # If the queue is full
+            if self._queued >= self.max_queue:
+                # Reject the task
+                self._counters["rejected"] += 1
+                raise ExecutorQueueFull(f"Executor {self.name} queue is full")
+
+            # Count the task as queued
+            self._queued += 1
+            self._counters["submitted"] += 1
+
+        # Submit the task wrapped with the instrumentation
+        try:
+            future = super().submit(self._run, time.monotonic(), fn, *args, **kwargs)
+
+        # If the executor is shut down
+        except BaseException:
+            with self._metrics_lock:
+                self._queued -= 1
+            raise
+
+        # Remove the task from the queue if it is cancelled before running
+        future.add_done_callback(self._discard_cancelled)
+
+        # Return the future
+        return future
+
+    # Method to count a task cancelled before running
+    def _discard_cancelled(self, future: Future) -> None:
+        # If the task ran
+        if not future.cancelled():
+            return
+
+        # Remove it from the queue
+        with self._metrics_lock:
+            self._queued -= 1
+            self._counters["cancelled"] += 1
+
+    # Method to run a task and record its metrics
+    def _run(
+        self, submitted_at: float, fn: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        # Time spent waiting for a thread
+        wait_time = time.monotonic() - submitted_at
+
+        # Move the task from the queue to the running tasks
+        with self._metrics_lock:
+            self._queued -= 1
+            self._running += 1
+            self._wait_time_total += wait_time
+            self._wait_time_max = max(self._wait_time_max, wait_time)
+
+        # Try
+        try:
+            # Run the task
+            result = fn(*args, **kwargs)
+
+        # If the task fails
+        except BaseException:
+            with self._metrics_lock:
+                self._counters["failed"] += 1
+            raise
+
+        # Count the task as completed
+        else:
+            with self._metrics_lock:
+                self._counters["completed"] += 1
+            return result
+
+        # The task is not running anymore
+        finally:
+            with self._metrics_lock:
+                self._running -= 1
+
+    # Method to get the statistics
+    def stats(self) -> Dict[str, Any]:
+        """Get the pool depth, the task counters and the wait times
+
+        Returns:
+            Dict[str, Any]: The metrics of the executor
+        """
+
+        # Lock the metrics
+        with self._metrics_lock:
+            # Number of tasks that started running
+            started = (
+                self._counters["submitted"] - self._queued - self._counters["cancelled"]
+            )
+
+            # Return the metrics
+            return {
+                "max_workers": self._max_workers,
+                "max_queue": self.max_queue,
+                "threads": len(self._threads),
+                "queued": self._queued,
+                "running": self._running,
+                **self._counters,
+                "wait_time_total": self._wait_time_total,
+                "wait_time_max": self._wait_time_max,
+                "wait_time_avg": self._wait_time_total / started if started else 0.0,
+            }
+
+
+# Registry of the executors
+_executors: Dict[str, InstrumentedExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+# Function to get an executor from the registry
+def get_executor(name: str) -> InstrumentedExecutor:
+    """Get a process wide executor by name, creating it on first use
+
+    The size and the queue depth of every executor are configured by the
+    SOCKET_EXECUTORS setting. Tasks that submit other tasks must use a
+    different executor than their own, otherwise a saturated pool would wait
+    on itself.
+
+    Args:
+        name (str): Name of the executor in SOCKET_EXECUTORS
+
+    Returns:
+        InstrumentedExecutor: The shared executor
+    """
+
+    # Lock the registry
+    with _executors_lock:
+        # Create the executor once
+        if name not in _executors:
+            # Get the configuration of the executor
+            config = settings.SOCKET_EXECUTORS[name]
+
+            # Create the executor
+            _executors[name] = InstrumentedExecutor(
+                name, config["max_workers"], config["max_queue"]
+            )
+
+        # Return the executor
+        return _executors[name]
+
+
+# Function to get the statistics of all the executors
+def get_executor_stats() -> Dict[str, Dict[str, Any]]:
+    """Get the metrics of every executor created in this process
+
+    Returns:
+        Dict[str, Dict[str, Any]]: The metrics by executor name
+    """
+
+    # Copy the registry
+    with _executors_lock:
+        executors = dict(_executors)
+
+    # Return the metrics
+    return {name: executor.stats() for name, executor in executors.items()}
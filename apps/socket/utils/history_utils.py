@@ -0,0 +1,476 @@
+# Imports
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import quote
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.socket.constants import (
+    HISTORY_BACKFILL_PERIODS,
+    HISTORY_BASE_INTERVALS,
+    HISTORY_REQUEST_DAYS,
+)
+
+from .market_utils import is_market_open
+from .resample_utils import can_resample, resample_history
+from .singleflight_utils import singleflight
+
+# Columns of the history frames
+HISTORY_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+# Record layout of the stored bars, the timestamp is in UTC nanoseconds
+HISTORY_DTYPE = np.dtype(
+    [("ts", "<i8")] + [(column.lower(), "<f8") for column in HISTORY_COLUMNS]
+)
+
+
+# Function to convert a history frame to bars
+def frame_to_bars(frame: pd.DataFrame) -> np.ndarray:
+    """Convert a history frame returned by yfinance to a record array
+
+    Args:
+        frame (pd.DataFrame): The history frame
+
+    Returns:
+        np.ndarray: The bars sorted by timestamp
+    """
+
+    # Create the records
+    bars = np.empty(len(frame), dtype=HISTORY_DTYPE)
+
+    # Set the timestamps in UTC nanoseconds
+    bars["ts"] = pd.DatetimeIndex(frame.index).asi8
+
+    # Set the prices and the volume, indices have no volume
+    for column in HISTORY_COLUMNS:
+        values = frame[column] if column in frame else 0.0
+        bars[column.lower()] = np.asarray(values, dtype="<f8")
+
+    # Return the bars sorted by timestamp
+    return bars[np.argsort(bars["ts"], kind="stable")]
+
+
+# Function to convert bars to a history frame
+def bars_to_frame(bars: np.ndarray, tz: Optional[str]) -> pd.DataFrame:
+    """Convert bars to a history frame like the ones returned by yfinance
+
+    Args:
+        bars (np.ndarray): The bars
+        tz (Optional[str]): Timezone of the exchange
+
+    Returns:
+        pd.DataFrame: The history frame
+    """
+
+    # Build the index in the timezone of the exchange
+    index = pd.to_datetime(np.asarray(bars["ts"]), utc=True)
+    if tz:
+        index = index.tz_convert(tz)
+
+    # Return the frame, copying the values out of the memory map
+    return pd.DataFrame(
+        {column: np.array(bars[column.lower()]) for column in HISTORY_COLUMNS},
+        index=pd.DatetimeIndex(index, name="Date"),
+    )
+
+
+# Function to get the first bar of a period
+def period_start(ts: np.ndarray, period: str, tz: Optional[str]) -> int:
+    """Get the position of the first bar of a period, counted from the last bar
+
+    Day periods count trading sessions like yfinance does, so "1d" is the last
+    session and "5d" the last five sessions, month and year periods count
+    calendar time back from the last bar.
+
+    Args:
+        ts (np.ndarray): Sorted timestamps of the bars in UTC nanoseconds
+        period (str): The period ("1d", "5d", "1mo", ..., "ytd" or "max")
+        tz (Optional[str]): Timezone of the exchange
+
+    Returns:
+        int: Position of the first bar of the period
+    """
+
+    # If there are no bars or the whole history is requested
+    if not len(ts) or period == "max":
+        return 0
+
+    # Timestamp of the last bar in the timezone of the exchange
+    last = pd.Timestamp(int(ts[-1]), tz="UTC").tz_convert(tz or "UTC")
+
+    # If the period starts at the beginning of the year
+    if period == "ytd":
+        start = last.normalize().replace(month=1, day=1)
+
+    # If the period counts sessions
+    elif period.endswith("d"):
+        # Get the session dates of the bars
+        dates = pd.to_datetime(np.asarray(ts), utc=True).tz_convert(tz or "UTC")
+        dates = dates.normalize().unique()
+
+        # Start at the first bar of the oldest session of the period
+        start = dates[max(len(dates) - int(period[:-1]), 0)]
+
+    # If the period counts months
+    elif period.endswith("mo"):
+        start = last - pd.DateOffset(months=int(period[:-2]))
+
+    # If the period counts years
+    elif period.endswith("y"):
+        start = last - pd.DateOffset(years=int(period[:-1]))
+
+    # Unknown period, serve the whole history
+    else:
+        return 0
+
+    # Return the position of the first bar at or after the start
+    return int(np.searchsorted(ts, start.value, side="left"))
+
+
+# Function to get the window of a backfill period
+def backfill_window(period: str) -> Optional[int]:
+    """Get the length of a backfill period
+
+    Args:
+        period (str): The backfill period ("7d", "60d", ... or "max")
+
+    Returns:
+        Optional[int]: The length in nanoseconds, None for the whole history
+    """
+
+    # If the period does not count days
+    if not period.endswith("d"):
+        return None
+
+    # Return the length
+    return pd.Timedelta(days=int(period[:-1])).value
+
+
+# Function to check if a stored bar was adjusted upstream
+def is_adjusted(bar: np.void, fetched: np.ndarray) -> bool:
+    """Check if the upstream changed the close of a complete stored bar
+
+    Yahoo back-adjusts the older bars after a split or a dividend, so a
+    complete bar that does not match its refetched copy means that every
+    stored bar before it is outdated.
+
+    Args:
+        bar (np.void): The stored bar
+        fetched (np.ndarray): The fetched bars
+
+    Returns:
+        bool: True if the fetched copy of the bar has another close
+    """
+
+    # If the bar was not refetched
+    position = int(np.searchsorted(fetched["ts"], bar["ts"], side="left"))
+    if position == len(fetched) or fetched["ts"][position] != bar["ts"]:
+        return False
+
+    # Return True if the close changed
+    return not np.isclose(
+        fetched["close"][position], bar["close"], rtol=1e-4, equal_nan=True
+    )
+
+
+# HistoryStore class
+class HistoryStore:
+    """Local store of the OHLCV history of every (symbol, interval)
+
+    The bars are kept on disk as memory mapped NumPy files, and the latest
+    copy of every series is also kept in the shared cache as a hot layer for
+    the other worker processes. A series is backfilled once with the longest
+    period Yahoo serves for its interval, then every refresh only fetches the
+    bars from the last complete stored one, which replace the stored tail.
+    The series is backfilled again when that bar was adjusted upstream, and
+    the bars older than the backfill period are dropped. Any period is served
+    as a slice of the stored series.
+
+    Attributes:
+        root (Path): Directory of the stored files
+        prefix (str): Prefix of the shared cache keys
+    """
+
+    # Constructor
+    def __init__(self, root: Optional[str] = None, prefix: str = "history"):
+        # Attributes
+        self._root = root
+        self.prefix = prefix
+
+    # Property to get the directory of the stored files
+    @property
+    def root(self) -> Path:
+        # Return the configured directory, resolved on first use
+        return Path(self._root or settings.HISTORY_STORE_DIR)
+
+    # Method to build the shared cache key of a series
+    def key(self, symbol: str, interval: str) -> str:
+        # Return the key
+        return f"{self.prefix}:{symbol}:{interval}"
+
+    # Method to build the path of a series
+    def path(self, symbol: str, interval: str) -> Path:
+        # Return the path, with the symbol escaped for the file system
+        return self.root / f"{quote(symbol, safe='')}.{interval}.npy"
+
+    # Method to load a series
+    def load(self, symbol: str, interval: str) -> Optional[Dict[str, Any]]:
+        """Load a series from the shared cache, or from the disk
+
+        Args:
+            symbol (str): Symbol of the ticker
+            interval (str): Interval of the bars
+
+        Returns:
+            Optional[Dict[str, Any]]: {"bars", "tz", "refreshed_at"}, None if
+                the series was never fetched
+        """
+
+        # Try the hot layer
+        try:
+            entry = cache.get(self.key(symbol, interval))
+
+        # If the shared cache is unavailable
+        except Exception:
+            entry = None
+
+        # If the series is in the hot layer
+        if entry is not None:
+            return entry
+
+        # Get the paths of the bars and of the metadata
+        path = self.path(symbol, interval)
+        meta_path = path.with_suffix(".json")
+
+        # If the series was never stored
+        if not path.exists() or not meta_path.exists():
+            return None
+
+        # Try
+        try:
+            # Map the bars and read the metadata
+            bars = np.load(path, mmap_mode="r")
+            meta = json.loads(meta_path.read_text())
+
+        # If the files are being replaced or are corrupted, fetch again
+        except (OSError, ValueError):
+            return None
+
+        # Return the series
+        return {"bars": bars, **meta}
+
+    # Method to save a series
+    def save(self, symbol: str, interval: str, entry: Dict[str, Any]) -> None:
+        """Save a series to the disk and to the shared cache
+
+        Args:
+            symbol (str): Symbol of the ticker
+            interval (str): Interval of the bars
+            entry (Dict[str, Any]): {"bars", "tz", "refreshed_at"}
+        """
+
+        # If there are bars
+        if len(entry["bars"]):
+            # Get the paths of the bars and of the metadata
+            path = self.path(symbol, interval)
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Write both files next to the targets, then swap them atomically
+            with tempfile.NamedTemporaryFile(
+                dir=path.parent, suffix=".npy", delete=False
+            ) as file:
+                np.save(file, entry["bars"])
+            os.replace(file.name, path)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=path.parent, suffix=".json", delete=False
+            ) as file:
+                json.dump(
+                    {"tz": entry["tz"], "refreshed_at": entry["refreshed_at"]}, file
+                )
+            os.replace(file.name, path.with_suffix(".json"))
+
+        # Try
+        try:
+            # Publish the series to the hot layer
+            cache.set(
+                self.key(symbol, interval),
+                {**entry, "bars": np.array(entry["bars"])},
+                getattr(settings, "HISTORY_HOT_TTL", 60 * 60),
+            )
+
+        # If the shared cache is unavailable, the disk copy is enough
+        except Exception:
+            pass
+
+    # Method to check if a series must be refreshed
+    def is_stale(self, entry: Optional[Dict[str, Any]]) -> bool:
+        # A series that was never fetched is stale
+        if entry is None:
+            return True
+
+        # Get the refresh TTL for the current market state
+        ttls = getattr(settings, "HISTORY_REFRESH_TTLS", {"open": 5, "closed": 900})
+        ttl = ttls["open" if is_market_open() else "closed"]
+
+        # Return True if the series is older than the TTL
+        return time.time() - entry["refreshed_at"] >= ttl
+
+    # Method to backfill a series
+    def backfill(self, ticker: yf.Ticker, interval: str, period: str) -> pd.DataFrame:
+        """Fetch the bars of a backfill period, in chunks if Yahoo serves less
+        in one request
+
+        Args:
+            ticker (yf.Ticker): Ticker object
+            interval (str): Interval of the bars
+            period (str): The backfill period
+
+        Returns:
+            pd.DataFrame: The history of the period
+        """
+
+        # If the period is served in one request
+        days = HISTORY_REQUEST_DAYS.get(interval)
+        window = backfill_window(period)
+        if days is None or window is None or window <= pd.Timedelta(days=days).value:
+            return ticker.history(period=period, interval=interval)
+
+        # Fetch the chunks, oldest first
+        now = pd.Timestamp.now(tz="UTC")
+        start = now - pd.Timedelta(window)
+        frames = []
+        while start < now:
+            end = start + pd.Timedelta(days=days)
+            frames.append(
+                ticker.history(
+                    start=start, end=end if end < now else None, interval=interval
+                )
+            )
+            start = end
+
+        # Join the chunks, dropping the bars served twice at their bounds
+        frame = pd.concat([chunk for chunk in frames if not chunk.empty] or frames)
+        return frame[~frame.index.duplicated(keep="last")]
+
+    # Method to refresh a series
+    def refresh(self, ticker: yf.Ticker, interval: str) -> Dict[str, Any]:
+        """Backfill a series, or fetch the bars from its last complete stored bar
+
+        Args:
+            ticker (yf.Ticker): Ticker object
+            interval (str): Interval of the bars
+
+        Returns:
+            Dict[str, Any]: The refreshed series
+        """
+
+        # Load the series, another worker may have refreshed it meanwhile
+        entry = self.load(ticker.ticker, interval)
+        if not self.is_stale(entry):
+            return entry
+
+        # Get the backfill period of the interval
+        backfill = HISTORY_BACKFILL_PERIODS.get(interval, "max")
+        window = backfill_window(backfill)
+        bars = entry["bars"] if entry is not None else np.empty(0, HISTORY_DTYPE)
+
+        # If the last stored bar is older than the backfill window, start over
+        horizon = time.time_ns() - (window or 0) + pd.Timedelta(days=1).value
+        if len(bars) and window is not None and bars["ts"][-1] < horizon:
+            bars = np.empty(0, HISTORY_DTYPE)
+
+        # If there are stored bars
+        if len(bars):
+            # Fetch the bars from the last complete one, the last may be incomplete
+            start = pd.Timestamp(int(bars["ts"][max(len(bars) - 2, 0)]), tz="UTC")
+            frame = ticker.history(start=start, interval=interval)
+            fetched = frame_to_bars(frame)
+
+            # If the stored bars were adjusted for a split or a dividend
+            if len(bars) > 1 and is_adjusted(bars[-2], fetched):
+                # Backfill the series again
+                bars = np.empty(0, HISTORY_DTYPE)
+                frame = self.backfill(ticker, interval, backfill)
+                fetched = frame_to_bars(frame)
+
+        # Otherwise backfill the series
+        else:
+            frame = self.backfill(ticker, interval, backfill)
+            fetched = frame_to_bars(frame)
+
+        # If bars were fetched
+        if len(fetched):
+            # Replace the stored bars from the first fetched one
+            keep = bars[: np.searchsorted(bars["ts"], fetched["ts"][0], side="left")]
+            bars = np.concatenate([keep, fetched])
+
+        # Drop the bars older than the window Yahoo serves for the interval
+        if window is not None:
+            bars = bars[bars["ts"] >= time.time_ns() - window]
+
+        # Build the refreshed series
+        tz = getattr(frame.index, "tz", None)
+        entry = {
+            "bars": bars,
+            "tz": str(tz) if tz is not None else (entry or {}).get("tz"),
+            "refreshed_at": time.time(),
+        }
+
+        # Save the series
+        self.save(ticker.ticker, interval, entry)
+
+        # Return the series
+        return entry
+
+    # Method to get the history of a ticker
+    def get(self, ticker: yf.Ticker, period: str, interval: str) -> pd.DataFrame:
+        """Get the history of a period, refreshing the stored series if stale
+
+        The coarser intraday intervals of the periods in HISTORY_BASE_INTERVALS
+        are resampled from the series of the base interval, so every interval
+        of these periods is served from a single upstream series.
+
+        Args:
+            ticker (yf.Ticker): Ticker object
+            period (str): The period
+            interval (str): Interval of the bars
+
+        Returns:
+            pd.DataFrame: The OHLCV history of the period
+        """
+
+        # If the interval is resampled from the base interval of the period
+        base = HISTORY_BASE_INTERVALS.get(period)
+        if base is not None and can_resample(interval, base):
+            return resample_history(self.get(ticker, period, base), interval)
+
+        # Load the series
+        entry = self.load(ticker.ticker, interval)
+
+        # If the series is stale
+        if self.is_stale(entry):
+            # Refresh it once for all the periods and the worker processes
+            entry = singleflight.do(
+                (self.prefix, ticker.ticker, interval),
+                lambda: self.refresh(ticker, interval),
+                shared=True,
+            )
+
+        # Slice the period
+        bars = entry["bars"]
+        start = period_start(bars["ts"], period, entry["tz"])
+
+        # Return the history of the period
+        return bars_to_frame(bars[start:], entry["tz"])
+
+
+# Process wide history store
+history_store = HistoryStore()
@@ -0,0 +1,329 @@
+# Imports
+import math
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.socket.constants import (
+    NSE_BREADTH_PRICE_FIELDS,
+    NSE_FNO_URL,
+    REQUIRED_FIELDS,
+)
+
+from .market_utils import is_market_open
+from .quote_utils import fetch_ranked_quotes, process_quote
+from .session_utils import nse_fetch
+from .singleflight_utils import singleflight
+
+
+# Function to get the advances and declines
+def nse_get_advances_declines() -> pd.DataFrame:
+    """Get the securities in F&O with their change, like nsepython
+
+    Returns:
+        pd.DataFrame: One row per security
+    """
+
+    # Fetch the securities with the shared NSE session
+    return pd.DataFrame(nse_fetch(NSE_FNO_URL)["data"])
+
+
+# BreadthSnapshot class
+class BreadthSnapshot:
+    """Shared snapshot of the NSE breadth table, ranked by change
+
+    The table is fetched once per refresh for every ranking of every
+    exchange, and the latest copy is kept in the shared cache for the other
+    worker processes. The rankings are computed once per refresh, so the
+    top and bottom securities are served as slices of them.
+
+    Attributes:
+        prefix (str): Prefix of the shared cache key
+    """
+
+    # Constructor
+    def __init__(self, prefix: str = "breadth"):
+        # Attributes
+        self.prefix = prefix
+        self._entry: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+
+    # Property to get the shared cache key of the snapshot
+    @property
+    def key(self) -> str:
+        # Return the key
+        return f"{self.prefix}:fno"
+
+    # Static method to build a snapshot entry
+    @staticmethod
+    def build(records: list, refreshed_at: float) -> Dict[str, Any]:
+        """Build a snapshot entry and rank its securities by change
+
+        Securities without a change are left out of the rankings, ties keep
+        the order of the table.
+
+        Args:
+            records (list): The rows of the breadth table
+            refreshed_at (float): Time of the fetch
+
+        Returns:
+            Dict[str, Any]: The table, its rankings and the time of the fetch
+        """
+
+        # Build the table and get the changes
+        frame = pd.DataFrame(records)
+        changes = pd.to_numeric(
+            frame.get("pChange", pd.Series(dtype=float)), errors="coerce"
+        ).to_numpy(dtype=float)
+
+        # Rank the securities with a change, in both directions
+        ranked = np.flatnonzero(~np.isnan(changes))
+        ascending = ranked[np.argsort(changes[ranked], kind="stable")]
+        descending = ranked[np.argsort(-changes[ranked], kind="stable")]
+
+        # Return the entry
+        return {
+            "frame": frame,
+            "ascending": ascending,
+            "descending": descending,
+            "refreshed_at": refreshed_at,
+        }
+
+    # Method to check if a snapshot must be refreshed
+    def is_stale(self, entry: Optional[Dict[str, Any]]) -> bool:
+        # A snapshot that was never fetched is stale
+        if entry is None:
+            return True
+
+        # Get the refresh TTL for the current market state
+        ttls = getattr(settings, "BREADTH_REFRESH_TTLS", {"open": 2, "closed": 900})
+        ttl = ttls["open" if is_market_open() else "closed"]
+
+        # Return True if the snapshot is older than the TTL
+        return time.time() - entry["refreshed_at"] >= ttl
+
+    # Method to load the snapshot
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Load the snapshot of this process, or the shared one if it is newer
+
+        Returns:
+            Optional[Dict[str, Any]]: The snapshot, None if it was never fetched
+        """
+
+        # If the snapshot of this process is fresh
+        entry = self._entry
+        if not self.is_stale(entry):
+            return entry
+
+        # Look in the shared cache
+        try:
+            item = cache.get(self.key)
+
+        # If the shared cache is unavailable
+        except Exception:
+            item = None
+
+        # If another worker fetched a newer snapshot
+        if item is not None and (entry is None or item[0] > entry["refreshed_at"]):
+            # Rank it and keep it in this process
+            with self._lock:
+                entry = self._entry = self.build(item[1], item[0])
+
+        # Return the snapshot
+        return entry
+
+    # Method to refresh the snapshot
+    def refresh(self) -> Dict[str, Any]:
+        """Fetch the breadth table, unless another worker just did
+
+        Returns:
+            Dict[str, Any]: The refreshed snapshot
+        """
+
+        # Load the snapshot, another worker may have refreshed it meanwhile
+        entry = self.load()
+        if not self.is_stale(entry):
+            return entry
+
+        # Fetch the table and rank it
+        records = nse_get_advances_declines().to_dict("records")
+        entry = self.build(records, time.time())
+
+        # Keep the snapshot in this process
+        with self._lock:
+            self._entry = entry
+
+        # Share the snapshot with the other workers until it is stale anyway
+        ttls = getattr(settings, "BREADTH_REFRESH_TTLS", {"open": 2, "closed": 900})
+        try:
+            cache.set(self.key, (entry["refreshed_at"], records), max(ttls.values()))
+
+        # If the shared cache is unavailable, the local copy is enough
+        except Exception:
+            pass
+
+        # Return the snapshot
+        return entry
+
+    # Method to get the snapshot
+    def get(self) -> Dict[str, Any]:
+        """Get the snapshot, refreshing it if stale
+
+        Returns:
+            Dict[str, Any]: The snapshot
+        """
+
+        # Load the snapshot
+        entry = self.load()
+
+        # If the snapshot is stale
+        if self.is_stale(entry):
+            # Refresh it once for all the rankings and the worker processes
+            entry = singleflight.do(self.key, self.refresh, shared=True)
+
+        # Return the snapshot
+        return entry
+
+    # Method to get the securities with the highest change
+    def top(self, n: int) -> pd.DataFrame:
+        """Get the n securities with the highest change
+
+        Args:
+            n (int): Number of securities
+
+        Returns:
+            pd.DataFrame: The securities, highest change first
+        """
+
+        # Return the first rows of the descending ranking
+        entry = self.get()
+        return entry["frame"].iloc[entry["descending"][:n]]
+
+    # Method to get the securities with the lowest change
+    def bottom(self, n: int) -> pd.DataFrame:
+        """Get the n securities with the lowest change
+
+        Args:
+            n (int): Number of securities
+
+        Returns:
+            pd.DataFrame: The securities, lowest change first
+        """
+
+        # Return the first rows of the ascending ranking
+        entry = self.get()
+        return entry["frame"].iloc[entry["ascending"][:n]]
+
+    # Method to clear the snapshot of this process
+    def clear(self) -> None:
+        # Lock the snapshot
+        with self._lock:
+            # Drop it
+            self._entry = None
+
+
+# Process wide breadth snapshot
+breadth_snapshot = BreadthSnapshot()
+
+
+# Function to get the top gainers
+def nse_get_top_gainers() -> pd.DataFrame:
+    """Get the 5 securities in F&O with the highest change, like nsepython
+
+    Returns:
+        pd.DataFrame: The top gainers
+    """
+
+    # Rank the securities of the shared snapshot
+    return breadth_snapshot.top(5)
+
+
+# Function to get the top losers
+def nse_get_top_losers() -> pd.DataFrame:
+    """Get the 5 securities in F&O with the lowest change, like nsepython
+
+    Returns:
+        pd.DataFrame: The top losers
+    """
+
+    # Rank the securities of the shared snapshot
+    return breadth_snapshot.bottom(5)
+
+
+# Function to build the quote of a row of the breadth table
+def nse_breadth_quote(row: Dict[str, Any], suffix: str = "NS") -> Dict[str, Any]:
+    """Build a quote with the required fields from a row of the breadth table
+
+    Args:
+        row (Dict[str, Any]): The row of the security
+        suffix (str, optional): Yahoo suffix of the exchange. Defaults to "NS".
+
+    Returns:
+        Dict[str, Any]: The quote, None for the fields missing from the row
+    """
+
+    # Get the metadata, missing from some rows
+    meta = row.get("meta")
+    meta = meta if isinstance(meta, dict) else {}
+
+    # Build the quote, the NSE symbol is the short name
+    quote = {
+        "symbol": f"{row['symbol']}.{suffix}",
+        "shortName": row["symbol"],
+        "longName": meta.get("companyName"),
+        **{key: row.get(key) for key in NSE_BREADTH_PRICE_FIELDS},
+    }
+
+    # Return the quote with the nan values replaced with None
+    return {
+        key: None if isinstance(value, float) and math.isnan(value) else value
+        for key, value in quote.items()
+    }
+
+
+# Function to get the quotes of the securities of the breadth table
+def nse_breadth_quotes(rows: pd.DataFrame) -> Dict[str, Optional[Dict]]:
+    """Get the processed quotes of securities of the breadth table
+
+    The quotes are built from the prices of the table, Yahoo is only asked
+    for the prices missing from it, with batched and cached requests.
+
+    Args:
+        rows (pd.DataFrame): The rows of the securities
+
+    Returns:
+        Dict[str, Optional[Dict]]: Processed quote of every security by Yahoo
+            symbol, in the same order, None if the quote is not available
+    """
+
+    # Build the quotes
+    quotes = {
+        quote["symbol"]: quote
+        for quote in map(nse_breadth_quote, rows.to_dict("records"))
+    }
+
+    # Get the symbols with missing prices
+    missing: List[str] = [
+        symbol
+        for symbol, quote in quotes.items()
+        if any(quote[key] is None for key in NSE_BREADTH_PRICE_FIELDS)
+    ]
+
+    # Fill the missing fields from Yahoo
+    for symbol, fetched in fetch_ranked_quotes(missing, len(missing)).items():
+        for key in REQUIRED_FIELDS:
+            if quotes[symbol][key] is None:
+                quotes[symbol][key] = fetched.get(key)
+
+    # Return the processed quotes, None if a price is still missing
+    return {
+        symbol: process_quote(quote)
+        if quote["lastPrice"] is not None and quote["previousClose"] is not None
+        else None
+        for symbol, quote in quotes.items()
+    }
@@ -1,13 +1,17 @@
 # Imports
 import math
-from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, Optional, Tuple
+import time
+from typing import Dict, List, Optional, Tuple
 
-import yfinance as yf
+from django.conf import settings
 
-from apps.socket.constants import REQUIRED_FIELDS
+from apps.socket.constants import BATCH_QUOTE_FIELDS, REQUIRED_FIELDS
 
-from .ticker_utils import fetch_ticker_data
+from .cache_utils import MISSING, quote_cache
+from .executor_utils import ExecutorQueueFull, get_executor
+from .session_utils import get_ticker
+from .singleflight_utils import singleflight
+from .ticker_utils import fetch_batch_quote_data, fetch_ticker_data
 
 
 # Function to process the quote
@@ -48,6 +52,9 @@ def fetch_and_process_quote(
 ) -> Tuple[str, Optional[Dict]]:
     """Fetch and process data using concurrent execution
 
+    Concurrent calls for the same symbol wait on the call already in flight
+    instead of starting their own upstream requests.
+
     Args:
         symbol (str): Stock symbol
         filter (bool, optional): Flag to filter the data. Defaults to True.
@@ -56,42 +63,59 @@ def fetch_and_process_quote(
         Tuple[str, Optional[Dict]]: Tuple containing the symbol and processed data
     """
 
+    # Fetch and process the quote once for all the concurrent callers
+    return singleflight.do(
+        ("quote", symbol, filter), lambda: _fetch_and_process_quote(symbol, filter)
+    )
+
+
+# Function to fetch and process the quote data from the upstream
+def _fetch_and_process_quote(symbol: str, filter: bool) -> Tuple[str, Optional[Dict]]:
     # Try
     try:
         # Get the ticker object
-        item_ticker = yf.Ticker(symbol)
-
-        # Create ThreadPoolExecutor for concurrent fetching
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            # Submit both fetch tasks
-            future_info = executor.submit(fetch_ticker_data, item_ticker, "info")
-            future_fast_info = executor.submit(
-                fetch_ticker_data, item_ticker, "fast_info"
-            )
+        item_ticker = get_ticker(symbol)
+
+        # Get the shared upstream executor
+        executor = get_executor("upstream")
+
+        # Submit both fetch tasks, served from the quote cache when fresh
+        future_info = executor.submit(
+            quote_cache.get_or_fetch,
+            "info",
+            symbol,
+            lambda: fetch_ticker_data(item_ticker, "info"),
+        )
+        future_fast_info = executor.submit(
+            quote_cache.get_or_fetch,
+            "fast_info",
+            symbol,
+            lambda: fetch_ticker_data(item_ticker, "fast_info"),
+        )
 
-            # Get results from both futures
-            info = future_info.result()
-            info_fast = future_fast_info.result()
+        # Get results from both futures
+        info = future_info.result()
+        info_fast = future_fast_info.result()
 
-            # Combine the info with priority to fast_info
-            result = {**info_fast, **info}
+        # Combine the info with priority to fast_info
+        result = {**info_fast, **info}
 
-            # If filter
-            if filter:
-                # Filter and process the data
-                result = {key: result.get(key) for key in REQUIRED_FIELDS}
+        # If filter
+        if filter:
+            # Filter and process the data
+            result = {key: result.get(key) for key in REQUIRED_FIELDS}
 
-            # Replace all nan values with None
-            result = {
-                key: None if isinstance(value, float) and math.isnan(value) else value
-                for key, value in result.items()
-            }
+        # Replace all nan values with None
+        result = {
+            key: None if isinstance(value, float) and math.isnan(value) else value
+            for key, value in result.items()
+        }
 
-            # Process the quote data
-            result = process_quote(result)
+        # Process the quote data
+        result = process_quote(result)
 
-            # Return the symbol and result
-            return symbol, result
+        # Return the symbol and result
+        return symbol, result
 
     # If error
     except Exception as e:
@@ -100,3 +124,331 @@ def fetch_and_process_quote(
 
         # Return the symbol and None
         return symbol, None
+
+
+# Function to normalize a batch quote
+def normalize_batch_quote(raw_quote: Dict) -> Dict:
+    """Rename the batch quote fields to the fields used by process_quote
+
+    Args:
+        raw_quote (Dict): The raw quote of the batch endpoint
+
+    Returns:
+        Dict: The quote with the required fields
+    """
+
+    # Copy the quote and add the renamed fields that are available
+    return {
+        **raw_quote,
+        **{
+            key: raw_quote[field]
+            for key, field in BATCH_QUOTE_FIELDS.items()
+            if raw_quote.get(field) is not None
+        },
+    }
+
+
+# Function to fetch the raw quotes of many symbols
+def fetch_raw_quotes(symbols: List[str]) -> Dict[str, Dict]:
+    """Fetch the raw quotes of many symbols, batching the cache misses
+
+    Args:
+        symbols (List[str]): List of unique symbols
+
+    Returns:
+        Dict[str, Dict]: Raw quote of every symbol found, by symbol
+    """
+
+    # Get the cached quotes
+    raw_quotes = {}
+    for symbol in symbols:
+        raw_quote = quote_cache.get("batch", symbol)
+        if raw_quote is not MISSING:
+            raw_quotes[symbol] = raw_quote
+
+    # Get the symbols that are not cached
+    missing = [symbol for symbol in symbols if symbol not in raw_quotes]
+
+    # Fetch the missing symbols, one upstream request per batch
+    batch_size = getattr(settings, "QUOTE_BATCH_SIZE", 50)
+    for start in range(0, len(missing), batch_size):
+        # Get the batch
+        batch = tuple(missing[start : start + batch_size])
+
+        # Try
+        try:
+            # Fetch the batch once for all the concurrent callers
+            fetched = singleflight.do(
+                ("batch", batch), lambda: fetch_batch_quote_data(list(batch))
+            )
+
+        # If error
+        except Exception as e:
+            # Print the error
+            print(f"Error fetching batch quotes {', '.join(batch)}: {e}")
+            continue
+
+        # Cache and keep the quotes
+        for symbol in batch:
+            if symbol in fetched:
+                quote_cache.set("batch", symbol, fetched[symbol])
+                raw_quotes[symbol] = fetched[symbol]
+
+    # Return the quotes
+    return raw_quotes
+
+
+# Function to fetch the info of many symbols
+def fetch_quote_infos(symbols: List[str]) -> Dict[str, Dict]:
+    """Fetch the info of many symbols concurrently, served from the quote
+    cache when fresh
+
+    The info the upstream cannot serve, or that cannot be queued because the
+    upstream executor is full, is left empty, the batch quote still carries
+    the names, the exchange and the quote type.
+
+    Args:
+        symbols (List[str]): List of unique symbols
+
+    Returns:
+        Dict[str, Dict]: The info of every symbol, by symbol
+    """
+
+    # Get the shared upstream executor
+    executor = get_executor("upstream")
+
+    # Dict to store the pending fetches
+    futures = {}
+
+    # For each symbol
+    for symbol in symbols:
+        # Try
+        try:
+            # Submit the fetch, served from the quote cache when fresh
+            futures[symbol] = executor.submit(
+                quote_cache.get_or_fetch,
+                "info",
+                symbol,
+                lambda symbol=symbol: fetch_ticker_data(get_ticker(symbol), "info"),
+            )
+
+        # If the upstream executor is full
+        except ExecutorQueueFull:
+            continue
+
+    # Dict to store the info
+    infos = {symbol: {} for symbol in symbols}
+
+    # For each pending fetch
+    for symbol, future in futures.items():
+        # Try
+        try:
+            # Wait for the info
+            infos[symbol] = future.result() or {}
+
+        # If error
+        except Exception as e:
+            # Print the error
+            print(f"Error fetching info {symbol}: {e}")
+
+    # Return the info
+    return infos
+
+
+# Function to process a raw quote of the batch endpoint
+def process_raw_quote(
+    symbol: str, raw_quote: Dict, filter: bool = True, info: Optional[Dict] = None
+) -> Optional[Dict]:
+    """Process a raw quote of the batch endpoint like fetch_and_process_quote
+
+    Args:
+        symbol (str): Stock symbol
+        raw_quote (Dict): The raw quote
+        filter (bool, optional): Flag to filter the data. Defaults to True.
+        info (Optional[Dict], optional): The info of the symbol, fetched
+            through the quote cache when None. Defaults to None.
+
+    Returns:
+        Optional[Dict]: The processed quote, None if it cannot be processed
+    """
+
+    # Try
+    try:
+        # Rename the batch fields
+        result = normalize_batch_quote(raw_quote)
+
+        # If filter
+        if filter:
+            # Filter the data
+            result = {key: result.get(key) for key in REQUIRED_FIELDS}
+
+        # Otherwise add the info of the symbol
+        else:
+            if info is None:
+                info = quote_cache.get_or_fetch(
+                    "info",
+                    symbol,
+                    lambda: fetch_ticker_data(get_ticker(symbol), "info"),
+                )
+            result = {**info, **result}
+
+        # Replace all nan values with None
+        result = {
+            key: None if isinstance(value, float) and math.isnan(value) else value
+            for key, value in result.items()
+        }
+
+        # Process the quote data
+        return process_quote(result)
+
+    # If error
+    except Exception as e:
+        # Print the error
+        print(f"Error processing index {symbol}: {e}")
+
+        # Return None
+        return None
+
+
+# Function to fetch and process the quotes of many symbols
+def fetch_and_process_quotes(
+    symbols: List[str], filter: bool = True
+) -> Dict[str, Optional[Dict]]:
+    """Fetch and process the quotes of many symbols with batched requests
+
+    The quotes of up to QUOTE_BATCH_SIZE symbols are fetched with one upstream
+    request, symbols missing from the batch response fall back to
+    fetch_and_process_quote. Unfiltered quotes add the info of their symbols,
+    fetched concurrently.
+
+    Args:
+        symbols (List[str]): List of symbols
+        filter (bool, optional): Flag to filter the data. Defaults to True.
+
+    Returns:
+        Dict[str, Optional[Dict]]: Processed quote of every symbol, in the same
+            order as the symbols, None if the quote is not available
+    """
+
+    # Remove the duplicate symbols, keeping the order
+    symbols = list(dict.fromkeys(symbols))
+
+    # Fetch the raw quotes
+    raw_quotes = fetch_raw_quotes(symbols)
+
+    # Fetch the info of the batch quotes at once if they are not filtered
+    infos = {} if filter else fetch_quote_infos(list(raw_quotes))
+
+    # Dict to store the quotes
+    quotes = {}
+
+    # For each symbol
+    for symbol in symbols:
+        # If the symbol is missing from the batch response
+        if symbol not in raw_quotes:
+            # Fall back to the single symbol fetch
+            quotes[symbol] = fetch_and_process_quote(symbol, filter)[1]
+            continue
+
+        # Process the batch quote
+        quotes[symbol] = process_raw_quote(
+            symbol, raw_quotes[symbol], filter, infos.get(symbol)
+        )
+
+    # Return the quotes
+    return quotes
+
+
+# Function to fetch and process the quotes of the first ranked symbols
+def fetch_ranked_quotes(
+    symbols: List[str], limit: int, timeout: Optional[float] = None
+) -> Dict[str, Dict]:
+    """Fetch and process the quotes of the first limit ranked symbols that
+    have one, in rank order
+
+    The quotes are fetched with batched requests, the symbols missing from
+    the batch response fall back to single symbol fetches running
+    concurrently on the "ranked" executor, which the callers do not run on.
+    The deadline starts with the call, so the fallbacks only get what the
+    batched requests left of the timeout, the symbols whose fallback did not
+    finish by then or could not be queued are skipped. The fallbacks still
+    waiting once limit quotes are kept are cancelled.
+
+    Args:
+        symbols (List[str]): List of symbols, in rank order
+        limit (int): Maximum number of quotes
+        timeout (Optional[float], optional): Seconds to wait for the fallbacks,
+            the QUOTE_RANKED_TIMEOUT setting when None. Defaults to None.
+
+    Returns:
+        Dict[str, Dict]: The available quotes by symbol, in rank order
+    """
+
+    # Deadline of the fallbacks, counting the batched requests
+    timeout = (
+        getattr(settings, "QUOTE_RANKED_TIMEOUT", 5) if timeout is None else timeout
+    )
+    deadline = time.monotonic() + timeout
+
+    # Remove the duplicate symbols, keeping the order
+    symbols = list(dict.fromkeys(symbols))
+
+    # Fetch the raw quotes
+    raw_quotes = fetch_raw_quotes(symbols)
+
+    # Start the fallbacks of the missing symbols, in rank order, on an
+    # executor the callers do not run on
+    executor = get_executor("ranked")
+    futures = {}
+    for symbol in symbols:
+        # If the symbol is in the batch response
+        if symbol in raw_quotes:
+            continue
+
+        # Try
+        try:
+            # Start the fallback
+            futures[symbol] = executor.submit(fetch_and_process_quote, symbol)
+
+        # If the executor is full, skip the symbol like a late fallback
+        except ExecutorQueueFull:
+            continue
+
+    # Dict to store the quotes
+    quotes = {}
+
+    # For each symbol, in rank order
+    for symbol in symbols:
+        # If enough quotes are kept
+        if len(quotes) >= limit:
+            break
+
+        # If the symbol is in the batch response
+        if symbol in raw_quotes:
+            quote = process_raw_quote(symbol, raw_quotes[symbol])
+
+        # If the fallback could not be queued
+        elif symbol not in futures:
+            quote = None
+
+        # Otherwise wait for its fallback until the deadline
+        else:
+            try:
+                quote = futures[symbol].result(
+                    timeout=max(deadline - time.monotonic(), 0)
+                )[1]
+
+            # If the fallback is late or failed
+            except Exception:
+                quote = None
+
+        # Keep the available quote
+        if quote:
+            quotes[symbol] = quote
+
+    # Cancel the fallbacks that are not needed anymore
+    for future in futures.values():
+        future.cancel()
+
+    # Return the quotes
+    return quotes
@@ -0,0 +1,104 @@
+# Imports
+import re
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from .downsample_utils import aggregate_ohlc
+
+# Nanoseconds in a minute and in a day
+MINUTE_NS = 60 * 10**9
+DAY_NS = 24 * 60 * MINUTE_NS
+
+# Sessions open on a quarter hour, the first bar of a day is floored to it
+SESSION_ALIGNMENT_NS = 15 * MINUTE_NS
+
+
+# Function to get the length of an intraday interval
+def interval_minutes(interval: str) -> Optional[int]:
+    """Get the number of minutes of an intraday interval
+
+    Args:
+        interval (str): The interval ("1m", "15m", "1h", ...)
+
+    Returns:
+        Optional[int]: The minutes, None for daily and longer intervals
+    """
+
+    # If the interval is not intraday
+    match = re.fullmatch(r"(\d+)([mh])", interval)
+    if match is None:
+        return None
+
+    # Return the minutes
+    return int(match.group(1)) * (60 if match.group(2) == "h" else 1)
+
+
+# Function to check if an interval can be resampled from a base interval
+def can_resample(interval: str, base: str) -> bool:
+    """Check if the bars of an interval are whole groups of base bars
+
+    Args:
+        interval (str): The requested interval
+        base (str): The base interval
+
+    Returns:
+        bool: True if the interval is a coarser multiple of the base
+    """
+
+    # Get the minutes of both intervals
+    minutes, base_minutes = interval_minutes(interval), interval_minutes(base)
+
+    # Return True if the interval is a coarser intraday multiple of the base
+    return (
+        minutes is not None
+        and base_minutes is not None
+        and minutes > base_minutes
+        and minutes % base_minutes == 0
+    )
+
+
+# Function to resample a history to a coarser interval
+def resample_history(history_df: pd.DataFrame, interval: str) -> pd.DataFrame:
+    """Aggregate intraday bars into the bars of a coarser interval
+
+    The bars of every session are counted from its open, taken as the first
+    bar of the day floored to a quarter hour, like the bars Yahoo serves.
+
+    Args:
+        history_df (pd.DataFrame): The intraday history, sorted by time
+        interval (str): The coarser interval
+
+    Returns:
+        pd.DataFrame: The resampled history, indexed by the bar start times
+    """
+
+    # If there are no bars
+    if history_df.empty:
+        return history_df
+
+    # Local wall clock time of the bars in nanoseconds
+    index = pd.DatetimeIndex(history_df.index)
+    local = index.tz_localize(None).asi8 if index.tz is not None else index.asi8
+
+    # Session open of the day of every bar
+    day = local // DAY_NS
+    first = np.flatnonzero(np.diff(day, prepend=day[0] - 1))
+    opens = np.repeat(local[first], np.diff(np.append(first, len(local))))
+    opens -= (opens - day * DAY_NS) % SESSION_ALIGNMENT_NS
+
+    # Start time of the bar every base bar belongs to
+    step = interval_minutes(interval) * MINUTE_NS
+    bar_start = opens + (local - opens) // step * step
+
+    # Position of the first base bar of every bar
+    starts = np.flatnonzero(np.diff(bar_start, prepend=bar_start[0] - 1))
+
+    # Build the index of the bar start times in the timezone of the history
+    resampled = pd.DatetimeIndex(bar_start[starts], name=index.name)
+    if index.tz is not None:
+        resampled = resampled.tz_localize(index.tz)
+
+    # Return the resampled history
+    return aggregate_ohlc(history_df, starts, resampled)
@@ -0,0 +1,148 @@
+# Imports
+import threading
+from typing import Any, Dict
+
+import requests
+import yfinance as yf
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from yfinance.data import YfData
+
+from apps.socket.constants import NSE_HEADERS, NSE_HOME_URL
+
+# Shared sessions
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+# Function to build a pooled session
+def build_session(headers: Dict[str, str] = None) -> requests.Session:
+    """Build a session with keep-alive connection pools and retries
+
+    Every host gets a pool of at most UPSTREAM_POOL_MAXSIZE connections,
+    callers block for a free connection instead of opening extra ones, so the
+    TLS handshakes are paid once per connection and not once per request.
+
+    Args:
+        headers (Dict[str, str], optional): Default headers. Defaults to None.
+
+    Returns:
+        requests.Session: The session
+    """
+
+    # Create the session
+    session = requests.Session()
+
+    # Mount the pooled adapter
+    adapter = HTTPAdapter(
+        pool_connections=getattr(settings, "UPSTREAM_POOL_CONNECTIONS", 10),
+        pool_maxsize=getattr(settings, "UPSTREAM_POOL_MAXSIZE", 16),
+        pool_block=True,
+        max_retries=Retry(
+            total=getattr(settings, "UPSTREAM_RETRIES", 2),
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=("GET",),
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    # Set the default headers
+    if headers:
+        session.headers.update(headers)
+
+    # Return the session
+    return session
+
+
+# Function to get a shared session
+def get_session(name: str) -> requests.Session:
+    """Get a process wide pooled session by name, creating it on first use
+
+    Args:
+        name (str): Name of the upstream ("yahoo" or "nse")
+
+    Returns:
+        requests.Session: The shared session
+    """
+
+    # Lock the sessions
+    with _sessions_lock:
+        # Create the session once
+        if name not in _sessions:
+            _sessions[name] = build_session(NSE_HEADERS if name == "nse" else None)
+
+        # Return the session
+        return _sessions[name]
+
+
+# Function to get the shared Yahoo client
+def get_yahoo_data() -> YfData:
+    """Get the yfinance data client bound to the shared Yahoo session
+
+    YfData is a singleton that keeps the cookie and the crumb, binding it to
+    the pooled session once means every ticker reuses both the connections
+    and the crumb instead of repeating the handshake.
+
+    Returns:
+        YfData: The yfinance data client
+    """
+
+    # Return the client bound to the shared session
+    return YfData(session=get_session("yahoo"))
+
+
+# Function to build a ticker
+def get_ticker(symbol: str) -> yf.Ticker:
+    """Build a ticker that uses the shared Yahoo session
+
+    Args:
+        symbol (str): Symbol of the ticker
+
+    Returns:
+        yf.Ticker: The ticker
+    """
+
+    # Return the ticker bound to the shared session
+    return yf.Ticker(symbol, session=get_session("yahoo"))
+
+
+# Function to fetch a NSE API url
+def nse_fetch(url: str) -> Any:
+    """Fetch a NSE API url with the shared NSE session
+
+    The NSE API only answers with the cookies set by its home page, the
+    session keeps them and they are only refreshed when a request is refused.
+
+    Args:
+        url (str): The API url
+
+    Returns:
+        Any: The decoded JSON response
+    """
+
+    # Get the shared session
+    session = get_session("nse")
+    timeout = getattr(settings, "UPSTREAM_TIMEOUT", 10)
+
+    # If the session has no cookies yet, visit the home page
+    if not session.cookies:
+        session.get(NSE_HOME_URL, timeout=timeout)
+
+    # Try
+    try:
+        # Fetch the url
+        response = session.get(url, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+
+    # If the cookies expired
+    except (ValueError, requests.HTTPError):
+        # Refresh the cookies and try again
+        session.cookies.clear()
+        session.get(NSE_HOME_URL, timeout=timeout)
+        response = session.get(url, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
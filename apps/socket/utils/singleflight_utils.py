@@ -0,0 +1,194 @@
+# Imports
+import hashlib
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterator
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+# SingleFlight class
+class SingleFlight:
+    """Coalesce concurrent calls that ask for the same key
+
+    The first caller of a key becomes the leader and runs the function, every
+    caller that arrives while it is running waits on the same future and gets
+    the same result (or exception). Optionally the leader also takes a lock in
+    the shared Django cache, so that only one worker process hits the upstream
+    at a time while the others wait for the result to land in the cache.
+
+    Attributes:
+        prefix (str): Prefix of the shared lock keys
+        counters (Dict[str, int]): Number of leader and follower calls
+    """
+
+    # Constructor
+    def __init__(self, prefix: str = "singleflight"):
+        # Attributes
+        self.prefix = prefix
+        self.counters = {"leaders": 0, "followers": 0}
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    # Method to run a function once per key
+    def do(self, key: Hashable, func: Callable[[], Any], shared: bool = False) -> Any:
+        """Run the function, or wait for the call already in flight for the key
+
+        Args:
+            key (Hashable): The key identifying the call
+            func (Callable[[], Any]): Function that produces the value
+            shared (bool, optional): Also coalesce across worker processes
+                through a lock in the shared cache. Defaults to False.
+
+        Returns:
+            Any: The value returned by the leader call
+        """
+
+        # Lock the in-flight calls
+        with self._lock:
+            # Get the call in flight for the key
+            future = self._calls.get(key)
+
+            # If there is no call in flight, become the leader
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+
+            # Count the call
+            self.counters["leaders" if leader else "followers"] += 1
+
+        # If another caller is already fetching the key
+        if not leader:
+            # Wait for its result
+            return future.result()
+
+        # Try
+        try:
+            # If the call must be coalesced across workers
+            if shared and getattr(settings, "SINGLEFLIGHT_SHARED_LOCK", True):
+                # Run the function holding the shared lock
+                with self.shared_lock(key):
+                    result = func()
+
+            # Otherwise run the function directly
+            else:
+                result = func()
+
+        # If any exception occurs
+        except BaseException as e:
+            # Hand the exception to the waiting callers
+            future.set_exception(e)
+            raise
+
+        # If the function succeeded
+        else:
+            # Hand the result to the waiting callers
+            future.set_result(result)
+            return result
+
+        # Forget the call
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    # Method to build the shared lock key of a call
+    def lock_key(self, key: Hashable) -> str:
+        """Build a valid cache key for the lock of a call
+
+        Keys are often tuples whose repr holds spaces and quotes, which
+        memcached rejects, so the parts are joined and sanitized and a digest
+        of the raw key is appended to keep the keys unique.
+
+        Args:
+            key (Hashable): The key identifying the call
+
+        Returns:
+            str: The lock key
+        """
+
+        # Build the raw key from the parts of the key
+        raw_key = ":".join(map(str, key if isinstance(key, tuple) else (key,)))
+
+        # Sanitize the key and truncate it
+        readable = re.sub(r"[^a-zA-Z0-9\-_.:]", "-", raw_key)[:120]
+
+        # Digest of the raw key
+        digest = hashlib.sha1(raw_key.encode()).hexdigest()[:12]
+
+        # Return the lock key
+        return f"{self.prefix}:{readable}:{digest}"
+
+    # Method to hold the shared lock of a key
+    @contextmanager
+    def shared_lock(self, key: Hashable) -> Iterator[bool]:
+        """Hold the lock of a key in the shared cache
+
+        If another worker holds the lock, wait until it is released or until
+        SINGLEFLIGHT_LOCK_TIMEOUT elapses, then proceed anyway so that a
+        crashed worker can never block the others.
+
+        Args:
+            key (Hashable): The key identifying the call
+
+        Yields:
+            bool: True if the lock was acquired by this caller
+        """
+
+        # Build the lock key and a token identifying this caller
+        lock_key = self.lock_key(key)
+        token = uuid.uuid4().hex
+        timeout = getattr(settings, "SINGLEFLIGHT_LOCK_TIMEOUT", 10)
+
+        # Try to take the lock until it is free or the wait times out
+        acquired = False
+        deadline = time.monotonic() + timeout
+        try:
+            while not acquired and time.monotonic() < deadline:
+                # Take the lock if nobody holds it
+                acquired = cache.add(lock_key, token, timeout)
+
+                # Wait for the other worker to release it
+                if not acquired:
+                    time.sleep(0.05)
+
+        # If the shared cache is unavailable, only coalesce in-process
+        except Exception:
+            acquired = False
+
+        # Try
+        try:
+            # Run the protected code
+            yield acquired
+
+        # Release the lock if this caller still holds it
+        finally:
+            if acquired:
+                try:
+                    if cache.get(lock_key) == token:
+                        cache.delete(lock_key)
+
+                # If the shared cache is unavailable
+                except Exception:
+                    pass
+
+    # Method to get the statistics
+    def stats(self) -> Dict[str, int]:
+        """Get the number of leader and follower calls and the calls in flight
+
+        Returns:
+            Dict[str, int]: The counters and the number of calls in flight
+        """
+
+        # Lock and copy the counters
+        with self._lock:
+            return {**self.counters, "in_flight": len(self._calls)}
+
+
+# Process wide single flight group
+singleflight = SingleFlight()
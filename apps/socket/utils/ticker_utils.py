@@ -1,7 +1,14 @@
 # Imports
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 import yfinance as yf
+from django.conf import settings
+
+from apps.socket.constants import YAHOO_QUOTE_URL
+
+from .history_utils import history_store
+from .session_utils import get_yahoo_data
+from .singleflight_utils import singleflight
 
 
 # Function to fetch the ticker data
@@ -10,6 +17,10 @@ def fetch_ticker_data(
 ) -> Dict[str, Any]:
     """Fetch specific ticker data type (info or fast_info)
 
+    Concurrent calls for the same symbol and data type share one upstream
+    request, every caller gets the same result. The history is served as a
+    slice of the local history store, which only fetches the new bars.
+
     Args:
         ticker (yf.Ticker): Ticker object
         data_type (str): Type of data to fetch ('info' or 'fast_info' or 'history')
@@ -18,10 +29,23 @@ def fetch_ticker_data(
         Dict[str, Any]: Fetched data
     """
 
+    # Build the key of the call
+    key = ("ticker", ticker.ticker, data_type, period, interval)
+
+    # Fetch the data once for all the concurrent callers
+    return singleflight.do(
+        key, lambda: _fetch_ticker_data(ticker, data_type, period, interval)
+    )
+
+
+# Function to fetch the ticker data from the upstream
+def _fetch_ticker_data(
+    ticker: yf.Ticker, data_type: str, period: str, interval: str
+) -> Dict[str, Any]:
     # If data type is history
     if data_type == "history":
-        # Fetch the historical data
-        return ticker.history(period=period, interval=interval)[
+        # Serve the period from the history store
+        return history_store.get(ticker, period, interval)[
             ["Open", "High", "Low", "Close"]
         ]
 
@@ -37,3 +61,28 @@ def fetch_ticker_data(
 
     # Return an empty dict
     return {}
+
+
+# Function to fetch the quotes of many symbols at once
+def fetch_batch_quote_data(symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch the raw quotes of many symbols with a single upstream request
+
+    Args:
+        symbols (List[str]): List of symbols
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Raw quote of every symbol found, by symbol
+    """
+
+    # Fetch the quotes with the shared session, reusing the cookie and the crumb
+    response = get_yahoo_data().get_raw_json(
+        YAHOO_QUOTE_URL,
+        params={"symbols": ",".join(symbols)},
+        timeout=getattr(settings, "QUOTE_BATCH_TIMEOUT", 10),
+    )
+
+    # Get the quotes
+    results = (response.get("quoteResponse") or {}).get("result") or []
+
+    # Return the quotes by symbol
+    return {item["symbol"]: item for item in results if item.get("symbol")}
@@ -0,0 +1,27 @@
+# Imports
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import JsonResponse
+
+from apps.socket.utils import get_executor_stats, quote_cache, singleflight
+
+
+# Metrics view
+@staff_member_required
+def metrics_view(request):
+    """Metrics view
+
+    Args:
+        request (HttpRequest): The request object
+
+    Returns:
+        JsonResponse: The metrics of the executors and the quote caches
+    """
+
+    # Return the metrics of this worker process
+    return JsonResponse(
+        {
+            "executors": get_executor_stats(),
+            "quote_cache": quote_cache.stats(),
+            "singleflight": singleflight.stats(),
+        }
+    )
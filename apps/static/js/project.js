@@ -11,3 +11,297 @@ function slugify(text) {
         .replace(/[\s_-]+/g, "-")
         .replace(/^-+|-+$/g, "");
 }
+
+function applyStreamDelta(state, delta, order) {
+    const changed = {};
+
+    Object.entries(delta).forEach(([key, value]) => {
+        if (value === null) {
+            delete state.data[key];
+            return;
+        }
+
+        const current = state.data[key];
+        if (current && typeof current === "object" && typeof value === "object" && !Array.isArray(value)) {
+            Object.entries(value).forEach(([field, fieldValue]) => {
+                if (fieldValue === null) {
+                    delete current[field];
+                } else {
+                    current[field] = fieldValue;
+                }
+            });
+        } else {
+            state.data[key] = value;
+        }
+
+        changed[key] = state.data[key];
+    });
+
+    if (order) {
+        const reordered = {};
+        order.forEach(key => {
+            if (key in state.data) reordered[key] = state.data[key];
+        });
+        state.data = reordered;
+    }
+
+    return changed;
+}
+
+function formatQuoteField(value, format) {
+    const number = parseFloat(value).toLocaleString("en-IN", {
+        minimumFractionDigits: 2,
+        maximumFractionDigits: 2
+    });
+
+    switch (format) {
+        case "price":
+            return `₹${number}`;
+        case "change":
+            return `${value >= 0 ? "+" : ""}${number}`;
+        case "percent":
+            return `${value >= 0 ? "+" : ""}${parseFloat(value).toFixed(2)}%`;
+        default:
+            return `${value}`;
+    }
+}
+
+function fillQuoteRow(row, quote) {
+    if (!row || !quote) return;
+
+    row.querySelectorAll("[data-field]").forEach(cell => {
+        const value = quote[cell.dataset.field];
+        if (value !== undefined && value !== null) {
+            cell.textContent = formatQuoteField(value, cell.dataset.format);
+        }
+    });
+
+    row.querySelectorAll("[data-name]").forEach(link => {
+        const name = quote.longName || quote.shortName;
+        if (name) link.textContent = name.toUpperCase();
+        if (link.dataset.href && quote.symbol) {
+            link.href = link.dataset.href.replace("SYMBOL_PLACEHOLDER", encodeURIComponent(quote.symbol));
+        }
+    });
+
+    if (quote.dayChange !== undefined && quote.dayChange !== null) {
+        const colorClass = quote.dayChange >= 0 ? "text-green-500" : "text-red-500";
+        row.querySelectorAll("[data-color]").forEach(cell => {
+            cell.classList.remove("text-green-500", "text-red-500");
+            cell.classList.add(colorClass);
+        });
+    }
+
+    row.removeAttribute("data-skeleton");
+}
+
+function connectQuoteStream(url, onUpdate, options = {}) {
+    if (!("WebSocket" in window)) {
+        console.error("WebSocket not supported in this browser.");
+        return null;
+    }
+
+    const streams = {};
+    const socket = new WebSocket(url);
+
+    socket.onopen = function () {
+        console.log("WebSocket connection established");
+    };
+
+    socket.onmessage = function (event) {
+        let message;
+        try {
+            message = JSON.parse(event.data);
+        } catch (error) {
+            console.error("Error parsing WebSocket message:", error);
+            return;
+        }
+
+        let changed;
+        const state = streams[message.stream];
+
+        if (message.type === "snapshot") {
+            streams[message.stream] = { seq: message.seq, data: message.data };
+            changed = message.data;
+        } else if (message.type === "delta") {
+            if (!state || message.seq !== state.seq + 1) {
+                if (!state || !state.resyncing) {
+                    streams[message.stream] = { ...(state || { seq: 0, data: {} }), resyncing: true };
+                    socket.send(JSON.stringify({ type: "resync", stream: message.stream }));
+                }
+                return;
+            }
+            state.seq = message.seq;
+            changed = applyStreamDelta(state, message.data, message.order);
+        } else {
+            return;
+        }
+
+        const quotes = Object.assign({}, ...Object.values(streams).map(stream => stream.data));
+
+        try {
+            onUpdate(quotes, changed);
+        } catch (error) {
+            console.error("Error updating quotes:", error);
+        }
+
+        if (options.once || (options.until && options.until(quotes))) socket.close();
+    };
+
+    socket.onclose = function () {
+        console.log("WebSocket connection closed");
+    };
+
+    socket.onerror = function (error) {
+        console.error("WebSocket error:", error);
+    };
+
+    return socket;
+}
+
+function buildChartTraces(chart) {
+    return chart.traces.map(spec => {
+        const { columns, ...trace } = spec;
+        Object.entries(columns).forEach(([key, name]) => {
+            trace[key] = chart.columns[name].slice();
+        });
+        return trace;
+    });
+}
+
+function applyChartDelta(chart, delta) {
+    let appendOnly = !delta.layout;
+    const appended = {};
+
+    Object.entries(delta.columns || {}).forEach(([name, change]) => {
+        const column = chart.columns[name];
+        if (change.start !== column.length) appendOnly = false;
+
+        column.length = change.start;
+        change.values.forEach(value => column.push(value));
+        appended[name] = change.values;
+    });
+
+    if (delta.layout) {
+        Object.entries(delta.layout).forEach(([key, value]) => {
+            if (value === null) {
+                delete chart.layout[key];
+            } else {
+                chart.layout[key] = value;
+            }
+        });
+    }
+
+    return appendOnly ? appended : null;
+}
+
+function renderChart(element, chart, appended) {
+    if (appended) {
+        chart.traces.forEach((spec, index) => {
+            const update = {};
+            Object.entries(spec.columns).forEach(([key, name]) => {
+                if (name in appended) update[key] = [appended[name]];
+            });
+            if (Object.keys(update).length) Plotly.extendTraces(element, update, [index]);
+        });
+        return;
+    }
+
+    Plotly.react(element, buildChartTraces(chart), { ...chart.layout }, { responsive: true });
+}
+
+function connectChartStream(url, container) {
+    if (!("WebSocket" in window)) {
+        console.error("WebSocket not supported in this browser.");
+        return null;
+    }
+
+    const baseUrl = new URL(url);
+    baseUrl.searchParams.set("points", Math.round(container.clientWidth || window.innerWidth));
+
+    let socket = null;
+    let chart = null;
+    let resyncing = false;
+    let zoomed = false;
+    let zoomBound = false;
+
+    function bindZoom(element) {
+        if (zoomBound || typeof element.on !== "function") return;
+        zoomBound = true;
+
+        element.on("plotly_relayout", function (event) {
+            const range = event["xaxis.range"] || [event["xaxis.range[0]"], event["xaxis.range[1]"]];
+            if (range[0] !== undefined && range[1] !== undefined) {
+                zoomed = true;
+                open(range);
+            } else if (event["xaxis.autorange"] && zoomed) {
+                zoomed = false;
+                open(null);
+            }
+        });
+    }
+
+    function open(range) {
+        if (socket) {
+            socket.onclose = null;
+            socket.close();
+        }
+
+        const target = new URL(baseUrl);
+        if (range) {
+            target.searchParams.set("start", range[0]);
+            target.searchParams.set("end", range[1]);
+        }
+
+        chart = null;
+        resyncing = false;
+        socket = new WebSocket(target);
+
+        socket.onopen = function () {
+            console.log("WebSocket connection established");
+        };
+
+        socket.onmessage = function (event) {
+            try {
+                const message = JSON.parse(event.data);
+                const element = container.querySelector(".plotly-graph-div") || container;
+
+                if (message.type === "snapshot") {
+                    chart = { seq: message.seq, ...message.data };
+                    resyncing = false;
+                    renderChart(element, chart, null);
+                } else if (message.type === "delta") {
+                    if (!chart || message.seq !== chart.seq + 1) {
+                        if (!resyncing) {
+                            resyncing = true;
+                            socket.send(JSON.stringify({ type: "resync", stream: message.stream }));
+                        }
+                        return;
+                    }
+                    chart.seq = message.seq;
+                    renderChart(element, chart, applyChartDelta(chart, message.data));
+                }
+                bindZoom(element);
+            } catch (error) {
+                console.error("Error rendering chart:", error);
+            }
+        };
+
+        socket.onclose = function () {
+            console.log("WebSocket connection closed");
+        };
+
+        socket.onerror = function (error) {
+            console.error("WebSocket error:", error);
+        };
+    }
+
+    open(null);
+    bindZoom(container.querySelector(".plotly-graph-div") || container);
+
+    return {
+        close: function () {
+            if (socket) socket.close();
+        },
+    };
+}
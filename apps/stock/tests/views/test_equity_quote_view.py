@@ -1,8 +1,13 @@
 # Imports
+import asyncio
+import time
+
 import pytest
 from django.urls import reverse
 from pytest_django.asserts import assertTemplateUsed
 
+from apps.stock import views as stock_views
+
 
 # Function to test the equity_quote view when the user is unauthenticated
 @pytest.mark.django_db
@@ -53,3 +58,65 @@ def test_equity_quote_view_authenticated(client, user):
     assert "user" in response.context
     assert response.context["request"].user.is_authenticated
     assert response.context["user"] == user
+
+
+# Function to test the equity_quote view when the upstream is late
+@pytest.mark.django_db(transaction=True)
+def test_equity_quote_view_unavailable(client, user, settings, monkeypatch):
+    # A quote that is late and a chart that is ready
+    settings.VIEW_SOURCE_TIMEOUT = 0.05
+
+    async def aget_quote(symbol):
+        await asyncio.sleep(1)
+        return symbol, None
+
+    async def aget_candlestick_chart_html(*args):
+        return "<div>chart</div>"
+
+    monkeypatch.setattr(stock_views, "aget_quote", aget_quote)
+    monkeypatch.setattr(
+        stock_views, "aget_candlestick_chart_html", aget_candlestick_chart_html
+    )
+
+    # Authenticate the user
+    client.force_login(user)
+
+    # Get the equity_quote page
+    response = client.get(
+        reverse("stock:equityQuote", kwargs={"symbol": "RELIANCE.NS"})
+    )
+
+    # Assert the page is rendered as unavailable instead of not found
+    assert response.status_code == 200
+    assertTemplateUsed(response, "stock/quote_unavailable.html")
+    assert response.context["chart"] == "<div>chart</div>"
+
+
+# Function to test the equity_quote view does not wait for the chart of an
+# invalid symbol
+@pytest.mark.django_db(transaction=True)
+def test_equity_quote_view_invalid_symbol(client, user, monkeypatch):
+    # An invalid quote and a slow chart
+    async def aget_quote(symbol):
+        return symbol, None
+
+    async def aget_candlestick_chart_html(*args):
+        await asyncio.sleep(5)
+        return ""
+
+    monkeypatch.setattr(stock_views, "aget_quote", aget_quote)
+    monkeypatch.setattr(
+        stock_views, "aget_candlestick_chart_html", aget_candlestick_chart_html
+    )
+
+    # Authenticate the user
+    client.force_login(user)
+
+    # Get the equity_quote page
+    started = time.monotonic()
+    response = client.get(reverse("stock:equityQuote", kwargs={"symbol": "NOPE"}))
+
+    # Assert the user is redirected at once
+    assert response.status_code == 302
+    assert response.url == reverse("core:explore")
+    assert time.monotonic() - started < 2
@@ -1,8 +1,11 @@
 # Imports
 import pytest
+from django.core.cache import cache
 from django.urls import reverse
 from pytest_django.asserts import assertTemplateUsed
 
+from apps.socket.publishers import QuotePublisher, build_group_name
+
 
 # Function to test the equity top gainers view when the user is unauthenticated
 @pytest.mark.django_db
@@ -49,3 +52,49 @@ def test_equity_top_gainers_view_authenticated(client, user):
     assert "user" in response.context
     assert response.context["request"].user.is_authenticated
     assert response.context["user"] == user
+
+
+# Function to test the equity top gainers view renders from the last snapshot
+@pytest.mark.django_db
+def test_equity_top_gainers_view_renders_from_snapshot(client, user, settings):
+    # Use an in-memory cache and render the page from the snapshots
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    settings.VIEW_RENDER_FROM_SNAPSHOT = True
+    cache.clear()
+
+    # Authenticate the user
+    client.force_login(user)
+
+    # Without a snapshot the page is rendered with skeleton rows
+    response = client.get(reverse("stock:equityTopGainers"))
+    assert response.status_code == 200
+    assert response.context["gainers"] == {}
+    assert len(response.context["skeleton"]) == 20
+    assert response.context["hydrate"]
+    assert response.content.count(b"data-skeleton") == 20
+
+    # Publish a snapshot of the topic
+    quote = {
+        "symbol": "TEST.NS",
+        "shortName": "TEST",
+        "lastPrice": 110.0,
+        "previousClose": 100.0,
+        "open": 101.0,
+        "dayHigh": 111.0,
+        "dayLow": 99.0,
+        "dayChange": 10.0,
+        "dayChangePercentage": 10.0,
+        "colorClass": "text-green-500",
+    }
+    cache.set(
+        QuotePublisher.page_key(build_group_name("topEquityGainersQuotes20", "NSE")),
+        {"TEST": quote},
+    )
+
+    # The page is rendered from the snapshot
+    response = client.get(reverse("stock:equityTopGainers"))
+    assert response.context["gainers"] == {"TEST": quote}
+    assert not response.context["skeleton"]
+    assert b"data-skeleton" not in response.content
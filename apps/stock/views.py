@@ -1,26 +1,115 @@
 # Imports
+import asyncio
+from typing import Callable
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
+from django.db import transaction
 from django.http import JsonResponse
 from django.shortcuts import redirect, render
 from django.urls import reverse
 
+from apps.account.decorators import async_login_required
 from apps.dashboard.models import StockIndexWatchlist
-from apps.socket.constants import BSE_CATEGORIES, NSE_CATEGORIES
+from apps.socket.constants import BSE_CATEGORIES, NSE_CATEGORIES, STOCK_INDICES
 from apps.socket.helpers import (
-    generate_candlestick_chart,
-    get_index_quotes,
+    aget_candlestick_chart_html,
+    aget_index_quotes,
+    aget_quote,
+    get_candlestick_chart_html,
     get_quote,
     get_top_equity_gainers_20_quotes,
     get_top_equity_losers_20_quotes,
 )
-from apps.socket.utils import is_market_open
+from apps.socket.publishers import aget_page_snapshot, get_page_snapshot
+from apps.socket.utils import UNAVAILABLE, is_market_open, with_timeout
 from apps.stock.forms import GainersLosersFilterForm, IndicesFilterForm
 
+# Number of rows of the top gainers and losers pages
+TOP_EQUITY_ROWS = 20
+
+
+# Function to get the quotes of the indices page
+async def aget_indices_page_quotes(stock_exchange: str, category: str) -> dict:
+    """Get the quotes of the indices page from the last published snapshot
+
+    The page is rendered without waiting for the upstream, the first frame of
+    the websocket fills in fresh data.
+
+    Args:
+        stock_exchange (str): Stock exchange
+        category (str): Category
+
+    Returns:
+        dict: The quotes, the symbols of the skeleton rows and whether the
+            page must be hydrated over the websocket
+    """
+
+    # If the page is rendered from live quotes
+    if not settings.VIEW_RENDER_FROM_SNAPSHOT:
+        # Return the quotes
+        return {
+            "quotes": await with_timeout(
+                aget_index_quotes(stock_exchange, category),
+                settings.VIEW_SOURCE_TIMEOUT,
+                {},
+            ),
+            "skeleton": [],
+            "hydrate": False,
+        }
+
+    # Get the last published quotes
+    quotes = await aget_page_snapshot("indexQuotes", stock_exchange, category) or {}
+
+    # Return the quotes, or a skeleton row per index if there are none
+    return {
+        "quotes": quotes,
+        "skeleton": (
+            [] if quotes else STOCK_INDICES.get(stock_exchange, {}).get(category, [])
+        ),
+        "hydrate": True,
+    }
+
+
+# Function to get the quotes of the top gainers or losers page
+def get_top_equity_page_quotes(
+    topic_name: str, stock_exchange: str, fetch: Callable[[str], dict]
+) -> dict:
+    """Get the quotes of the top gainers or losers page from the last
+    published snapshot
+
+    Args:
+        topic_name (str): Name of the topic streamed to the page
+        stock_exchange (str): Stock exchange
+        fetch (Callable[[str], dict]): Function that fetches the live quotes
+
+    Returns:
+        dict: The quotes, the skeleton rows and whether the page must be
+            hydrated over the websocket
+    """
+
+    # If the page is rendered from live quotes
+    if not settings.VIEW_RENDER_FROM_SNAPSHOT:
+        # Return the quotes
+        return {"quotes": fetch(stock_exchange), "skeleton": [], "hydrate": False}
+
+    # Get the last published quotes
+    quotes = get_page_snapshot(topic_name, stock_exchange) or {}
+
+    # Return the quotes, or skeleton rows if there are none
+    return {
+        "quotes": quotes,
+        "skeleton": [] if quotes else range(TOP_EQUITY_ROWS),
+        "hydrate": True,
+    }
+
 
 # Indices view
-@login_required
-def indices_view(request):
+@transaction.non_atomic_requests
+@async_login_required
+async def indices_view(request):
     """Indices view
 
     Args:
@@ -49,7 +138,7 @@ def indices_view(request):
         messages.error(request, "Invalid stock exchange selected!")
 
         # Redirect to the indices page
-        return render(
+        return await sync_to_async(render)(
             request,
             "stock/indices.html",
             {
@@ -58,7 +147,7 @@ def indices_view(request):
                 "stock_exchange": stock_exchange,
                 "category": category,
                 "category_name": "Broad Market",
-                "quotes": get_index_quotes(stock_exchange, category),
+                **await aget_indices_page_quotes(stock_exchange, category),
                 "is_market_open": is_market_open(),
             },
         )
@@ -74,7 +163,7 @@ def indices_view(request):
             messages.error(request, "Invalid category selected!")
 
             # Redirect to the indices page
-            return render(
+            return await sync_to_async(render)(
                 request,
                 "stock/indices.html",
                 {
@@ -83,7 +172,7 @@ def indices_view(request):
                     "stock_exchange": stock_exchange,
                     "category": category,
                     "category_name": "Broad Market",
-                    "quotes": get_index_quotes(stock_exchange, category),
+                    **await aget_indices_page_quotes(stock_exchange, category),
                     "is_market_open": is_market_open(),
                 },
             )
@@ -99,7 +188,7 @@ def indices_view(request):
             messages.error(request, "Invalid category selected!")
 
             # Redirect to the indices page
-            return render(
+            return await sync_to_async(render)(
                 request,
                 "stock/indices.html",
                 {
@@ -108,13 +197,13 @@ def indices_view(request):
                     "stock_exchange": stock_exchange,
                     "category": category,
                     "category_name": "Broad Market",
-                    "quotes": get_index_quotes(stock_exchange, category),
+                    **await aget_indices_page_quotes(stock_exchange, category),
                     "is_market_open": is_market_open(),
                 },
             )
 
     # Get the quotes for the indices
-    quotes = get_index_quotes(stock_exchange, category)
+    page_quotes = await aget_indices_page_quotes(stock_exchange, category)
 
     # If stock_exchange is NSE
     if stock_exchange == "NSE":
@@ -133,12 +222,12 @@ def indices_view(request):
         "stock_exchange": stock_exchange,
         "category": category,
         "category_name": category_name,
-        "quotes": quotes,
+        **page_quotes,
         "is_market_open": is_market_open(),
     }
 
     # Render the indices.html template
-    return render(request, "stock/indices.html", context)
+    return await sync_to_async(render)(request, "stock/indices.html", context)
 
 
 # Get categories view
@@ -179,8 +268,8 @@ def index_quote_view(request, symbol: str):
     # Get the index quote
     quote = get_quote(symbol)[-1]
 
-    # Generate the candle stick chart
-    chart = generate_candlestick_chart(symbol, "1d", "5m", "none")
+    # Get the candle stick chart, rendered once per bar
+    chart = get_candlestick_chart_html(symbol, "1d", "5m", "none")
 
     # Check if the quote is bookmarked
     is_bookmarked = StockIndexWatchlist.objects.filter(
@@ -194,7 +283,7 @@ def index_quote_view(request, symbol: str):
         "quote": quote,
         "is_bookmarked": is_bookmarked,
         "is_market_open": is_market_open(),
-        "chart": chart.to_html(),
+        "chart": chart,
     }
 
     # Render the home.html template
@@ -227,11 +316,18 @@ def equity_top_gainers_view(request):
         # Add an error message
         messages.error(request, "Invalid stock exchange selected!")
 
+    # Get the quotes of the page
+    page_quotes = get_top_equity_page_quotes(
+        "topEquityGainersQuotes20", stock_exchange, get_top_equity_gainers_20_quotes
+    )
+
     # Context dictionary
     context = {
         "user": request.user,
         "form": form,
-        "gainers": get_top_equity_gainers_20_quotes(stock_exchange),
+        "gainers": page_quotes["quotes"],
+        "skeleton": page_quotes["skeleton"],
+        "hydrate": page_quotes["hydrate"],
         "stock_exchange": stock_exchange,
         "is_market_open": is_market_open(),
     }
@@ -266,11 +362,18 @@ def equity_top_losers_view(request):
         # Add an error message
         messages.error(request, "Invalid stock exchange selected!")
 
+    # Get the quotes of the page
+    page_quotes = get_top_equity_page_quotes(
+        "topEquityLosersQuotes20", stock_exchange, get_top_equity_losers_20_quotes
+    )
+
     # Context dictionary
     context = {
         "user": request.user,
         "form": form,
-        "losers": get_top_equity_losers_20_quotes(stock_exchange),
+        "losers": page_quotes["quotes"],
+        "skeleton": page_quotes["skeleton"],
+        "hydrate": page_quotes["hydrate"],
         "stock_exchange": stock_exchange,
         "is_market_open": is_market_open(),
     }
@@ -280,8 +383,9 @@ def equity_top_losers_view(request):
 
 
 # Equity quote view
-@login_required
-def equity_quote_view(request, symbol: str):
+@transaction.non_atomic_requests
+@async_login_required
+async def equity_quote_view(request, symbol: str):
     """Equity quote view
 
     Args:
@@ -292,19 +396,49 @@ def equity_quote_view(request, symbol: str):
         HttpResponse: The response object
     """
 
-    # Get the equity quote
-    quote = get_quote(symbol)[-1]
+    # Start rendering the candle stick chart, rendered once per bar, while the
+    # quote is fetched
+    chart_task = asyncio.ensure_future(
+        with_timeout(
+            aget_candlestick_chart_html(symbol, "1d", "5m", "none"),
+            settings.VIEW_CHART_TIMEOUT,
+            "",
+        )
+    )
+
+    # Get the equity quote, UNAVAILABLE if the upstream failed or was late
+    result = await with_timeout(
+        aget_quote(symbol), settings.VIEW_SOURCE_TIMEOUT, UNAVAILABLE
+    )
+
+    # If the upstream failed or was late
+    if result is UNAVAILABLE:
+        # Render the page without the quote, it is filled in once available
+        return await sync_to_async(render)(
+            request,
+            "stock/quote_unavailable.html",
+            {
+                "user": request.user,
+                "symbol": symbol,
+                "is_market_open": is_market_open(),
+                "chart": await chart_task,
+            },
+        )
 
     # If the the symbol was invalid
+    quote = result[1]
     if quote is None or quote["quoteType"] != "EQUITY":
+        # Stop rendering the chart
+        chart_task.cancel()
+
         # Add an error message
         messages.error(request, "Equity Stock Not Found!")
 
         # Redirect to explore page
         return redirect(reverse("core:explore"))
 
-    # Generate the candle stick chart
-    chart = generate_candlestick_chart(symbol, "1d", "5m", "none")
+    # Wait for the chart
+    chart = await chart_task
 
     # Get the symbol from the quote
     symbol = quote["symbol"]
@@ -317,9 +451,9 @@ def equity_quote_view(request, symbol: str):
     bse_symbol = base_symbol + ".BO"
 
     # Check if the quote is bookmarked
-    is_bookmarked = StockIndexWatchlist.objects.filter(
+    is_bookmarked = await StockIndexWatchlist.objects.filter(
         user=request.user, symbol=symbol
-    ).exists()
+    ).aexists()
 
     # Create a context dictionary
     context = {
@@ -330,11 +464,11 @@ def equity_quote_view(request, symbol: str):
         "quote": quote,
         "is_bookmarked": is_bookmarked,
         "is_market_open": is_market_open(),
-        "chart": chart.to_html(),
+        "chart": chart,
     }
 
     # Render the home.html template
-    return render(request, "stock/equity_quote.html", context)
+    return await sync_to_async(render)(request, "stock/equity_quote.html", context)
 
 
 # Index Quote Bookmark View
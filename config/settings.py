@@ -164,6 +164,7 @@ TEMPLATES = [
                 "django.template.context_processors.static",
                 "django.template.context_processors.tz",
                 "django.contrib.messages.context_processors.messages",
+                "apps.socket.context_processors.plotly_js",
             ],
         },
     },
@@ -234,6 +235,96 @@ CHANNEL_LAYERS = {
     },
 }
 
+# Socket settings
+# ------------------------------------------------------------------------------
+SOCKET_FETCH_MAX_WORKERS = env.int("SOCKET_FETCH_MAX_WORKERS", default=16)
+SOCKET_EXECUTORS = {
+    # Runs the helpers called from the event loop
+    "fetch": {
+        "max_workers": SOCKET_FETCH_MAX_WORKERS,
+        "max_queue": env.int("SOCKET_FETCH_MAX_QUEUE", default=256),
+    },
+    # Runs the upstream requests submitted by the helpers
+    "upstream": {
+        "max_workers": env.int("SOCKET_UPSTREAM_MAX_WORKERS", default=16),
+        "max_queue": env.int("SOCKET_UPSTREAM_MAX_QUEUE", default=256),
+    },
+    # Runs the single symbol fallbacks of the ranked quotes
+    "ranked": {
+        "max_workers": env.int("SOCKET_RANKED_MAX_WORKERS", default=8),
+        "max_queue": env.int("SOCKET_RANKED_MAX_QUEUE", default=128),
+    },
+}
+
+# Quote cache settings
+# ------------------------------------------------------------------------------
+QUOTE_CACHE_MAX_ENTRIES = env.int("QUOTE_CACHE_MAX_ENTRIES", default=2048)
+QUOTE_CACHE_TTLS = {
+    "info": {"open": 30, "closed": 60 * 60},
+    "fast_info": {"open": 2, "closed": 60 * 15},
+    "default": {"open": 2, "closed": 60 * 15},
+}
+
+# Upstream HTTP settings
+# ------------------------------------------------------------------------------
+UPSTREAM_POOL_CONNECTIONS = env.int("UPSTREAM_POOL_CONNECTIONS", default=10)
+UPSTREAM_POOL_MAXSIZE = env.int("UPSTREAM_POOL_MAXSIZE", default=16)
+UPSTREAM_RETRIES = env.int("UPSTREAM_RETRIES", default=2)
+UPSTREAM_TIMEOUT = env.int("UPSTREAM_TIMEOUT", default=10)
+
+# Batch quote settings
+# ------------------------------------------------------------------------------
+QUOTE_BATCH_SIZE = env.int("QUOTE_BATCH_SIZE", default=50)
+QUOTE_BATCH_TIMEOUT = env.int("QUOTE_BATCH_TIMEOUT", default=10)
+QUOTE_RANKED_TIMEOUT = env.int("QUOTE_RANKED_TIMEOUT", default=5)
+
+# Single flight settings
+# ------------------------------------------------------------------------------
+SINGLEFLIGHT_SHARED_LOCK = env.bool("SINGLEFLIGHT_SHARED_LOCK", default=True)
+SINGLEFLIGHT_LOCK_TIMEOUT = env.int("SINGLEFLIGHT_LOCK_TIMEOUT", default=10)
+
+# History store settings
+# ------------------------------------------------------------------------------
+HISTORY_STORE_DIR = env.str("HISTORY_STORE_DIR", default=str(BASE_DIR / ".history"))
+HISTORY_HOT_TTL = env.int("HISTORY_HOT_TTL", default=60 * 60)
+HISTORY_REFRESH_TTLS = {
+    "open": env.int("HISTORY_REFRESH_TTL_OPEN", default=5),
+    "closed": env.int("HISTORY_REFRESH_TTL_CLOSED", default=60 * 15),
+}
+
+# View settings
+# ------------------------------------------------------------------------------
+VIEW_SOURCE_TIMEOUT = env.int("VIEW_SOURCE_TIMEOUT", default=8)
+VIEW_CHART_TIMEOUT = env.int("VIEW_CHART_TIMEOUT", default=20)
+VIEW_RENDER_FROM_SNAPSHOT = env.bool("VIEW_RENDER_FROM_SNAPSHOT", default=True)
+PAGE_SNAPSHOT_TTL = env.int("PAGE_SNAPSHOT_TTL", default=60 * 60 * 24)
+
+# Breadth snapshot settings
+# ------------------------------------------------------------------------------
+BREADTH_REFRESH_TTLS = {
+    "open": env.int("BREADTH_REFRESH_TTL_OPEN", default=2),
+    "closed": env.int("BREADTH_REFRESH_TTL_CLOSED", default=60 * 15),
+}
+
+# Indicator stream settings
+# ------------------------------------------------------------------------------
+INDICATOR_STREAM_MAX_ENTRIES = env.int("INDICATOR_STREAM_MAX_ENTRIES", default=256)
+INDICATOR_STREAM_TTL = env.int("INDICATOR_STREAM_TTL", default=60 * 15)
+
+
+# Indicator cache settings
+# ------------------------------------------------------------------------------
+INDICATOR_CACHE_MAX_ENTRIES = env.int("INDICATOR_CACHE_MAX_ENTRIES", default=512)
+INDICATOR_CACHE_TTL = env.int("INDICATOR_CACHE_TTL", default=60 * 15)
+INDICATOR_CACHE_SHARED = env.bool("INDICATOR_CACHE_SHARED", default=False)
+
+
+# Chart cache settings
+# ------------------------------------------------------------------------------
+CHART_CACHE_MAX_ENTRIES = env.int("CHART_CACHE_MAX_ENTRIES", default=64)
+CHART_CACHE_CLOSED_TTL = env.int("CHART_CACHE_CLOSED_TTL", default=60 * 15)
+CHART_MAX_POINTS = env.int("CHART_MAX_POINTS", default=1000)
+
 
 # MinIO settings
 # ------------------------------------------------------------------------------
@@ -284,4 +375,5 @@ STATICFILES_DIRS = [str(APPS_DIR / "static")]
 STATICFILES_FINDERS = [
     "django.contrib.staticfiles.finders.FileSystemFinder",
     "django.contrib.staticfiles.finders.AppDirectoriesFinder",
+    "apps.socket.finders.PlotlyJsFinder",
 ]
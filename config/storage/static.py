@@ -15,9 +15,39 @@ class StaticStorage(CustomS3Boto3Storage):
         location (str): The location of the static files.
         default_acl (str): The default ACL for the static files.
         file_overwrite (bool): Whether to overwrite the file if it already exists.
+        gzip (bool): Whether to gzip the scripts and stylesheets.
+
+    Methods:
+        get_object_parameters -> dict: Returns the upload parameters of the file.
     """
 
     # Attributes
     location = "static"
     default_acl = "private"
     file_overwrite = False
+    gzip = True
+
+    # Method to return the upload parameters of the file
+    def get_object_parameters(self, name):
+        """Get the upload parameters of the file.
+
+        Vendored files live under a versioned directory, so the browsers can
+        cache them forever.
+
+        Args:
+            name (str): The name of the file.
+
+        Returns:
+            dict: The upload parameters.
+        """
+
+        # Get the default parameters
+        params = super().get_object_parameters(name)
+
+        # If the file is vendored
+        if name.startswith(f"{self.location}/vendor/"):
+            # Cache the file forever
+            params["CacheControl"] = "public, max-age=31536000, immutable"
+
+        # Return the parameters
+        return params
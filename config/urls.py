@@ -17,6 +17,7 @@ urlpatterns += [
     path("account/", include("apps.account.urls")),
     path("stock/", include("apps.stock.urls")),
     path("", include("apps.dashboard.urls")),
+    path("socket/", include("apps.socket.urls")),
 ]
 
 # If the app is in debug mode